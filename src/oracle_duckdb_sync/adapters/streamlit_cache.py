@@ -7,6 +7,7 @@ the core business logic depending on it.
 
 from functools import wraps
 from typing import Any, Callable, Optional
+from uuid import uuid4
 
 import streamlit as st
 
@@ -69,6 +70,19 @@ class StreamlitCacheProvider(CacheProvider):
         return wrapper
 
 
+def get_session_cache_id() -> str:
+    """
+    Get a stable id for the current Streamlit session.
+
+    The id is kept in session_state, so it survives reruns; pass it as
+    QueryCacheManager's session_id to keep the session's cached frames
+    when the manager is rebuilt.
+    """
+    if 'query_cache_session_id' not in st.session_state:
+        st.session_state.query_cache_session_id = str(uuid4())
+    return str(st.session_state.query_cache_session_id)
+
+
 class StreamlitDataCacheDecorator:
     """
     Helper class to use Streamlit's @st.cache_data as a drop-in replacement.
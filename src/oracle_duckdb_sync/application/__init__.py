@@ -6,7 +6,12 @@ use cases and coordinating business logic without depending on specific
 UI frameworks or data storage implementations.
 """
 
+from oracle_duckdb_sync.application.async_query_service import (
+    AsyncQueryService,
+    QueryHandle,
+    QueryStatus,
+)
 from oracle_duckdb_sync.application.query_service import QueryService
 from oracle_duckdb_sync.application.sync_service import SyncService
 
-__all__ = ['QueryService', 'SyncService']
+__all__ = ['AsyncQueryService', 'QueryHandle', 'QueryStatus', 'QueryService', 'SyncService']
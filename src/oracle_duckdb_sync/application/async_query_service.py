@@ -0,0 +1,259 @@
+"""
+Async Query Service - run QueryService calls on a background worker pool.
+
+The UI submits a query and gets a QueryHandle back immediately. Each query
+runs on its own DuckDB cursor, so the handle can report DuckDB's progress
+estimate and cancel the running statement with ``interrupt()`` while the
+script thread stays responsive.
+"""
+
+import itertools
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from enum import Enum
+from typing import Any, Callable, Optional
+
+from ..config.query_constants import QUERY_CONSTANTS
+from ..log.logger import setup_logger
+from .query_service import QueryService
+
+logger = setup_logger(__name__)
+
+_query_ids = itertools.count(1)
+
+
+class QueryStatus(Enum):
+    """Lifecycle of a background query."""
+    PENDING = "pending"
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
+    CANCELLED = "cancelled"
+
+
+class QueryHandle:
+    """
+    Handle of a query submitted to AsyncQueryService.
+
+    ``result`` holds whatever the submitted QueryService call returned
+    (QueryResult or the legacy dict) once the query is COMPLETED or FAILED.
+    """
+
+    def __init__(self, description: str, connection: Any):
+        self.query_id = next(_query_ids)
+        self.description = description
+        self.status = QueryStatus.PENDING
+        self.result: Any = None
+        self.error: Optional[str] = None
+        self.submitted_at = time.time()
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+        self._connection = connection
+        self._future: Optional[Future] = None
+        self._cancel_requested = threading.Event()
+
+    @property
+    def progress(self) -> Optional[float]:
+        """Fraction (0.0-1.0) of the running statement done, or None if unknown."""
+        if self.status == QueryStatus.COMPLETED:
+            return 1.0
+        if self.status != QueryStatus.RUNNING:
+            return None
+        try:
+            percent = self._connection.query_progress()
+        except Exception:
+            return None
+        return percent / 100 if percent >= 0 else None
+
+    @property
+    def elapsed_seconds(self) -> float:
+        """Seconds since the query started running (0 while pending)."""
+        if self.started_at is None:
+            return 0.0
+        return (self.finished_at or time.time()) - self.started_at
+
+    @property
+    def cancel_requested(self) -> bool:
+        return self._cancel_requested.is_set()
+
+    def done(self) -> bool:
+        """Return True once the query finished, failed or was cancelled."""
+        return self.status in (QueryStatus.COMPLETED, QueryStatus.FAILED, QueryStatus.CANCELLED)
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Block until the query is done. Returns False on timeout."""
+        if self._future is None:
+            return self.done()
+        try:
+            self._future.result(timeout)
+        except Exception:
+            if not self._future.done():
+                return False
+        return True
+
+    def cancel(self) -> bool:
+        """
+        Cancel the query.
+
+        A pending query is removed from the queue; a running statement is
+        interrupted. Returns False if the query had already finished.
+        """
+        if self.done():
+            return False
+
+        self._cancel_requested.set()
+        if self._future is not None and self._future.cancel():
+            self._finish(QueryStatus.CANCELLED)
+            self._connection.close()
+        else:
+            try:
+                self._connection.interrupt()
+            except Exception as e:
+                logger.warning(f"Failed to interrupt query {self.query_id}: {e}")
+
+        logger.info(f"Query {self.query_id} cancelled: {self.description}")
+        return True
+
+    def _finish(self, status: QueryStatus, result: Any = None, error: Optional[str] = None) -> None:
+        self.result = result
+        self.error = error
+        self.finished_at = time.time()
+        self.status = status
+
+
+class AsyncQueryService:
+    """
+    Runs QueryService calls on a shared background worker pool.
+
+    Example:
+        >>> service = AsyncQueryService(QueryService(duckdb))
+        >>> handle = service.query_table("sensor_data")
+        >>> handle.progress
+        0.42
+        >>> handle.cancel()
+    """
+
+    def __init__(self, query_service: QueryService,
+                 worker_pool: Optional[ThreadPoolExecutor] = None):
+        """
+        Args:
+            query_service: Service whose DuckDB source the queries run against
+            worker_pool: Executor running the queries. If None, uses the process-wide pool
+        """
+        self.query_service = query_service
+        self.worker_pool = worker_pool or get_query_worker_pool()
+
+    def submit(self, description: str, func: Callable[[QueryService], Any]) -> QueryHandle:
+        """
+        Run ``func`` with a QueryService bound to a dedicated cursor.
+
+        Args:
+            description: Human-readable description (shown in the UI and logs)
+            func: Called with the cursor-bound QueryService on a worker thread
+
+        Returns:
+            QueryHandle to poll for progress and result
+        """
+        cursor = self.query_service.duckdb_source.get_connection().cursor()
+        # query_progress() is only tracked while the progress bar is enabled
+        cursor.execute("SET enable_progress_bar = true")
+        cursor.execute("SET enable_progress_bar_print = false")
+
+        handle = QueryHandle(description, cursor)
+        worker_service = QueryService(
+            self.query_service.duckdb_source,
+            connection=cursor,
+            profiler=self.query_service.profiler
+        )
+        handle._future = self.worker_pool.submit(self._run, handle, func, worker_service)
+        logger.info(f"Query {handle.query_id} submitted: {description}")
+        return handle
+
+    def query_table(self, table_name: str, limit: int = 10000,
+                    convert_types: bool = True) -> QueryHandle:
+        """Background version of QueryService.query_table."""
+        return self.submit(
+            f"SELECT * FROM {table_name} LIMIT {limit}",
+            lambda service: service.query_table(
+                table_name, limit=limit, convert_types=convert_types
+            )
+        )
+
+    def query_table_aggregated_legacy(self,
+                                      table_name: str,
+                                      time_column: str,
+                                      interval: str = QUERY_CONSTANTS.DEFAULT_AGGREGATION_INTERVAL,
+                                      numeric_cols: Optional[list[str]] = None) -> QueryHandle:
+        """Background version of QueryService.query_table_aggregated_legacy."""
+        return self.submit(
+            f"Aggregate {table_name} by {interval}",
+            lambda service: service.query_table_aggregated_legacy(
+                table_name, time_column, interval=interval, numeric_cols=numeric_cols
+            )
+        )
+
+    @staticmethod
+    def _run(handle: QueryHandle, func: Callable[[QueryService], Any],
+             service: QueryService) -> None:
+        if handle.cancel_requested:
+            handle._finish(QueryStatus.CANCELLED)
+            handle._connection.close()
+            return
+
+        handle.started_at = time.time()
+        handle.status = QueryStatus.RUNNING
+        try:
+            result = func(service)
+        except Exception as e:
+            if handle.cancel_requested:
+                handle._finish(QueryStatus.CANCELLED)
+            else:
+                logger.error(f"Query {handle.query_id} failed: {e}")
+                handle._finish(QueryStatus.FAILED, error=str(e))
+            return
+        finally:
+            handle._connection.close()
+
+        if handle.cancel_requested:
+            # QueryService reports the interrupt as an unsuccessful result
+            handle._finish(QueryStatus.CANCELLED)
+        elif _is_success(result):
+            handle._finish(QueryStatus.COMPLETED, result=result)
+        else:
+            handle._finish(QueryStatus.FAILED, result=result, error=_error_of(result))
+
+        logger.info(
+            f"Query {handle.query_id} {handle.status.value} in {handle.elapsed_seconds:.2f}s"
+        )
+
+
+def _is_success(result: Any) -> bool:
+    if isinstance(result, dict):
+        return bool(result.get('success'))
+    return bool(getattr(result, 'success', True))
+
+
+def _error_of(result: Any) -> Optional[str]:
+    if isinstance(result, dict):
+        return result.get('error')
+    return getattr(result, 'error', None)
+
+
+# Global worker pool (queries from every session share it)
+_global_worker_pool: Optional[ThreadPoolExecutor] = None
+_worker_pool_lock = threading.Lock()
+
+
+def get_query_worker_pool() -> ThreadPoolExecutor:
+    """Get or create the process-wide query worker pool."""
+    global _global_worker_pool
+
+    with _worker_pool_lock:
+        if _global_worker_pool is None:
+            _global_worker_pool = ThreadPoolExecutor(
+                max_workers=QUERY_CONSTANTS.ASYNC_QUERY_WORKERS,
+                thread_name_prefix="query-worker"
+            )
+
+    return _global_worker_pool
@@ -71,6 +71,18 @@ class CacheProvider(ABC):
         """
         pass
 
+    def evict(self, key: str) -> None:
+        """
+        Drop a value to relieve memory pressure.
+
+        Providers with a persistent tier override this to keep the
+        persisted copy; by default it is the same as delete().
+
+        Args:
+            key: Cache key to evict
+        """
+        self.delete(key)
+
     def cached_function(self, func: Callable, key_prefix: Optional[str] = None) -> Callable:
         """
         Decorator to cache function results.
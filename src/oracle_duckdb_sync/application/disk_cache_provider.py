@@ -0,0 +1,402 @@
+"""
+Disk-backed cache tier.
+
+Converted query results survive a process restart: DataFrames are stored as
+uncompressed Arrow IPC files, which are memory-mapped on read, and other
+values (e.g. CachedQueryMetadata) are pickled next to them. The directory is
+bounded by size with least-recently-used eviction; entries written with a
+ttl expire after it.
+
+TieredCacheProvider puts a fast in-memory provider (e.g. the Streamlit
+session cache) in front of the disk tier so a cold start is served from disk
+and later reads from memory. create_query_cache_provider() builds it from
+the QUERY_DISK_CACHE_* settings.
+"""
+
+import hashlib
+import os
+import pickle
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import partial
+from typing import Any, Optional
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.ipc
+
+from oracle_duckdb_sync.application.cache_provider import CacheProvider
+from oracle_duckdb_sync.config import Config
+from oracle_duckdb_sync.log.logger import setup_logger
+
+# Set up logger
+disk_cache_logger = setup_logger('DiskCacheProvider')
+
+ARROW_SUFFIX = ".arrow"
+PICKLE_SUFFIX = ".pkl"
+# Arrow schema metadata key holding the expiry time (epoch seconds) of a frame
+EXPIRES_AT_KEY = b"cache_expires_at"
+
+
+class DiskCacheProvider(CacheProvider):
+    """
+    Cache provider storing values as files in a directory.
+
+    Writes are atomic (temporary file + rename) and, by default, run on a
+    single background thread so the caller never waits for a large frame to
+    be written. Reads of a key with a pending write wait for that write.
+    """
+
+    def __init__(self, cache_dir: str, max_bytes: int, async_writes: bool = True):
+        """
+        Args:
+            cache_dir: Directory for cache files (created if missing)
+            max_bytes: Maximum total size of the cache files
+            async_writes: Write files on a background thread
+        """
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.logger = disk_cache_logger
+        os.makedirs(cache_dir, exist_ok=True)
+
+        self._executor: Optional[ThreadPoolExecutor] = None
+        if async_writes:
+            self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="disk-cache")
+        self._pending: dict[str, Future] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls, config: Config) -> 'DiskCacheProvider':
+        """Create the disk tier configured by query_disk_cache_* settings."""
+        return cls(config.query_disk_cache_path, config.query_disk_cache_max_mb * 1024 * 1024)
+
+    def get(self, key: str) -> Optional[Any]:
+        self._wait_for_write(key)
+        path = self._find_file(key)
+        if path is None:
+            return None
+
+        try:
+            if path.endswith(ARROW_SUFFIX):
+                # Memory-mapped: pages are loaded lazily from the OS page cache
+                with pa.memory_map(path, 'r') as source:
+                    table = pa.ipc.open_file(source).read_all()
+                expires_at = self._arrow_expires_at(table.schema)
+                value = None if self._expired(expires_at) else table.to_pandas()
+            else:
+                with open(path, 'rb') as f:
+                    expires_at, value = pickle.load(f)
+        except Exception as e:
+            self.logger.warning(f"Discarding unreadable cache file for '{key}': {e}")
+            self._remove_files(key)
+            return None
+
+        if self._expired(expires_at):
+            self._remove_files(key)
+            return None
+
+        # mtime is the LRU clock
+        os.utime(path)
+        return value
+
+    def set(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
+        expires_at = time.time() + ttl if ttl else None
+        if self._executor is None:
+            self._write(key, value, expires_at)
+            return
+
+        with self._lock:
+            future = self._executor.submit(self._write, key, value, expires_at)
+            self._pending[key] = future
+        future.add_done_callback(partial(self._clear_pending, key))
+
+    def delete(self, key: str) -> None:
+        self._wait_for_write(key)
+        self._remove_files(key)
+
+    def clear(self) -> None:
+        self.flush()
+        for entry in self._scan():
+            self._unlink(entry.path)
+
+    def has(self, key: str) -> bool:
+        with self._lock:
+            if key in self._pending:
+                return True
+        path = self._find_file(key)
+        if path is None:
+            return False
+        if self._expired(self.expires_at(key)):
+            self._remove_files(key)
+            return False
+        return True
+
+    def expires_at(self, key: str) -> Optional[float]:
+        """Return when an entry expires (epoch seconds), or None if it never does."""
+        self._wait_for_write(key)
+        path = self._find_file(key)
+        if path is None:
+            return None
+        try:
+            if path.endswith(ARROW_SUFFIX):
+                with pa.memory_map(path, 'r') as source:
+                    return self._arrow_expires_at(pa.ipc.open_file(source).schema)
+            with open(path, 'rb') as f:
+                expires_at: Optional[float] = pickle.load(f)[0]
+            return expires_at
+        except Exception:
+            # Unreadable files are discarded by the next get()
+            return None
+
+    def flush(self) -> None:
+        """Wait until all pending writes are on disk."""
+        with self._lock:
+            pending = list(self._pending.values())
+        for future in pending:
+            future.result()
+
+    def get_statistics(self) -> dict[str, Any]:
+        """Return file count and total size of the disk tier."""
+        entries = self._scan()
+        return {
+            'entry_count': len(entries),
+            'total_bytes': sum(entry.stat().st_size for entry in entries),
+            'max_bytes': self.max_bytes,
+        }
+
+    def _write(self, key: str, value: Any, expires_at: Optional[float] = None) -> None:
+        base = self._base_path(key)
+        if isinstance(value, pd.DataFrame):
+            path = base + ARROW_SUFFIX
+            table = pa.Table.from_pandas(value, preserve_index=False)
+            if expires_at is not None:
+                metadata = dict(table.schema.metadata or {})
+                metadata[EXPIRES_AT_KEY] = repr(expires_at).encode()
+                table = table.replace_schema_metadata(metadata)
+            self._atomic_write(path, lambda f: self._write_arrow(f, table))
+        else:
+            path = base + PICKLE_SUFFIX
+            try:
+                payload = pickle.dumps((expires_at, value), protocol=pickle.HIGHEST_PROTOCOL)
+            except Exception as e:
+                self.logger.warning(f"Value for '{key}' cannot be stored on disk: {e}")
+                return
+            self._atomic_write(path, lambda f: f.write(payload))
+
+        # A key changes type rarely, but never leave a stale file of the other kind
+        other = base + (PICKLE_SUFFIX if path.endswith(ARROW_SUFFIX) else ARROW_SUFFIX)
+        self._unlink(other)
+        self._evict_over_budget(keep=path)
+
+    @staticmethod
+    def _arrow_expires_at(schema: pa.Schema) -> Optional[float]:
+        raw = (schema.metadata or {}).get(EXPIRES_AT_KEY)
+        return float(raw) if raw is not None else None
+
+    @staticmethod
+    def _expired(expires_at: Optional[float]) -> bool:
+        return expires_at is not None and time.time() >= expires_at
+
+    @staticmethod
+    def _write_arrow(f, table: pa.Table) -> None:
+        # Uncompressed IPC so reads can be memory-mapped without decoding
+        with pa.ipc.new_file(f, table.schema) as writer:
+            writer.write_table(table)
+
+    @staticmethod
+    def _atomic_write(path: str, write) -> None:
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        try:
+            with open(tmp_path, 'wb') as f:
+                write(f)
+            os.replace(tmp_path, path)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    def _evict_over_budget(self, keep: str) -> None:
+        """Delete least recently used files until the directory fits max_bytes."""
+        entries = [
+            (entry.stat().st_mtime, entry.stat().st_size, entry.path) for entry in self._scan()
+        ]
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            if path == keep:
+                continue
+            self._unlink(path)
+            total -= size
+            self.logger.info(
+                f"Evicted disk cache file {os.path.basename(path)} ({size / 1024 / 1024:.1f} MB)"
+            )
+
+    def _scan(self) -> list:
+        return [
+            entry for entry in os.scandir(self.cache_dir)
+            if entry.is_file() and entry.name.endswith((ARROW_SUFFIX, PICKLE_SUFFIX))
+        ]
+
+    def _base_path(self, key: str) -> str:
+        # Keys contain table names and custom suffixes; hash them into safe file names
+        return os.path.join(self.cache_dir, hashlib.sha1(key.encode('utf-8')).hexdigest())
+
+    def _find_file(self, key: str) -> Optional[str]:
+        base = self._base_path(key)
+        for suffix in (ARROW_SUFFIX, PICKLE_SUFFIX):
+            if os.path.exists(base + suffix):
+                return base + suffix
+        return None
+
+    def _remove_files(self, key: str) -> None:
+        base = self._base_path(key)
+        for suffix in (ARROW_SUFFIX, PICKLE_SUFFIX):
+            self._unlink(base + suffix)
+
+    @staticmethod
+    def _unlink(path: str) -> None:
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+
+    def _wait_for_write(self, key: str) -> None:
+        with self._lock:
+            future = self._pending.get(key)
+        if future is not None:
+            future.result()
+
+    def _clear_pending(self, key: str, future: Future) -> None:
+        with self._lock:
+            if self._pending.get(key) is future:
+                del self._pending[key]
+        if future.exception():
+            self.logger.error(f"Failed to write cache file for '{key}': {future.exception()}")
+
+
+class TieredCacheProvider(CacheProvider):
+    """
+    Two-level cache: a memory provider in front of a disk provider.
+
+    Reads check memory first and promote disk hits into memory. Writes go
+    to both tiers. Expiry times are tracked here for the memory tier, which
+    may not support ttl itself (e.g. the Streamlit session cache).
+
+    The disk tier is shared by every session of the process, so delete()
+    and clear() only remove disk entries this provider wrote; entries of
+    other sessions are left to the disk tier's ttl and size limit.
+    """
+
+    def __init__(self, memory: CacheProvider, disk: CacheProvider):
+        """
+        Args:
+            memory: Fast provider (e.g. InMemoryCacheProvider, StreamlitCacheProvider)
+            disk: Persistent provider (e.g. DiskCacheProvider)
+        """
+        self.memory = memory
+        self.disk = disk
+        self._expires_at: dict[str, float] = {}
+        # Disk entries written through this provider
+        self._owned_keys: set[str] = set()
+
+    def get(self, key: str) -> Optional[Any]:
+        if self._expire(key):
+            return None
+
+        value = self.memory.get(key)
+        if value is not None:
+            return value
+
+        value = self.disk.get(key)
+        if value is not None:
+            self.memory.set(key, value)
+            expires_at = None
+            if isinstance(self.disk, DiskCacheProvider):
+                expires_at = self.disk.expires_at(key)
+            if expires_at is not None:
+                self._expires_at[key] = expires_at
+        return value
+
+    def set(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
+        self.memory.set(key, value, ttl)
+        self.disk.set(key, value, ttl)
+        self._owned_keys.add(key)
+        if ttl:
+            self._expires_at[key] = time.time() + ttl
+        else:
+            self._expires_at.pop(key, None)
+
+    def delete(self, key: str) -> None:
+        self.memory.delete(key)
+        if key in self._owned_keys:
+            self._owned_keys.discard(key)
+            self.disk.delete(key)
+        self._expires_at.pop(key, None)
+
+    def clear(self) -> None:
+        self.memory.clear()
+        for key in self._owned_keys:
+            self.disk.delete(key)
+        self._owned_keys.clear()
+        self._expires_at.clear()
+
+    def evict(self, key: str) -> None:
+        # Memory pressure only: the disk copy serves the next read
+        self.memory.delete(key)
+        self._expires_at.pop(key, None)
+
+    def has(self, key: str) -> bool:
+        if self._expire(key):
+            return False
+        return self.memory.has(key) or self.disk.has(key)
+
+    def _expire(self, key: str) -> bool:
+        """Drop an expired entry from both tiers; returns True if it had expired."""
+        expires_at = self._expires_at.get(key)
+        if expires_at is None or time.time() < expires_at:
+            return False
+        self.delete(key)
+        return True
+
+
+_disk_cache_providers: dict[str, DiskCacheProvider] = {}
+_disk_cache_lock = threading.Lock()
+
+
+def get_disk_cache_provider(config: Config) -> DiskCacheProvider:
+    """
+    Get or create the disk tier for the configured directory.
+
+    The tier is shared by every session of the process so its writes go
+    through one background thread and its size limit covers all of them.
+
+    Args:
+        config: Application configuration (query_disk_cache_* settings)
+
+    Returns:
+        DiskCacheProvider instance
+    """
+    path = os.path.abspath(config.query_disk_cache_path)
+    with _disk_cache_lock:
+        provider = _disk_cache_providers.get(path)
+        if provider is None:
+            provider = DiskCacheProvider.from_config(config)
+            _disk_cache_providers[path] = provider
+        return provider
+
+
+def create_query_cache_provider(config: Config, memory: CacheProvider) -> CacheProvider:
+    """
+    Build the cache provider for query results.
+
+    Args:
+        config: Application configuration; QUERY_DISK_CACHE_MAX_MB=0 disables the disk tier
+        memory: Memory provider of the session (e.g. StreamlitCacheProvider)
+
+    Returns:
+        TieredCacheProvider over the shared disk tier, or ``memory`` alone when disabled
+    """
+    if config.query_disk_cache_max_mb <= 0:
+        return memory
+    return TieredCacheProvider(memory, get_disk_cache_provider(config))
@@ -5,6 +5,9 @@ This module provides the main business logic for querying data with
 caching, incremental loading, and type conversion.
 """
 
+import hashlib
+import json
+
 import pandas as pd
 from dataclasses import dataclass
 from datetime import datetime
@@ -20,6 +23,8 @@ from oracle_duckdb_sync.data.query_executor import QueryExecutor
 from oracle_duckdb_sync.data.type_converter_service import TypeConverterService
 from oracle_duckdb_sync.database.duckdb_source import DuckDBSource
 from oracle_duckdb_sync.log.logger import setup_logger
+from oracle_duckdb_sync.models.sync_log import SyncType
+from oracle_duckdb_sync.repository.sync_log_repo import SyncLogRepository
 
 
 # Set up logger
@@ -62,8 +67,16 @@ class EnhancedQueryService:
     - Caching via QueryCacheManager
 
     It provides a clean, framework-independent API for data queries.
+
+    Cached results are keyed by table, conversion plan and data version, so
+    sessions with different plans share the disk tier without overwriting
+    each other and a resynced table is never served from an old entry.
     """
 
+    # Sync types that may update or replace existing rows; incremental syncs
+    # only append, which the incremental load picks up from the cached frame
+    DATA_VERSION_SYNC_TYPES = (SyncType.FULL, SyncType.UPSERT, SyncType.TEST)
+
     def __init__(
         self,
         duckdb_source: DuckDBSource,
@@ -85,6 +98,10 @@ class EnhancedQueryService:
         self.incremental = incremental_loader
         self.converter = type_converter
         self.logger = service_logger
+        self._sync_logs: Optional[SyncLogRepository] = None
+        # Last conversion plan and cache key used per table
+        self._plans: dict[str, Optional[dict[str, str]]] = {}
+        self._cache_keys: dict[str, str] = {}
 
     def query_with_caching(
         self,
@@ -108,7 +125,8 @@ class EnhancedQueryService:
             table_name: Name of the table to query
             limit: Maximum rows for initial load (ignored for incremental)
             time_column: Timestamp column for incremental loading (optional)
-            selected_conversions: User-selected type conversions (optional)
+            selected_conversions: User-selected type conversions (optional).
+                None reuses the plan last used for the table
 
         Returns:
             QueryServiceResult with data and metadata
@@ -125,9 +143,17 @@ class EnhancedQueryService:
         """
         self.logger.info(f"Query request: table='{table_name}', limit={limit}, time_column={time_column}")
 
-        # Check if we have cached data
-        has_cache = self.cache.has_cache(table_name)
-        metadata = self.cache.get_metadata(table_name) if has_cache else None
+        if selected_conversions is None:
+            selected_conversions = self._plans.get(table_name)
+
+        # Cached data is only reusable for the same conversion plan and data version
+        data_version = self._get_data_version(table_name)
+        cache_key = self._switch_cache_key(table_name, selected_conversions, data_version)
+
+        # Check if we have cached data. Without a time column there is no way
+        # to tell whether rows were added since, so the table is reloaded.
+        has_cache = self.cache.has_cache(table_name, cache_key)
+        metadata = self.cache.get_metadata(table_name, cache_key) if has_cache else None
 
         # Determine if incremental mode is possible
         use_incremental = (
@@ -140,13 +166,88 @@ class EnhancedQueryService:
         if use_incremental:
             self.logger.info(f"Using incremental mode (last_timestamp: {metadata.last_timestamp})")
             return self._perform_incremental_load(
-                table_name, time_column, metadata, selected_conversions
+                table_name, time_column, metadata, selected_conversions, data_version, cache_key
             )
         else:
             self.logger.info("Using initial load mode")
             return self._perform_initial_load(
-                table_name, limit, time_column, selected_conversions
+                table_name, limit, time_column, selected_conversions, data_version, cache_key
+            )
+
+    def _get_data_version(self, table_name: str) -> Optional[str]:
+        """
+        Get the current data version of a table: the sync_id of its last
+        finished full, upsert or test sync in sync_logs.
+
+        Those syncs may update or replace rows (even keeping the row count),
+        so each gets a new version. Incremental syncs only append rows and
+        keep the version, so the cached frame is extended instead of
+        reloaded. Returns None if no such sync of the table is logged.
+        """
+        try:
+            if self._sync_logs is None:
+                if not self.duckdb.table_exists(SyncLogRepository.TABLE_NAME):
+                    return None
+                self._sync_logs = SyncLogRepository(duckdb_source=self.duckdb)
+
+            last_run = self._sync_logs.get_last_finished(
+                table_name, sync_types=self.DATA_VERSION_SYNC_TYPES
+            )
+            return last_run.sync_id if last_run else None
+        except Exception as e:
+            self.logger.warning(f"Could not determine data version of '{table_name}': {e}")
+            return None
+
+    @staticmethod
+    def _cache_key(
+        selected_conversions: Optional[dict[str, str]],
+        data_version: Optional[str]
+    ) -> str:
+        """
+        Build the cache key suffix for a conversion plan and data version.
+
+        Args:
+            selected_conversions: Conversion plan (None is automatic conversion)
+            data_version: Data version of the table (optional)
+
+        Returns:
+            Key suffix, e.g. "3f2a9c01d4e5_<sync_id>"
+        """
+        plan = "auto"
+        if selected_conversions is not None:
+            plan = json.dumps(selected_conversions, sort_keys=True)
+        plan_hash = hashlib.sha1(plan.encode('utf-8')).hexdigest()[:12]
+        return f"{plan_hash}_{data_version or 'unversioned'}"
+
+    def _switch_cache_key(
+        self,
+        table_name: str,
+        selected_conversions: Optional[dict[str, str]],
+        data_version: Optional[str]
+    ) -> str:
+        """
+        Make the key of a plan and data version the table's current cache key.
+
+        The frame cached under a previous key is released from memory; its
+        disk copy stays for other sessions using that plan.
+        """
+        cache_key = self._cache_key(selected_conversions, data_version)
+        previous_key = self._cache_keys.get(table_name)
+        if previous_key is not None and previous_key != cache_key:
+            self.logger.info(
+                f"Conversion plan or data version of '{table_name}' changed, reloading"
             )
+            self.cache.release(table_name, previous_key)
+
+        self._plans[table_name] = selected_conversions
+        self._cache_keys[table_name] = cache_key
+        return cache_key
+
+    def _current_cache_key(self, table_name: str) -> str:
+        """Return the cache key a query of the table would use next."""
+        return self._cache_keys.get(table_name) or self._cache_key(
+            self._plans.get(table_name), self._get_data_version(table_name)
+        )
 
     def query_with_conversion_options(
         self,
@@ -203,7 +304,9 @@ class EnhancedQueryService:
         table_name: str,
         limit: int,
         time_column: Optional[str],
-        selected_conversions: Optional[dict[str, str]]
+        selected_conversions: Optional[dict[str, str]],
+        data_version: Optional[str] = None,
+        cache_key: Optional[str] = None
     ) -> QueryServiceResult:
         """
         Perform initial data load.
@@ -213,6 +316,8 @@ class EnhancedQueryService:
             limit: Maximum rows to load
             time_column: Timestamp column (optional)
             selected_conversions: User-selected conversions (optional)
+            data_version: Current data version of the table (optional)
+            cache_key: Cache key of the plan and data version (optional)
 
         Returns:
             QueryServiceResult with loaded data
@@ -266,9 +371,12 @@ class EnhancedQueryService:
                 last_timestamp=max_timestamp,
                 row_count=len(conversion_result.df_converted),
                 last_update=datetime.now(),
-                selected_conversions=selected_conversions
+                selected_conversions=selected_conversions,
+                data_version=data_version
+            )
+            self.cache.set_cached_data(
+                table_name, conversion_result.df_converted, metadata, cache_key
             )
-            self.cache.set_cached_data(table_name, conversion_result.df_converted, metadata)
 
             self.logger.info(
                 f"Initial load complete: {len(conversion_result.df_converted)} rows, "
@@ -307,7 +415,9 @@ class EnhancedQueryService:
         table_name: str,
         time_column: str,
         metadata: CachedQueryMetadata,
-        selected_conversions: Optional[dict[str, str]]
+        selected_conversions: Optional[dict[str, str]],
+        data_version: Optional[str] = None,
+        cache_key: Optional[str] = None
     ) -> QueryServiceResult:
         """
         Perform incremental data load.
@@ -317,6 +427,8 @@ class EnhancedQueryService:
             time_column: Timestamp column
             metadata: Cached metadata with last_timestamp
             selected_conversions: User-selected conversions (optional)
+            data_version: Current data version of the table (optional)
+            cache_key: Cache key of the plan and data version (optional)
 
         Returns:
             QueryServiceResult with merged data
@@ -333,7 +445,7 @@ class EnhancedQueryService:
             # If no new data, return cached data
             if load_result.row_count == 0:
                 self.logger.info("No new data, returning cached result")
-                cached_df = self.cache.get_cached_data(table_name)
+                cached_df = self.cache.get_cached_data(table_name, cache_key)
 
                 return QueryServiceResult(
                     success=True,
@@ -368,7 +480,7 @@ class EnhancedQueryService:
                 conversion_result.df_converted = df_new
 
             # Merge with cached data
-            cached_df = self.cache.get_cached_data(table_name)
+            cached_df = self.cache.get_cached_data(table_name, cache_key)
             df_merged = self.incremental.merge_with_existing(
                 cached_df, conversion_result.df_converted, time_column
             )
@@ -378,9 +490,10 @@ class EnhancedQueryService:
                 last_timestamp=load_result.max_timestamp,
                 row_count=len(df_merged),
                 last_update=datetime.now(),
-                selected_conversions=selected_conversions
+                selected_conversions=selected_conversions,
+                data_version=data_version
             )
-            self.cache.set_cached_data(table_name, df_merged, new_metadata)
+            self.cache.set_cached_data(table_name, df_merged, new_metadata, cache_key)
 
             self.logger.info(
                 f"Incremental load complete: +{load_result.row_count} new rows, "
@@ -404,7 +517,7 @@ class EnhancedQueryService:
             self.logger.error(f"Traceback:\n{traceback.format_exc()}")
 
             # On error, try to return cached data if available
-            cached_df = self.cache.get_cached_data(table_name)
+            cached_df = self.cache.get_cached_data(table_name, cache_key)
 
             return QueryServiceResult(
                 success=False,
@@ -428,7 +541,12 @@ class EnhancedQueryService:
             >>> service.clear_cache("users")  # Clear specific table
             >>> service.clear_cache()  # Clear all caches
         """
-        self.cache.clear_cache(table_name)
+        if table_name:
+            self.cache.clear_cache(table_name, self._current_cache_key(table_name))
+            self._cache_keys.pop(table_name, None)
+        else:
+            self.cache.clear_cache()
+            self._cache_keys.clear()
         self.logger.info(f"Cache cleared: {table_name or 'all tables'}")
 
     def get_cache_info(self, table_name: str) -> Optional[CachedQueryMetadata]:
@@ -447,4 +565,4 @@ class EnhancedQueryService:
             ...     print(f"Last update: {info.last_update}")
             ...     print(f"Row count: {info.row_count}")
         """
-        return self.cache.get_metadata(table_name)
+        return self.cache.get_metadata(table_name, self._current_cache_key(table_name))
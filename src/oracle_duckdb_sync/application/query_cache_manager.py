@@ -5,18 +5,28 @@ This module provides specialized caching for query results and metadata,
 building on top of the generic CacheProvider interface.
 """
 
-import pandas as pd
-from dataclasses import dataclass, asdict
+import itertools
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
 from datetime import datetime
 from typing import Any, Optional
 
-from oracle_duckdb_sync.application.cache_provider import CacheProvider
-from oracle_duckdb_sync.log.logger import setup_logger
+import pandas as pd
 
+from oracle_duckdb_sync.application.cache_provider import CacheProvider, InMemoryCacheProvider
+from oracle_duckdb_sync.config import Config
+from oracle_duckdb_sync.config.query_constants import QUERY_CONSTANTS
+from oracle_duckdb_sync.log.logger import setup_logger
 
 # Set up logger
 cache_logger = setup_logger('QueryCacheManager')
 
+# Owner ids for managers without a session id (id() can be reused after GC)
+_owner_ids = itertools.count(1)
+
 
 @dataclass
 class CachedQueryMetadata:
@@ -31,12 +41,15 @@ class CachedQueryMetadata:
         last_update: Timestamp when the cache was last updated
         selected_conversions: User-selected type conversions to reapply
         query_params: Original query parameters (for cache validation)
+        data_version: sync_id of the table's last finished sync when the data
+            was cached (used to detect resynced tables)
     """
     last_timestamp: Optional[Any]
     row_count: int
     last_update: datetime
     selected_conversions: Optional[dict[str, str]] = None
     query_params: Optional[dict[str, Any]] = None
+    data_version: Optional[str] = None
 
     def to_dict(self) -> dict:
         """Convert to dictionary for serialization."""
@@ -48,6 +61,187 @@ class CachedQueryMetadata:
         return cls(**data)
 
 
+def estimate_dataframe_bytes(df: pd.DataFrame, sample_rows: int = 10000) -> int:
+    """
+    Estimate the memory held by a DataFrame.
+
+    Equivalent to ``df.memory_usage(deep=True).sum()``, but for large frames
+    string/object columns are measured on an evenly spaced sample and scaled,
+    because a deep scan of millions of Python strings takes seconds.
+
+    Args:
+        df: DataFrame to measure
+        sample_rows: Frames up to this many rows are measured exactly
+
+    Returns:
+        Estimated size in bytes
+    """
+    if len(df) <= sample_rows:
+        return int(df.memory_usage(deep=True).sum())
+
+    shallow = df.memory_usage(deep=False)
+    deep_columns = [
+        col for col in df.columns
+        if pd.api.types.is_object_dtype(df[col].dtype)
+        or pd.api.types.is_string_dtype(df[col].dtype)
+    ]
+    if not deep_columns:
+        return int(shallow.sum())
+
+    step = max(1, len(df) // sample_rows)
+    sample = df[deep_columns].iloc[::step]
+    scale = len(df) / len(sample)
+    deep_bytes = sample.memory_usage(deep=True, index=False).sum() * scale
+    return int(shallow.drop(deep_columns).sum() + deep_bytes)
+
+
+class CacheMemoryBudget:
+    """
+    Process-wide, byte-bounded store of cached DataFrames with LRU eviction.
+
+    Every QueryCacheManager (one per Streamlit session) keeps its cached
+    DataFrames here and only their keys and metadata in its own cache
+    provider, so a few users opening large tables cannot grow the process
+    without bound. When the total exceeds ``max_bytes`` the least recently
+    used frames are dropped, whichever manager owns them; the memory is
+    released right away, even if the owning session stays idle.
+
+    Frames are owned by a session id rather than a manager instance, so a
+    manager rebuilt on a Streamlit rerun keeps serving the session's frames.
+    """
+
+    def __init__(self, max_bytes: int):
+        """
+        Args:
+            max_bytes: Maximum total bytes of cached DataFrames
+        """
+        self.max_bytes = max_bytes
+        # (owner_id, key) -> (frame, bytes, expiry time or None)
+        self._entries: OrderedDict[
+            tuple[str, str], tuple[pd.DataFrame, int, Optional[float]]
+        ] = OrderedDict()
+        self._owner_evictions: dict[str, int] = {}
+        self._total_bytes = 0
+        self._eviction_count = 0
+        self._evicted_bytes = 0
+        self._lock = threading.Lock()
+
+    def add(self, owner: 'QueryCacheManager', key: str, df: pd.DataFrame, nbytes: int,
+            ttl: Optional[int] = None) -> None:
+        """Store (or replace) a frame as most recently used and evict beyond the budget."""
+        entry_id = (owner.owner_id, key)
+        expires_at = time.time() + ttl if ttl else None
+        victims = []
+        with self._lock:
+            self._remove_locked(entry_id)
+            self._entries[entry_id] = (df, nbytes, expires_at)
+            self._total_bytes += nbytes
+
+            while self._total_bytes > self.max_bytes and len(self._entries) > 1:
+                victim_id, (_, victim_bytes, _) = next(iter(self._entries.items()))
+                self._remove_locked(victim_id)
+                self._eviction_count += 1
+                self._evicted_bytes += victim_bytes
+                self._owner_evictions[victim_id[0]] = self._owner_evictions.get(victim_id[0], 0) + 1
+                victims.append(victim_id[1])
+
+        for victim_key in victims:
+            cache_logger.info(f"Evicted '{victim_key}' from cache (memory budget)")
+
+    def get(self, owner: 'QueryCacheManager', key: str) -> Optional[pd.DataFrame]:
+        """Return a frame and mark it as most recently used, or None if not stored."""
+        with self._lock:
+            entry_id = (owner.owner_id, key)
+            if not self._live_locked(entry_id):
+                return None
+            self._entries.move_to_end(entry_id)
+            return self._entries[entry_id][0]
+
+    def has(self, owner: 'QueryCacheManager', key: str) -> bool:
+        """Check whether a frame is stored (without marking it as used)."""
+        with self._lock:
+            return self._live_locked((owner.owner_id, key))
+
+    def discard(self, owner: 'QueryCacheManager', key: Optional[str] = None) -> None:
+        """Drop one frame, or every frame of ``owner`` when key is None."""
+        if key is None:
+            self.release_owner(owner.owner_id)
+            return
+        with self._lock:
+            self._remove_locked((owner.owner_id, key))
+
+    def release_owner(self, owner_id: str) -> None:
+        """Drop every frame and counter of an owner (also called when it is garbage collected)."""
+        with self._lock:
+            for entry_id in [entry_id for entry_id in self._entries if entry_id[0] == owner_id]:
+                self._remove_locked(entry_id)
+            self._owner_evictions.pop(owner_id, None)
+
+    def owner_bytes(self, owner: 'QueryCacheManager') -> tuple[int, int]:
+        """Return (entry count, bytes) stored for one owner."""
+        with self._lock:
+            sizes = [
+                entry[1] for (owner_id, _), entry in self._entries.items()
+                if owner_id == owner.owner_id
+            ]
+        return len(sizes), sum(sizes)
+
+    def owner_evictions(self, owner: 'QueryCacheManager') -> int:
+        """Return how many frames of one owner were evicted."""
+        with self._lock:
+            return self._owner_evictions.get(owner.owner_id, 0)
+
+    def get_statistics(self) -> dict[str, Any]:
+        """Return budget usage and eviction counters."""
+        with self._lock:
+            return {
+                'max_bytes': self.max_bytes,
+                'total_bytes': self._total_bytes,
+                'entry_count': len(self._entries),
+                'eviction_count': self._eviction_count,
+                'evicted_bytes': self._evicted_bytes,
+            }
+
+    def _live_locked(self, entry_id: tuple[str, str]) -> bool:
+        """Check an entry exists, dropping it if it has expired."""
+        entry = self._entries.get(entry_id)
+        if entry is None:
+            return False
+        if entry[2] is not None and time.time() >= entry[2]:
+            self._remove_locked(entry_id)
+            return False
+        return True
+
+    def _remove_locked(self, entry_id: tuple[str, str]) -> None:
+        entry = self._entries.pop(entry_id, None)
+        if entry is not None:
+            self._total_bytes -= entry[1]
+
+
+_global_memory_budget: Optional[CacheMemoryBudget] = None
+
+
+def get_cache_memory_budget(max_bytes: Optional[int] = None) -> CacheMemoryBudget:
+    """
+    Get or create the process-wide cache memory budget.
+
+    Args:
+        max_bytes: Budget in bytes (first creation only; defaults to
+            QUERY_CONSTANTS.QUERY_CACHE_MEMORY_BUDGET_MB)
+
+    Returns:
+        CacheMemoryBudget instance
+    """
+    global _global_memory_budget
+
+    if _global_memory_budget is None:
+        if max_bytes is None:
+            max_bytes = QUERY_CONSTANTS.QUERY_CACHE_MEMORY_BUDGET_MB * 1024 * 1024
+        _global_memory_budget = CacheMemoryBudget(max_bytes)
+
+    return _global_memory_budget
+
+
 class QueryCacheManager:
     """
     Manages caching for query results and metadata.
@@ -57,23 +251,75 @@ class QueryCacheManager:
     - Metadata caching for incremental loading
     - Cache invalidation strategies
     - Cache hit/miss tracking
+    - DataFrames held in a process-wide memory budget (LRU eviction)
+
+    The cache provider stores the metadata and, if it has a persistent tier
+    (e.g. TieredCacheProvider), a copy of each DataFrame that survives
+    eviction; it never keeps DataFrames in memory itself.
     """
 
     # Cache key prefixes
     DATA_PREFIX = "query_data"
     METADATA_PREFIX = "query_metadata"
 
-    def __init__(self, cache_provider: CacheProvider):
+    def __init__(
+        self,
+        cache_provider: CacheProvider,
+        memory_budget: Optional[CacheMemoryBudget] = None,
+        session_id: Optional[str] = None
+    ):
         """
         Initialize QueryCacheManager with a cache provider.
 
         Args:
             cache_provider: CacheProvider implementation for actual storage
+            memory_budget: Memory budget shared with other managers.
+                If None, uses the process-wide budget
+            session_id: Stable id of the session owning the cached frames
+                (e.g. kept in st.session_state). Managers created with the same
+                id share their frames. If None, the frames belong to this
+                instance and are released when it is garbage collected
         """
         self.cache = cache_provider
         self.logger = cache_logger
+        self.memory_budget = memory_budget or get_cache_memory_budget()
+        self.owner_id = session_id or f"manager-{next(_owner_ids)}"
         self._hit_count = 0
         self._miss_count = 0
+        self._rejected_count = 0
+        # Evictions reported by the budget before the statistics were last reset
+        self._evictions_at_reset = 0
+        if session_id is None:
+            # Nobody else can reach these frames once the manager is gone
+            weakref.finalize(self, self.memory_budget.release_owner, self.owner_id)
+
+    @classmethod
+    def from_config(
+        cls,
+        config: Config,
+        memory_provider: Optional[CacheProvider] = None,
+        memory_budget: Optional[CacheMemoryBudget] = None,
+        session_id: Optional[str] = None
+    ) -> 'QueryCacheManager':
+        """
+        Create a manager whose results persist in the configured disk tier.
+
+        Args:
+            config: Application configuration (QUERY_DISK_CACHE_* settings)
+            memory_provider: Memory tier of the session. If None, uses InMemoryCacheProvider
+            memory_budget: Memory budget shared with other managers
+            session_id: Stable id of the session owning the cached frames
+
+        Example:
+            >>> manager = QueryCacheManager.from_config(
+            ...     config, StreamlitCacheProvider(), session_id=get_session_cache_id()
+            ... )
+        """
+        # Imported lazily: the disk tier pulls in pyarrow
+        from oracle_duckdb_sync.application.disk_cache_provider import create_query_cache_provider
+
+        provider = create_query_cache_provider(config, memory_provider or InMemoryCacheProvider())
+        return cls(provider, memory_budget=memory_budget, session_id=session_id)
 
     def get_cached_data(self, table_name: str, cache_key: Optional[str] = None) -> Optional[pd.DataFrame]:
         """
@@ -93,7 +339,12 @@ class QueryCacheManager:
             ...     print(f"Cache hit: {len(df)} rows")
         """
         key = self._generate_data_key(table_name, cache_key)
-        df = self.cache.get(key)
+        df = self.memory_budget.get(self, key)
+        if df is None:
+            # Evicted, or written by another process: a persistent tier (e.g. disk) may hold it
+            df = self.cache.get(key)
+            if df is not None:
+                self._store_frame(key, df, estimate_dataframe_bytes(df))
 
         if df is not None:
             self._hit_count += 1
@@ -135,14 +386,24 @@ class QueryCacheManager:
         data_key = self._generate_data_key(table_name, cache_key)
         metadata_key = self._generate_metadata_key(table_name, cache_key)
 
-        # Cache DataFrame
-        self.cache.set(data_key, df, ttl)
+        nbytes = estimate_dataframe_bytes(df)
+        if nbytes > self.memory_budget.max_bytes:
+            # Caching it would evict everything else and still exceed the budget
+            self._rejected_count += 1
+            self._forget(data_key, metadata_key)
+            self.logger.warning(
+                f"Not caching '{table_name}': {nbytes / 1024 / 1024:.1f} MB exceeds the "
+                f"cache memory budget of {self.memory_budget.max_bytes / 1024 / 1024:.1f} MB"
+            )
+            return
 
-        # Cache metadata
+        # Cache DataFrame (persistent tiers keep a copy) and metadata
+        self.cache.set(data_key, df, ttl)
         self.cache.set(metadata_key, metadata, ttl)
+        self._store_frame(data_key, df, nbytes, ttl)
 
         self.logger.info(
-            f"Cached '{table_name}': {len(df)} rows, "
+            f"Cached '{table_name}': {len(df)} rows ({nbytes / 1024 / 1024:.1f} MB), "
             f"last_timestamp={metadata.last_timestamp}"
         )
 
@@ -199,7 +460,7 @@ class QueryCacheManager:
         data_key = self._generate_data_key(table_name, cache_key)
         metadata_key = self._generate_metadata_key(table_name, cache_key)
 
-        has_data = self.cache.has(data_key)
+        has_data = self.memory_budget.has(self, data_key) or self.cache.has(data_key)
         has_metadata = self.cache.has(metadata_key)
 
         return has_data and has_metadata
@@ -214,6 +475,7 @@ class QueryCacheManager:
 
         Args:
             table_name: Optional table name. If None, clears all query caches
+                of this manager (a shared persistent tier keeps other sessions' entries)
             cache_key: Optional custom cache key
 
         Example:
@@ -228,18 +490,36 @@ class QueryCacheManager:
             data_key = self._generate_data_key(table_name, cache_key)
             metadata_key = self._generate_metadata_key(table_name, cache_key)
 
-            self.cache.delete(data_key)
-            self.cache.delete(metadata_key)
+            self._forget(data_key, metadata_key)
 
             self.logger.info(f"Cleared cache for '{table_name}'")
         else:
             # Clear all caches
             self.cache.clear()
+            self.memory_budget.discard(self)
             self.logger.info("Cleared all query caches")
 
         # Reset statistics
         self._hit_count = 0
         self._miss_count = 0
+        self._rejected_count = 0
+        self._evictions_at_reset = self.memory_budget.owner_evictions(self)
+
+    def release(self, table_name: str, cache_key: Optional[str] = None) -> None:
+        """
+        Release a cached entry from memory, keeping any persistent copy.
+
+        Used when a session moves on to another entry of the table (e.g. a
+        different conversion plan) that other sessions may still read.
+
+        Args:
+            table_name: Name of the table
+            cache_key: Optional custom cache key
+        """
+        data_key = self._generate_data_key(table_name, cache_key)
+        self.cache.evict(data_key)
+        self.cache.evict(self._generate_metadata_key(table_name, cache_key))
+        self.memory_budget.discard(self, data_key)
 
     def update_metadata(
         self,
@@ -282,26 +562,50 @@ class QueryCacheManager:
 
     def get_cache_statistics(self) -> dict[str, Any]:
         """
-        Get cache hit/miss statistics.
+        Get cache hit/miss, size and eviction statistics.
 
         Returns:
-            Dictionary with cache statistics
+            Dictionary with cache statistics. ``memory_budget`` holds the
+            process-wide totals shared with other managers.
 
         Example:
             >>> manager = QueryCacheManager(cache_provider)
             >>> stats = manager.get_cache_statistics()
             >>> print(f"Hit rate: {stats['hit_rate']:.2%}")
+            >>> print(f"Cached: {stats['cached_bytes'] / 1024 / 1024:.1f} MB")
         """
         total = self._hit_count + self._miss_count
         hit_rate = self._hit_count / total if total > 0 else 0.0
+        entry_count, cached_bytes = self.memory_budget.owner_bytes(self)
 
         return {
             'hit_count': self._hit_count,
             'miss_count': self._miss_count,
             'total_requests': total,
-            'hit_rate': hit_rate
+            'hit_rate': hit_rate,
+            'entry_count': entry_count,
+            'cached_bytes': cached_bytes,
+            'eviction_count': self.memory_budget.owner_evictions(self) - self._evictions_at_reset,
+            'rejected_count': self._rejected_count,
+            'memory_budget': self.memory_budget.get_statistics()
         }
 
+    def _store_frame(self, data_key: str, df: pd.DataFrame, nbytes: int,
+                     ttl: Optional[int] = None) -> None:
+        """Keep a DataFrame in the memory budget only.
+
+        A memory tier of the provider would hold a second reference the
+        budget cannot release, so it is dropped there; a persistent copy stays.
+        """
+        self.cache.evict(data_key)
+        self.memory_budget.add(self, data_key, df, nbytes, ttl)
+
+    def _forget(self, data_key: str, metadata_key: str) -> None:
+        """Delete an entry from the cache provider and the memory budget."""
+        self.cache.delete(data_key)
+        self.cache.delete(metadata_key)
+        self.memory_budget.discard(self, data_key)
+
     def _generate_data_key(self, table_name: str, custom_key: Optional[str] = None) -> str:
         """
         Generate cache key for DataFrame data.
@@ -5,16 +5,22 @@ This service handles all query-related business logic without
 depending on any UI framework.
 """
 
+from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any, Optional
 
+import numpy as np
 import pandas as pd
 
+from ..config.query_constants import QUERY_CONSTANTS
 from ..data.converter import detect_and_convert_types
+from ..data.query_builder import QueryBuilder
+from ..data.result_stream import ResultStream
 from ..database.duckdb_source import DuckDBSource
 from ..log.logger import setup_logger
 
 if TYPE_CHECKING:
     from ..config.config import Config
+    from ..data.query_profiler import QueryProfiler
 
 logger = setup_logger(__name__)
 
@@ -42,6 +48,21 @@ class QueryResult:
         }
 
 
+@dataclass(frozen=True)
+class PageCursor:
+    """
+    Position in a keyset-paginated table.
+
+    Attributes:
+        values: Sort key values of the boundary row
+        forward: True to read the page after the row, False for the page before it
+        offset: First row of the page, for views paged by OFFSET (None for keyset cursors)
+    """
+    values: tuple
+    forward: bool = True
+    offset: Optional[int] = None
+
+
 class QueryService:
     """
     Application service for data queries.
@@ -49,24 +70,70 @@ class QueryService:
     This service is UI-agnostic and can be used by any presentation layer.
     """
 
-    def __init__(self, duckdb_source: DuckDBSource):
+    def __init__(self,
+                 duckdb_source: DuckDBSource,
+                 connection: Optional[Any] = None,
+                 profiler: Optional['QueryProfiler'] = None):
+        """
+        Args:
+            duckdb_source: DuckDB data source
+            connection: Connection to run queries on instead of the source's own
+                (e.g. a cursor owned by a background query worker)
+            profiler: Records latency and profiles of data queries (None disables)
+        """
         self.duckdb_source = duckdb_source
+        self.connection = connection
+        self.profiler = profiler
         # Using function-based converter from data.converter module
 
+    def _get_connection(self):
+        """Return the connection queries run on."""
+        if self.connection is not None:
+            return self.connection
+        return self.duckdb_source.get_connection()
+
+    def _fetch_df(self,
+                  conn,
+                  query: str,
+                  table_name: str,
+                  source: str,
+                  params: Optional[list] = None) -> pd.DataFrame:
+        """Execute a data query, recording it in the query history when profiling is on."""
+        def run() -> pd.DataFrame:
+            result = conn.execute(query, params) if params else conn.execute(query)
+            return result.df()
+
+        if self.profiler is None:
+            return run()
+
+        with self.profiler.track(conn, query, table_name=table_name, source=source) as record:
+            df = run()
+            record.set_result(df)
+        return df
+
     def get_available_tables(self) -> list[str]:
         """Get list of available tables."""
         try:
-            conn = self.duckdb_source.get_connection()
+            conn = self._get_connection()
             tables = conn.execute("SHOW TABLES").fetchall()
             return [table[0] for table in tables]
         except Exception as e:
             logger.error(f"Failed to get available tables: {e}")
             return []
 
+    def get_table_columns(self, table_name: str) -> list[str]:
+        """Get column names of a table."""
+        try:
+            columns, _ = self._describe_table(self._get_connection(), table_name)
+            return columns
+        except Exception as e:
+            logger.error(f"Failed to get columns for {table_name}: {e}")
+            return []
+
     def get_table_row_count(self, table_name: str) -> int:
         """Get row count for a specific table."""
         try:
-            conn = self.duckdb_source.get_connection()
+            conn = self._get_connection()
             result = conn.execute(f"SELECT COUNT(*) FROM {table_name}").fetchone()
             return result[0] if result else 0
         except Exception as e:
@@ -85,6 +152,12 @@ class QueryService:
             Default table name
         """
         if config.sync_duckdb_table:
+            if config.typed_table_mode:
+                # Prefer the typed copy built at sync time
+                typed_table = f"{config.sync_duckdb_table}{config.typed_table_suffix}"
+                tables = table_list if table_list is not None else self.get_available_tables()
+                if typed_table in tables:
+                    return typed_table
             return config.sync_duckdb_table
 
         if table_list is None:
@@ -112,11 +185,11 @@ class QueryService:
         """
         try:
             # Fetch raw data
-            conn = self.duckdb_source.get_connection()
+            conn = self._get_connection()
             query = f"SELECT * FROM {table_name} LIMIT {limit}"
 
             logger.info(f"Executing query: {query}")
-            df_raw = conn.execute(query).df()
+            df_raw = self._fetch_df(conn, query, table_name, 'QueryService.query_table')
 
             if df_raw is None or len(df_raw) == 0:
                 return QueryResult(
@@ -152,6 +225,213 @@ class QueryService:
                 error=str(e)
             )
 
+    def browse_table(self,
+                     table_name: str,
+                     sort_column: Optional[str] = None,
+                     descending: bool = False,
+                     page_size: int = QUERY_CONSTANTS.DEFAULT_PAGE_SIZE,
+                     cursor: Optional[PageCursor] = None,
+                     key_column: Optional[str] = None) -> QueryResult:
+        """
+        Fetch one page of a table using keyset (seek) pagination.
+
+        Pages are located by the sort key of their boundary row instead of an
+        OFFSET, so any page costs the same as the first one. The sort key is
+        sort_column followed by the table's primary key (or key_column, or
+        DuckDB's rowid) as a tie-breaker. Rows with NULL sort values are
+        not reachable by seeking and should be avoided in sort columns.
+
+        Views have no rowid; without key_column they are paged with
+        LIMIT/OFFSET, ordered by sort_column and then all columns.
+
+        Args:
+            table_name: Name of the table
+            sort_column: Column to sort by (default: the key column)
+            descending: Sort direction
+            page_size: Rows per page
+            cursor: next_cursor/previous_cursor of a previous page (None for the first page)
+            key_column: Unique column used as tie-breaker (default: primary key)
+
+        Returns:
+            QueryResult with the page rows; metadata holds ``next_cursor`` and
+            ``previous_cursor`` (None at either end) and ``sort_columns``
+        """
+        try:
+            conn = self._get_connection()
+            table_columns, primary_key = self._describe_table(conn, table_name)
+
+            for column in (sort_column, key_column):
+                if column is not None and column not in table_columns:
+                    return QueryResult(
+                        success=False,
+                        error=f"Column '{column}' not found in table '{table_name}'"
+                    )
+
+            if not key_column and not primary_key and self._is_view(conn, table_name):
+                return self._browse_view(
+                    conn, table_name, table_columns, sort_column, descending, page_size, cursor
+                )
+
+            key_columns = [key_column] if key_column else (primary_key or ['rowid'])
+            sort_columns = [sort_column] if sort_column else []
+            sort_columns += [column for column in key_columns if column not in sort_columns]
+
+            # Backward pages are read in reverse order and flipped afterwards
+            forward = cursor is None or cursor.forward
+            select_columns = None
+            if 'rowid' in sort_columns:
+                select_columns = ['*', 'rowid']
+
+            query, params = QueryBuilder.build_keyset_query(
+                table_name,
+                sort_columns,
+                descending=descending if forward else not descending,
+                after=cursor.values if cursor else None,
+                limit=page_size + 1,
+                columns=select_columns
+            )
+            logger.info(f"Executing page query: {query}")
+            df_page = self._fetch_df(conn, query, table_name, 'QueryService.browse_table', params)
+
+            has_more = len(df_page) > page_size
+            df_page = df_page.iloc[:page_size]
+            if not forward:
+                df_page = df_page.iloc[::-1]
+            df_page = df_page.reset_index(drop=True)
+
+            next_cursor = previous_cursor = None
+            if not df_page.empty:
+                first = PageCursor(self._row_key(df_page, 0, sort_columns), forward=False)
+                last = PageCursor(
+                    self._row_key(df_page, len(df_page) - 1, sort_columns), forward=True
+                )
+                if forward:
+                    next_cursor = last if has_more else None
+                    previous_cursor = first if cursor is not None else None
+                else:
+                    next_cursor = last
+                    previous_cursor = first if has_more else None
+
+            if 'rowid' in df_page.columns and 'rowid' not in table_columns:
+                df_page = df_page.drop(columns=['rowid'])
+
+            return QueryResult(
+                success=True,
+                data=df_page,
+                metadata={
+                    'row_count': len(df_page),
+                    'table_name': table_name,
+                    'sort_columns': sort_columns,
+                    'descending': descending,
+                    'next_cursor': next_cursor,
+                    'previous_cursor': previous_cursor
+                }
+            )
+
+        except Exception as e:
+            logger.error(f"Page query failed for table {table_name}: {e}")
+            return QueryResult(
+                success=False,
+                error=str(e)
+            )
+
+    def _browse_view(self,
+                     conn,
+                     table_name: str,
+                     table_columns: list[str],
+                     sort_column: Optional[str],
+                     descending: bool,
+                     page_size: int,
+                     cursor: Optional[PageCursor]) -> QueryResult:
+        """Fetch one page of a view by LIMIT/OFFSET (views have no rowid to seek by)."""
+        logger.warning(
+            f"'{table_name}' is a view without a key column; paging by OFFSET, "
+            f"which gets slower on later pages"
+        )
+        sort_columns = [sort_column] if sort_column else []
+        sort_columns += [column for column in table_columns if column not in sort_columns]
+
+        start = (cursor.offset or 0) if cursor is not None else 0
+        query = QueryBuilder.build_offset_page_query(
+            table_name, sort_columns, descending=descending, offset=start, limit=page_size + 1
+        )
+        logger.info(f"Executing page query: {query}")
+        df_page = self._fetch_df(conn, query, table_name, 'QueryService.browse_table')
+
+        has_more = len(df_page) > page_size
+        df_page = df_page.iloc[:page_size].reset_index(drop=True)
+
+        next_cursor = PageCursor((), forward=True, offset=start + page_size) if has_more else None
+        previous_cursor = None
+        if start > 0:
+            previous_cursor = PageCursor((), forward=False, offset=max(0, start - page_size))
+
+        return QueryResult(
+            success=True,
+            data=df_page,
+            metadata={
+                'row_count': len(df_page),
+                'table_name': table_name,
+                'sort_columns': sort_columns,
+                'descending': descending,
+                'next_cursor': next_cursor,
+                'previous_cursor': previous_cursor
+            }
+        )
+
+    @staticmethod
+    def _is_view(conn, table_name: str) -> bool:
+        """True if table_name is a view rather than a base table."""
+        row = conn.execute(
+            "SELECT table_type FROM information_schema.tables WHERE table_name = ?",
+            [table_name.split('.')[-1]]
+        ).fetchone()
+        return row is not None and row[0] == 'VIEW'
+
+    @staticmethod
+    def _describe_table(conn, table_name: str) -> tuple[list[str], list[str]]:
+        """Return (column names, primary key columns) of a table."""
+        rows = conn.execute(f"DESCRIBE {table_name}").fetchall()
+        columns = [row[0] for row in rows]
+        primary_key = [row[0] for row in rows if row[3] == 'PRI']
+        return columns, primary_key
+
+    @staticmethod
+    def _row_key(df: pd.DataFrame, position: int, sort_columns: list[str]) -> tuple:
+        """Sort key values of one row as plain Python values (usable as query parameters)."""
+        values = []
+        for column in sort_columns:
+            value = df[column].iloc[position]
+            values.append(value.item() if isinstance(value, np.generic) else value)
+        return tuple(values)
+
+    def stream_table(self,
+                     table_name: str,
+                     chunk_size: int = QUERY_CONSTANTS.STREAM_CHUNK_SIZE) -> ResultStream:
+        """
+        Open a stream over all rows of a table for page-by-page display.
+
+        The stream runs on its own cursor; the caller closes it.
+
+        Args:
+            table_name: Name of the table
+            chunk_size: Rows per page
+
+        Returns:
+            ResultStream yielding typed DataFrame chunks
+
+        Raises:
+            Exception: If the query cannot be executed
+        """
+        cursor = self._get_connection().cursor()
+        try:
+            logger.info(f"Streaming table {table_name} in chunks of {chunk_size}")
+            cursor.execute(f"SELECT * FROM {table_name}")
+            return ResultStream(cursor, chunk_size)
+        except Exception:
+            cursor.close()
+            raise
+
     def query_table_aggregated(self,
                                table_name: str,
                                time_column: str,
@@ -170,7 +450,7 @@ class QueryService:
             QueryResult with aggregated data
         """
         try:
-            conn = self.duckdb_source.get_connection()
+            conn = self._get_connection()
 
             # Build aggregation query
             agg_cols = ", ".join([
@@ -191,7 +471,7 @@ class QueryService:
             """
 
             logger.info(f"Executing aggregation query with resolution {resolution}")
-            df_agg = conn.execute(query).df()
+            df_agg = self._fetch_df(conn, query, table_name, 'QueryService.query_table_aggregated')
 
             if df_agg is None or len(df_agg) == 0:
                 return QueryResult(
@@ -246,7 +526,7 @@ class QueryService:
                 - error: Error message if failed
         """
         try:
-            conn = self.duckdb_source.get_connection()
+            conn = self._get_connection()
 
             # Auto-detect numeric columns if not provided
             if numeric_cols is None:
@@ -322,7 +602,14 @@ class QueryService:
             logger.info(f"Executing aggregated query with interval '{interval}'")
 
             # Execute query
-            df_aggregated = conn.execute(query).fetchdf()
+            if self.profiler is None:
+                df_aggregated = conn.execute(query).fetchdf()
+            else:
+                source = 'QueryService.query_table_aggregated_legacy'
+                with self.profiler.track(conn, query, table_name=table_name,
+                                         source=source) as record:
+                    df_aggregated = conn.execute(query).fetchdf()
+                    record.set_result(df_aggregated)
 
             if df_aggregated.empty:
                 return {
@@ -7,11 +7,12 @@ depending on any UI framework.
 
 import threading
 from dataclasses import dataclass
-from queue import Queue
 from typing import Any, Callable, Optional
 
 from ..config.config import Config
 from ..log.logger import setup_logger
+from ..metrics import start_metrics_server
+from ..scheduler.progress_bus import ProgressEvent, get_progress_bus
 from ..scheduler.sync_worker import SyncWorker
 from ..state import SyncLock
 
@@ -21,7 +22,7 @@ logger = setup_logger(__name__)
 @dataclass
 class SyncStatus:
     """Encapsulates synchronization status."""
-    state: str  # 'idle', 'running', 'completed', 'error'
+    state: str  # 'idle', 'running', 'completed', 'error', 'stopped'
     progress: Optional[dict[str, Any]] = None
     result: Optional[dict[str, Any]] = None
     error: Optional[dict[str, Any]] = None
@@ -38,11 +39,34 @@ class SyncService:
         self.config = config
         self._current_worker: Optional[SyncWorker] = None
         self._current_lock: Optional[SyncLock] = None
-        self._progress_queue: Optional[Queue] = None
+        self._progress_bus = get_progress_bus(config)
+        self._sync_id: Optional[str] = None
+        self._progress_cursor = -1
         self._status = SyncStatus(state='idle')
+        if config.metrics_port:
+            self._start_metrics_endpoint()
+
+    def _start_metrics_endpoint(self) -> None:
+        """Expose sync metrics for Prometheus scraping (idempotent per port)."""
+        try:
+            start_metrics_server(self.config.metrics_port, host=self.config.metrics_host)
+        except OSError as e:
+            logger.warning(
+                f"Could not start metrics endpoint on port {self.config.metrics_port}: {e}"
+            )
 
     def get_status(self) -> SyncStatus:
-        """Get current synchronization status."""
+        """Get current synchronization status.
+
+        When this service has not started a sync, a sync started elsewhere
+        (e.g. from another UI session) is reported from the progress bus.
+        """
+        if self._status.state == 'idle':
+            active = self._progress_bus.active_sync_ids()
+            if active:
+                latest = self._progress_bus.latest(active[-1])
+                progress = latest.data if latest is not None and latest.type == 'progress' else {}
+                return SyncStatus(state='running', progress=progress)
         return self._status
 
     def start_sync(self,
@@ -83,13 +107,12 @@ class SyncService:
             return False
 
         try:
-            # Create progress queue
-            self._progress_queue = Queue()
-
-            # Create and start worker
+            # Create and start worker (progress is published on the progress bus)
             params = dict(sync_params)
             params.setdefault('oracle_table', table_name)
-            worker = SyncWorker(self.config, params, self._progress_queue)
+            worker = SyncWorker(self.config, params, progress_bus=self._progress_bus)
+            self._sync_id = worker.sync_id
+            self._progress_cursor = -1
             worker.start()
 
             # Store references
@@ -115,72 +138,81 @@ class SyncService:
             return False
 
     def _start_progress_monitoring(self, callback: Callable) -> None:
-        """Start background thread to monitor progress."""
-        def monitor():
-            while self._status.state == 'running':
-                try:
-                    if self._progress_queue and not self._progress_queue.empty():
-                        msg = self._progress_queue.get_nowait()
-
-                        if msg['type'] == 'progress':
-                            self._status.progress = msg['data']
-                        elif msg['type'] == 'complete':
-                            self._status = SyncStatus(
-                                state='completed',
-                                result=msg['data']
-                            )
-                            self._cleanup()
-                            break
-                        elif msg['type'] == 'error':
-                            self._status = SyncStatus(
-                                state='error',
-                                error=msg['data']
-                            )
-                            self._cleanup()
-                            break
+        """Start background thread that follows this sync on the progress bus."""
+        subscription = self._progress_bus.subscribe(self._sync_id)
 
+        def monitor():
+            with subscription:
+                while self._status.state == 'running':
+                    try:
+                        event = subscription.get(timeout=1.0)
+                        if event is None:
+                            continue
+                        self._progress_cursor = event.seq
+                        self._apply_event(event)
                         callback(self._status)
-                except Exception as e:
-                    logger.error(f"Error in progress monitoring: {e}")
+                    except Exception as e:
+                        logger.error(f"Error in progress monitoring: {e}")
 
         thread = threading.Thread(target=monitor, daemon=True)
         thread.start()
 
     def check_and_update_progress(self) -> Optional[dict[str, Any]]:
         """
-        Check for progress updates without blocking.
+        Apply progress updates published since the last check, without blocking.
 
         Returns:
-            Progress data if available, None otherwise
+            Data of the latest update if any, None otherwise
         """
-        if not self._progress_queue or self._progress_queue.empty():
+        if not self._sync_id:
             return None
 
         try:
-            msg = self._progress_queue.get_nowait()
-
-            if msg['type'] == 'progress':
-                self._status.progress = msg['data']
-                return msg['data']
-            elif msg['type'] == 'complete':
-                self._status = SyncStatus(
-                    state='completed',
-                    result=msg['data']
-                )
-                self._cleanup()
-                return msg['data']
-            elif msg['type'] == 'error':
-                self._status = SyncStatus(
-                    state='error',
-                    error=msg['data']
-                )
-                self._cleanup()
-                return msg['data']
+            events, self._progress_cursor = self._progress_bus.read_since(
+                self._sync_id, self._progress_cursor
+            )
+            for event in events:
+                self._apply_event(event)
+            if events:
+                return events[-1].data
         except Exception as e:
             logger.error(f"Error checking progress: {e}")
 
         return None
 
+    def _apply_event(self, event: ProgressEvent) -> None:
+        """Update status from a progress bus event."""
+        if event.type == 'progress':
+            self._status.progress = event.data
+        elif event.type == 'complete':
+            self._status = SyncStatus(
+                state='completed',
+                result=event.data
+            )
+            self._cleanup()
+        elif event.type == 'error':
+            self._status = SyncStatus(
+                state='error',
+                error=self._error_info(event)
+            )
+            self._cleanup()
+        elif event.type == 'stopped':
+            self._status = SyncStatus(
+                state='stopped',
+                result=event.data
+            )
+            self._cleanup()
+
+    def _error_info(self, event: ProgressEvent) -> dict:
+        """Error of a failed sync, with the traceback if this service started it.
+
+        Bus events carry no traceback; it is only kept on the worker.
+        """
+        worker = self._current_worker
+        if worker is not None and worker.sync_id == event.sync_id and worker.error_info:
+            return worker.error_info
+        return event.data
+
     def reset(self) -> None:
         """Reset sync state to idle."""
         self._cleanup()
@@ -193,4 +225,3 @@ class SyncService:
             self._current_lock = None
 
         self._current_worker = None
-        self._progress_queue = None
@@ -1,9 +1,21 @@
 """Authentication and authorization module for Oracle-DuckDB Sync."""
 
 from oracle_duckdb_sync.auth.models import DEFAULT_ROLE_PERMISSIONS, Permission, Role, User, UserRole
-from oracle_duckdb_sync.auth.password import hash_password, is_password_strong, verify_password
+from oracle_duckdb_sync.auth.password import (
+    hash_password,
+    is_password_strong,
+    verify_password,
+    verify_password_limited,
+)
 from oracle_duckdb_sync.auth.repository import RoleRepository, UserRepository
 from oracle_duckdb_sync.auth.service import AuthService
+from oracle_duckdb_sync.auth.session import (
+    SessionClaims,
+    SessionManager,
+    UserSessionCache,
+    get_session_manager,
+    get_user_session_cache,
+)
 
 __all__ = [
     # Models
@@ -15,10 +27,17 @@ __all__ = [
     # Password
     'hash_password',
     'verify_password',
+    'verify_password_limited',
     'is_password_strong',
     # Repository
     'UserRepository',
     'RoleRepository',
     # Service
     'AuthService',
+    # Session
+    'SessionClaims',
+    'SessionManager',
+    'UserSessionCache',
+    'get_session_manager',
+    'get_user_session_cache',
 ]
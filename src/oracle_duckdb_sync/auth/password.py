@@ -4,8 +4,17 @@
 bcrypt를 사용하여 안전하게 비밀번호를 해싱하고 검증합니다.
 """
 
+import threading
+from typing import Optional
+
 import bcrypt
 
+# 동시에 실행할 bcrypt 검증 수 (bcrypt는 해싱 중 GIL을 해제함)
+DEFAULT_PASSWORD_WORKERS = 4
+
+_password_slots: Optional[threading.BoundedSemaphore] = None
+_password_slots_lock = threading.Lock()
+
 
 def hash_password(password: str) -> str:
     """
@@ -48,6 +57,41 @@ def verify_password(password: str, hashed_password: str) -> bool:
         return False
 
 
+def configure_password_concurrency(
+    max_workers: int = DEFAULT_PASSWORD_WORKERS
+) -> threading.BoundedSemaphore:
+    """
+    bcrypt 동시 검증 슬롯 반환 (없으면 생성)
+
+    Args:
+        max_workers: 동시 검증 수 (최초 생성 시에만 적용)
+    """
+    global _password_slots
+
+    with _password_slots_lock:
+        if _password_slots is None:
+            _password_slots = threading.BoundedSemaphore(max(1, max_workers))
+        return _password_slots
+
+
+def verify_password_limited(password: str, hashed_password: str) -> bool:
+    """
+    동시 실행 수를 제한하여 비밀번호 검증
+
+    호출한 스레드에서 검증이 끝날 때까지 블로킹됩니다. 로그인이 몰리면 슬롯 수를 넘는
+    요청은 슬롯이 빌 때까지 대기하므로, bcrypt가 모든 코어를 점유하지 않습니다.
+
+    Args:
+        password: 검증할 평문 비밀번호
+        hashed_password: 저장된 해시된 비밀번호
+
+    Returns:
+        일치 여부 (True/False)
+    """
+    with configure_password_concurrency():
+        return verify_password(password, hashed_password)
+
+
 def is_password_strong(password: str, min_length: int = 8) -> tuple[bool, str]:
     """
     비밀번호 강도 검사
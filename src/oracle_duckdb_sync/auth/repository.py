@@ -8,6 +8,7 @@ from datetime import datetime
 from typing import List, Optional
 
 from oracle_duckdb_sync.auth.models import Role, User, UserRole
+from oracle_duckdb_sync.auth.session import get_user_session_cache
 from oracle_duckdb_sync.config import Config
 from oracle_duckdb_sync.database.duckdb_source import DuckDBSource
 from oracle_duckdb_sync.log.logger import setup_logger
@@ -225,6 +226,7 @@ class UserRepository:
 
         try:
             self.duckdb.conn.execute(update_sql, params)
+            get_user_session_cache().invalidate(user.id)
             self.logger.info(f"Updated user: {user.username}")
             return user
 
@@ -270,6 +272,7 @@ class UserRepository:
 
         try:
             self.duckdb.conn.execute(delete_sql, (user_id,))
+            get_user_session_cache().invalidate(user_id)
             self.logger.info(f"Deleted user id: {user_id}")
             return True
 
@@ -292,6 +295,7 @@ class UserRepository:
 
         try:
             self.duckdb.conn.execute(update_sql, (user_id,))
+            get_user_session_cache().invalidate(user_id)
             self.logger.info(f"Deactivated user id: {user_id}")
 
         except Exception as e:
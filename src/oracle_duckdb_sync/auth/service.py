@@ -7,8 +7,14 @@
 from typing import Optional, Tuple
 
 from oracle_duckdb_sync.auth.models import User, UserRole
-from oracle_duckdb_sync.auth.password import hash_password, is_password_strong, verify_password
+from oracle_duckdb_sync.auth.password import (
+    configure_password_concurrency,
+    hash_password,
+    is_password_strong,
+    verify_password_limited,
+)
 from oracle_duckdb_sync.auth.repository import UserRepository
+from oracle_duckdb_sync.auth.session import get_session_manager, get_user_session_cache
 from oracle_duckdb_sync.config import Config
 from oracle_duckdb_sync.database.duckdb_source import DuckDBSource
 from oracle_duckdb_sync.log.logger import setup_logger
@@ -27,8 +33,23 @@ class AuthService:
             config: 애플리케이션 설정
             duckdb_source: DuckDB 소스 객체
         """
+        if not config and not duckdb_source:
+            raise ValueError("Either config or duckdb_source must be provided")
+
         self.logger = setup_logger('AuthService')
-        self.user_repo = UserRepository(config=config, duckdb_source=duckdb_source)
+        self.config = config
+        self.duckdb_source = duckdb_source
+        self._user_repo: Optional[UserRepository] = None
+        self.sessions = get_session_manager(config)
+        if config is not None:
+            configure_password_concurrency(config.password_hash_workers)
+
+    @property
+    def user_repo(self) -> UserRepository:
+        """사용자 저장소 (세션 캐시로 충분한 rerun은 DB에 연결하지 않도록 지연 생성)"""
+        if self._user_repo is None:
+            self._user_repo = UserRepository(config=self.config, duckdb_source=self.duckdb_source)
+        return self._user_repo
 
     def create_user(
         self,
@@ -100,8 +121,8 @@ class AuthService:
             self.logger.warning(f"Login attempt with inactive user: {username}")
             return False, "비활성화된 계정입니다. 관리자에게 문의하세요.", None
 
-        # 비밀번호 검증
-        if not verify_password(password, user.password_hash):
+        # 비밀번호 검증 (블로킹, 동시 bcrypt 실행 수만 제한)
+        if not verify_password_limited(password, user.password_hash):
             self.logger.warning(f"Failed login attempt for user: {username}")
             return False, "사용자명 또는 비밀번호가 올바르지 않습니다.", None
 
@@ -141,7 +162,7 @@ class AuthService:
             return False, "사용자를 찾을 수 없습니다."
 
         # 기존 비밀번호 확인
-        if not verify_password(old_password, user.password_hash):
+        if not verify_password_limited(old_password, user.password_hash):
             self.logger.warning(f"Password change failed for user {user.username}: wrong old password")
             return False, "기존 비밀번호가 올바르지 않습니다."
 
@@ -246,6 +267,30 @@ class AuthService:
         """모든 사용자 조회"""
         return self.user_repo.get_all(include_inactive=include_inactive)
 
+    def issue_session_token(self, user: User) -> str:
+        """
+        로그인한 사용자의 세션 토큰 발급
+
+        Args:
+            user: 인증된 사용자
+
+        Returns:
+            서명된 세션 토큰 (st.session_state에 저장)
+        """
+        return self.sessions.issue(user)
+
+    def resolve_session(self, token: Optional[str]) -> Optional[User]:
+        """
+        세션 토큰으로 사용자 조회 (캐시 미스 시에만 DB 조회)
+
+        Args:
+            token: 세션 토큰
+
+        Returns:
+            활성 사용자 또는 None
+        """
+        return self.sessions.resolve(token, self.user_repo.get_by_id)
+
     def has_permission(self, user: User, permission: str) -> bool:
         """
         사용자 권한 검사
@@ -257,13 +302,6 @@ class AuthService:
         Returns:
             권한 보유 여부
         """
-        # 관리자는 모든 권한 보유
-        if user.is_admin():
-            return True
-
         # TODO: Role 테이블과 연동하여 세밀한 권한 체크
-        # 현재는 UserRole 기반 간단한 권한 체크
-        from oracle_duckdb_sync.auth.models import DEFAULT_ROLE_PERMISSIONS
-
-        role_permissions = DEFAULT_ROLE_PERMISSIONS.get(user.role, [])
-        return permission in role_permissions
+        # 현재는 UserRole 기반 간단한 권한 체크 (권한 집합은 사용자 캐시에 보관)
+        return get_user_session_cache().has_permission(user, permission)
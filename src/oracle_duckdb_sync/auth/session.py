@@ -0,0 +1,282 @@
+"""
+세션 토큰 및 사용자/권한 캐시
+
+로그인 성공 시 HMAC 서명된 세션 토큰을 발급하고, 이후 Streamlit rerun 마다
+토큰 서명만 검증하여 사용자를 메모리 캐시에서 복원합니다.
+bcrypt 검증과 users 테이블 조회는 로그인 시와 캐시 미스 시에만 수행됩니다.
+
+캐시는 UserRepository.update/deactivate/delete 시 해당 사용자만 무효화되며,
+다른 프로세스에서 변경된 내용도 ttl_seconds 이후에는 DB에서 다시 읽습니다.
+"""
+
+import base64
+import hashlib
+import hmac
+import json
+import secrets
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable, Optional
+
+from oracle_duckdb_sync.auth.models import DEFAULT_ROLE_PERMISSIONS, User
+from oracle_duckdb_sync.log.logger import setup_logger
+
+
+def _b64encode(data: bytes) -> str:
+    return base64.urlsafe_b64encode(data).rstrip(b'=').decode('ascii')
+
+
+def _b64decode(data: str) -> bytes:
+    return base64.urlsafe_b64decode(data + '=' * (-len(data) % 4))
+
+
+@dataclass(frozen=True)
+class SessionClaims:
+    """
+    세션 토큰에 담긴 정보
+
+    Attributes:
+        user_id: 사용자 ID
+        issued_at: 발급 시각 (epoch 초)
+        expires_at: 만료 시각 (epoch 초)
+    """
+    user_id: int
+    issued_at: float
+    expires_at: float
+
+
+@dataclass
+class _CachedUser:
+    user: User
+    permissions: frozenset
+    loaded_at: float
+
+
+class UserSessionCache:
+    """
+    사용자 및 권한 메모리 캐시
+
+    user_id 별로 User 객체와 권한 집합을 보관합니다.
+    """
+
+    def __init__(self, ttl_seconds: float = 300.0, clock: Callable[[], float] = time.monotonic):
+        """
+        Args:
+            ttl_seconds: 캐시 항목을 DB 재조회 없이 신뢰하는 시간 (초)
+            clock: 시간 함수 (단조 증가 초)
+        """
+        self.ttl_seconds = ttl_seconds
+        self.clock = clock
+        self._entries: dict[int, _CachedUser] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, user_id: int) -> Optional[User]:
+        """캐시된 사용자 (없거나 만료되면 None)"""
+        with self._lock:
+            entry = self._entries.get(user_id)
+            if entry is None or self.clock() - entry.loaded_at > self.ttl_seconds:
+                self._entries.pop(user_id, None)
+                self.misses += 1
+                return None
+            self.hits += 1
+            return entry.user
+
+    def put(self, user: User) -> None:
+        """사용자와 역할 권한을 캐시에 저장"""
+        if user.id is None:
+            return
+        permissions = frozenset(DEFAULT_ROLE_PERMISSIONS.get(user.role, []))
+        with self._lock:
+            self._entries[user.id] = _CachedUser(user, permissions, self.clock())
+
+    def permissions(self, user: User) -> frozenset:
+        """사용자의 권한 집합 (캐시에 없으면 역할에서 계산)"""
+        with self._lock:
+            entry = self._entries.get(user.id) if user.id is not None else None
+            if entry is not None and entry.user.role == user.role:
+                return entry.permissions
+        return frozenset(DEFAULT_ROLE_PERMISSIONS.get(user.role, []))
+
+    def has_permission(self, user: User, permission: str) -> bool:
+        """
+        사용자 권한 검사 (DB 조회 없음)
+
+        Args:
+            user: 사용자 객체
+            permission: 검사할 권한
+
+        Returns:
+            권한 보유 여부
+        """
+        # 관리자는 모든 권한 보유
+        if user.is_admin():
+            return True
+        return permission in self.permissions(user)
+
+    def invalidate(self, user_id: Optional[int] = None) -> None:
+        """사용자 한 명 (또는 전체) 캐시 무효화"""
+        with self._lock:
+            if user_id is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(user_id, None)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class SessionManager:
+    """
+    서명된 세션 토큰 발급 및 검증
+
+    토큰 형식은 ``<base64url(JSON claims)>.<base64url(HMAC-SHA256)>`` 입니다.
+
+    Example:
+        >>> manager = SessionManager(secret="...", ttl_seconds=8 * 3600)
+        >>> token = manager.issue(user)
+        >>> user = manager.resolve(token, load_user=auth_service.get_user_by_id)
+    """
+
+    def __init__(
+        self,
+        secret: str = "",
+        ttl_seconds: float = 8 * 3600,
+        cache: Optional[UserSessionCache] = None,
+        clock: Callable[[], float] = time.time
+    ):
+        """
+        Args:
+            secret: 서명 키 (비어 있으면 프로세스마다 임의 생성, 재시작 시 토큰 무효)
+            ttl_seconds: 토큰 유효 시간 (초)
+            cache: 사용자 캐시 (기본값: 전역 캐시)
+            clock: 시간 함수 (epoch 초)
+        """
+        self.logger = setup_logger('SessionManager')
+        self._key = secret.encode('utf-8') if secret else secrets.token_bytes(32)
+        self.ttl_seconds = ttl_seconds
+        self.cache = cache if cache is not None else get_user_session_cache()
+        self.clock = clock
+
+    def issue(self, user: User) -> str:
+        """
+        사용자에 대한 세션 토큰 발급 (사용자를 캐시에 저장)
+
+        Args:
+            user: 인증된 사용자 (id 필수)
+
+        Returns:
+            서명된 세션 토큰
+        """
+        if user.id is None:
+            raise ValueError("User must have an ID to issue a session token")
+
+        now = self.clock()
+        payload = json.dumps(
+            {'uid': user.id, 'iat': now, 'exp': now + self.ttl_seconds},
+            separators=(',', ':')
+        ).encode('utf-8')
+        body = _b64encode(payload)
+        self.cache.put(user)
+        return f"{body}.{self._sign(body)}"
+
+    def verify(self, token: Optional[str]) -> Optional[SessionClaims]:
+        """
+        토큰 서명 및 만료 검증
+
+        Returns:
+            유효하면 SessionClaims, 아니면 None
+        """
+        if not token or token.count('.') != 1:
+            return None
+
+        body, signature = token.split('.')
+        try:
+            body.encode('ascii')
+        except UnicodeEncodeError:
+            return None
+        if not hmac.compare_digest(signature.encode('utf-8'), self._sign(body).encode('ascii')):
+            self.logger.warning("Rejected session token with invalid signature")
+            return None
+
+        try:
+            data = json.loads(_b64decode(body))
+            claims = SessionClaims(int(data['uid']), float(data['iat']), float(data['exp']))
+        except (ValueError, KeyError, TypeError):
+            return None
+
+        if claims.expires_at <= self.clock():
+            return None
+        return claims
+
+    def resolve(
+        self,
+        token: Optional[str],
+        load_user: Callable[[int], Optional[User]]
+    ) -> Optional[User]:
+        """
+        세션 토큰으로 사용자 복원
+
+        캐시에 있으면 DB를 조회하지 않으며, 캐시 미스 시에만 load_user를 호출합니다.
+
+        Args:
+            token: 세션 토큰
+            load_user: user_id로 사용자를 조회하는 함수 (예: AuthService.get_user_by_id)
+
+        Returns:
+            활성 사용자 또는 None (토큰 무효/만료, 사용자 삭제/비활성화)
+        """
+        claims = self.verify(token)
+        if claims is None:
+            return None
+
+        user = self.cache.get(claims.user_id)
+        if user is None:
+            user = load_user(claims.user_id)
+            if user is None or not user.is_active:
+                return None
+            self.cache.put(user)
+        return user
+
+    def _sign(self, body: str) -> str:
+        digest = hmac.new(self._key, body.encode('ascii'), hashlib.sha256).digest()
+        return _b64encode(digest)
+
+
+_global_user_cache: Optional[UserSessionCache] = None
+_global_session_manager: Optional[SessionManager] = None
+_session_lock = threading.Lock()
+
+
+def get_user_session_cache() -> UserSessionCache:
+    """전역 사용자/권한 캐시 반환 (없으면 생성)"""
+    global _global_user_cache
+
+    with _session_lock:
+        if _global_user_cache is None:
+            _global_user_cache = UserSessionCache()
+        return _global_user_cache
+
+
+def get_session_manager(config=None) -> SessionManager:
+    """
+    전역 세션 매니저 반환 (없으면 생성)
+
+    Args:
+        config: 애플리케이션 설정 (session_secret, session_ttl_seconds 사용)
+    """
+    global _global_session_manager
+
+    cache = get_user_session_cache()
+    with _session_lock:
+        if _global_session_manager is None:
+            if config is not None:
+                cache.ttl_seconds = config.user_cache_ttl_seconds
+            _global_session_manager = SessionManager(
+                secret=config.session_secret if config is not None else "",
+                ttl_seconds=config.session_ttl_seconds if config is not None else 8 * 3600,
+                cache=cache
+            )
+        return _global_session_manager
@@ -37,6 +37,11 @@ class Config:
 
     # Progress reporting
     progress_refresh_interval_seconds: float = 0.5
+    # Sync progress log lines are emitted at most this often (0 logs every batch)
+    progress_log_interval_seconds: float = 5.0
+    # Source row estimate for progress/ETA (seconds per COUNT/SAMPLE query, 0 disables)
+    sync_row_estimate_budget_seconds: float = 5.0
+    sync_row_estimate_sample_percent: float = 1.0
 
     # Type detection threshold
     type_detection_threshold: float = 0.9
@@ -48,11 +53,66 @@ class Config:
     # Infinite loop prevention (safety limit: ~100M rows with default batch_size=10000)
     sync_max_iterations: int = 10000
 
+    # Adaptive batch sizing (learned size is persisted per table)
+    adaptive_batch_enabled: bool = False
+    adaptive_batch_min_size: int = 1000
+    adaptive_batch_max_size: int = 100000
+    batch_memory_budget_mb: int = 256
+
+    # Memory governance (0 disables the process budget)
+    sync_memory_budget_mb: int = 0
+    memory_backoff_ratio: float = 0.85
+    # DuckDB settings (derived from sync_memory_budget_mb when empty)
+    duckdb_memory_limit: str = ""
+    duckdb_temp_directory: str = ""
+
+    # Sync metrics (metrics_port 0 disables the Prometheus endpoint)
+    sync_metrics_persist: bool = True
+    metrics_port: int = 0
+    # The endpoint has no authentication: bind to loopback unless exposed on purpose
+    metrics_host: str = "127.0.0.1"
+
+    # Disk cache tier for query results (directory defaults to <state_directory>/query_cache,
+    # query_disk_cache_max_mb 0 disables the tier)
+    query_disk_cache_dir: str = ""
+    query_disk_cache_max_mb: int = 2048
+
+    # Oracle schema catalog cache (seconds before last_ddl_time is re-checked)
+    schema_catalog_ttl_seconds: int = 300
+
+    # Typed view/table per synced table ("" disables, "view" or "table")
+    typed_table_mode: str = ""
+    typed_table_suffix: str = "_typed"
+
+    # Query profiling (records latency, size and DuckDB profiles in query_history)
+    query_profiling_enabled: bool = False
+    query_history_retention_days: int = 30
+
+    # Sync log writes are buffered and flushed by a background thread
+    sync_log_flush_interval_seconds: float = 2.0
+
+    # Sync progress bus (progress updates are coalesced to one per interval per sync)
+    sync_progress_interval_seconds: float = 0.5
+    sync_progress_history_size: int = 200
+
+    # Sync log retention (0 disables; daily rollups outlive raw logs)
+    sync_log_retention_days: int = 90
+    sync_log_rollup_retention_days: int = 730
+    sync_log_retention_interval_hours: int = 24
+
+    # Login sessions (empty secret: random per process, tokens end on restart)
+    session_secret: str = ""
+    session_ttl_seconds: int = 28800
+    user_cache_ttl_seconds: int = 300
+    password_hash_workers: int = 4
+
     # State file paths
     state_directory: str = "./data"
     sync_state_file: str = "sync_state.json"
     schema_mapping_file: str = "schema_mappings.json"
     sync_progress_file: str = "sync_progress.json"
+    batch_size_state_file: str = "batch_sizes.json"
+    typed_table_state_file: str = "typed_tables.json"
 
     @property
     def oracle_full_table_name(self) -> str:
@@ -73,6 +133,23 @@ class Config:
     def sync_progress_path(self) -> str:
         return os.path.join(self.state_directory, self.sync_progress_file)
 
+    @property
+    def batch_size_state_path(self) -> str:
+        return os.path.join(self.state_directory, self.batch_size_state_file)
+
+    @property
+    def typed_table_state_path(self) -> str:
+        return os.path.join(self.state_directory, self.typed_table_state_file)
+
+    @property
+    def query_disk_cache_path(self) -> str:
+        return self.query_disk_cache_dir or os.path.join(self.state_directory, "query_cache")
+
+def _env_flag(name: str, default: str) -> bool:
+    """Read a boolean environment variable ("1", "true" or "yes" enable it)."""
+    return os.getenv(name, default).strip().lower() in ("1", "true", "yes")
+
+
 def load_config(load_dotenv_file: bool = True) -> Config:
     if load_dotenv_file:
         load_dotenv()
@@ -177,6 +254,13 @@ def load_config(load_dotenv_file: bool = True) -> Config:
 
         # Progress reporting
         progress_refresh_interval_seconds=float(os.getenv("PROGRESS_REFRESH_INTERVAL_SECONDS", "0.5")),
+        progress_log_interval_seconds=float(os.getenv("PROGRESS_LOG_INTERVAL_SECONDS", "5.0")),
+        sync_row_estimate_budget_seconds=float(
+            os.getenv("SYNC_ROW_ESTIMATE_BUDGET_SECONDS", "5.0")
+        ),
+        sync_row_estimate_sample_percent=float(
+            os.getenv("SYNC_ROW_ESTIMATE_SAMPLE_PERCENT", "1.0")
+        ),
 
         # Type detection
         type_detection_threshold=float(os.getenv("TYPE_DETECTION_THRESHOLD", "0.9")),
@@ -188,9 +272,59 @@ def load_config(load_dotenv_file: bool = True) -> Config:
         # Infinite loop prevention
         sync_max_iterations=int(os.getenv("SYNC_MAX_ITERATIONS", "10000")),
 
+        # Adaptive batch sizing
+        adaptive_batch_enabled=_env_flag("ADAPTIVE_BATCH_ENABLED", "false"),
+        adaptive_batch_min_size=int(os.getenv("ADAPTIVE_BATCH_MIN_SIZE", "1000")),
+        adaptive_batch_max_size=int(os.getenv("ADAPTIVE_BATCH_MAX_SIZE", "100000")),
+        batch_memory_budget_mb=int(os.getenv("BATCH_MEMORY_BUDGET_MB", "256")),
+
+        # Memory governance
+        sync_memory_budget_mb=int(os.getenv("SYNC_MEMORY_BUDGET_MB", "0")),
+        memory_backoff_ratio=float(os.getenv("MEMORY_BACKOFF_RATIO", "0.85")),
+        duckdb_memory_limit=os.getenv("DUCKDB_MEMORY_LIMIT", ""),
+        duckdb_temp_directory=os.getenv("DUCKDB_TEMP_DIRECTORY", ""),
+
+        # Sync metrics
+        sync_metrics_persist=_env_flag("SYNC_METRICS_PERSIST", "true"),
+        metrics_port=int(os.getenv("METRICS_PORT", "0")),
+        metrics_host=os.getenv("METRICS_HOST", "127.0.0.1"),
+
+        # Disk cache tier
+        query_disk_cache_dir=os.getenv("QUERY_DISK_CACHE_DIR", ""),
+        query_disk_cache_max_mb=int(os.getenv("QUERY_DISK_CACHE_MAX_MB", "2048")),
+
+        # Oracle schema catalog
+        schema_catalog_ttl_seconds=int(os.getenv("SCHEMA_CATALOG_TTL_SECONDS", "300")),
+
+        # Typed tables
+        typed_table_mode=os.getenv("TYPED_TABLE_MODE", "").strip().lower(),
+        typed_table_suffix=os.getenv("TYPED_TABLE_SUFFIX", "_typed"),
+
+        # Query profiling
+        query_profiling_enabled=_env_flag("QUERY_PROFILING_ENABLED", "false"),
+        query_history_retention_days=int(os.getenv("QUERY_HISTORY_RETENTION_DAYS", "30")),
+
+        # Sync log writer / retention
+        sync_log_flush_interval_seconds=float(os.getenv("SYNC_LOG_FLUSH_INTERVAL_SECONDS", "2.0")),
+        sync_log_retention_days=int(os.getenv("SYNC_LOG_RETENTION_DAYS", "90")),
+        sync_log_rollup_retention_days=int(os.getenv("SYNC_LOG_ROLLUP_RETENTION_DAYS", "730")),
+        sync_log_retention_interval_hours=int(os.getenv("SYNC_LOG_RETENTION_INTERVAL_HOURS", "24")),
+
+        # Sync progress bus
+        sync_progress_interval_seconds=float(os.getenv("SYNC_PROGRESS_INTERVAL_SECONDS", "0.5")),
+        sync_progress_history_size=int(os.getenv("SYNC_PROGRESS_HISTORY_SIZE", "200")),
+
+        # Login sessions
+        session_secret=os.getenv("SESSION_SECRET", ""),
+        session_ttl_seconds=int(os.getenv("SESSION_TTL_SECONDS", "28800")),
+        user_cache_ttl_seconds=int(os.getenv("USER_CACHE_TTL_SECONDS", "300")),
+        password_hash_workers=int(os.getenv("PASSWORD_HASH_WORKERS", "4")),
+
         # State file paths
         state_directory=os.getenv("STATE_DIRECTORY", "./data"),
         sync_state_file=os.getenv("SYNC_STATE_FILE", "sync_state.json"),
         schema_mapping_file=os.getenv("SCHEMA_MAPPING_FILE", "schema_mappings.json"),
-        sync_progress_file=os.getenv("SYNC_PROGRESS_FILE", "sync_progress.json")
+        sync_progress_file=os.getenv("SYNC_PROGRESS_FILE", "sync_progress.json"),
+        batch_size_state_file=os.getenv("BATCH_SIZE_STATE_FILE", "batch_sizes.json"),
+        typed_table_state_file=os.getenv("TYPED_TABLE_STATE_FILE", "typed_tables.json")
     )
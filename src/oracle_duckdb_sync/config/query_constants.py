@@ -16,6 +16,9 @@ class QueryConstants:
     DEFAULT_QUERY_LIMIT: int = 100
     """Default number of rows to fetch in queries"""
 
+    DEFAULT_PAGE_SIZE: int = 100
+    """Default number of rows per page when browsing a table"""
+
     # Type detection and conversion
     SAMPLE_SIZE_FOR_TYPE_DETECTION: int = 1000
     """Number of rows to sample for automatic type detection"""
@@ -31,6 +34,24 @@ class QueryConstants:
     INCREMENTAL_FETCH_BATCH_SIZE: int = 10000
     """Batch size for incremental data fetching"""
 
+    PREPARED_STATEMENT_CACHE_SIZE: int = 64
+    """Prepared statements kept per connection (LRU) for parameterized queries"""
+
+    # Streaming results
+    STREAM_CHUNK_SIZE: int = 2048
+    """Rows per chunk of a streamed query result (one DuckDB vector)"""
+
+    # Query result caching
+    QUERY_CACHE_MEMORY_BUDGET_MB: int = 1024
+    """Process-wide memory budget for cached query DataFrames (LRU eviction beyond it)"""
+
+    # Background query execution
+    ASYNC_QUERY_WORKERS: int = 4
+    """Number of worker threads running UI queries in the background"""
+
+    ASYNC_QUERY_POLL_INTERVAL_SECONDS: float = 0.5
+    """How often the UI polls a running query for progress"""
+
 
 # Global instance for easy access
 QUERY_CONSTANTS = QueryConstants()
@@ -11,6 +11,7 @@ from typing import Any, Optional
 
 from oracle_duckdb_sync.data.query_builder import QueryBuilder
 from oracle_duckdb_sync.data.query_executor import QueryExecutor, QueryExecutionError
+from oracle_duckdb_sync.data.sorted_merge import merge_sorted
 from oracle_duckdb_sync.log.logger import setup_logger
 
 
@@ -41,7 +42,7 @@ class IncrementalLoader:
 
     This class provides:
     - Time-based incremental data fetching
-    - DataFrame merging with deduplication
+    - Append-optimised DataFrame merging with deduplication
     - Timestamp tracking for subsequent loads
     """
 
@@ -97,7 +98,7 @@ class IncrementalLoader:
         is_initial_load = last_timestamp is None
 
         # Build incremental query
-        query = QueryBuilder.build_incremental_query(
+        query, params = QueryBuilder.build_incremental_query(
             table_name=table_name,
             time_column=time_column,
             last_timestamp=last_timestamp,
@@ -106,7 +107,7 @@ class IncrementalLoader:
 
         try:
             # Execute query
-            df = self.executor.fetch_to_dataframe(query)
+            df = self.executor.fetch_to_dataframe(query, params or None)
 
             # Extract max timestamp from loaded data
             max_timestamp = None
@@ -140,20 +141,22 @@ class IncrementalLoader:
         self,
         existing_df: Optional[pd.DataFrame],
         new_df: pd.DataFrame,
-        time_column: str
+        time_column: str,
+        unique_columns: Optional[list[str]] = None
     ) -> pd.DataFrame:
         """
         Merge existing DataFrame with newly loaded data.
 
-        The merge operation:
-        1. Concatenates the two DataFrames
-        2. Sorts by timestamp column
-        3. Resets the index
+        The existing DataFrame is kept sorted by time_column, so new rows are
+        appended when they start after the last cached timestamp; otherwise
+        only the overlapping tail is merged (see data.sorted_merge).
 
         Args:
             existing_df: Existing cached DataFrame (can be None or empty)
             new_df: Newly loaded DataFrame
             time_column: Name of the timestamp column for sorting
+            unique_columns: Optional key columns for removing rows that were
+                loaded twice in the overlap window
 
         Returns:
             Merged DataFrame sorted by time_column
@@ -175,21 +178,11 @@ class IncrementalLoader:
             self.logger.info(f"No new data, returning {len(existing_df)} existing rows")
             return existing_df
 
-        # Concatenate DataFrames
-        merged_df = pd.concat([existing_df, new_df], ignore_index=True)
-
-        # Sort by timestamp if column exists
-        if time_column in merged_df.columns:
-            merged_df = merged_df.sort_values(by=time_column).reset_index(drop=True)
-            self.logger.info(
-                f"Merged and sorted by '{time_column}': "
-                f"{len(existing_df)} + {len(new_df)} = {len(merged_df)} rows"
-            )
-        else:
-            self.logger.warning(
-                f"Time column '{time_column}' not found in merged DataFrame. "
-                f"Data will not be sorted."
-            )
+        merged_df = merge_sorted(existing_df, new_df, time_column, unique_columns)
+        self.logger.info(
+            f"Merged by '{time_column}': "
+            f"{len(existing_df)} + {len(new_df)} = {len(merged_df)} rows"
+        )
 
         return merged_df
 
@@ -0,0 +1,187 @@
+"""
+Prepared statement cache for parameterized DuckDB queries.
+
+The DuckDB Python API re-parses and re-plans a statement on every
+``execute(sql, params)`` call. For queries that repeat with different
+values (incremental polling every few seconds) this cache keeps one
+server-side ``PREPARE`` per SQL text and runs it with ``EXECUTE name(...)``,
+rendering the parameters as typed literals so comparisons keep the native
+type of the value (a timestamp stays a TIMESTAMP).
+
+Prepared statements belong to a connection, so a cache is bound to one
+connection; the least recently used statements are DEALLOCATEd when the
+cache is full.
+"""
+
+import datetime
+import math
+import threading
+from collections import OrderedDict
+from decimal import Decimal
+from itertools import count
+from typing import Any, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+from oracle_duckdb_sync.config.query_constants import QUERY_CONSTANTS
+from oracle_duckdb_sync.log.logger import setup_logger
+
+# Set up logger
+statement_logger = setup_logger('PreparedStatementCache')
+
+# Statement names are unique per process so caches never collide on a connection
+_statement_ids = count(1)
+
+
+class UnsupportedParameterError(ValueError):
+    """Raised when a parameter value cannot be rendered as a SQL literal."""
+    pass
+
+
+def to_sql_literal(value: Any) -> str:
+    """
+    Render a parameter value as a typed DuckDB literal.
+
+    Args:
+        value: Python, numpy or pandas scalar
+
+    Returns:
+        SQL literal (e.g. ``TIMESTAMP '2024-01-01 00:00:00'``)
+
+    Raises:
+        UnsupportedParameterError: For values without a literal form
+    """
+    if isinstance(value, np.generic):
+        value = value.item()
+
+    if value is None or value is pd.NaT or value is pd.NA:
+        return "NULL"
+    if isinstance(value, bool):
+        return "TRUE" if value else "FALSE"
+    if isinstance(value, int):
+        return str(value)
+    if isinstance(value, float):
+        if not math.isfinite(value):
+            raise UnsupportedParameterError(f"Non-finite float parameter: {value}")
+        return f"CAST({value!r} AS DOUBLE)"
+    if isinstance(value, Decimal):
+        exponent = value.as_tuple().exponent
+        if not isinstance(exponent, int):
+            raise UnsupportedParameterError(f"Non-finite decimal parameter: {value}")
+        scale = min(max(-exponent, 0), 38)
+        return f"CAST('{value}' AS DECIMAL(38, {scale}))"
+    if isinstance(value, str):
+        return "'" + value.replace("'", "''") + "'"
+    if isinstance(value, datetime.datetime):
+        # pandas Timestamps keep nanoseconds; TIMESTAMP has microsecond precision
+        text = value.strftime('%Y-%m-%d %H:%M:%S.%f')
+        if value.tzinfo is not None:
+            return f"TIMESTAMPTZ '{text}{value.strftime('%z')}'"
+        return f"TIMESTAMP '{text}'"
+    if isinstance(value, datetime.date):
+        return f"DATE '{value.isoformat()}'"
+    raise UnsupportedParameterError(f"Unsupported parameter type: {type(value).__name__}")
+
+
+class PreparedStatementCache:
+    """
+    LRU cache of prepared statements on one DuckDB connection.
+
+    Example:
+        >>> cache = PreparedStatementCache(conn, capacity=64)
+        >>> result = cache.execute("SELECT * FROM logs WHERE ts > ?", [last_ts])
+        >>> df = result.df()
+    """
+
+    def __init__(self, conn, capacity: int = QUERY_CONSTANTS.PREPARED_STATEMENT_CACHE_SIZE):
+        """
+        Args:
+            conn: DuckDB connection the statements are prepared on
+            capacity: Maximum number of prepared statements kept
+        """
+        self.conn = conn
+        self.capacity = capacity
+        self._statements: OrderedDict[str, str] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def execute(self, query: str, params: Sequence[Any]):
+        """
+        Execute a parameterized query through its prepared statement.
+
+        Falls back to a plain ``execute(query, params)`` when a parameter has no
+        literal form or the statement cannot be prepared (e.g. DDL).
+
+        Args:
+            query: SQL with ``?`` placeholders
+            params: Parameter values in placeholder order
+
+        Returns:
+            The connection, positioned on the result (like ``conn.execute``)
+        """
+        try:
+            arguments = ", ".join(to_sql_literal(value) for value in params)
+        except UnsupportedParameterError as e:
+            statement_logger.debug("Executing without prepared statement: %s", e)
+            return self.conn.execute(query, list(params))
+
+        with self._lock:
+            name = self._statements.get(query)
+            if name is not None:
+                self._statements.move_to_end(query)
+                self.hits += 1
+            else:
+                name = self._prepare(query)
+                if name is None:
+                    return self.conn.execute(query, list(params))
+
+            execute_sql = f"EXECUTE {name}({arguments})" if params else f"EXECUTE {name}"
+            try:
+                return self.conn.execute(execute_sql)
+            except Exception:
+                # A failing statement is dropped so a retry prepares it again
+                self._deallocate(query)
+                raise
+
+    def clear(self) -> None:
+        """Deallocate all prepared statements."""
+        with self._lock:
+            for query in list(self._statements):
+                self._deallocate(query)
+
+    def get_statistics(self) -> dict:
+        """Return cache size and hit/miss counts."""
+        return {
+            'size': len(self._statements),
+            'capacity': self.capacity,
+            'hits': self.hits,
+            'misses': self.misses
+        }
+
+    def __len__(self) -> int:
+        return len(self._statements)
+
+    def _prepare(self, query: str) -> Optional[str]:
+        name = f"stmt_{next(_statement_ids)}"
+        try:
+            self.conn.execute(f"PREPARE {name} AS {query}")
+        except Exception as e:
+            statement_logger.debug("Statement cannot be prepared (%s): %s", e, query)
+            return None
+
+        self.misses += 1
+        self._statements[query] = name
+        while len(self._statements) > self.capacity:
+            self._deallocate(next(iter(self._statements)))
+        return name
+
+    def _deallocate(self, query: str) -> None:
+        name = self._statements.pop(query, None)
+        if name is None:
+            return
+        try:
+            self.conn.execute(f"DEALLOCATE {name}")
+        except Exception as e:
+            statement_logger.debug("DEALLOCATE %s failed: %s", name, e)
@@ -6,6 +6,7 @@ table metadata.
 """
 
 # UI dependencies removed - this module is now framework-independent
+import weakref
 from typing import Optional
 
 import pandas as pd
@@ -18,12 +19,26 @@ from oracle_duckdb_sync.data.converter import (
     detect_and_convert_types,
     detect_convertible_columns,
 )
+from oracle_duckdb_sync.data.query_builder import QueryBuilder
+from oracle_duckdb_sync.data.query_executor import QueryExecutor
+from oracle_duckdb_sync.data.sorted_merge import SortedSegments
 from oracle_duckdb_sync.database.duckdb_source import DuckDBSource
 from oracle_duckdb_sync.log.logger import setup_logger
 
 # Set up logger
 query_logger = setup_logger('DataQuery')
 
+# One executor per source, so its prepared statements are reused across reruns
+_executors: "weakref.WeakKeyDictionary[DuckDBSource, QueryExecutor]" = weakref.WeakKeyDictionary()
+
+
+def _get_executor(duckdb: DuckDBSource) -> QueryExecutor:
+    """Return the shared QueryExecutor of a DuckDB source."""
+    executor = _executors.get(duckdb)
+    if executor is None:
+        executor = _executors.setdefault(duckdb, QueryExecutor(duckdb))
+    return executor
+
 
 def get_available_tables(duckdb: DuckDBSource) -> dict:
     """
@@ -146,7 +161,8 @@ def query_duckdb_table(duckdb: DuckDBSource, table_name: str, limit: int = QUERY
             'message': f"실행 쿼리: SELECT * FROM {table_name} LIMIT {limit}"
         })
 
-        data = duckdb.execute(f"SELECT * FROM {table_name} LIMIT {limit}")
+        result = duckdb.conn.execute(f"SELECT * FROM {table_name} LIMIT {limit}")
+        data = result.fetchall()
 
         if not data or len(data) == 0:
             query_logger.warning(f"조회 결과가 없습니다. 테이블 '{table_name}'이(가) 비어있거나 존재하지 않습니다.")
@@ -174,8 +190,7 @@ def query_duckdb_table(duckdb: DuckDBSource, table_name: str, limit: int = QUERY
                 'error': 'No data returned'
             }
 
-        # Get column names from DuckDB
-        result = duckdb.conn.execute(f"SELECT * FROM {table_name} LIMIT 0")
+        # Column names from the same execution
         columns = [desc[0] for desc in result.description]
         df = pd.DataFrame(data, columns=columns)
 
@@ -263,7 +278,8 @@ def _fetch_raw_data(conn, table_name: str, limit: int) -> dict:
     """
     try:
         # Execute query
-        data = conn.execute(f"SELECT * FROM {table_name} LIMIT {limit}").fetchall()
+        result = conn.execute(f"SELECT * FROM {table_name} LIMIT {limit}")
+        data = result.fetchall()
 
         if not data or len(data) == 0:
             return {
@@ -273,8 +289,7 @@ def _fetch_raw_data(conn, table_name: str, limit: int) -> dict:
                 'error': 'No data returned'
             }
 
-        # Get column names
-        result = conn.execute(f"SELECT * FROM {table_name} LIMIT 0")
+        # Column names from the same execution
         columns = [desc[0] for desc in result.description]
 
         return {
@@ -295,12 +310,16 @@ def _fetch_raw_data(conn, table_name: str, limit: int) -> dict:
         }
 
 
-def _fetch_incremental_data(conn, table_name: str, time_column: str, last_timestamp, limit: Optional[int] = None) -> dict:
+def _fetch_incremental_data(duckdb: DuckDBSource, table_name: str, time_column: str, last_timestamp,
+                            limit: Optional[int] = None) -> dict:
     """
     Fetch only new/updated data since the last timestamp.
 
+    The timestamp is bound as a parameter, so it is compared with its native
+    type and each poll reuses the same prepared statement.
+
     Args:
-        conn: DuckDB connection object
+        duckdb: DuckDBSource instance
         table_name: Name of table to query
         time_column: Name of timestamp column for incremental detection
         last_timestamp: Last timestamp from previous query (can be None for initial load)
@@ -310,26 +329,13 @@ def _fetch_incremental_data(conn, table_name: str, time_column: str, last_timest
         Dictionary containing incremental data, columns, max_timestamp, or error
     """
     try:
-        # Build query based on whether we have a previous timestamp
-        if last_timestamp is None:
-            # Initial load - fetch all data
-            if limit:
-                query = f"SELECT * FROM {table_name} ORDER BY {time_column} LIMIT {limit}"
-            else:
-                query = f"SELECT * FROM {table_name} ORDER BY {time_column}"
-        else:
-            # Incremental load - fetch only new data
-            if limit:
-                query = f"SELECT * FROM {table_name} WHERE {time_column} > '{last_timestamp}' ORDER BY {time_column} LIMIT {limit}"
-            else:
-                query = f"SELECT * FROM {table_name} WHERE {time_column} > '{last_timestamp}' ORDER BY {time_column}"
+        # Initial load (no previous timestamp) fetches from the beginning
+        query, params = QueryBuilder.build_incremental_query(
+            table_name, time_column, last_timestamp, limit or None
+        )
 
         query_logger.info(f"Incremental query: {query}")
-        data = conn.execute(query).fetchall()
-
-        # Get column names
-        result = conn.execute(f"SELECT * FROM {table_name} LIMIT 0")
-        columns = [desc[0] for desc in result.description]
+        data, columns = _get_executor(duckdb).fetch_rows(query, params)
 
         # Find max timestamp from fetched data
         max_timestamp = None
@@ -359,34 +365,35 @@ def _fetch_incremental_data(conn, table_name: str, time_column: str, last_timest
         }
 
 
-def _merge_dataframes(existing_df: pd.DataFrame, new_df: pd.DataFrame, time_column: str) -> pd.DataFrame:
+def _merge_dataframes(existing, new_df: pd.DataFrame, time_column: str) -> SortedSegments:
     """
-    Merge existing cached DataFrame with new incremental data.
+    Merge existing cached data with new incremental data.
+
+    The cache is kept as sorted segments, so a refresh neither re-sorts nor
+    copies the rows that are already cached.
 
     Args:
-        existing_df: Existing cached DataFrame (can be None)
+        existing: Cached SortedSegments or DataFrame (can be None)
         new_df: Newly fetched and converted DataFrame
         time_column: Name of timestamp column for sorting
 
     Returns:
-        Merged DataFrame sorted by time_column
+        SortedSegments holding the merged rows sorted by time_column
     """
-    if existing_df is None or existing_df.empty:
-        return new_df
-
-    if new_df is None or new_df.empty:
-        return existing_df
-
-    # Concatenate and sort by timestamp
-    merged_df = pd.concat([existing_df, new_df], ignore_index=True)
+    if isinstance(existing, SortedSegments):
+        segments = existing
+    else:
+        segments = SortedSegments(time_column, existing)
 
-    # Sort by timestamp if column exists
-    if time_column in merged_df.columns:
-        merged_df = merged_df.sort_values(by=time_column).reset_index(drop=True)
+    previous_rows = len(segments)
+    segments.append(new_df)
 
-    query_logger.info(f"Merged DataFrames: {len(existing_df)} + {len(new_df)} = {len(merged_df)} rows")
+    query_logger.info(
+        f"Merged DataFrames: {previous_rows} + {len(new_df) if new_df is not None else 0} = "
+        f"{len(segments)} rows in {segments.segment_count} segments"
+    )
 
-    return merged_df
+    return segments
 
 
 def _detect_conversion_suggestions(df: pd.DataFrame) -> dict:
@@ -478,7 +485,8 @@ def query_duckdb_table_cached(duckdb: DuckDBSource, table_name: str, limit: int
 
     Returns:
         Dictionary containing:
-            - df_converted: Converted DataFrame
+            - df_converted: Converted DataFrame, or SortedSegments after an incremental
+              refresh (use sorted_merge.as_frame where one frame is needed)
             - table_name: Table name
             - type_changes: Dictionary of type conversions applied
             - success: Boolean indicating success
@@ -503,7 +511,9 @@ def query_duckdb_table_cached(duckdb: DuckDBSource, table_name: str, limit: int
         st.info(f"🔄 증분 조회: {table_name} (마지막: {last_timestamp})")
 
         # Fetch only incremental data
-        fetch_result = _fetch_incremental_data(duckdb.conn, table_name, time_column, last_timestamp, limit=None)
+        fetch_result = _fetch_incremental_data(
+            duckdb, table_name, time_column, last_timestamp, limit=None
+        )
 
         if not fetch_result['success']:
             st.error(f"증분 데이터 조회 오류: {fetch_result['error']}")
@@ -551,10 +561,10 @@ def query_duckdb_table_cached(duckdb: DuckDBSource, table_name: str, limit: int
             }
 
         # Merge with existing cache
-        existing_df = st.session_state.converted_data_cache.get(cache_key)
-        df_merged = _merge_dataframes(existing_df, df_new_converted, time_column)
+        existing = st.session_state.converted_data_cache.get(cache_key)
+        df_merged = _merge_dataframes(existing, df_new_converted, time_column)
 
-        # Update cache
+        # Update cache (segments are concatenated only when a caller needs one frame)
         st.session_state.converted_data_cache[cache_key] = df_merged
         st.session_state.cache_metadata[cache_key] = {
             'last_timestamp': fetch_result['max_timestamp'],
@@ -589,7 +599,7 @@ def query_duckdb_table_cached(duckdb: DuckDBSource, table_name: str, limit: int
         # Initial load or non-incremental mode
         if time_column:
             st.info(f"🔍 초기 조회: {table_name} (최대 {limit}행)")
-            fetch_result = _fetch_incremental_data(duckdb.conn, table_name, time_column, None, limit)
+            fetch_result = _fetch_incremental_data(duckdb, table_name, time_column, None, limit)
         else:
             st.info(f"실행 쿼리: SELECT * FROM {table_name} LIMIT {limit}")
             fetch_result = _fetch_raw_data(duckdb.conn, table_name, limit)
@@ -685,7 +695,8 @@ def query_duckdb_table_with_conversion_ui(duckdb: DuckDBSource, table_name: str,
         time_column: Name of timestamp column for incremental detection
 
     Returns:
-        Dictionary containing converted DataFrame and metadata
+        Dictionary containing converted DataFrame (SortedSegments after an
+        incremental refresh, see sorted_merge.as_frame) and metadata
     """
     # Initialize cache structures in session state if needed
     if 'converted_data_cache' not in st.session_state:
@@ -707,7 +718,9 @@ def query_duckdb_table_with_conversion_ui(duckdb: DuckDBSource, table_name: str,
         st.info(f"🔄 증분 조회: {table_name} (마지막: {last_timestamp})")
 
         # Fetch only incremental data
-        fetch_result = _fetch_incremental_data(duckdb.conn, table_name, time_column, last_timestamp, limit=None)
+        fetch_result = _fetch_incremental_data(
+            duckdb, table_name, time_column, last_timestamp, limit=None
+        )
 
         if not fetch_result['success']:
             st.error(f"증분 데이터 조회 오류: {fetch_result['error']}")
@@ -749,10 +762,10 @@ def query_duckdb_table_with_conversion_ui(duckdb: DuckDBSource, table_name: str,
             df_new_converted, _ = detect_and_convert_types(df_new)
 
         # Merge with existing cache
-        existing_df = st.session_state.converted_data_cache.get(cache_key)
-        df_merged = _merge_dataframes(existing_df, df_new_converted, time_column)
+        existing = st.session_state.converted_data_cache.get(cache_key)
+        df_merged = _merge_dataframes(existing, df_new_converted, time_column)
 
-        # Update cache
+        # Update cache (segments are concatenated only when a caller needs one frame)
         st.session_state.converted_data_cache[cache_key] = df_merged
         st.session_state.cache_metadata[cache_key] = {
             'last_timestamp': fetch_result['max_timestamp'],
@@ -789,7 +802,7 @@ def query_duckdb_table_with_conversion_ui(duckdb: DuckDBSource, table_name: str,
         # Initial load - show UI for conversion selection
         if time_column:
             st.info(f"🔍 초기 조회: {table_name} (최대 {limit}행)")
-            fetch_result = _fetch_incremental_data(duckdb.conn, table_name, time_column, None, limit)
+            fetch_result = _fetch_incremental_data(duckdb, table_name, time_column, None, limit)
         else:
             st.info(f"실행 쿼리: SELECT * FROM {table_name} LIMIT {limit}")
             fetch_result = _fetch_raw_data(duckdb.conn, table_name, limit)
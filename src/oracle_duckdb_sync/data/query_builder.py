@@ -6,7 +6,7 @@ without executing them. Separation of query construction from execution
 improves testability and maintainability.
 """
 
-from typing import Optional
+from typing import Any, Optional
 
 
 class QueryBuilder:
@@ -57,11 +57,15 @@ class QueryBuilder:
     def build_incremental_query(
         table_name: str,
         time_column: str,
-        last_timestamp: Optional[str] = None,
+        last_timestamp: Optional[Any] = None,
         limit: Optional[int] = None
-    ) -> str:
+    ) -> tuple[str, list]:
         """
-        Build a query for incremental data loading based on timestamp.
+        Build a parameterized query for incremental data loading based on timestamp.
+
+        The timestamp is bound as a parameter, so it is compared with its
+        native type and the SQL text stays the same between polls (which lets
+        QueryExecutor reuse the prepared statement).
 
         Args:
             table_name: Name of the table to query
@@ -71,26 +75,28 @@ class QueryBuilder:
             limit: Optional row limit
 
         Returns:
-            SQL query string with WHERE clause (if last_timestamp provided)
-            and ORDER BY clause
+            Tuple of (SQL with ``?`` placeholder, parameter list)
 
         Example:
             >>> QueryBuilder.build_incremental_query("logs", "created_at")
-            'SELECT * FROM logs ORDER BY created_at'
+            ('SELECT * FROM logs ORDER BY created_at', [])
 
             >>> QueryBuilder.build_incremental_query(
             ...     "logs", "created_at",
-            ...     last_timestamp="2024-01-01 00:00:00",
+            ...     last_timestamp=datetime(2024, 1, 1),
             ...     limit=1000
             ... )
-            "SELECT * FROM logs WHERE created_at > '2024-01-01 00:00:00' ORDER BY created_at LIMIT 1000"
+            ('SELECT * FROM logs WHERE created_at > ? ORDER BY created_at LIMIT 1000',
+             [datetime(2024, 1, 1)])
         """
         # Build base query
         query = f"SELECT * FROM {table_name}"
+        params: list = []
 
         # Add WHERE clause if last_timestamp is provided
         if last_timestamp is not None:
-            query += f" WHERE {time_column} > '{last_timestamp}'"
+            query += f" WHERE {time_column} > ?"
+            params.append(last_timestamp)
 
         # Always add ORDER BY for incremental loading
         query += f" ORDER BY {time_column}"
@@ -99,7 +105,7 @@ class QueryBuilder:
         if limit is not None:
             query += f" LIMIT {limit}"
 
-        return query
+        return query, params
 
     @staticmethod
     def build_aggregation_query(
@@ -182,3 +188,95 @@ class QueryBuilder:
             'SELECT * FROM users LIMIT 0'
         """
         return f"SELECT * FROM {table_name} LIMIT 0"
+
+    @staticmethod
+    def build_offset_page_query(
+        table_name: str,
+        order_columns: list[str],
+        descending: bool = False,
+        offset: int = 0,
+        limit: int = 100
+    ) -> str:
+        """
+        Build a LIMIT/OFFSET page query.
+
+        Only for relations that cannot be paged by key (views without a
+        unique column): the cost grows with the offset.
+
+        Args:
+            table_name: Name of the table or view to query
+            order_columns: Columns that define a stable row order
+            descending: Sort direction
+            offset: Number of rows to skip
+            limit: Row limit
+
+        Returns:
+            SQL query string
+
+        Example:
+            >>> QueryBuilder.build_offset_page_query("v", ["ts", "id"], offset=200, limit=100)
+            'SELECT * FROM v ORDER BY ts ASC, id ASC LIMIT 100 OFFSET 200'
+        """
+        direction = "DESC" if descending else "ASC"
+        order_by = ", ".join(f"{column} {direction}" for column in order_columns)
+        return (
+            f"SELECT * FROM {table_name} ORDER BY {order_by} "
+            f"LIMIT {int(limit)} OFFSET {int(offset)}"
+        )
+
+    @staticmethod
+    def build_keyset_query(
+        table_name: str,
+        key_columns: list[str],
+        descending: bool = False,
+        after: Optional[tuple] = None,
+        limit: int = 100,
+        columns: Optional[list[str]] = None
+    ) -> tuple[str, list]:
+        """
+        Build a keyset (seek) pagination query with placeholders.
+
+        Rows are ordered by key_columns and, when ``after`` is given, start
+        right after that key. Unlike OFFSET, the cost does not grow with the
+        page number. The redundant bound on the first key column lets DuckDB
+        skip row groups by their min/max statistics.
+
+        Args:
+            table_name: Name of the table to query
+            key_columns: Sort columns; together they must be unique
+            descending: Sort direction
+            after: Key values of the last row of the previous page (optional)
+            limit: Row limit
+            columns: Optional list of column names. If None, selects all columns (*)
+
+        Returns:
+            Tuple of (SQL query string with ``?`` placeholders, parameter list)
+
+        Example:
+            >>> QueryBuilder.build_keyset_query("logs", ["ts", "id"], after=(t, 42), limit=100)
+            ('SELECT * FROM logs WHERE ts >= ? AND ((ts > ?) OR (ts = ? AND id > ?)) '
+             'ORDER BY ts ASC, id ASC LIMIT 100', [t, t, t, 42])
+        """
+        column_str = "*" if columns is None else ", ".join(columns)
+        direction = "DESC" if descending else "ASC"
+        query = f"SELECT {column_str} FROM {table_name}"
+        params: list = []
+
+        if after is not None:
+            op = "<" if descending else ">"
+            bound = "<=" if descending else ">="
+            params.append(after[0])
+
+            # Lexicographic comparison: (k1 > v1) OR (k1 = v1 AND k2 > v2) OR ...
+            alternatives = []
+            for i, column in enumerate(key_columns):
+                terms = [f"{key_columns[j]} = ?" for j in range(i)] + [f"{column} {op} ?"]
+                params.extend(after[:i + 1])
+                alternatives.append(f"({' AND '.join(terms)})")
+
+            query += f" WHERE {key_columns[0]} {bound} ? AND ({' OR '.join(alternatives)})"
+
+        order_by = ", ".join(f"{column} {direction}" for column in key_columns)
+        query += f" ORDER BY {order_by} LIMIT {limit}"
+
+        return query, params
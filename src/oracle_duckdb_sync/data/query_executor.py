@@ -6,8 +6,12 @@ to DataFrames. It separates query execution from query building.
 """
 
 import pandas as pd
-from typing import Optional
+import threading
+from typing import Any, Optional, Sequence
 
+from oracle_duckdb_sync.config.query_constants import QUERY_CONSTANTS
+from oracle_duckdb_sync.data.prepared_statements import PreparedStatementCache
+from oracle_duckdb_sync.data.result_stream import ResultStream
 from oracle_duckdb_sync.database.duckdb_source import DuckDBSource
 from oracle_duckdb_sync.log.logger import setup_logger
 
@@ -26,8 +30,9 @@ class QueryExecutor:
     Executes SQL queries against DuckDB and returns results.
 
     This class handles:
-    - Query execution
+    - Query execution (parameterized queries through a prepared statement cache)
     - Result conversion to DataFrames
+    - Streaming results in typed DataFrame chunks
     - Column metadata extraction
     - Error handling and logging
     """
@@ -41,13 +46,47 @@ class QueryExecutor:
         """
         self.duckdb = duckdb_source
         self.logger = executor_logger
+        self._statements: Optional[PreparedStatementCache] = None
+        self._statements_lock = threading.Lock()
 
-    def fetch_to_dataframe(self, query: str) -> pd.DataFrame:
+    def _execute(self, query: str, params: Optional[Sequence[Any]] = None):
+        """
+        Execute a query on the source connection.
+
+        Parameterized queries run through an LRU cache of prepared statements
+        bound to the current connection, so repeated queries skip parsing and
+        planning. The cache is rebuilt when the source reconnects.
+        """
+        conn = self.duckdb.conn
+        if params is None:
+            return conn.execute(query)
+
+        with self._statements_lock:
+            if self._statements is None or self._statements.conn is not conn:
+                self._statements = PreparedStatementCache(conn)
+            statements = self._statements
+
+        return statements.execute(query, params)
+
+    @staticmethod
+    def _describe(query: str, params: Optional[Sequence[Any]]) -> str:
+        """Log line for an executed query and its parameters."""
+        return f"Executing query: {query}" + (f" with {list(params)}" if params else "")
+
+    def get_statement_cache_statistics(self) -> dict:
+        """Return prepared statement cache statistics (empty until a parameterized query runs)."""
+        if self._statements is None:
+            return {}
+        return self._statements.get_statistics()
+
+    def fetch_to_dataframe(self, query: str,
+                           params: Optional[Sequence[Any]] = None) -> pd.DataFrame:
         """
         Execute a query and return results as a pandas DataFrame.
 
         Args:
-            query: SQL query string to execute
+            query: SQL query string to execute (``?`` placeholders when params are given)
+            params: Optional parameter values for the placeholders
 
         Returns:
             pandas DataFrame with query results
@@ -60,22 +99,24 @@ class QueryExecutor:
             >>> df = executor.fetch_to_dataframe("SELECT * FROM users LIMIT 10")
             >>> print(df.shape)
             (10, 5)
+
+            >>> df = executor.fetch_to_dataframe("SELECT * FROM logs WHERE ts > ?", [last_ts])
         """
         try:
-            self.logger.info(f"Executing query: {query}")
+            self.logger.info(self._describe(query, params))
 
             # Execute query using DuckDB connection
-            data = self.duckdb.conn.execute(query).fetchall()
+            result = self._execute(query, params)
+            data = result.fetchall()
+
+            # Column names come from the same execution
+            columns = [desc[0] for desc in result.description]
 
             if not data or len(data) == 0:
                 self.logger.warning(f"Query returned no data: {query}")
                 # Return empty DataFrame with correct columns
-                columns = self._extract_column_names_from_query(query)
                 return pd.DataFrame(columns=columns)
 
-            # Get column names
-            columns = self._extract_column_names_from_query(query)
-
             # Convert to DataFrame
             df = pd.DataFrame(data, columns=columns)
             self.logger.info(f"Query successful: {len(df)} rows, {len(df.columns)} columns")
@@ -88,6 +129,70 @@ class QueryExecutor:
             self.logger.error(f"Traceback:\n{traceback.format_exc()}")
             raise QueryExecutionError(f"Failed to execute query: {e}") from e
 
+    def fetch_rows(self, query: str,
+                   params: Optional[Sequence[Any]] = None) -> tuple[list, list[str]]:
+        """
+        Execute a query and return its rows as tuples.
+
+        Args:
+            query: SQL query string to execute (``?`` placeholders when params are given)
+            params: Optional parameter values for the placeholders
+
+        Returns:
+            Tuple of (rows, column names)
+
+        Raises:
+            QueryExecutionError: If query execution fails
+        """
+        try:
+            self.logger.info(self._describe(query, params))
+            result = self._execute(query, params)
+            data = result.fetchall()
+            return data, [desc[0] for desc in result.description]
+        except Exception as e:
+            self.logger.error(f"Query execution failed: {e}")
+            raise QueryExecutionError(f"Failed to execute query: {e}") from e
+
+    def stream(self, query: str,
+               chunk_size: int = QUERY_CONSTANTS.STREAM_CHUNK_SIZE) -> ResultStream:
+        """
+        Execute a query and return its rows as a stream of typed DataFrame chunks.
+
+        The query runs on a dedicated cursor, so the stream stays valid while
+        other queries use the main connection. Close the stream when done.
+
+        Args:
+            query: SQL query string to execute
+            chunk_size: Maximum rows per chunk
+
+        Returns:
+            ResultStream over the query result
+
+        Raises:
+            QueryExecutionError: If query execution fails
+
+        Example:
+            >>> executor = QueryExecutor(duckdb_source)
+            >>> with executor.stream("SELECT * FROM logs ORDER BY ts") as stream:
+            ...     first_page = stream.next_chunk()  # rendered right away
+            ...     second_page = stream.next_chunk()  # loaded on demand
+        """
+        cursor = None
+        try:
+            self.logger.info(f"Streaming query: {query}")
+            conn = self.duckdb.conn
+            if conn is None:
+                raise QueryExecutionError("DuckDB connection is closed")
+            cursor = conn.cursor()
+            cursor.execute(query)
+            return ResultStream(cursor, chunk_size)
+
+        except Exception as e:
+            if cursor is not None:
+                cursor.close()
+            self.logger.error(f"Streaming query failed: {e}")
+            raise QueryExecutionError(f"Failed to stream query: {e}") from e
+
     def get_column_names(self, table_name: str) -> list[str]:
         """
         Get column names for a table.
@@ -122,7 +227,8 @@ class QueryExecutor:
             self.logger.error(f"Failed to get column names for table '{table_name}': {e}")
             raise QueryExecutionError(f"Failed to get column names: {e}") from e
 
-    def execute_raw(self, query: str) -> tuple[list[tuple], list[str]]:
+    def execute_raw(self, query: str,
+                    params: Optional[Sequence[Any]] = None) -> tuple[list[tuple], list[str]]:
         """
         Execute a query and return raw data without DataFrame conversion.
 
@@ -130,7 +236,8 @@ class QueryExecutor:
         or when you want to handle the data manually.
 
         Args:
-            query: SQL query string to execute
+            query: SQL query string to execute (``?`` placeholders when params are given)
+            params: Optional parameter values for the placeholders
 
         Returns:
             Tuple of (data rows, column names)
@@ -152,7 +259,7 @@ class QueryExecutor:
             self.logger.info(f"Executing raw query: {query}")
 
             # Execute query
-            result = self.duckdb.conn.execute(query)
+            result = self._execute(query, params)
             data = result.fetchall()
 
             # Extract column names
@@ -198,37 +305,3 @@ class QueryExecutor:
         except Exception as e:
             self.logger.error(f"Failed to count rows in table '{table_name}': {e}")
             raise QueryExecutionError(f"Failed to count rows: {e}") from e
-
-    def _extract_column_names_from_query(self, query: str) -> list[str]:
-        """
-        Extract column names by executing a LIMIT 0 version of the query.
-
-        This is an internal helper method that modifies the query to fetch
-        only column metadata.
-
-        Args:
-            query: Original SQL query
-
-        Returns:
-            List of column names
-
-        Raises:
-            QueryExecutionError: If extraction fails
-        """
-        try:
-            # Remove existing LIMIT clause if present, then add LIMIT 0
-            # This is a simple approach; more robust parsing could be added
-            if "LIMIT" in query.upper():
-                # Replace existing LIMIT with LIMIT 0
-                import re
-                query_no_limit = re.sub(r'\s+LIMIT\s+\d+', '', query, flags=re.IGNORECASE)
-                metadata_query = f"{query_no_limit} LIMIT 0"
-            else:
-                metadata_query = f"{query} LIMIT 0"
-
-            result = self.duckdb.conn.execute(metadata_query)
-            return [desc[0] for desc in result.description]
-
-        except Exception as e:
-            self.logger.error(f"Failed to extract column names from query: {e}")
-            raise QueryExecutionError(f"Failed to extract column names: {e}") from e
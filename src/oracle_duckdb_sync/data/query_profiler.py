@@ -0,0 +1,247 @@
+"""
+Opt-in query profiling for dashboard queries.
+
+QueryProfiler.track() wraps one query execution. It measures latency and
+result size and, with profiling enabled, captures DuckDB's JSON profile of
+the statement (``enable_profiling``). The entry is stored in the
+query_history table together with diagnostic hints (full scans, per-row
+casts, large aggregations without a rollup) for the admin query page.
+"""
+
+import json
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Any, Iterator, Optional
+
+import pandas as pd
+
+from oracle_duckdb_sync.log.logger import setup_logger
+from oracle_duckdb_sync.models.query_history import QueryHistoryEntry
+from oracle_duckdb_sync.repository.query_history_repo import QueryHistoryRepository
+
+# Set up logger
+profiler_logger = setup_logger('QueryProfiler')
+
+# Scans and aggregations below these sizes are not worth a hint
+FULL_SCAN_HINT_ROWS = 100_000
+ROLLUP_HINT_ROWS = 1_000_000
+CAST_MARKERS = ("CAST(", "strptime(", "strftime(")
+
+
+class QueryRecord:
+    """Result size of a tracked query, filled in by the caller."""
+
+    def __init__(self):
+        self.row_count = 0
+        self.result_bytes = 0
+
+    def set_result(self, result: Any) -> None:
+        """Record rows and approximate bytes of a DataFrame or a list of rows."""
+        if isinstance(result, pd.DataFrame):
+            self.row_count = len(result)
+            self.result_bytes = int(result.memory_usage(index=False).sum())
+        elif result is not None:
+            self.row_count = len(result)
+
+
+class QueryProfiler:
+    """
+    Records latency, result size and (optionally) DuckDB profiles of queries.
+
+    Recording never fails a query: errors while profiling or writing the
+    history are logged and ignored.
+
+    Example:
+        >>> profiler = QueryProfiler(QueryHistoryRepository(duckdb_source=duckdb))
+        >>> with profiler.track(conn, query, table_name="logs") as record:
+        ...     df = conn.execute(query).df()
+        ...     record.set_result(df)
+    """
+
+    def __init__(self, history_repo: QueryHistoryRepository, profiling: bool = True):
+        """
+        Args:
+            history_repo: Repository storing the query history
+            profiling: Capture DuckDB's operator profile (otherwise latency and size only)
+        """
+        self.history_repo = history_repo
+        self.profiling = profiling
+        self.logger = profiler_logger
+
+    @classmethod
+    def from_config(cls, config, duckdb_source) -> Optional['QueryProfiler']:
+        """
+        Create a profiler when ``query_profiling_enabled`` is set.
+
+        Args:
+            config: Application configuration
+            duckdb_source: DuckDB source holding the query_history table
+
+        Returns:
+            QueryProfiler, or None when profiling is disabled
+        """
+        if not config.query_profiling_enabled:
+            return None
+        return cls(QueryHistoryRepository(duckdb_source=duckdb_source))
+
+    @contextmanager
+    def track(self,
+              conn,
+              query: str,
+              table_name: Optional[str] = None,
+              source: Optional[str] = None) -> Iterator[QueryRecord]:
+        """
+        Track one query executed on ``conn`` inside the with-block.
+
+        The block must run exactly this query on ``conn`` (the profile of the
+        last statement is captured). Nothing is recorded if the block raises.
+
+        Args:
+            conn: DuckDB connection or cursor the query runs on
+            query: SQL text (stored in the history)
+            table_name: Table the query reads (for per-table statistics)
+            source: Name of the calling component
+        """
+        profiling = self.profiling and self._enable_profiling(conn)
+        record = QueryRecord()
+        started = time.perf_counter()
+        executed_at = datetime.now()
+        try:
+            yield record
+        finally:
+            latency_ms = (time.perf_counter() - started) * 1000
+            profile = self._collect_profile(conn, query) if profiling else None
+
+        self._record(QueryHistoryEntry(
+            query_text=query,
+            executed_at=executed_at,
+            latency_ms=latency_ms,
+            row_count=record.row_count,
+            result_bytes=record.result_bytes,
+            table_name=table_name,
+            source=source,
+            profile=profile
+        ))
+
+    def explain_analyze(self, conn, query: str) -> str:
+        """
+        Run ``EXPLAIN ANALYZE`` for a query (executes it once) and return the plan text.
+
+        Args:
+            conn: DuckDB connection or cursor
+            query: SQL query to analyze
+
+        Returns:
+            Rendered physical plan with per-operator timings
+        """
+        rows = conn.execute(f"EXPLAIN ANALYZE {query}").fetchall()
+        return "\n".join(row[1] for row in rows)
+
+    def _enable_profiling(self, conn) -> bool:
+        if not hasattr(conn, 'get_profiling_information'):
+            # Older DuckDB: only EXPLAIN ANALYZE (on demand from the admin page)
+            return False
+        try:
+            conn.execute("SET enable_profiling = 'no_output'")
+            return True
+        except Exception as e:
+            self.logger.debug("Could not enable profiling: %s", e)
+            return False
+
+    def _collect_profile(self, conn, query: str) -> Optional[dict]:
+        try:
+            info = json.loads(conn.get_profiling_information(format='json'))
+            return summarize_profile(info, query)
+        except Exception as e:
+            self.logger.debug("Could not read query profile: %s", e)
+            return None
+        finally:
+            try:
+                conn.execute("PRAGMA disable_profiling")
+            except Exception:
+                pass
+
+    def _record(self, entry: QueryHistoryEntry) -> None:
+        try:
+            self.history_repo.create(entry)
+        except Exception as e:
+            self.logger.warning(f"Failed to record query history: {e}")
+
+
+def summarize_profile(info: dict, query: Optional[str] = None) -> dict:
+    """
+    Reduce DuckDB's JSON profile to the fields shown on the admin page.
+
+    Args:
+        info: Parsed output of ``get_profiling_information(format='json')``
+        query: SQL text of the profiled query (aliased expressions are not
+            visible in the profile)
+
+    Returns:
+        Dictionary with query totals, a flattened operator list and hints
+    """
+    operators = []
+
+    def walk(node: dict, depth: int) -> None:
+        if node.get('operator_type'):
+            operators.append({
+                'depth': depth,
+                'operator': node.get('operator_name') or node.get('operator_type'),
+                'type': node.get('operator_type'),
+                'seconds': node.get('operator_timing', 0.0),
+                'rows': node.get('operator_cardinality', 0),
+                'rows_scanned': node.get('operator_rows_scanned', 0),
+                'extra_info': node.get('extra_info', {})
+            })
+            depth += 1
+        for child in node.get('children', []):
+            walk(child, depth)
+
+    walk(info, 0)
+
+    summary = {
+        'latency_seconds': info.get('latency'),
+        'cpu_seconds': info.get('cpu_time'),
+        'rows_returned': info.get('rows_returned'),
+        'rows_scanned': info.get('cumulative_rows_scanned'),
+        'peak_buffer_memory': info.get('system_peak_buffer_memory'),
+        'operators': operators
+    }
+    summary['hints'] = detect_hints(summary, query)
+    return summary
+
+
+def detect_hints(summary: dict, query: Optional[str] = None) -> list[str]:
+    """
+    Derive tuning hints from a profile summary.
+
+    - Full scan: a large table scan without pushed-down filters
+    - Per-row cast: CAST/strptime evaluated in an operator or in the query
+    - Missing rollup: a large aggregation that returns few rows
+    """
+    hints = []
+    if query and any(marker.lower() in query.lower() for marker in CAST_MARKERS):
+        hints.append("Per-row cast/parse in query: consider a typed column or view")
+
+    for op in summary['operators']:
+        extra = op['extra_info'] or {}
+        extra_text = json.dumps(extra, default=str)
+
+        full_scan = op['type'] == 'TABLE_SCAN' and not extra.get('Filters')
+        if full_scan and op['rows_scanned'] >= FULL_SCAN_HINT_ROWS:
+            table = str(extra.get('Table', 'table')).split('.')[-1]
+            hints.append(f"Full scan of {table} ({op['rows_scanned']:,} rows)")
+
+        if any(marker in extra_text for marker in CAST_MARKERS):
+            hints.append(f"Per-row cast/parse in {op['operator']}: consider a typed column or view")
+
+        if 'GROUP_BY' in op['type']:
+            scanned = summary.get('rows_scanned') or 0
+            if scanned >= ROLLUP_HINT_ROWS and op['rows'] * 100 < scanned:
+                hints.append(
+                    f"{op['operator']} reduces {scanned:,} rows to {op['rows']:,}: "
+                    "consider a rollup table"
+                )
+
+    return list(dict.fromkeys(hints))
@@ -0,0 +1,106 @@
+"""
+Streaming query results.
+
+A ResultStream wraps one executed DuckDB statement and hands out its rows
+as typed DataFrame chunks read from an Arrow RecordBatchReader, so the first
+page is available as soon as DuckDB produces it instead of after the whole
+result has been materialised. Column names and types come from the cursor
+description of the same execution.
+"""
+
+from collections.abc import Iterator
+from typing import Optional
+
+import pandas as pd
+
+from oracle_duckdb_sync.config.query_constants import QUERY_CONSTANTS
+from oracle_duckdb_sync.log.logger import setup_logger
+
+# Set up logger
+stream_logger = setup_logger('ResultStream')
+
+
+class ResultStream:
+    """
+    Chunked reader over an executed DuckDB statement.
+
+    The stream owns its cursor: keep it open while pages are loaded on
+    demand and close it (or use it as a context manager) when done.
+
+    Example:
+        >>> with executor.stream("SELECT * FROM big_table") as stream:
+        ...     first_page = stream.next_chunk()
+        ...     print(stream.columns, len(first_page))
+    """
+
+    def __init__(self, cursor, chunk_size: int = QUERY_CONSTANTS.STREAM_CHUNK_SIZE):
+        """
+        Args:
+            cursor: DuckDB cursor on which the query has just been executed
+            chunk_size: Maximum rows per chunk
+        """
+        self.cursor = cursor
+        self.chunk_size = chunk_size
+        description = cursor.description or []
+        self.columns: list[str] = [desc[0] for desc in description]
+        self.column_types: dict[str, str] = {desc[0]: str(desc[1]) for desc in description}
+        self.rows_fetched = 0
+        self.exhausted = False
+
+        # to_arrow_reader() replaces fetch_record_batch() in newer DuckDB releases
+        open_reader = getattr(cursor, 'to_arrow_reader', None) or cursor.fetch_record_batch
+        self._reader = open_reader(chunk_size)
+
+    def next_chunk(self) -> Optional[pd.DataFrame]:
+        """
+        Fetch the next chunk.
+
+        Returns:
+            DataFrame with up to chunk_size rows, or None when the result is exhausted
+        """
+        if self.exhausted:
+            return None
+
+        try:
+            batch = self._reader.read_next_batch()
+        except StopIteration:
+            self.exhausted = True
+            stream_logger.debug("Stream exhausted after %d rows", self.rows_fetched)
+            return None
+
+        self.rows_fetched += batch.num_rows
+        return batch.to_pandas()
+
+    def __iter__(self) -> Iterator[pd.DataFrame]:
+        while True:
+            chunk = self.next_chunk()
+            if chunk is None:
+                return
+            yield chunk
+
+    def read_all(self) -> pd.DataFrame:
+        """Read the remaining rows into one DataFrame."""
+        chunks = list(self)
+        if not chunks:
+            return self.empty_frame()
+        if len(chunks) == 1:
+            return chunks[0]
+        return pd.concat(chunks, ignore_index=True)
+
+    def empty_frame(self) -> pd.DataFrame:
+        """Return an empty DataFrame with the result's columns."""
+        return self._reader.schema.empty_table().to_pandas()
+
+    def close(self) -> None:
+        """Release the reader and its cursor."""
+        self.exhausted = True
+        try:
+            self.cursor.close()
+        except Exception as e:
+            stream_logger.debug("Closing stream cursor failed: %s", e)
+
+    def __enter__(self) -> 'ResultStream':
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
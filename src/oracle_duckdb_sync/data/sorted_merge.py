@@ -0,0 +1,264 @@
+"""
+Append-optimised merge of time-ordered DataFrames.
+
+Incremental refreshes fetch rows ``WHERE time_column > last_timestamp ORDER BY
+time_column``, so new rows almost always sort after everything that is
+already cached. This module merges them without re-sorting or copying the
+cached rows:
+
+- SortedSegments keeps a refreshed cache as a list of sorted segments. New
+  rows that start at or after the last cached timestamp become a new segment;
+  nothing that is already cached is copied.
+- Overlap path: only the cached rows at or after the first new timestamp
+  (located by binary search) are merged and sorted together with the new rows.
+- The segments are only concatenated when a caller needs one frame
+  (to_frame); that frame then replaces the segments, so the rows are never
+  held twice. They are also compacted once there are more than
+  ``max_segments`` of them.
+
+The cached rows must already be sorted by ``time_column``. Frames produced by
+this module, and initial loads (which use ``ORDER BY``), keep that invariant.
+"""
+
+from typing import Optional, Union
+
+import pandas as pd
+
+from oracle_duckdb_sync.log.logger import setup_logger
+
+logger = setup_logger('SortedMerge')
+
+DEFAULT_MAX_SEGMENTS = 16
+
+
+class SortedSegments:
+    """
+    Time-ordered rows held as a list of sorted DataFrame segments.
+
+    Every segment is sorted by time_column and ends at or before the first
+    timestamp of the next one, so the concatenation of the segments is sorted.
+
+    Example:
+        >>> segments = SortedSegments('ts', pd.DataFrame({'id': [1, 2], 'ts': [1, 2]}))
+        >>> segments.append(pd.DataFrame({'id': [3], 'ts': [3]})).segment_count
+        2
+        >>> segments.to_frame()['id'].tolist()
+        [1, 2, 3]
+    """
+
+    def __init__(
+        self,
+        time_column: str,
+        df: Optional[pd.DataFrame] = None,
+        max_segments: int = DEFAULT_MAX_SEGMENTS
+    ):
+        """
+        Initialize the segments.
+
+        Args:
+            time_column: Timestamp column the rows are ordered by
+            df: Initial rows, already sorted by time_column (optional)
+            max_segments: Segment count above which the segments are compacted
+        """
+        self.time_column = time_column
+        self.max_segments = max(1, max_segments)
+        self._segments: list[pd.DataFrame] = []
+        if df is not None and not df.empty:
+            self._segments.append(df)
+
+    def __len__(self) -> int:
+        return sum(len(segment) for segment in self._segments)
+
+    @property
+    def segment_count(self) -> int:
+        """Number of segments currently held."""
+        return len(self._segments)
+
+    def append(
+        self,
+        new_df: Optional[pd.DataFrame],
+        unique_columns: Optional[list[str]] = None
+    ) -> 'SortedSegments':
+        """
+        Merge new rows into the segments.
+
+        Cost is proportional to the new rows plus the overlap window; cached
+        rows before the window are neither sorted nor copied.
+
+        Args:
+            new_df: Newly loaded rows (any order)
+            unique_columns: Optional key columns. Duplicates are removed inside
+                the overlap window only (keeping the new row), which covers rows
+                that were fetched twice at the boundary. Use
+                IncrementalLoader.deduplicate for a full pass.
+
+        Returns:
+            self, for chaining
+        """
+        if new_df is None or new_df.empty:
+            return self
+
+        if not self._segments:
+            self._segments.append(new_df)
+            return self
+
+        time_column = self.time_column
+        if time_column not in self._segments[0].columns or time_column not in new_df.columns:
+            logger.warning(
+                f"Time column '{time_column}' not found in merged DataFrame. "
+                f"Data will not be sorted."
+            )
+            self._segments.append(new_df)
+            return self._compact_if_needed()
+
+        if not new_df[time_column].is_monotonic_increasing:
+            new_df = new_df.sort_values(by=time_column, kind='stable')
+
+        first_new = new_df[time_column].iloc[0]
+        if pd.isna(self._segments[-1][time_column].iloc[-1]) or pd.isna(first_new):
+            # Missing timestamps sort last, so the segments cannot be bisected
+            return self._replace(_full_merge(self._concat(), new_df, time_column, unique_columns))
+
+        # Equal timestamps belong to the window only when they may be duplicates
+        side = 'left' if unique_columns else 'right'
+        try:
+            index, split = self._locate(first_new, side)
+        except TypeError:
+            # Incomparable dtypes (e.g. cached datetimes vs. new strings)
+            return self._replace(_full_merge(self._concat(), new_df, time_column, unique_columns))
+
+        if index == len(self._segments):
+            # Sorted-append fast path
+            logger.debug("Appended %d rows after %d cached rows", len(new_df), len(self))
+            self._segments.append(new_df)
+            return self._compact_if_needed()
+
+        head = self._segments[index].iloc[:split]
+        window = [self._segments[index].iloc[split:]] + self._segments[index + 1:]
+        tail = pd.concat(window + [new_df], ignore_index=True)
+        tail = tail.sort_values(by=time_column, kind='stable')
+        if unique_columns:
+            tail = tail.drop_duplicates(subset=unique_columns, keep='last')
+
+        logger.debug(
+            "Merged %d new rows into an overlap window of %d cached rows",
+            len(new_df), sum(len(part) for part in window)
+        )
+        self._segments[index:] = ([head] if not head.empty else []) + [tail]
+        return self._compact_if_needed()
+
+    def to_frame(self) -> pd.DataFrame:
+        """
+        Return all rows as one DataFrame with a fresh RangeIndex.
+
+        The segments are concatenated and replaced by the result, so a
+        second call (until the next append) returns the same frame without
+        copying.
+        """
+        if not self._segments:
+            return pd.DataFrame()
+        return self._replace(self._concat())._segments[0]
+
+    def head(self, n: int = 5) -> pd.DataFrame:
+        """Return the first n rows, concatenating only the segments they span."""
+        parts = []
+        remaining = n
+        for segment in self._segments:
+            if remaining <= 0:
+                break
+            parts.append(segment.iloc[:remaining])
+            remaining -= len(parts[-1])
+        if not parts:
+            return pd.DataFrame()
+        return pd.concat(parts, ignore_index=True)
+
+    def _locate(self, value, side: str) -> tuple[int, int]:
+        """Return (segment index, row offset) of the first cached row in the window."""
+        index = len(self._segments)
+        while index > 0:
+            times = self._segments[index - 1][self.time_column]
+            split = int(times.searchsorted(value, side=side))
+            if split > 0:
+                return (index, 0) if split == len(times) else (index - 1, split)
+            index -= 1
+        return 0, 0
+
+    def _concat(self) -> pd.DataFrame:
+        if len(self._segments) == 1:
+            frame = self._segments[0]
+            index = frame.index
+            if isinstance(index, pd.RangeIndex) and index.start == 0 and index.step == 1:
+                return frame
+            return frame.reset_index(drop=True)
+        return pd.concat(self._segments, ignore_index=True)
+
+    def _replace(self, df: pd.DataFrame) -> 'SortedSegments':
+        self._segments = [df]
+        return self
+
+    def _compact_if_needed(self) -> 'SortedSegments':
+        if len(self._segments) > self.max_segments:
+            logger.debug("Compacting %d segments of %d rows", len(self._segments), len(self))
+            self._replace(self._concat())
+        return self
+
+
+def as_frame(data: Union[pd.DataFrame, SortedSegments, None]) -> Optional[pd.DataFrame]:
+    """Return data as one DataFrame (query results may hold SortedSegments)."""
+    if isinstance(data, SortedSegments):
+        return data.to_frame()
+    return data
+
+
+def merge_sorted(
+    existing_df: Optional[pd.DataFrame],
+    new_df: Optional[pd.DataFrame],
+    time_column: str,
+    unique_columns: Optional[list[str]] = None
+) -> pd.DataFrame:
+    """
+    Merge new rows into a DataFrame sorted by time_column.
+
+    The existing rows are never re-sorted, but the result is one contiguous
+    frame, so they are copied once. Caches that are refreshed repeatedly keep
+    a SortedSegments instead and only copy when the full frame is read.
+
+    Args:
+        existing_df: Cached DataFrame sorted by time_column (can be None or empty)
+        new_df: Newly loaded rows (any order)
+        time_column: Timestamp column the data is ordered by
+        unique_columns: Optional key columns. Duplicates are removed inside the
+            overlap window only (keeping the new row), which covers rows that
+            were fetched twice at the boundary. Use
+            IncrementalLoader.deduplicate for a full pass.
+
+    Returns:
+        Merged DataFrame sorted by time_column with a fresh RangeIndex
+
+    Example:
+        >>> existing = pd.DataFrame({'id': [1, 2], 'ts': [1, 2]})
+        >>> new = pd.DataFrame({'id': [3], 'ts': [3]})
+        >>> merge_sorted(existing, new, 'ts')['id'].tolist()
+        [1, 2, 3]
+    """
+    if existing_df is None or existing_df.empty:
+        return new_df
+
+    if new_df is None or new_df.empty:
+        return existing_df
+
+    return SortedSegments(time_column, existing_df).append(new_df, unique_columns).to_frame()
+
+
+def _full_merge(
+    existing_df: pd.DataFrame,
+    new_df: pd.DataFrame,
+    time_column: str,
+    unique_columns: Optional[list[str]]
+) -> pd.DataFrame:
+    """Concatenate and sort everything (fallback when the fast paths do not apply)."""
+    merged_df = pd.concat([existing_df, new_df], ignore_index=True)
+    merged_df = merged_df.sort_values(by=time_column, kind='stable')
+    if unique_columns:
+        merged_df = merged_df.drop_duplicates(subset=unique_columns, keep='last')
+    return merged_df.reset_index(drop=True)
@@ -0,0 +1,148 @@
+"""AdaptiveBatchSizer - Per-table batch size controller driven by measured throughput"""
+import sys
+from typing import Optional
+
+
+def estimate_row_bytes(rows: list, sample_size: int = 50) -> float:
+    """Estimate the in-memory size of one fetched row.
+
+    Sizes are measured on an evenly spaced sample so the cost stays constant
+    regardless of the batch size.
+
+    Args:
+        rows: List of row tuples as returned by the Oracle cursor
+        sample_size: Maximum number of rows to inspect
+
+    Returns:
+        float: Average bytes per row (0.0 for an empty batch)
+    """
+    if not rows:
+        return 0.0
+
+    step = max(1, len(rows) // sample_size)
+    sample = rows[::step][:sample_size]
+    total = 0
+    for row in sample:
+        total += sys.getsizeof(row)
+        total += sum(sys.getsizeof(value) for value in row)
+    return total / len(sample)
+
+
+class AdaptiveBatchSizer:
+    """Grow or shrink the batch size to maximise rows/second under a memory budget.
+
+    The controller hill-climbs on measured throughput: it keeps moving the
+    batch size in the same direction while throughput improves and reverses
+    when it drops. The size is always capped so that one batch stays below
+    ``memory_budget_bytes`` given the observed bytes per row.
+    """
+
+    def __init__(
+        self,
+        initial_size: int,
+        min_size: int = 1000,
+        max_size: int = 100000,
+        memory_budget_bytes: int = 256 * 1024 * 1024,
+        step_factor: float = 1.5,
+        tolerance: float = 0.05,
+        bytes_per_row: float = 0.0,
+    ):
+        """Initialize AdaptiveBatchSizer
+
+        Args:
+            initial_size: Starting batch size (learned or configured)
+            min_size: Lower bound for the batch size
+            max_size: Upper bound for the batch size
+            memory_budget_bytes: Maximum estimated memory for a single batch
+            step_factor: Multiplicative step used when growing/shrinking
+            tolerance: Relative throughput change treated as noise
+            bytes_per_row: Previously observed bytes per row (0 if unknown)
+        """
+        self.min_size = max(1, min_size)
+        self.max_size = max(self.min_size, max_size)
+        self.memory_budget_bytes = memory_budget_bytes
+        self.step_factor = step_factor
+        self.tolerance = tolerance
+        self.bytes_per_row = bytes_per_row
+
+        self._direction = 1
+        self._last_throughput: Optional[float] = None
+        self.best_throughput = 0.0
+        self.size = self._clamp(initial_size)
+
+    def current_size(self) -> int:
+        """Return the batch size to use for the next fetch."""
+        return self.size
+
+    def memory_cap(self) -> int:
+        """Largest batch size that fits into the memory budget."""
+        if self.bytes_per_row <= 0:
+            return self.max_size
+        return max(self.min_size, int(self.memory_budget_bytes // self.bytes_per_row))
+
+    def _clamp(self, size: int) -> int:
+        upper = min(self.max_size, self.memory_cap())
+        return int(max(self.min_size, min(size, upper)))
+
+    def record(
+        self,
+        rows: int,
+        elapsed: float,
+        row_bytes: float = 0.0,
+        requested: Optional[int] = None
+    ) -> int:
+        """Feed the measurements of a completed batch and compute the next size.
+
+        Partial batches (fewer rows than requested, e.g. the last one) only
+        update the bytes-per-row estimate since their throughput is not
+        comparable.
+
+        Args:
+            rows: Number of rows in the batch
+            elapsed: Seconds spent fetching, converting and inserting the batch
+            row_bytes: Estimated bytes per row for the batch
+            requested: Rows actually requested for the batch, when a caller
+                capped the fetch below current_size() (default: current_size())
+
+        Returns:
+            int: Batch size for the next fetch
+        """
+        if row_bytes > 0:
+            # Exponential moving average keeps a single odd batch from dominating
+            if self.bytes_per_row > 0:
+                self.bytes_per_row = 0.7 * self.bytes_per_row + 0.3 * row_bytes
+            else:
+                self.bytes_per_row = row_bytes
+
+        if rows < (requested or self.size) or elapsed <= 0:
+            self.size = self._clamp(self.size)
+            return self.size
+
+        throughput = rows / elapsed
+        self.best_throughput = max(self.best_throughput, throughput)
+
+        if self._last_throughput is not None:
+            change = (throughput - self._last_throughput) / self._last_throughput
+            if change < -self.tolerance:
+                self._direction = -self._direction
+        self._last_throughput = throughput
+
+        if self._direction > 0:
+            next_size = int(self.size * self.step_factor)
+        else:
+            next_size = int(self.size / self.step_factor)
+
+        clamped = self._clamp(next_size)
+        if clamped == self.size:
+            # Hit a bound - turn around on the next measurement
+            self._direction = -1 if clamped >= self.max_size or clamped >= self.memory_cap() else 1
+        self.size = clamped
+        return self.size
+
+    def to_dict(self) -> dict:
+        """Serializable snapshot used to persist the learned size."""
+        return {
+            "batch_size": self.size,
+            "bytes_per_row": round(self.bytes_per_row, 1),
+            "rows_per_second": round(self.best_throughput, 1),
+        }
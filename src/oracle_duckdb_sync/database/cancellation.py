@@ -0,0 +1,104 @@
+"""Cooperative pause/stop for running syncs.
+
+A CancellationToken is shared between the thread that controls a sync
+(SyncWorker) and the SyncEngine running it. The engine calls checkpoint()
+between fetching and inserting batches:
+
+- while paused, checkpoint() blocks, so no Oracle fetches or DuckDB
+  writes happen until the sync is resumed or stopped
+- once cancelled, checkpoint() raises SyncCancelled, so the sync ends at
+  a batch boundary with every inserted batch committed
+
+cancel() also runs the registered callbacks, which the engine uses to
+interrupt an in-flight Oracle call (connection.cancel()).
+"""
+
+import threading
+from typing import Callable, Optional
+
+# How often a paused checkpoint re-checks for cancellation (seconds)
+PAUSE_POLL_SECONDS = 0.5
+
+
+class SyncCancelled(Exception):
+    """Raised inside the engine when a sync was stopped at a batch boundary."""
+
+
+class CancellationToken:
+    """Pause/resume/stop signal for one sync.
+
+    Example:
+        >>> token = CancellationToken()
+        >>> engine = SyncEngine(config, cancel_token=token)
+        >>> token.pause(); token.resume()
+        >>> token.cancel("stopped by user")  # engine raises SyncCancelled
+    """
+
+    def __init__(self):
+        self._cancelled = threading.Event()
+        self._running = threading.Event()
+        self._running.set()
+        self._callbacks: list[Callable[[], None]] = []
+        self._lock = threading.Lock()
+        self.reason: Optional[str] = None
+
+    @property
+    def is_cancelled(self) -> bool:
+        return self._cancelled.is_set()
+
+    @property
+    def is_paused(self) -> bool:
+        return not self._running.is_set() and not self.is_cancelled
+
+    def pause(self) -> None:
+        """Hold the sync at its next checkpoint."""
+        self._running.clear()
+
+    def resume(self) -> None:
+        """Let a paused sync continue."""
+        self._running.set()
+
+    def cancel(self, reason: str = "Sync stopped") -> None:
+        """Stop the sync at its next checkpoint and interrupt in-flight calls."""
+        with self._lock:
+            if self._cancelled.is_set():
+                return
+            self.reason = reason
+            self._cancelled.set()
+            callbacks = list(self._callbacks)
+        # Wake a paused checkpoint so it can raise
+        self._running.set()
+        for callback in callbacks:
+            try:
+                callback()
+            except Exception:
+                # Interrupting is best effort; the checkpoint still stops the sync
+                pass
+
+    def on_cancel(self, callback: Callable[[], None]) -> Callable[[], None]:
+        """Run callback when the token is cancelled (immediately if it already is).
+
+        Returns:
+            Function that unregisters the callback
+        """
+        with self._lock:
+            cancelled = self._cancelled.is_set()
+            if not cancelled:
+                self._callbacks.append(callback)
+        if cancelled:
+            callback()
+
+        def unregister():
+            with self._lock:
+                if callback in self._callbacks:
+                    self._callbacks.remove(callback)
+
+        return unregister
+
+    def checkpoint(self) -> None:
+        """Block while paused; raise SyncCancelled once cancelled."""
+        while not self._running.wait(PAUSE_POLL_SECONDS):
+            if self.is_cancelled:
+                break
+        if self.is_cancelled:
+            raise SyncCancelled(self.reason or "Sync stopped")
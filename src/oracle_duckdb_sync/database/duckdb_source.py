@@ -1,3 +1,4 @@
+import os
 from pathlib import Path
 from typing import Optional
 
@@ -14,7 +15,32 @@ class DuckDBSource:
         db_path = Path(self.config.duckdb_path)
         db_path.parent.mkdir(parents=True, exist_ok=True)
 
-        self.conn: Optional[duckdb.DuckDBPyConnection] = duckdb.connect(self.config.duckdb_path)
+        conn = duckdb.connect(self.config.duckdb_path)
+        self.conn: Optional[duckdb.DuckDBPyConnection] = conn
+        self._apply_memory_settings(conn)
+
+    def _apply_memory_settings(self, conn: duckdb.DuckDBPyConnection):
+        """Apply DuckDB memory_limit/temp_directory from the configuration.
+
+        When a process memory budget is configured but no explicit DuckDB
+        settings are given, DuckDB gets half of the budget and spills to a
+        temp directory under the state directory instead of growing further.
+        """
+        budget_mb = self.config.sync_memory_budget_mb
+
+        memory_limit = self.config.duckdb_memory_limit
+        if not memory_limit and budget_mb > 0:
+            memory_limit = f"{max(1, budget_mb // 2)}MB"
+
+        temp_directory = self.config.duckdb_temp_directory
+        if not temp_directory and budget_mb > 0:
+            temp_directory = os.path.join(self.config.state_directory, "duckdb_tmp")
+
+        if memory_limit:
+            conn.execute(f"SET memory_limit = '{memory_limit}'")
+        if temp_directory:
+            Path(temp_directory).mkdir(parents=True, exist_ok=True)
+            conn.execute(f"SET temp_directory = '{temp_directory}'")
 
     def disconnect(self):
         """Close the DuckDB connection"""
@@ -95,7 +121,7 @@ class DuckDBSource:
         import pandas as pd
 
         if logger:
-            logger.info(f"[DUCKDB] Converting {len(data)} rows to Pandas DataFrame...")
+            logger.debug("[DUCKDB] Converting %d rows to Pandas DataFrame...", len(data))
 
         start = time.time()
 
@@ -106,8 +132,8 @@ class DuckDBSource:
             df = pd.DataFrame(data)
 
         if logger:
-            logger.info(f"[DUCKDB] DataFrame created in {time.time() - start:.2f}s")
-            logger.info(f"[DUCKDB] Inserting {len(df)} rows into '{table}' using Pandas...")
+            logger.debug("[DUCKDB] DataFrame created in %.2fs", time.time() - start)
+            logger.debug("[DUCKDB] Inserting %d rows into '%s' using Pandas...", len(df), table)
 
         insert_start = time.time()
 
@@ -126,7 +152,7 @@ class DuckDBSource:
             """
 
             if logger:
-                logger.info(f"[DUCKDB] Using UPSERT mode with primary key: {primary_key}")
+                logger.debug("[DUCKDB] Using UPSERT mode with primary key: %s", primary_key)
 
             self.conn.execute(insert_query)
         else:
@@ -136,8 +162,8 @@ class DuckDBSource:
         insert_time = time.time() - insert_start
 
         if logger:
-            logger.info(f"[DUCKDB] Successfully inserted {len(df)} rows in {insert_time:.2f}s")
-            logger.info(f"[DUCKDB] Performance: {len(df)/insert_time:.0f} rows/second")
+            logger.debug("[DUCKDB] Successfully inserted %d rows in %.2fs (%.0f rows/second)",
+                         len(df), insert_time, len(df) / insert_time if insert_time > 0 else 0.0)
 
         return len(df)
 
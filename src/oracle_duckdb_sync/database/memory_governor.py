@@ -0,0 +1,130 @@
+"""MemoryGovernor - Keep the sync process under a configurable RSS budget"""
+import gc
+import os
+import sys
+import time
+from typing import Optional
+
+try:
+    import psutil
+except ImportError:  # psutil is optional; fall back to /proc on Linux
+    psutil = None
+
+
+def get_rss_bytes() -> Optional[int]:
+    """Return the resident set size of the current process.
+
+    Returns:
+        int: RSS in bytes, or None if it cannot be determined on this platform
+    """
+    if psutil is not None:
+        return int(psutil.Process(os.getpid()).memory_info().rss)
+
+    if sys.platform.startswith("linux"):
+        try:
+            with open("/proc/self/statm") as f:
+                resident_pages = int(f.read().split()[1])
+            return resident_pages * os.sysconf("SC_PAGE_SIZE")
+        except (OSError, ValueError, IndexError):
+            return None
+
+    return None
+
+
+class MemoryGovernor:
+    """Bound sync memory usage by sizing batches and backing off fetches.
+
+    - Batches are capped so that one batch uses at most ``batch_fraction`` of
+      the budget, based on the observed bytes per row.
+    - Before each fetch, if RSS is above ``backoff_ratio`` of the budget, the
+      governor collects garbage and waits (up to ``max_wait_seconds``) for
+      memory to be released (e.g. DuckDB spilling to its temp directory).
+    """
+
+    def __init__(
+        self,
+        budget_bytes: int,
+        backoff_ratio: float = 0.85,
+        batch_fraction: float = 0.1,
+        poll_interval: float = 0.5,
+        max_wait_seconds: float = 30.0,
+        logger=None,
+    ):
+        """Initialize MemoryGovernor
+
+        Args:
+            budget_bytes: Process memory budget in bytes
+            backoff_ratio: Fraction of the budget at which fetching backs off
+            batch_fraction: Fraction of the budget a single batch may use
+            poll_interval: Seconds between RSS checks while backing off
+            max_wait_seconds: Maximum time to wait for headroom before continuing
+            logger: Optional logger for back-off warnings
+        """
+        self.budget_bytes = budget_bytes
+        self.backoff_ratio = backoff_ratio
+        self.batch_fraction = batch_fraction
+        self.poll_interval = poll_interval
+        self.max_wait_seconds = max_wait_seconds
+        self.logger = logger
+
+        self.bytes_per_row = 0.0
+        self.peak_rss = 0
+        self.backoff_count = 0
+        self.last_wait = 0.0
+
+    def observe(self, row_bytes: float) -> None:
+        """Update the bytes-per-row estimate with a measured batch."""
+        if row_bytes <= 0:
+            return
+        if self.bytes_per_row > 0:
+            self.bytes_per_row = 0.7 * self.bytes_per_row + 0.3 * row_bytes
+        else:
+            self.bytes_per_row = row_bytes
+
+    def limit_batch_size(self, batch_size: int) -> int:
+        """Cap a batch size so the batch fits into its share of the budget."""
+        if self.bytes_per_row <= 0:
+            return batch_size
+        max_rows = int(self.budget_bytes * self.batch_fraction / self.bytes_per_row)
+        return max(1, min(batch_size, max_rows))
+
+    def wait_for_headroom(self) -> float:
+        """Block while RSS is above the back-off threshold.
+
+        Returns:
+            float: Seconds spent waiting (0.0 if no back-off was needed)
+        """
+        self.last_wait = 0.0
+        rss = get_rss_bytes()
+        if rss is None:
+            return 0.0
+        self.peak_rss = max(self.peak_rss, rss)
+
+        threshold = self.budget_bytes * self.backoff_ratio
+        if rss < threshold:
+            return 0.0
+
+        self.backoff_count += 1
+        if self.logger:
+            self.logger.warning(
+                f"[MEMORY] RSS {rss / 1024 / 1024:.0f}MB above {threshold / 1024 / 1024:.0f}MB, "
+                f"backing off fetch"
+            )
+
+        start = time.time()
+        while True:
+            gc.collect()
+            rss = get_rss_bytes() or 0
+            if rss < threshold:
+                break
+            if time.time() - start >= self.max_wait_seconds:
+                if self.logger:
+                    self.logger.warning(
+                        f"[MEMORY] RSS still {rss / 1024 / 1024:.0f}MB after "
+                        f"{self.max_wait_seconds:.0f}s, continuing"
+                    )
+                break
+            time.sleep(self.poll_interval)
+
+        self.last_wait = time.time() - start
+        return self.last_wait
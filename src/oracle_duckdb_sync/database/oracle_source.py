@@ -2,7 +2,7 @@
 Oracle 데이터베이스 연결 관리 모듈
 """
 import os
-from typing import Optional
+from typing import Callable, Optional
 
 import oracledb
 
@@ -217,10 +217,22 @@ class OracleSource:
 
         return [tuple(datetime_handler(v) for v in row) for row in rows]
 
-    def fetch_generator(self, query: str, batch_size: int = 1000):
+    def fetch_generator(self, query: str, batch_size: int = 1000,
+                        batch_size_fn: Optional[Callable[[], int]] = None,
+                        convert: bool = True):
         """Yield batches of rows from the query.
 
         This method is thread-safe as it creates a fresh cursor for each execution.
+
+        Args:
+            query: SQL query to execute
+            batch_size: Number of rows per batch
+            batch_size_fn: Optional callable returning the size of the next batch.
+                When given, it is consulted before every fetch so callers can
+                resize batches while iterating (e.g. adaptive batch sizing) or
+                delay the fetch until memory is available.
+            convert: Convert Oracle values with datetime_handler before yielding.
+                Pass False to receive the raw cursor rows.
         """
         if not self.conn:
             self.connect()
@@ -229,15 +241,25 @@ class OracleSource:
         try:
             cursor.execute(query)
             while True:
-                rows = cursor.fetchmany(batch_size)
+                size = batch_size_fn() if batch_size_fn else batch_size
+                rows = cursor.fetchmany(size)
                 if not rows:
                     break
-                yield [tuple(datetime_handler(v) for v in row) for row in rows]
+                if convert:
+                    # Rebind so the raw cursor rows are released after conversion
+                    rows = [tuple(datetime_handler(v) for v in row) for row in rows]
+                yield rows
+                # Drop the batch before the next fetch so it is not held twice
+                rows = None
         finally:
             cursor.close()
 
+    def build_incremental_predicate(self, column_name: str, last_value: str) -> str:
+        return f"{column_name} > '{last_value}'"
+
     def build_incremental_query(self, table_name: str, column_name: str, last_value: str):
-        return f"SELECT * FROM {table_name} WHERE {column_name} > '{last_value}' ORDER BY {column_name} ASC"
+        predicate = self.build_incremental_predicate(column_name, last_value)
+        return f"SELECT * FROM {table_name} WHERE {predicate} ORDER BY {column_name} ASC"
 
     def get_table_schema(self, table_name: str):
         """Get table schema from Oracle data dictionary
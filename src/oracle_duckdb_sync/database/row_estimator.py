@@ -0,0 +1,140 @@
+"""Cheap estimates of how many rows a sync will read.
+
+Used for progress percentage and ETA. Strategies, cheapest first:
+
+- full table: optimizer statistics (all_tables.num_rows), then an exact
+  COUNT(*) within the time budget, then a block SAMPLE count scaled up
+- incremental: COUNT(*) on the incremental predicate within the time
+  budget, then a block SAMPLE count of the predicate scaled up
+- row limit (test sync): the smaller of the limit and the table estimate
+
+Counts run with the connection's call_timeout set to the budget, so a slow
+count is abandoned instead of delaying the sync. Statistics can be stale;
+callers should treat the estimate as a lower bound once it is exceeded.
+"""
+
+from dataclasses import dataclass
+from typing import Optional
+
+from oracle_duckdb_sync.log.logger import setup_logger
+
+
+@dataclass(frozen=True)
+class RowEstimate:
+    """Estimated number of rows to sync.
+
+    Attributes:
+        rows: Estimated row count
+        method: How it was obtained ('statistics', 'count', 'sample', 'limit')
+    """
+    rows: int
+    method: str
+
+    @property
+    def exact(self) -> bool:
+        return self.method in ('count', 'limit')
+
+
+class RowCountEstimator:
+    """Estimate source row counts without delaying the sync.
+
+    Example:
+        >>> estimator = RowCountEstimator(oracle, budget_seconds=5.0)
+        >>> estimator.estimate("SCHEMA.ORDERS", where="UPDATED_AT > '2024-01-01'")
+        RowEstimate(rows=120000, method='count')
+    """
+
+    def __init__(self, oracle_source, budget_seconds: float = 5.0, sample_percent: float = 1.0):
+        """
+        Args:
+            oracle_source: OracleSource used for the estimate queries
+            budget_seconds: Time allowed for each COUNT(*)/SAMPLE query
+            sample_percent: Percentage of blocks read by the SAMPLE fallback
+        """
+        self.oracle = oracle_source
+        self.budget_seconds = budget_seconds
+        self.sample_percent = sample_percent
+        self.logger = setup_logger('RowCountEstimator')
+
+    def estimate(self, table_name: str, where: Optional[str] = None,
+                 row_limit: Optional[int] = None) -> Optional[RowEstimate]:
+        """Estimate the rows a sync of table_name will read.
+
+        Args:
+            table_name: "SCHEMA.TABLE" or "TABLE"
+            where: Incremental predicate (without WHERE), None for the whole table
+            row_limit: Maximum rows the sync will read (test sync)
+
+        Returns:
+            RowEstimate, or None when no strategy produced a number
+        """
+        if where:
+            estimate = self._count(table_name, where) or self._sample(table_name, where)
+        else:
+            estimate = (
+                self._statistics(table_name)
+                or self._count(table_name)
+                or self._sample(table_name)
+            )
+
+        if row_limit is not None and (estimate is None or row_limit <= estimate.rows):
+            return RowEstimate(row_limit, 'limit')
+        return estimate
+
+    def _statistics(self, table_name: str) -> Optional[RowEstimate]:
+        if '.' in table_name:
+            owner, table = table_name.upper().split('.', 1)
+            query = (
+                "SELECT num_rows FROM all_tables "
+                "WHERE owner = :owner AND table_name = :table_name"
+            )
+            params = {"owner": owner, "table_name": table}
+        else:
+            query = "SELECT num_rows FROM user_tables WHERE table_name = :table_name"
+            params = {"table_name": table_name.upper()}
+
+        rows = self._scalar(query, params)
+        return RowEstimate(rows, 'statistics') if rows is not None else None
+
+    def _count(self, table_name: str, where: Optional[str] = None) -> Optional[RowEstimate]:
+        query = f"SELECT COUNT(*) FROM {table_name}"
+        if where:
+            query += f" WHERE {where}"
+        rows = self._scalar(query, timeout=self.budget_seconds)
+        return RowEstimate(rows, 'count') if rows is not None else None
+
+    def _sample(self, table_name: str, where: Optional[str] = None) -> Optional[RowEstimate]:
+        if self.sample_percent <= 0:
+            return None
+        query = f"SELECT COUNT(*) FROM {table_name} SAMPLE BLOCK ({self.sample_percent:g})"
+        if where:
+            query += f" WHERE {where}"
+        rows = self._scalar(query, timeout=self.budget_seconds)
+        if rows is None:
+            return None
+        return RowEstimate(int(rows * 100 / self.sample_percent), 'sample')
+
+    def _scalar(self, query: str, params: Optional[dict] = None,
+                timeout: Optional[float] = None) -> Optional[int]:
+        """First column of the first row as int; None on error, timeout or NULL."""
+        try:
+            if not self.oracle.conn:
+                self.oracle.connect()
+            conn = self.oracle.conn
+            previous_timeout = getattr(conn, 'call_timeout', 0)
+            if timeout:
+                conn.call_timeout = int(timeout * 1000)
+            cursor = conn.cursor()
+            try:
+                cursor.execute(query, params or {})
+                row = cursor.fetchone()
+            finally:
+                cursor.close()
+                if timeout:
+                    conn.call_timeout = previous_timeout
+            if not row or row[0] is None:
+                return None
+            return int(row[0])
+        except Exception as e:
+            self.logger.info(f"Row estimate query skipped ({e.__class__.__name__}): {query}")
+            return None
@@ -0,0 +1,292 @@
+"""Bulk Oracle schema discovery with a TTL cache.
+
+OracleSource.get_table_schema reads the data dictionary one table at a
+time. The catalog fetches columns, types, precision, primary key columns,
+row-count estimates (all_tables.num_rows) and last_ddl_time for any number
+of tables in a single query, and caches the result:
+
+- within the TTL, cached schemas are returned without touching Oracle
+- after the TTL, one light query re-reads last_ddl_time/num_rows of the
+  expired tables; only tables whose DDL changed are fetched again
+"""
+
+import threading
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Callable, Iterable, Optional
+
+from oracle_duckdb_sync.log.logger import setup_logger
+
+# Oracle allows at most 1000 expressions in an IN list
+MAX_IN_LIST = 1000
+
+TableKey = tuple[str, str]
+
+
+@dataclass
+class ColumnInfo:
+    """One column of an Oracle table."""
+    name: str
+    data_type: str
+    precision: Optional[int] = None
+    scale: Optional[int] = None
+    length: Optional[int] = None
+    nullable: bool = True
+
+
+@dataclass
+class TableSchema:
+    """Data dictionary information of one Oracle table.
+
+    Attributes:
+        owner: Schema (owner) name
+        table_name: Table name
+        columns: Columns in column_id order
+        primary_key: Primary key columns in constraint order
+        num_rows: Row count estimate from the last statistics run (None if never analyzed)
+        last_ddl_time: Time of the last DDL on the table
+    """
+    owner: str
+    table_name: str
+    columns: list[ColumnInfo] = field(default_factory=list)
+    primary_key: list[str] = field(default_factory=list)
+    num_rows: Optional[int] = None
+    last_ddl_time: Optional[datetime] = None
+
+    @property
+    def full_name(self) -> str:
+        return f"{self.owner}.{self.table_name}"
+
+    @property
+    def column_names(self) -> list[str]:
+        return [col.name for col in self.columns]
+
+    def has_column(self, name: str) -> bool:
+        return name.upper() in self.column_names
+
+    def as_column_types(self) -> list[tuple[str, str]]:
+        """(column_name, data_type) tuples, the format of OracleSource.get_table_schema."""
+        return [(col.name, col.data_type) for col in self.columns]
+
+
+@dataclass
+class _CacheEntry:
+    schema: Optional[TableSchema]
+    checked_at: float
+
+
+class OracleSchemaCatalog:
+    """Cached, bulk-loaded schemas of Oracle tables.
+
+    Tables that do not exist are cached as None, so validating a config with
+    a typo does not query Oracle again until the TTL expires.
+
+    Example:
+        >>> catalog = OracleSchemaCatalog(oracle_source, ttl_seconds=300)
+        >>> schemas = catalog.get_schemas([("SALES", "ORDERS"), ("SALES", "ITEMS")])
+        >>> schemas[("SALES", "ORDERS")].primary_key
+        ['ORDER_ID']
+    """
+
+    def __init__(self, oracle_source, ttl_seconds: float = 300.0,
+                 clock: Callable[[], float] = time.monotonic):
+        """
+        Args:
+            oracle_source: Connected (or connectable) OracleSource
+            ttl_seconds: How long a schema is trusted without re-checking last_ddl_time
+            clock: Time source (monotonic seconds)
+        """
+        self.oracle = oracle_source
+        self.ttl_seconds = ttl_seconds
+        self.clock = clock
+        self.logger = setup_logger('OracleSchemaCatalog')
+        self._entries: dict[TableKey, _CacheEntry] = {}
+        self._current_schema: Optional[str] = None
+        self._lock = threading.Lock()
+        self.queries = 0
+
+    def get_schema(self, owner: Optional[str], table_name: str) -> Optional[TableSchema]:
+        """Schema of one table (None if it does not exist)."""
+        key = self._key(owner, table_name)
+        return self.get_schemas([key]).get(key)
+
+    def get_schemas(
+        self, tables: Iterable[tuple[Optional[str], str]]
+    ) -> dict[TableKey, Optional[TableSchema]]:
+        """Schemas of many tables, loading what is missing or changed in bulk.
+
+        Args:
+            tables: (owner, table_name) pairs; owner None means the session's schema
+
+        Returns:
+            Dict keyed by upper-case (owner, table_name); None for tables that do not exist
+        """
+        keys = list(dict.fromkeys(self._key(owner, table) for owner, table in tables))
+
+        with self._lock:
+            now = self.clock()
+            missing = [key for key in keys if key not in self._entries]
+            expired = [
+                key for key in keys
+                if key in self._entries and now - self._entries[key].checked_at > self.ttl_seconds
+            ]
+
+            if expired:
+                missing += self._revalidate(expired, now)
+            if missing:
+                self._load(missing, now)
+
+            return {key: self._entries[key].schema for key in keys}
+
+    def invalidate(self, owner: Optional[str] = None, table_name: Optional[str] = None) -> None:
+        """Drop one table (or everything) from the cache."""
+        with self._lock:
+            if table_name is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(self._key(owner, table_name), None)
+
+    def _key(self, owner: Optional[str], table_name: str) -> TableKey:
+        if '.' in table_name and not owner:
+            owner, table_name = table_name.split('.', 1)
+        return ((owner or self._session_schema()).upper(), table_name.upper())
+
+    def _session_schema(self) -> str:
+        if self._current_schema is None:
+            rows = self._query("SELECT SYS_CONTEXT('USERENV', 'CURRENT_SCHEMA') FROM dual", {})
+            self._current_schema = rows[0][0]
+        return self._current_schema
+
+    def _load(self, keys: list[TableKey], now: float) -> None:
+        """Fetch full schemas of the given tables (one query per 1000 tables)."""
+        schemas: dict[TableKey, TableSchema] = {}
+        for chunk_start in range(0, len(keys), MAX_IN_LIST):
+            chunk = keys[chunk_start:chunk_start + MAX_IN_LIST]
+            in_list, params = self._in_list(chunk, "c.owner", "c.table_name")
+            query = f"""
+            SELECT c.owner, c.table_name, c.column_name, c.data_type,
+                   c.data_precision, c.data_scale, c.data_length, c.nullable,
+                   t.num_rows, o.last_ddl_time, pk.position
+            FROM all_tab_columns c
+            LEFT JOIN all_tables t
+                ON t.owner = c.owner AND t.table_name = c.table_name
+            LEFT JOIN all_objects o
+                ON o.owner = c.owner AND o.object_name = c.table_name
+                AND o.object_type IN ('TABLE', 'VIEW')
+            LEFT JOIN (
+                SELECT cc.owner, cc.table_name, cc.column_name, cc.position
+                FROM all_constraints k
+                JOIN all_cons_columns cc
+                    ON cc.owner = k.owner AND cc.constraint_name = k.constraint_name
+                WHERE k.constraint_type = 'P'
+            ) pk
+                ON pk.owner = c.owner AND pk.table_name = c.table_name
+                AND pk.column_name = c.column_name
+            WHERE {in_list}
+            ORDER BY c.owner, c.table_name, c.column_id
+            """
+            pk_positions: dict[TableKey, list[tuple[int, str]]] = {}
+            for row in self._query(query, params):
+                (owner, table, column, data_type, precision, scale, length,
+                 nullable, num_rows, last_ddl_time, pk_position) = row
+                key = (owner, table)
+                schema = schemas.get(key)
+                if schema is None:
+                    schema = schemas[key] = TableSchema(
+                        owner, table, num_rows=num_rows, last_ddl_time=last_ddl_time
+                    )
+                schema.columns.append(
+                    ColumnInfo(column, data_type, precision, scale, length, nullable != 'N')
+                )
+                if pk_position is not None:
+                    pk_positions.setdefault(key, []).append((pk_position, column))
+
+            for key, positions in pk_positions.items():
+                schemas[key].primary_key = [column for _, column in sorted(positions)]
+
+        for key in keys:
+            self._entries[key] = _CacheEntry(schemas.get(key), now)
+        self.logger.info(f"Loaded schemas of {len(schemas)}/{len(keys)} Oracle tables")
+
+    def _revalidate(self, keys: list[TableKey], now: float) -> list[TableKey]:
+        """Re-check last_ddl_time of expired tables; return those that must be reloaded."""
+        current: dict[TableKey, tuple] = {}
+        for chunk_start in range(0, len(keys), MAX_IN_LIST):
+            chunk = keys[chunk_start:chunk_start + MAX_IN_LIST]
+            in_list, params = self._in_list(chunk, "o.owner", "o.object_name")
+            query = f"""
+            SELECT o.owner, o.object_name, o.last_ddl_time, t.num_rows
+            FROM all_objects o
+            LEFT JOIN all_tables t
+                ON t.owner = o.owner AND t.table_name = o.object_name
+            WHERE o.object_type IN ('TABLE', 'VIEW') AND {in_list}
+            """
+            for owner, table, last_ddl_time, num_rows in self._query(query, params):
+                current[(owner, table)] = (last_ddl_time, num_rows)
+
+        changed = []
+        for key in keys:
+            schema = self._entries[key].schema
+            if key not in current:
+                if schema is not None:
+                    changed.append(key)  # dropped
+                else:
+                    self._entries[key].checked_at = now
+                continue
+
+            last_ddl_time, num_rows = current[key]
+            if schema is None or schema.last_ddl_time != last_ddl_time:
+                self.logger.info(f"DDL change detected on {key[0]}.{key[1]}")
+                changed.append(key)
+            else:
+                schema.num_rows = num_rows
+                self._entries[key].checked_at = now
+
+        for key in changed:
+            del self._entries[key]
+        return changed
+
+    @staticmethod
+    def _in_list(keys: list[TableKey], owner_column: str, table_column: str) -> tuple[str, dict]:
+        """(owner, table) IN ((:o0, :t0), ...) with bind variables."""
+        params = {}
+        pairs = []
+        for i, (owner, table) in enumerate(keys):
+            params[f"o{i}"] = owner
+            params[f"t{i}"] = table
+            pairs.append(f"(:o{i}, :t{i})")
+        return f"({owner_column}, {table_column}) IN ({', '.join(pairs)})", params
+
+    def _query(self, query: str, params: dict) -> list:
+        if not self.oracle.conn:
+            self.oracle.connect()
+        self.queries += 1
+        cursor = self.oracle.conn.cursor()
+        try:
+            cursor.arraysize = 1000
+            cursor.execute(query, params)
+            return list(cursor.fetchall())
+        finally:
+            cursor.close()
+
+
+_global_schema_catalog: Optional[OracleSchemaCatalog] = None
+_schema_catalog_lock = threading.Lock()
+
+
+def get_schema_catalog(config) -> OracleSchemaCatalog:
+    """Get or create the process-wide schema catalog (shared by admin pages and validation)."""
+    global _global_schema_catalog
+
+    with _schema_catalog_lock:
+        if _global_schema_catalog is None:
+            # Imported lazily: oracledb is only needed once Oracle is actually used
+            from oracle_duckdb_sync.database.oracle_source import OracleSource
+
+            _global_schema_catalog = OracleSchemaCatalog(
+                OracleSource(config),
+                ttl_seconds=config.schema_catalog_ttl_seconds
+            )
+
+    return _global_schema_catalog
@@ -1,20 +1,69 @@
 import time
-from typing import Optional
+import uuid
+from contextlib import contextmanager
+from datetime import datetime
+from typing import TYPE_CHECKING, Callable, Optional
 
 from oracle_duckdb_sync.config import Config
+from oracle_duckdb_sync.database.batch_sizer import AdaptiveBatchSizer, estimate_row_bytes
+from oracle_duckdb_sync.database.cancellation import CancellationToken, SyncCancelled
 from oracle_duckdb_sync.database.duckdb_source import DuckDBSource
-from oracle_duckdb_sync.database.oracle_source import OracleSource
-from oracle_duckdb_sync.log.logger import setup_logger
+from oracle_duckdb_sync.database.memory_governor import MemoryGovernor
+from oracle_duckdb_sync.database.oracle_source import OracleSource, datetime_handler
+from oracle_duckdb_sync.database.row_estimator import RowCountEstimator, RowEstimate
+from oracle_duckdb_sync.database.sync_events import (
+    AsyncEventSink,
+    BatchFetched,
+    BatchWritten,
+    CheckpointSaved,
+    SchemaResolved,
+    SyncEvent,
+    SyncFinished,
+    SyncRetried,
+    SyncStarted,
+)
+from oracle_duckdb_sync.database.typed_table import (
+    TypedTableMaterializer,
+    TypedTablePlan,
+    quote_identifier,
+)
+from oracle_duckdb_sync.log.logger import LogRateLimiter, setup_logger
+from oracle_duckdb_sync.metrics.sync_metrics import SyncRunMetrics
 from oracle_duckdb_sync.state.file_manager import StateFileManager
 
+if TYPE_CHECKING:
+    from oracle_duckdb_sync.repository.sync_log_writer import SyncLogWriter
+
 
 class SyncEngine:
-    def __init__(self, config: Config):
+    def __init__(self, config: Config, cancel_token: Optional[CancellationToken] = None,
+                 event_handler: Optional[Callable[[SyncEvent], None]] = None):
         self.config = config
+        # Pause/stop signal checked between batches (None: runs to completion)
+        self.cancel_token = cancel_token
         self.oracle = OracleSource(config)
         self.duckdb = DuckDBSource(config)
         self.logger = setup_logger("sync_engine")
+        # Typed sync events, delivered to event_handler on a background thread
+        self.events: Optional[AsyncEventSink] = (
+            AsyncEventSink(event_handler, logger=self.logger) if event_handler else None
+        )
         self.state_manager = StateFileManager(self.logger)
+        self.memory_governor: Optional[MemoryGovernor] = None
+        if config.sync_memory_budget_mb > 0:
+            self.memory_governor = MemoryGovernor(
+                budget_bytes=config.sync_memory_budget_mb * 1024 * 1024,
+                backoff_ratio=config.memory_backoff_ratio,
+                logger=self.logger,
+            )
+        # Metrics of the sync run in progress (None between runs)
+        self.run_metrics: Optional[SyncRunMetrics] = None
+        self.last_run_metrics: Optional[SyncRunMetrics] = None
+        # Per-batch progress is logged every N seconds, not every batch
+        self._progress_log_limiter = LogRateLimiter(config.progress_log_interval_seconds)
+        # Buffered sync_logs writer (created on the first persisted run)
+        self.log_writer: Optional[SyncLogWriter] = None
+        self._run_sync_id: Optional[str] = None
 
     @staticmethod
     def map_oracle_type(oracle_type: str) -> str:
@@ -45,6 +94,15 @@ class SyncEngine:
 
     def close(self):
         """Clean up all resources"""
+        events = getattr(self, 'events', None)
+        if events is not None:
+            # Deliver pending events before the handler's consumers see the end of the run
+            events.close()
+        log_writer = getattr(self, 'log_writer', None)
+        if log_writer is not None:
+            # Flush buffered sync logs before the connection goes away
+            log_writer.close()
+            self.log_writer = None
         if hasattr(self, 'oracle'):
             self.oracle.disconnect()
         if hasattr(self, 'duckdb'):
@@ -70,7 +128,7 @@ class SyncEngine:
 
         Args:
             oracle_table: Source Oracle table name
-            duckdb_table: Target DuckDB table name (unused in current implementation but kept for future use)
+            duckdb_table: Target DuckDB table name (label of the SchemaResolved event)
 
         Returns:
             tuple: (schema, duckdb_columns) where:
@@ -96,9 +154,55 @@ class SyncEngine:
             (col_name, self.map_oracle_type(oracle_type))
             for col_name, oracle_type in schema
         ]
+        self._emit(SchemaResolved(duckdb_table, oracle_table, tuple(duckdb_columns)))
 
         return schema, duckdb_columns
 
+    def estimate_rows(
+        self,
+        oracle_table_name: str,
+        column: Optional[str] = None,
+        last_value: Optional[str] = None,
+        row_limit: Optional[int] = None
+    ) -> Optional[RowEstimate]:
+        """Estimate how many rows a sync will read, for progress percentage and ETA.
+
+        Runs on its own Oracle connection so it can be called from another
+        thread while the sync is already fetching.
+
+        Args:
+            oracle_table_name: Source Oracle table name
+            column: Incremental time column (None for a full/test sync)
+            last_value: Last synchronized value of column
+            row_limit: Row limit of a test sync
+
+        Returns:
+            RowEstimate, or None when disabled or no estimate was possible
+        """
+        budget = self.config.sync_row_estimate_budget_seconds
+        if budget <= 0:
+            return None
+
+        where = None
+        if column and last_value is not None:
+            where = self.oracle.build_incremental_predicate(column, last_value)
+
+        oracle = OracleSource(self.config)
+        try:
+            estimator = RowCountEstimator(
+                oracle, budget, self.config.sync_row_estimate_sample_percent
+            )
+            estimate = estimator.estimate(oracle_table_name, where=where, row_limit=row_limit)
+        finally:
+            oracle.disconnect()
+
+        if estimate is not None:
+            self.logger.info(
+                f"Estimated {estimate.rows:,} rows to sync from {oracle_table_name} "
+                f"({estimate.method})"
+            )
+        return estimate
+
     def full_sync(self, oracle_table_name: str, duckdb_table: str, primary_key: str):
         """Perform full synchronization from Oracle to DuckDB
 
@@ -116,21 +220,27 @@ class SyncEngine:
         Returns:
             int: Total number of rows synchronized
         """
-        # Step 1 & 2: Get schema and prepare columns
-        schema, duckdb_columns = self._prepare_sync(oracle_table_name, duckdb_table)
+        with self._track_run(duckdb_table, "full", oracle_table_name):
+            # Step 1 & 2: Get schema and prepare columns
+            schema, duckdb_columns = self._prepare_sync(oracle_table_name, duckdb_table)
+
+            # Step 3: Create table in DuckDB
+            self.logger.info(f"Creating table {duckdb_table} in DuckDB")
+            create_ddl = self.duckdb.build_create_table_query(
+                duckdb_table,
+                duckdb_columns,
+                primary_key
+            )
+            self.duckdb.execute(create_ddl)
+            self._discard_stopped_run(duckdb_table)
 
-        # Step 3: Create table in DuckDB
-        self.logger.info(f"Creating table {duckdb_table} in DuckDB")
-        create_ddl = self.duckdb.build_create_table_query(
-            duckdb_table,
-            duckdb_columns,
-            primary_key
-        )
-        self.duckdb.execute(create_ddl)
+            # Step 4: Sync data
+            self.logger.info(f"Starting full sync from {oracle_table_name} to {duckdb_table}")
+            total_rows = self.sync_in_batches(oracle_table_name, duckdb_table)
 
-        # Step 4: Sync data
-        self.logger.info(f"Starting full sync from {oracle_table_name} to {duckdb_table}")
-        return self.sync_in_batches(oracle_table_name, duckdb_table)
+            # Step 5: Rebuild the typed view/table for the dashboard
+            self.refresh_typed_table(duckdb_table)
+            return total_rows
 
     def test_sync(self, oracle_table_name: str, duckdb_table: str, primary_key: str, row_limit: int = 100000):
         """Perform test synchronization with limited rows from Oracle to DuckDB
@@ -154,28 +264,38 @@ class SyncEngine:
         Returns:
             int: Total number of rows synchronized
         """
-        # Step 1 & 2: Get schema and prepare columns
-        schema, duckdb_columns = self._prepare_sync(oracle_table_name, duckdb_table)
-
-        # Step 3: Create table in DuckDB (drop if exists for test)
-        self.logger.info(f"Creating table {duckdb_table} in DuckDB")
-
-        # Drop test table if it exists to avoid duplicate key errors
-        if self.duckdb.table_exists(duckdb_table):
-            self.logger.info(f"Dropping existing test table {duckdb_table}")
-            self.duckdb.execute(f"DROP TABLE IF EXISTS {duckdb_table}")
-
-        # Create table WITHOUT primary key for test (faster inserts)
-        col_defs = ", ".join([f"{name} {duckdb_type}" for name, duckdb_type in duckdb_columns])
-        create_ddl = f"CREATE TABLE {duckdb_table} ({col_defs})"
-        self.logger.info("Creating test table WITHOUT PRIMARY KEY for faster inserts")
-        self.duckdb.execute(create_ddl)
+        with self._track_run(duckdb_table, "test", oracle_table_name):
+            # Step 1 & 2: Get schema and prepare columns
+            schema, duckdb_columns = self._prepare_sync(oracle_table_name, duckdb_table)
+
+            # Step 3: Create table in DuckDB (drop if exists for test)
+            self.logger.info(f"Creating table {duckdb_table} in DuckDB")
+
+            # Drop test table if it exists to avoid duplicate key errors
+            if self.duckdb.table_exists(duckdb_table):
+                self.logger.info(f"Dropping existing test table {duckdb_table}")
+                self.duckdb.execute(f"DROP TABLE IF EXISTS {duckdb_table}")
+
+            # Create table WITHOUT primary key for test (faster inserts)
+            col_defs = ", ".join([f"{name} {duckdb_type}" for name, duckdb_type in duckdb_columns])
+            create_ddl = f"CREATE TABLE {duckdb_table} ({col_defs})"
+            self.logger.info("Creating test table WITHOUT PRIMARY KEY for faster inserts")
+            self.duckdb.execute(create_ddl)
+
+            # Step 4: Sync limited data with proper row limit enforcement
+            if row_limit is None:
+                row_limit = self.config.test_sync_default_row_limit
+            self.logger.info(
+                f"Starting test sync from {oracle_table_name} to {duckdb_table} "
+                f"(limit: {row_limit} rows)"
+            )
+            total_rows = self._execute_limited_sync(
+                oracle_table_name, duckdb_table, row_limit, duckdb_columns,
+                batch_size=self.config.sync_batch_size
+            )
 
-        # Step 4: Sync limited data with proper row limit enforcement
-        if row_limit is None:
-            row_limit = self.config.test_sync_default_row_limit
-        self.logger.info(f"Starting test sync from {oracle_table_name} to {duckdb_table} (limit: {row_limit} rows)")
-        return self._execute_limited_sync(oracle_table_name, duckdb_table, row_limit, duckdb_columns, batch_size=self.config.sync_batch_size)
+            self.refresh_typed_table(duckdb_table)
+            return total_rows
 
     def incremental_sync(self, oracle_table_name: str, duckdb_table: str, column: str, last_value: str, primary_key: Optional[str] = None, retries: Optional[int] = None):
         """Perform incremental synchronization from Oracle to DuckDB
@@ -196,43 +316,65 @@ class SyncEngine:
         Returns:
             int: Total number of rows synchronized
         """
-        # Ensure Oracle connection is established
-        if not self.oracle.conn:
-            self.oracle.connect()
-
-        if retries is None:
-            retries = self.config.sync_retry_attempts
-        query = self.oracle.build_incremental_query(oracle_table_name, column, last_value)
-        last_exception = None
-        for attempt in range(retries):
-            try:
-                # Use INSERT only (primary_key=None) for incremental sync
-                total_rows = self._execute_sync(query, duckdb_table, primary_key=None)
-
-                # Only save state if sync was successful
-                if total_rows >= 0:
-                    # Get the latest timestamp from DuckDB after successful insert
-                    max_time_query = f"SELECT MAX({column}) FROM {duckdb_table}"
-                    result = self.duckdb.conn.execute(max_time_query).fetchone()
-
-                    if result and result[0]:
-                        new_last_value = str(result[0])
-                        self.save_state(oracle_table_name, new_last_value)
-                        self.logger.info(f"Incremental sync state saved: {oracle_table_name} -> {new_last_value}")
-
-                return total_rows
-            except Exception as e:
-                last_exception = e
-                if attempt < retries - 1:
-                    self.logger.warning(f"Incremental sync attempt {attempt + 1} failed, retrying...")
-                    time.sleep(self.config.sync_retry_delay_seconds)
-                    continue
-
-        # If all retries failed, do NOT save state
-        self.logger.error(f"Incremental sync failed after {retries} attempts. State NOT updated.")
-        if last_exception:
-            raise last_exception
-        raise RuntimeError(f"Incremental sync failed after {retries} attempts")
+        with self._track_run(duckdb_table, "incremental", oracle_table_name) as metrics:
+            # Ensure Oracle connection is established
+            if not self.oracle.conn:
+                self.oracle.connect()
+
+            if retries is None:
+                retries = self.config.sync_retry_attempts
+            query = self.oracle.build_incremental_query(oracle_table_name, column, last_value)
+            last_exception = None
+            for attempt in range(retries):
+                try:
+                    # Use INSERT only (primary_key=None) for incremental sync
+                    total_rows = self._execute_sync(query, duckdb_table, primary_key=None)
+
+                    # Only save state if sync was successful
+                    if total_rows >= 0:
+                        # Get the latest timestamp from DuckDB after successful insert
+                        max_time_query = f"SELECT MAX({column}) FROM {duckdb_table}"
+                        max_rows = self.duckdb.execute(max_time_query)
+                        result = max_rows[0] if max_rows else None
+
+                        if result and result[0]:
+                            new_last_value = str(result[0])
+                            self.save_state(oracle_table_name, new_last_value)
+                            self.logger.info(
+                                f"Incremental sync state saved: "
+                                f"{oracle_table_name} -> {new_last_value}"
+                            )
+                            self._emit(CheckpointSaved(duckdb_table, 'state', new_last_value))
+
+                    # Only the new rows are converted into the typed table
+                    self.refresh_typed_table(duckdb_table, column=column, last_value=last_value)
+                    return total_rows
+                except SyncCancelled:
+                    # Stopped on request: keep what was inserted and never retry
+                    self._save_incremental_checkpoint(
+                        oracle_table_name, duckdb_table, column, last_value
+                    )
+                    # The next run starts after the kept rows, so convert them now
+                    self.refresh_typed_table(duckdb_table, column=column, last_value=last_value)
+                    raise
+                except Exception as e:
+                    last_exception = e
+                    if attempt < retries - 1:
+                        self.logger.warning(
+                            f"Incremental sync attempt {attempt + 1} failed, retrying..."
+                        )
+                        metrics.record_retry()
+                        self._emit(SyncRetried(duckdb_table, attempt + 1, str(e)))
+                        time.sleep(self.config.sync_retry_delay_seconds)
+                        continue
+
+            # If all retries failed, do NOT save state
+            self.logger.error(
+                f"Incremental sync failed after {retries} attempts. State NOT updated."
+            )
+            if last_exception:
+                raise last_exception
+            raise RuntimeError(f"Incremental sync failed after {retries} attempts")
 
     def sync_in_batches(self, oracle_table_name: str, duckdb_table: str, batch_size: Optional[int] = None, max_duration: Optional[int] = None):
         if batch_size is None:
@@ -240,7 +382,8 @@ class SyncEngine:
         if max_duration is None:
             max_duration = self.config.sync_max_duration_seconds
         query = f"SELECT * FROM {oracle_table_name}"
-        return self._execute_sync(query, duckdb_table, batch_size, max_duration)
+        with self._track_run(duckdb_table, "full", oracle_table_name):
+            return self._execute_sync(query, duckdb_table, batch_size, max_duration)
 
     def _execute_sync(self, query: str, duckdb_table: str, batch_size: Optional[int] = None, max_duration: Optional[int] = None, primary_key: Optional[str] = None):
         """Execute sync query with optional UPSERT support
@@ -259,64 +402,126 @@ class SyncEngine:
             batch_size = self.config.sync_batch_size
         if max_duration is None:
             max_duration = self.config.sync_max_duration_seconds
-        self.duckdb.ensure_database()
-
-        # Check if target table exists
-        if not self.duckdb.table_exists(duckdb_table):
-            raise ValueError(
-                f"Table '{duckdb_table}' does not exist in DuckDB. "
-                f"Please run full_sync() first to create the table schema."
+        sync_type = "upsert" if primary_key else "full"
+        with self._track_run(duckdb_table, sync_type):
+            self.duckdb.ensure_database()
+
+            # Check if target table exists
+            if not self.duckdb.table_exists(duckdb_table):
+                raise ValueError(
+                    f"Table '{duckdb_table}' does not exist in DuckDB. "
+                    f"Please run full_sync() first to create the table schema."
+                )
+
+            start_time = time.time()
+            total_count = 0
+            batch_number = 0
+            # Prevent infinite loops (configurable safety limit)
+            max_iterations = self.config.sync_max_iterations
+
+            sizer = self._create_batch_sizer(duckdb_table, batch_size)
+            batch_size_fn: Optional[Callable[[], int]] = None
+            # Size of the fetch in flight (the governor may cap it below the sizer's size)
+            requested = [batch_size]
+            if sizer or self.memory_governor:
+                def next_batch_size() -> int:
+                    requested[0] = self._next_batch_size(sizer, batch_size)
+                    return requested[0]
+
+                batch_size_fn = next_batch_size
+
+            # Use fetch_generator for thread-safe iteration; conversion is done
+            # here so fetch and convert time can be measured separately
+            cycle_start = time.time()
+            batches = self.oracle.fetch_generator(
+                query, convert=False, batch_size=batch_size, batch_size_fn=batch_size_fn
             )
+            for rows in self._cancellable(batches):
+                batch_start_time = time.time()
+                batch_number += 1
+
+                fetch_elapsed = batch_start_time - cycle_start
+                if self.memory_governor:
+                    fetch_elapsed -= self.memory_governor.last_wait
+                self._observe_stage("fetch", fetch_elapsed)
+                self._emit(BatchFetched(duckdb_table, batch_number, len(rows), fetch_elapsed))
+                data = [tuple(datetime_handler(v) for v in row) for row in rows]
+                rows = None
+                convert_elapsed = time.time() - batch_start_time
+                self._observe_stage("convert", convert_elapsed)
+
+                # Check max iterations
+                if batch_number > max_iterations:
+                    raise RuntimeError(f"Exceeded maximum iterations ({max_iterations})")
+
+                # Check timeout
+                elapsed = time.time() - start_time
+                if elapsed > max_duration:
+                    raise TimeoutError(f"Sync exceeded maximum duration ({max_duration}s)")
+
+                self.logger.debug("[BATCH %d] Fetched %d rows (Total so far: %d)",
+                                  batch_number, len(data), total_count)
+
+                # A stop between fetch and insert drops this batch;
+                # every inserted batch stays committed
+                self._checkpoint()
+
+                # Use UPSERT if primary_key is provided
+                insert_start = time.time()
+                if primary_key:
+                    # Get column names from table schema
+                    schema_query = f"DESCRIBE {duckdb_table}"
+                    schema_result = self.duckdb.execute(schema_query)
+                    column_names = [row[0] for row in schema_result]
+
+                    self.duckdb.insert_batch(
+                        duckdb_table, data, column_names=column_names,
+                        primary_key=primary_key, logger=self.logger
+                    )
+                else:
+                    self.duckdb.insert_batch(duckdb_table, data)
+                insert_elapsed = time.time() - insert_start
+                self._observe_stage("insert", insert_elapsed)
+
+                total_count += len(data)
+                # Sampled once per batch for the metrics, the sizer and the governor
+                row_bytes = estimate_row_bytes(data)
+                batch_bytes = self._record_batch(len(data), row_bytes)
+                self._emit(BatchWritten(
+                    duckdb_table, batch_number, len(data), batch_bytes, total_count,
+                    fetch_elapsed, convert_elapsed, insert_elapsed
+                ))
+
+                # Log batch timing
+                batch_elapsed = time.time() - batch_start_time
+                self.logger.debug("[BATCH %d] Processed %d rows in %.3fs (Total: %d)",
+                                  batch_number, len(data), batch_elapsed, total_count)
+
+                if sizer or self.memory_governor:
+                    # Throughput includes the fetch, so measure the whole cycle
+                    cycle_elapsed = time.time() - cycle_start
+                    if self.memory_governor:
+                        cycle_elapsed -= self.memory_governor.last_wait
+                    self._observe_batch(sizer, len(data), row_bytes, cycle_elapsed, requested[0])
+
+                self._log_progress(duckdb_table, total_count, len(data))
+                # Release the batch before the generator fetches the next one
+                del data
+                cycle_start = time.time()
+
+            if sizer:
+                self.save_batch_size(duckdb_table, sizer)
+
+            # Log statistics
+            elapsed_time = time.time() - start_time
+            self.logger.info(
+                f"Sync completed: {total_count} rows processed in {elapsed_time:.2f} seconds"
+            )
+            if elapsed_time > 0:
+                rows_per_second = total_count / elapsed_time
+                self.logger.info(f"Processing rate: {rows_per_second:.2f} rows/second")
 
-        start_time = time.time()
-        total_count = 0
-        batch_number = 0
-        # Prevent infinite loops (configurable safety limit)
-        max_iterations = self.config.sync_max_iterations
-
-        # Use fetch_generator for thread-safe iteration
-        for data in self.oracle.fetch_generator(query, batch_size=batch_size):
-            batch_start_time = time.time()
-            batch_number += 1
-
-            # Check max iterations
-            if batch_number > max_iterations:
-                raise RuntimeError(f"Exceeded maximum iterations ({max_iterations})")
-
-            # Check timeout
-            elapsed = time.time() - start_time
-            if elapsed > max_duration:
-                raise TimeoutError(f"Sync exceeded maximum duration ({max_duration}s)")
-
-            self.logger.info(f"[BATCH {batch_number}] Fetched {len(data)} rows (Total so far: {total_count})")
-
-            # Use UPSERT if primary_key is provided
-            if primary_key:
-                # Get column names from table schema
-                schema_query = f"DESCRIBE {duckdb_table}"
-                schema_result = self.duckdb.conn.execute(schema_query).fetchall()
-                column_names = [row[0] for row in schema_result]
-
-                self.duckdb.insert_batch(duckdb_table, data, column_names=column_names, primary_key=primary_key, logger=self.logger)
-            else:
-                self.duckdb.insert_batch(duckdb_table, data)
-
-            total_count += len(data)
-
-            # Log batch timing
-            batch_elapsed = time.time() - batch_start_time
-            self.logger.info(f"[BATCH {batch_number}] Processed {len(data)} rows in {batch_elapsed:.3f}s (Total: {total_count})")
-
-            self._log_progress(duckdb_table, total_count, len(data))
-
-        # Log statistics
-        elapsed_time = time.time() - start_time
-        self.logger.info(f"Sync completed: {total_count} rows processed in {elapsed_time:.2f} seconds")
-        if elapsed_time > 0:
-            rows_per_second = total_count / elapsed_time
-            self.logger.info(f"Processing rate: {rows_per_second:.2f} rows/second")
-
-        return total_count
+            return total_count
 
     def _validate_sync_preconditions(self, duckdb_table: str) -> None:
         """Validate database connections and table existence.
@@ -369,15 +574,21 @@ class SyncEngine:
         Returns:
             list: Fetched rows from Oracle
         """
-        self.logger.info("[ORACLE] Fetching batch from Oracle...")
+        self.logger.debug("[ORACLE] Fetching batch from Oracle...")
         fetch_start = time.time()
-        rows = cursor.fetchmany(batch_size)
+        try:
+            rows = cursor.fetchmany(batch_size)
+        except Exception as e:
+            self._raise_if_cancelled(e)
+            raise
         fetch_time = time.time() - fetch_start
+        self._observe_stage("fetch", fetch_time)
 
         if not rows:
             self.logger.info("[ORACLE] No more rows to fetch. End of data.")
         else:
-            self.logger.info(f"[ORACLE] Fetched {len(rows)} rows from Oracle in {fetch_time:.2f}s")
+            self.logger.debug("[ORACLE] Fetched %d rows from Oracle in %.2fs",
+                              len(rows), fetch_time)
 
         return rows
 
@@ -390,10 +601,11 @@ class SyncEngine:
         Returns:
             list: Rows with datetime objects converted to strings
         """
-        self.logger.info("[PROCESS] Converting datetime objects...")
-        from oracle_duckdb_sync.database.oracle_source import datetime_handler
+        self.logger.debug("[PROCESS] Converting datetime objects...")
+        convert_start = time.time()
         data = [tuple(datetime_handler(v) for v in row) for row in rows]
-        self.logger.info(f"[PROCESS] Converted {len(data)} rows")
+        self._observe_stage("convert", time.time() - convert_start)
+        self.logger.debug("[PROCESS] Converted %d rows", len(data))
         return data
 
     def _insert_batch_to_duckdb(self, duckdb_table: str, data: list, duckdb_columns: list) -> None:
@@ -408,11 +620,13 @@ class SyncEngine:
         column_names = [col_name for col_name, _ in duckdb_columns]
 
         # Insert batch with Pandas DataFrame (100x faster)
-        self.logger.info(f"[DUCKDB] Starting insert of {len(data)} rows into DuckDB table '{duckdb_table}'...")
+        self.logger.debug("[DUCKDB] Starting insert of %d rows into DuckDB table '%s'...",
+                          len(data), duckdb_table)
         insert_start = time.time()
         self.duckdb.insert_batch(duckdb_table, data, column_names=column_names, logger=self.logger)
         insert_time = time.time() - insert_start
-        self.logger.info(f"[DUCKDB] Total insert completed in {insert_time:.2f}s")
+        self._observe_stage("insert", insert_time)
+        self.logger.debug("[DUCKDB] Total insert completed in %.2fs", insert_time)
 
     def _process_batches_with_limit(
         self,
@@ -440,9 +654,11 @@ class SyncEngine:
         """
         total_count = 0
         batch_number = 0
+        sizer = self._create_batch_sizer(duckdb_table, batch_size)
 
         # Fetch and insert in batches, respecting the row_limit
         while total_count < row_limit:
+            self._checkpoint()
             batch_start_time = time.time()
             batch_number += 1
 
@@ -453,28 +669,52 @@ class SyncEngine:
 
             # Calculate how many rows to fetch in this batch
             remaining = row_limit - total_count
-            current_batch_size = min(batch_size, remaining)
+            current_batch_size = min(self._next_batch_size(sizer, batch_size), remaining)
 
-            self.logger.info(f"[BATCH {batch_number}] Preparing to fetch {current_batch_size} rows (total so far: {total_count}, remaining: {remaining})")
+            self.logger.debug(
+                "[BATCH %d] Preparing to fetch %d rows (total so far: %d, remaining: %d)",
+                batch_number, current_batch_size, total_count, remaining
+            )
 
             # Fetch batch from cursor
+            fetch_start = time.time()
             rows = self._fetch_batch_from_oracle(cursor, current_batch_size, batch_number)
+            fetch_elapsed = time.time() - fetch_start
 
             if not rows:
                 break
+            self._emit(BatchFetched(duckdb_table, batch_number, len(rows), fetch_elapsed))
 
-            # Convert datetime objects
+            # Convert datetime objects (drop the raw rows so only one copy is held)
+            convert_start = time.time()
             data = self._convert_datetime_values(rows)
+            del rows
+            convert_elapsed = time.time() - convert_start
 
-            # Insert batch to DuckDB
+            # Insert batch to DuckDB (unless stopped while fetching)
+            self._checkpoint()
+            insert_start = time.time()
             self._insert_batch_to_duckdb(duckdb_table, data, duckdb_columns)
+            insert_elapsed = time.time() - insert_start
 
             total_count += len(data)
+            # Sampled once per batch for the metrics, the sizer and the governor
+            row_bytes = estimate_row_bytes(data)
+            batch_bytes = self._record_batch(len(data), row_bytes)
+            self._emit(BatchWritten(
+                duckdb_table, batch_number, len(data), batch_bytes, total_count,
+                fetch_elapsed, convert_elapsed, insert_elapsed
+            ))
 
             # Log batch timing
             batch_elapsed = time.time() - batch_start_time
-            self.logger.info(f"[BATCH {batch_number}] Processed {len(data)} rows in {batch_elapsed:.3f}s (Total: {total_count})")
-            self.logger.info(f"[PROGRESS] Total rows processed: {total_count}/{row_limit} ({total_count/row_limit*100:.1f}%)")
+            if sizer or self.memory_governor:
+                work_elapsed = batch_elapsed
+                if self.memory_governor:
+                    work_elapsed -= self.memory_governor.last_wait
+                self._observe_batch(sizer, len(data), row_bytes, work_elapsed, current_batch_size)
+            self.logger.debug("[BATCH %d] Processed %d rows in %.3fs (Total: %d)",
+                              batch_number, len(data), batch_elapsed, total_count)
             self._log_progress(duckdb_table, total_count, len(data))
 
             # CRITICAL: Stop if we reached the limit
@@ -487,6 +727,12 @@ class SyncEngine:
                 self.logger.info(f"[COMPLETE] Got less than requested ({len(data)} < {current_batch_size}). End of data.")
                 break
 
+            # Release the batch before fetching the next one
+            del data
+
+        if sizer:
+            self.save_batch_size(duckdb_table, sizer)
+
         return total_count
 
     def _build_sync_query(self, oracle_table: str, row_limit: int) -> str:
@@ -520,6 +766,14 @@ class SyncEngine:
             batch_size = self.config.sync_batch_size
         if max_duration is None:
             max_duration = self.config.sync_max_duration_seconds
+        with self._track_run(duckdb_table, "test", oracle_table):
+            return self._run_limited_sync(
+                oracle_table, duckdb_table, row_limit, duckdb_columns, batch_size, max_duration
+            )
+
+    def _run_limited_sync(self, oracle_table: str, duckdb_table: str, row_limit: int,
+                          duckdb_columns: list, batch_size: int, max_duration: int):
+        """Body of _execute_limited_sync, run inside the metrics tracking context."""
         self._validate_sync_preconditions(duckdb_table)
 
         self.logger.info("=" * 80)
@@ -560,10 +814,324 @@ class SyncEngine:
         return total_count
 
     def _log_progress(self, table: str, total_count: int, batch_count: int):
-        """Log sync progress"""
-        self.logger.info(
-            f"Sync progress - Table: {table}, Total rows: {total_count}, Batch size: {batch_count}"
-        )
+        """Log sync progress, at most once per progress_log_interval_seconds"""
+        if self._progress_log_limiter.ready():
+            self.logger.info(
+                "Sync progress - Table: %s, Total rows: %d, Batch size: %d",
+                table, total_count, batch_count
+            )
+
+    @contextmanager
+    def _track_run(self, duckdb_table: str, sync_type: str, source_table: Optional[str] = None):
+        """Collect metrics for one sync run and persist its summary.
+
+        Nested calls (e.g. full_sync -> sync_in_batches -> _execute_sync)
+        reuse the outermost run so each sync is counted once.
+
+        Args:
+            duckdb_table: Target DuckDB table name (metrics label)
+            sync_type: test, full, incremental or upsert
+            source_table: Oracle table name stored in sync_logs (defaults to duckdb_table)
+        """
+        if self.run_metrics is not None:
+            yield self.run_metrics
+            return
+
+        metrics = SyncRunMetrics(duckdb_table, sync_type)
+        self.run_metrics = metrics
+        self._progress_log_limiter.reset()
+        self._run_sync_id = self._start_run_log(metrics, source_table or duckdb_table)
+        self._emit(SyncStarted(duckdb_table, sync_type, source_table or duckdb_table))
+        # Interrupt an in-flight Oracle call as soon as a stop is requested
+        unregister = None
+        if self.cancel_token is not None:
+            unregister = self.cancel_token.on_cancel(self._interrupt_oracle_call)
+        status = "failed"
+        error_message = None
+        try:
+            yield metrics
+            status = "completed"
+            if sync_type != "incremental":
+                self._clear_stop_checkpoint(sync_type, duckdb_table)
+        except SyncCancelled as e:
+            status = "stopped"
+            error_message = str(e)
+            # Incremental runs resume from their saved state instead
+            if sync_type != "incremental":
+                self._save_stop_checkpoint(sync_type, duckdb_table, metrics)
+                self._emit(CheckpointSaved(duckdb_table, 'partial_progress', metrics.rows))
+            raise
+        except BaseException as e:
+            error_message = str(e)
+            raise
+        finally:
+            if unregister:
+                unregister()
+            self.run_metrics = None
+            self.last_run_metrics = metrics
+            metrics.finish(status)
+            self._persist_run_summary(metrics, source_table or duckdb_table, error_message)
+            self._run_sync_id = None
+            self._emit(SyncFinished(
+                duckdb_table, status, metrics.rows, metrics.elapsed, error_message,
+                metrics.summary()
+            ))
+
+    def _checkpoint(self) -> None:
+        """Batch boundary: wait while paused, raise SyncCancelled once stopped."""
+        if self.cancel_token is not None:
+            self.cancel_token.checkpoint()
+
+    def _cancellable(self, batches):
+        """Iterate fetched batches, checking for pause/stop before each fetch."""
+        while True:
+            self._checkpoint()
+            try:
+                rows = next(batches)
+            except StopIteration:
+                return
+            except Exception as e:
+                self._raise_if_cancelled(e)
+                raise
+            yield rows
+
+    def _raise_if_cancelled(self, error: Exception) -> None:
+        """Report an Oracle call interrupted by a stop request as SyncCancelled."""
+        if self.cancel_token is not None and self.cancel_token.is_cancelled:
+            raise SyncCancelled(self.cancel_token.reason or "Sync stopped") from error
+
+    def _interrupt_oracle_call(self) -> None:
+        """Cancel the Oracle call in progress (runs on the thread requesting the stop)."""
+        conn = getattr(self.oracle, 'conn', None)
+        if conn is not None:
+            self.logger.info("Stop requested: interrupting in-flight Oracle call")
+            conn.cancel()
+
+    @staticmethod
+    def _stop_checkpoint_key(sync_type: str, duckdb_table: str) -> str:
+        """Partial progress key of a run: one Oracle table may feed several DuckDB targets."""
+        return f"{sync_type}:{duckdb_table}"
+
+    def _save_stop_checkpoint(
+        self, sync_type: str, duckdb_table: str, metrics: SyncRunMetrics
+    ) -> None:
+        """Record how far a stopped sync got. Failures are logged, never raised."""
+        key = self._stop_checkpoint_key(sync_type, duckdb_table)
+        try:
+            self.save_partial_progress(key, metrics.rows, None)
+            self.logger.info(
+                f"Sync of {duckdb_table} stopped after {metrics.rows} rows; checkpoint saved"
+            )
+        except Exception as e:
+            self.logger.warning(f"Failed to save stop checkpoint for {duckdb_table}: {e}")
+
+    def _clear_stop_checkpoint(self, sync_type: str, duckdb_table: str) -> None:
+        """Drop the stop checkpoint of a target once a sync of the same type completes."""
+        key = self._stop_checkpoint_key(sync_type, duckdb_table)
+        try:
+            if self.load_partial_progress(key):
+                self.clear_partial_progress(key)
+        except Exception as e:
+            self.logger.warning(f"Failed to clear stop checkpoint for {duckdb_table}: {e}")
+
+    def _discard_stopped_run(self, duckdb_table: str) -> None:
+        """Empty the target of a full sync when the previous full sync of it was stopped.
+
+        A stopped full sync leaves a partially filled table whose primary key
+        would reject the rows of the next run, so it is refilled from scratch.
+        """
+        if not self.load_partial_progress(self._stop_checkpoint_key("full", duckdb_table)):
+            return
+        self.logger.info(f"Previous full sync of {duckdb_table} was stopped; refilling it")
+        self.duckdb.execute(f"DELETE FROM {duckdb_table}")
+
+    def _save_incremental_checkpoint(
+        self, oracle_table_name: str, duckdb_table: str, column: str, last_value: str
+    ) -> None:
+        """Make the rows a stopped incremental sync inserted a clean resume point.
+
+        Rows arrive ordered by column, so the inserted rows are a prefix of
+        the result; only the newest value may be partially inserted when its
+        rows were split across batches. Those rows are removed and the state
+        is moved to the newest complete value, so the next incremental sync
+        continues exactly where this one stopped.
+        """
+        col = quote_identifier(column)
+        try:
+            self.duckdb.execute(
+                f"DELETE FROM {duckdb_table} WHERE {col} > ? "
+                f"AND {col} = (SELECT MAX({col}) FROM {duckdb_table})",
+                [last_value],
+            )
+            rows = self.duckdb.execute(
+                f"SELECT MAX({col}) FROM {duckdb_table} WHERE {col} > ?", [last_value]
+            )
+            resume_value = rows[0][0] if rows else None
+            if resume_value is not None:
+                self.save_state(oracle_table_name, str(resume_value))
+                self._emit(CheckpointSaved(duckdb_table, 'state', str(resume_value)))
+                self.logger.info(
+                    f"Incremental sync stopped; resuming {oracle_table_name} from {resume_value}"
+                )
+        except Exception as e:
+            self.logger.warning(
+                f"Failed to save incremental resume point for {oracle_table_name}: {e}"
+            )
+
+    def _get_log_writer(self) -> 'SyncLogWriter':
+        """Buffered sync_logs writer shared by the runs of this engine."""
+        if self.log_writer is None:
+            # Imported lazily: the repository layer depends on the database layer
+            from oracle_duckdb_sync.repository.sync_log_repo import SyncLogRepository
+            from oracle_duckdb_sync.repository.sync_log_writer import SyncLogWriter
+
+            self.log_writer = SyncLogWriter(
+                SyncLogRepository(duckdb_source=self.duckdb),
+                flush_interval=self.config.sync_log_flush_interval_seconds
+            )
+        return self.log_writer
+
+    def _start_run_log(self, metrics: SyncRunMetrics, table_name: str) -> Optional[str]:
+        """Queue the 'running' sync_logs row of a run; returns its sync_id."""
+        if not self.config.sync_metrics_persist:
+            return None
+        try:
+            from oracle_duckdb_sync.models.sync_log import SyncLog, SyncStatus, SyncType
+
+            return self._get_log_writer().start(SyncLog(
+                sync_id=str(uuid.uuid4()),
+                table_name=table_name,
+                sync_type=SyncType(metrics.sync_type),
+                status=SyncStatus.RUNNING,
+                start_time=datetime.fromtimestamp(metrics.start_time),
+                duckdb_table=metrics.table,
+            ))
+        except Exception as e:
+            self.logger.warning(f"Failed to start sync log for {table_name}: {e}")
+            return None
+
+    def _persist_run_summary(
+        self, metrics: SyncRunMetrics, table_name: str, error_message: Optional[str]
+    ) -> None:
+        """Queue the run summary for sync_logs. Failures are logged, never raised."""
+        if self._run_sync_id is None:
+            return
+        try:
+            from oracle_duckdb_sync.models.sync_log import SyncStatus
+
+            self._get_log_writer().finish(
+                self._run_sync_id,
+                SyncStatus(metrics.status),
+                total_rows=metrics.rows,
+                error_message=error_message,
+                metrics=metrics.summary(),
+                end_time=datetime.fromtimestamp(metrics.start_time + metrics.elapsed),
+            )
+        except Exception as e:
+            self.logger.warning(f"Failed to persist sync run summary for {table_name}: {e}")
+
+    def flush_sync_logs(self) -> None:
+        """Write buffered sync_logs rows now (normally done in the background)."""
+        if self.log_writer is not None:
+            self.log_writer.flush()
+
+    def _record_batch(self, rows: int, row_bytes: float) -> int:
+        """Record a written batch on the current run and queue its progress, if any.
+
+        Args:
+            rows: Rows in the batch
+            row_bytes: Estimated bytes per row (estimate_row_bytes of the batch)
+
+        Returns:
+            Estimated size of the batch in bytes
+        """
+        batch_bytes = int(row_bytes * rows)
+        if self.run_metrics is None:
+            return batch_bytes
+        self.run_metrics.observe_batch(rows, batch_bytes)
+        if self._run_sync_id is not None and self.log_writer is not None:
+            self.log_writer.progress(self._run_sync_id, self.run_metrics.rows)
+        return batch_bytes
+
+    def _emit(self, event: SyncEvent) -> None:
+        """Queue an event for the event handler, if any (never blocks)."""
+        if self.events is not None:
+            self.events.publish(event)
+
+    def flush_events(self, timeout: Optional[float] = None) -> bool:
+        """Wait until the event handler has seen every emitted event.
+
+        Returns:
+            False if the timeout expired first
+        """
+        return self.events.flush(timeout) if self.events is not None else True
+
+    def _observe_stage(self, stage: str, seconds: float) -> None:
+        """Record stage timing on the current run, if any."""
+        if self.run_metrics is not None:
+            self.run_metrics.observe_stage(stage, seconds)
+
+    def refresh_typed_table(self, duckdb_table: str, column: Optional[str] = None,
+                            last_value=None) -> Optional[TypedTablePlan]:
+        """Build or refresh the typed view/table of a synced table (typed_table_mode).
+
+        The conversion plan is detected once and stored in the typed table
+        state file. An incremental refresh (column and last_value given)
+        appends only rows newer than last_value; the table is rebuilt
+        instead when it does not exist yet or the raw table's schema
+        changed. Failures are logged, never raised: the sync itself succeeded.
+
+        Args:
+            duckdb_table: Synced DuckDB table
+            column: Incremental column (None for a full rebuild)
+            last_value: Value the incremental sync started from
+
+        Returns:
+            TypedTablePlan in use, or None if disabled or the refresh failed
+        """
+        if not self.config.typed_table_mode:
+            return None
+
+        start = time.time()
+        try:
+            materializer = TypedTableMaterializer(
+                self.duckdb,
+                mode=self.config.typed_table_mode,
+                suffix=self.config.typed_table_suffix,
+                logger=self.logger,
+            )
+            stored = self.load_typed_table_plan(duckdb_table)
+            plan = TypedTablePlan.from_dict(stored) if stored else None
+
+            if column and last_value is not None and plan and materializer.is_current(plan):
+                materializer.refresh_incremental(plan, column, last_value)
+            else:
+                plan = materializer.build_plan(duckdb_table)
+                materializer.rebuild(plan)
+                self.save_typed_table_plan(duckdb_table, plan)
+            return plan
+        except Exception as e:
+            self.logger.warning(f"Failed to refresh typed table for {duckdb_table}: {e}")
+            return None
+        finally:
+            self._observe_stage("typed_table", time.time() - start)
+
+    def save_typed_table_plan(self, table_name: str, plan: TypedTablePlan,
+                              file_path: Optional[str] = None):
+        """Persist the typed table conversion plan of a table"""
+        if file_path is None:
+            file_path = self.config.typed_table_state_path
+        state = self.state_manager.load_json(file_path, default_data={})
+        state[table_name] = plan.to_dict()
+        self.state_manager.save_json(file_path, state)
+
+    def load_typed_table_plan(self, table_name: str,
+                              file_path: Optional[str] = None) -> Optional[dict]:
+        """Load the typed table conversion plan of a table (None if never built)"""
+        if file_path is None:
+            file_path = self.config.typed_table_state_path
+        state = self.state_manager.load_json(file_path, default_data={})
+        return state.get(table_name)
 
     def save_state(self, table_name: str, last_value: str, file_path: Optional[str] = None):
         """Save sync state for a table using StateFileManager"""
@@ -585,6 +1153,109 @@ class SyncEngine:
         state = self.state_manager.load_json(file_path, default_data={})
         return state.get(table_name)
 
+    def _create_batch_sizer(
+        self, duckdb_table: str, batch_size: int
+    ) -> Optional[AdaptiveBatchSizer]:
+        """Create an adaptive batch sizer seeded with the learned size for the table.
+
+        Args:
+            duckdb_table: Target DuckDB table name (key of the learned size)
+            batch_size: Configured batch size, used when nothing was learned yet
+
+        Returns:
+            AdaptiveBatchSizer, or None if adaptive batch sizing is disabled
+        """
+        if not self.config.adaptive_batch_enabled:
+            return None
+
+        memory_budget_bytes = self.config.batch_memory_budget_mb * 1024 * 1024
+        if self.memory_governor:
+            # One batch may not exceed its share of the process budget
+            governor = self.memory_governor
+            memory_budget_bytes = min(
+                memory_budget_bytes,
+                int(governor.budget_bytes * governor.batch_fraction),
+            )
+
+        learned = self.load_batch_size(duckdb_table) or {}
+        sizer = AdaptiveBatchSizer(
+            initial_size=learned.get("batch_size", batch_size),
+            min_size=self.config.adaptive_batch_min_size,
+            max_size=self.config.adaptive_batch_max_size,
+            memory_budget_bytes=memory_budget_bytes,
+            bytes_per_row=learned.get("bytes_per_row", 0.0),
+        )
+        self.logger.info(
+            f"Adaptive batch sizing enabled for {duckdb_table}: starting at {sizer.size} rows"
+        )
+        return sizer
+
+    def _next_batch_size(self, sizer: Optional[AdaptiveBatchSizer], batch_size: int) -> int:
+        """Decide the size of the next fetch.
+
+        Blocks while the process is above the memory back-off threshold, then
+        returns the adaptive (or configured) size capped by the memory budget.
+        """
+        size = sizer.current_size() if sizer else batch_size
+        if self.memory_governor:
+            self.memory_governor.wait_for_headroom()
+            size = self.memory_governor.limit_batch_size(size)
+        return size
+
+    def _observe_batch(
+        self,
+        sizer: Optional[AdaptiveBatchSizer],
+        rows: int,
+        row_bytes: float,
+        elapsed: float,
+        requested: int
+    ) -> None:
+        """Feed per-batch measurements to the batch sizer and memory governor.
+
+        requested is the size the batch was fetched with; a batch capped by
+        the memory governor is full when it holds that many rows.
+        """
+        if sizer:
+            sizer.record(rows, elapsed, row_bytes, requested)
+        if self.memory_governor:
+            self.memory_governor.observe(row_bytes)
+
+    def save_batch_size(self, table_name: str, sizer: AdaptiveBatchSizer,
+                        file_path: Optional[str] = None):
+        """Persist the learned batch size for a table
+
+        Args:
+            table_name: Name of the table
+            sizer: AdaptiveBatchSizer holding the learned values
+            file_path: Path to the batch size state file
+        """
+        if file_path is None:
+            file_path = self.config.batch_size_state_path
+        state = self.state_manager.load_json(file_path, default_data={})
+
+        import datetime
+        entry = sizer.to_dict()
+        entry["timestamp"] = datetime.datetime.now().isoformat()
+        state[table_name] = entry
+
+        self.state_manager.save_json(file_path, state)
+        self.logger.info(f"Learned batch size saved: {table_name} -> {sizer.size} rows")
+
+    def load_batch_size(self, table_name: str, file_path: Optional[str] = None) -> Optional[dict]:
+        """Load the learned batch size for a table
+
+        Args:
+            table_name: Name of the table
+            file_path: Path to the batch size state file
+
+        Returns:
+            dict: batch_size, bytes_per_row, rows_per_second, timestamp, or None
+        """
+        if file_path is None:
+            file_path = self.config.batch_size_state_path
+        state = self.state_manager.load_json(file_path, default_data={})
+        return state.get(table_name)
+
 
     def save_schema_mapping(self, table_name: str, schema: dict, version: str, file_path: Optional[str] = None):
         """Save schema mapping configuration with version tracking
@@ -708,14 +1379,14 @@ class SyncEngine:
             file_path = self.config.sync_state_path
         return self.state_manager.save_json(file_path, checkpoint)
 
-    def save_partial_progress(self, table_name: str, rows_processed: int, last_row_id: int,
-                             file_path: Optional[str] = None):
+    def save_partial_progress(self, table_name: str, rows_processed: int,
+                              last_row_id: Optional[int], file_path: Optional[str] = None):
         """Save partial progress during sync operation
 
         Args:
             table_name: Name of the table being synced
             rows_processed: Number of rows processed so far
-            last_row_id: ID of the last row processed
+            last_row_id: ID of the last row processed (None if unknown)
             file_path: Path to the progress file
         """
         if file_path is None:
@@ -0,0 +1,190 @@
+"""Typed events emitted by SyncEngine while a sync runs.
+
+A run emits, in order:
+
+- SyncStarted
+- SchemaResolved (full and test syncs)
+- BatchFetched / BatchWritten for every batch
+- SyncRetried before each retry of an incremental sync
+- CheckpointSaved when a resume point is written
+- SyncFinished (completed, failed or stopped)
+
+Events are delivered by an AsyncEventSink on a background thread, so a
+slow handler never stalls the batch loop.
+"""
+
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Callable, Optional
+
+from oracle_duckdb_sync.log.logger import setup_logger
+
+# Events a handler may fall behind by before the oldest are dropped
+DEFAULT_MAX_PENDING = 1000
+
+
+@dataclass(frozen=True)
+class SyncEvent:
+    """Base of all sync events.
+
+    Attributes:
+        table: Target DuckDB table
+        timestamp: When the event was emitted (epoch seconds)
+    """
+    table: str
+    timestamp: float = field(init=False, default_factory=time.time, compare=False)
+
+
+@dataclass(frozen=True)
+class SyncStarted(SyncEvent):
+    sync_type: str
+    source_table: str
+
+
+@dataclass(frozen=True)
+class SchemaResolved(SyncEvent):
+    source_table: str
+    columns: tuple  # (column_name, duckdb_type) pairs
+
+
+@dataclass(frozen=True)
+class BatchFetched(SyncEvent):
+    batch_number: int
+    rows: int
+    fetch_seconds: float
+
+
+@dataclass(frozen=True)
+class BatchWritten(SyncEvent):
+    batch_number: int
+    rows: int
+    bytes: int
+    total_rows: int
+    fetch_seconds: float
+    convert_seconds: float
+    write_seconds: float
+
+
+@dataclass(frozen=True)
+class CheckpointSaved(SyncEvent):
+    kind: str  # 'state' (incremental last value) or 'partial_progress' (rows of a stopped run)
+    value: object
+
+
+@dataclass(frozen=True)
+class SyncRetried(SyncEvent):
+    attempt: int  # Attempt that failed (1-based)
+    error: str
+
+
+@dataclass(frozen=True)
+class SyncFinished(SyncEvent):
+    status: str  # 'completed', 'failed' or 'stopped'
+    total_rows: int
+    elapsed_seconds: float
+    error: Optional[str]
+    summary: dict  # SyncRunMetrics.summary()
+
+
+# Events superseded by later ones, which a full buffer may drop
+DROPPABLE_EVENTS = (BatchFetched, BatchWritten)
+
+
+class AsyncEventSink:
+    """Deliver events to a handler on a background thread.
+
+    publish() only appends to a bounded buffer. When the handler falls
+    behind by max_pending events the oldest batch event is dropped; batch
+    events carry running totals, so later events supersede them. Lifecycle
+    events (start, schema, retry, checkpoint, finish) are never dropped.
+
+    Example:
+        >>> sink = AsyncEventSink(lambda event: print(event))
+        >>> sink.publish(SyncStarted("orders", "full", "APP.ORDERS"))
+        >>> sink.close()  # delivers what is left
+    """
+
+    def __init__(self, handler: Callable[[SyncEvent], None], max_pending: int = DEFAULT_MAX_PENDING,
+                 logger=None):
+        """
+        Args:
+            handler: Called with each event, on the delivery thread
+            max_pending: Events buffered for a slow handler
+            logger: Logger for handler errors
+        """
+        self.handler = handler
+        self.logger = logger or setup_logger('AsyncEventSink')
+        self.published = 0
+        self.delivered = 0
+        self.dropped = 0
+        self.max_pending = max(1, max_pending)
+
+        self._events: deque = deque()
+        self._cond = threading.Condition()
+        self._busy = False
+        self._closed = False
+        self._thread: Optional[threading.Thread] = None
+
+    def publish(self, event: SyncEvent) -> None:
+        """Queue an event for delivery (never blocks on the handler)."""
+        with self._cond:
+            if self._closed:
+                return
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name='sync-events', daemon=True)
+                self._thread.start()
+            self.published += 1
+            if len(self._events) >= self.max_pending and not self._drop_oldest_batch_event():
+                if isinstance(event, DROPPABLE_EVENTS):
+                    self.dropped += 1
+                    return
+            self._events.append(event)
+            self._cond.notify_all()
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Wait until every queued event was handled.
+
+        Returns:
+            False if the timeout expired first
+        """
+        with self._cond:
+            return self._cond.wait_for(lambda: not self._events and not self._busy, timeout)
+
+    def close(self, timeout: Optional[float] = None) -> None:
+        """Deliver the queued events and stop the delivery thread."""
+        self.flush(timeout)
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+            thread = self._thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout)
+
+    def _drop_oldest_batch_event(self) -> bool:
+        """Drop the oldest queued batch event. Returns False if none is queued."""
+        for index, queued in enumerate(self._events):
+            if isinstance(queued, DROPPABLE_EVENTS):
+                del self._events[index]
+                self.dropped += 1
+                return True
+        return False
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                self._cond.wait_for(lambda: self._events or self._closed)
+                if not self._events:
+                    return
+                event = self._events.popleft()
+                self._busy = True
+            try:
+                self.handler(event)
+            except Exception as e:
+                self.logger.warning(f"Sync event handler failed on {type(event).__name__}: {e}")
+            finally:
+                with self._cond:
+                    self._busy = False
+                    self.delivered += 1
+                    self._cond.notify_all()
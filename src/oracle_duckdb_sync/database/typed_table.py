@@ -0,0 +1,255 @@
+"""Typed copies of synced tables for the dashboard.
+
+Oracle columns often arrive as VARCHAR (numbers stored as text,
+YYYYMMDDHHmmss timestamps). Instead of detecting and converting them on
+every dashboard read, the sync detects a conversion plan once and
+materializes a typed view or table next to the synced table:
+
+    sync_table        raw copy of the Oracle table
+    sync_table_typed  same columns, converted to DOUBLE / TIMESTAMP
+
+A typed table is rebuilt after full syncs and refreshed with only the new
+rows after incremental syncs. A typed view costs nothing to refresh but
+converts on every read.
+"""
+
+import re
+from dataclasses import asdict, dataclass, field
+from typing import Optional
+
+import duckdb
+
+from oracle_duckdb_sync.config.query_constants import QUERY_CONSTANTS
+from oracle_duckdb_sync.database.duckdb_source import DuckDBSource
+
+TYPED_TABLE_MODES = ("view", "table")
+
+_DIGITS_14 = re.compile(r'^\d{14}$')
+_DIGITS_8 = re.compile(r'^\d{8}$')
+
+
+def quote_identifier(name: str) -> str:
+    """Quote a column or table name for DuckDB."""
+    return '"' + name.replace('"', '""') + '"'
+
+
+@dataclass
+class TypedColumn:
+    """One column of a typed table.
+
+    Attributes:
+        name: Column name (same in the raw and the typed table)
+        source_type: DuckDB type in the raw table
+        target_type: 'numeric' or 'datetime' when converted, None when copied as is
+        expression: SQL expression producing the typed value
+    """
+    name: str
+    source_type: str
+    target_type: Optional[str] = None
+    expression: str = ""
+
+    def __post_init__(self):
+        if not self.expression:
+            self.expression = quote_identifier(self.name)
+
+
+@dataclass
+class TypedTablePlan:
+    """Conversion plan of a synced table.
+
+    Attributes:
+        source_table: Synced (raw) DuckDB table
+        typed_table: Name of the typed view or table
+        mode: 'view' or 'table'
+        columns: Columns in source order
+    """
+    source_table: str
+    typed_table: str
+    mode: str
+    columns: list[TypedColumn] = field(default_factory=list)
+
+    @property
+    def conversions(self) -> dict:
+        """Converted columns as {column: 'numeric'|'datetime'} (the UI conversion format)."""
+        return {col.name: col.target_type for col in self.columns if col.target_type}
+
+    @property
+    def source_columns(self) -> list[tuple[str, str]]:
+        """(name, type) of the raw table the plan was built for."""
+        return [(col.name, col.source_type) for col in self.columns]
+
+    def select_sql(self, where: str = "") -> str:
+        """SELECT producing the typed rows from the raw table."""
+        select_list = ",\n    ".join(
+            f"{col.expression} AS {quote_identifier(col.name)}" for col in self.columns
+        )
+        query = f"SELECT\n    {select_list}\nFROM {self.source_table}"
+        if where:
+            query += f"\nWHERE {where}"
+        return query
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'TypedTablePlan':
+        return cls(
+            source_table=data["source_table"],
+            typed_table=data["typed_table"],
+            mode=data["mode"],
+            columns=[TypedColumn(**col) for col in data.get("columns", [])],
+        )
+
+
+def conversion_expression(name: str, target_type: str, sample_value: Optional[str]) -> str:
+    """SQL expression converting a VARCHAR column; unparsable values become NULL.
+
+    Mirrors data.converter.convert_to_datetime: 14 and 8 digit values use a
+    fixed strptime format, anything else is cast.
+    """
+    column = quote_identifier(name)
+    if target_type == 'numeric':
+        return f"TRY_CAST({column} AS DOUBLE)"
+
+    sample = (sample_value or "").strip()
+    if _DIGITS_14.match(sample):
+        return f"try_strptime(TRIM({column}), '%Y%m%d%H%M%S')"
+    if _DIGITS_8.match(sample):
+        return f"try_strptime(TRIM({column}), '%Y%m%d')"
+    return f"TRY_CAST({column} AS TIMESTAMP)"
+
+
+class TypedTableMaterializer:
+    """Builds and refreshes the typed view/table of a synced table.
+
+    Example:
+        >>> materializer = TypedTableMaterializer(duckdb, mode="table")
+        >>> plan = materializer.build_plan("sync_table")
+        >>> materializer.rebuild(plan)
+        >>> materializer.refresh_incremental(plan, "UPDATED_AT", "2024-01-01 00:00:00")
+    """
+
+    def __init__(self,
+                 duckdb_source: DuckDBSource,
+                 mode: str = "table",
+                 suffix: str = "_typed",
+                 sample_size: int = QUERY_CONSTANTS.SAMPLE_SIZE_FOR_TYPE_DETECTION,
+                 logger=None):
+        if mode not in TYPED_TABLE_MODES:
+            raise ValueError(
+                f"Unknown typed table mode '{mode}' (expected one of {TYPED_TABLE_MODES})"
+            )
+        self.duckdb = duckdb_source
+        self.mode = mode
+        self.suffix = suffix
+        self.sample_size = sample_size
+        self.logger = logger
+
+    @property
+    def _conn(self) -> duckdb.DuckDBPyConnection:
+        """Open DuckDB connection (RuntimeError once it is closed)."""
+        conn = self.duckdb.conn
+        if conn is None:
+            raise RuntimeError("DuckDB connection is closed")
+        return conn
+
+    def typed_table_name(self, source_table: str) -> str:
+        return f"{source_table}{self.suffix}"
+
+    def describe(self, table: str) -> list[tuple[str, str]]:
+        """(name, type) of the columns of a DuckDB table."""
+        rows = self._conn.execute(f"DESCRIBE {table}").fetchall()
+        return [(row[0], row[1]) for row in rows]
+
+    def build_plan(self, source_table: str) -> TypedTablePlan:
+        """Detect which VARCHAR columns hold numbers or timestamps.
+
+        Detection uses the same rules as the dashboard's automatic conversion
+        (data.converter.detect_column_type) on a sample of the raw table.
+        """
+        # Imported lazily: the data package pulls in the UI query helpers
+        from oracle_duckdb_sync.data.converter import detect_column_type
+
+        schema = self.describe(source_table)
+        varchar_columns = [name for name, col_type in schema if col_type == "VARCHAR"]
+
+        sample = None
+        if varchar_columns:
+            sample_columns = ", ".join(quote_identifier(name) for name in varchar_columns)
+            sample = self._conn.execute(
+                f"SELECT {sample_columns} FROM {source_table} LIMIT {self.sample_size}"
+            ).df()
+
+        columns = []
+        for name, col_type in schema:
+            target_type = None
+            expression = ""
+            if sample is not None and name in varchar_columns:
+                series = sample[name].astype(object)
+                detected = detect_column_type(series)
+                if detected in ('numeric', 'datetime'):
+                    non_null = series.dropna()
+                    sample_value = str(non_null.iloc[0]) if len(non_null) else None
+                    target_type = detected
+                    expression = conversion_expression(name, detected, sample_value)
+            columns.append(TypedColumn(name, col_type, target_type, expression))
+
+        plan = TypedTablePlan(source_table, self.typed_table_name(source_table), self.mode, columns)
+        conversions = plan.conversions or 'no conversions'
+        self._log("info", f"Typed table plan for {source_table}: {conversions}")
+        return plan
+
+    def is_current(self, plan: TypedTablePlan) -> bool:
+        """True if the plan matches the raw table's schema and the typed object exists."""
+        return (
+            plan.mode == self.mode
+            and plan.source_columns == self.describe(plan.source_table)
+            and self.duckdb.table_exists(plan.typed_table)
+        )
+
+    def rebuild(self, plan: TypedTablePlan) -> None:
+        """(Re)create the typed view or table from the whole raw table."""
+        if self.mode == "view":
+            self._drop(plan.typed_table, "TABLE")
+            self._conn.execute(
+                f"CREATE OR REPLACE VIEW {plan.typed_table} AS {plan.select_sql()}"
+            )
+        else:
+            self._drop(plan.typed_table, "VIEW")
+            self._conn.execute(
+                f"CREATE OR REPLACE TABLE {plan.typed_table} AS {plan.select_sql()}"
+            )
+        self._log("info", f"Typed {self.mode} {plan.typed_table} rebuilt from {plan.source_table}")
+
+    def refresh_incremental(self, plan: TypedTablePlan, column: str, last_value) -> int:
+        """Append the rows of the raw table newer than last_value.
+
+        Args:
+            plan: Current plan of the table
+            column: Incremental column of the sync
+            last_value: Value the incremental sync started from
+
+        Returns:
+            Number of rows appended (0 for views, which need no refresh)
+        """
+        if self.mode == "view":
+            return 0
+
+        newer_rows = plan.select_sql(f"{quote_identifier(column)} > ?")
+        query = f"INSERT INTO {plan.typed_table} {newer_rows}"
+        result = self._conn.execute(query, [last_value]).fetchone()
+        appended = result[0] if result else 0
+        self._log("info", f"Typed table {plan.typed_table} refreshed: {appended} new rows")
+        return appended
+
+    def _drop(self, name: str, kind: str) -> None:
+        """Drop an object of the other kind left over from a mode change."""
+        existing = self._conn.execute(
+            "SELECT table_type FROM information_schema.tables WHERE table_name = ?", [name]
+        ).fetchone()
+        if existing and existing[0] == ("VIEW" if kind == "VIEW" else "BASE TABLE"):
+            self._conn.execute(f"DROP {kind} {name}")
+
+    def _log(self, level: str, message: str) -> None:
+        if self.logger:
+            getattr(self.logger, level)(message)
@@ -1,6 +1,5 @@
 """Logging module for Oracle-DuckDB Sync."""
 
-from oracle_duckdb_sync.log.logger import cleanup_logger, setup_logger
 from oracle_duckdb_sync.log.log_stream import (
     LogEntry,
     LogStreamHandler,
@@ -8,10 +7,18 @@ from oracle_duckdb_sync.log.log_stream import (
     detach_stream_handler_from_logger,
     get_log_stream_handler,
 )
+from oracle_duckdb_sync.log.logger import (
+    AsyncQueueHandler,
+    LogRateLimiter,
+    cleanup_logger,
+    setup_logger,
+)
 
 __all__ = [
     'setup_logger',
     'cleanup_logger',
+    'AsyncQueueHandler',
+    'LogRateLimiter',
     'LogEntry',
     'LogStreamHandler',
     'get_log_stream_handler',
@@ -1,16 +1,20 @@
 """
 실시간 로그 스트리밍 모듈
 
-Queue 기반의 실시간 로그 핸들러를 제공하여
+링 버퍼 기반의 실시간 로그 핸들러를 제공하여
 UI에서 동기화 작업의 로그를 실시간으로 확인할 수 있습니다.
 """
 
 import logging
+import threading
 from collections import deque
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from datetime import datetime
 from typing import Optional
 
+# 기본 링 버퍼 크기 (LogEntry 참조만 보관하므로 수천 건도 부담이 적음)
+DEFAULT_MAX_SIZE = 5000
+
 
 @dataclass
 class LogEntry:
@@ -23,12 +27,14 @@ class LogEntry:
         source: 로그 소스 (SyncEngine, SyncWorker 등)
         message: 로그 메시지
         details: 추가 상세 정보 (선택적)
+        seq: 핸들러가 부여한 시퀀스 번호 (저장 전에는 -1)
     """
     timestamp: datetime
     level: str
     source: str
     message: str
     details: Optional[dict] = None
+    seq: int = -1
 
     def to_dict(self) -> dict:
         """딕셔너리로 변환"""
@@ -37,7 +43,8 @@ class LogEntry:
             'level': self.level,
             'source': self.source,
             'message': self.message,
-            'details': self.details
+            'details': self.details,
+            'seq': self.seq
         }
 
     def __str__(self) -> str:
@@ -48,25 +55,38 @@ class LogEntry:
 
 class LogStreamHandler(logging.Handler):
     """
-    Queue 기반 실시간 로그 핸들러
+    링 버퍼 기반 실시간 로그 핸들러
 
-    메모리 내 deque를 사용하여 최근 로그를 저장하고,
-    UI에서 실시간으로 로그를 조회할 수 있도록 합니다.
+    미리 할당한 고정 크기 링 버퍼에 최근 로그를 저장합니다.
+    각 로그에는 단조 증가하는 시퀀스 번호(seq)가 붙으며, 레벨별/소스별로
+    seq 색인을 유지합니다. UI는 마지막으로 읽은 seq(커서)를 기억해 두고
+    read_since()로 그 이후의 새 로그만 가져오므로, 조회 비용은 버퍼 크기가
+    아니라 새로 들어온 로그 수에 비례합니다.
 
     Attributes:
-        log_queue: 최근 로그를 저장하는 deque (maxlen으로 자동 관리)
         max_size: 저장할 최대 로그 수
+        next_seq: 다음 로그에 부여될 시퀀스 번호
     """
 
-    def __init__(self, max_size: int = 100, level: int = logging.INFO):
+    def __init__(self, max_size: int = DEFAULT_MAX_SIZE, level: int = logging.INFO):
         """
         Args:
-            max_size: 저장할 최대 로그 수 (기본값: 100)
+            max_size: 저장할 최대 로그 수 (기본값: DEFAULT_MAX_SIZE)
             level: 최소 로그 레벨 (기본값: INFO)
         """
         super().__init__(level)
-        self.log_queue: deque[LogEntry] = deque(maxlen=max_size)
+        if max_size <= 0:
+            raise ValueError("max_size must be positive")
         self.max_size = max_size
+        self.next_seq = 0
+        # clear() 이전의 로그는 버퍼에 남아 있어도 읽지 않음
+        self._start_seq = 0
+        self._slots: list[Optional[LogEntry]] = [None] * max_size
+        # 레벨/소스 -> 해당 로그의 seq (오래된 것부터, 버퍼에서 밀려난 seq는 읽을 때 건너뜀)
+        self._by_level: dict[str, deque[int]] = {}
+        self._by_source: dict[str, deque[int]] = {}
+        # 버퍼/색인 보호 (emit 밖의 read_since, clear에서도 사용)
+        self._buffer_lock = threading.RLock()
 
     def emit(self, record: logging.LogRecord):
         """
@@ -88,14 +108,94 @@ class LogStreamHandler(logging.Handler):
                     'funcName': record.funcName,
                 } if record.exc_info else None
             )
+            self.append(entry)
 
-            # Queue에 추가 (deque의 maxlen이 자동으로 관리)
-            self.log_queue.append(entry)
-
-        except Exception as e:
+        except Exception:
             # 핸들러 자체에서 에러 발생 시 무시 (로그 시스템 보호)
             self.handleError(record)
 
+    def append(self, entry: LogEntry) -> int:
+        """
+        엔트리를 버퍼에 추가하고 seq 부여
+
+        Returns:
+            부여된 시퀀스 번호
+        """
+        with self._buffer_lock:
+            seq = self.next_seq
+            entry.seq = seq
+            self._slots[seq % self.max_size] = entry
+            self._index(self._by_level, entry.level, seq)
+            self._index(self._by_source, entry.source, seq)
+            self.next_seq = seq + 1
+            return seq
+
+    def _index(self, index: dict[str, deque[int]], key: str, seq: int):
+        seqs = index.get(key)
+        if seqs is None:
+            seqs = index[key] = deque(maxlen=self.max_size)
+        seqs.append(seq)
+
+    @property
+    def first_seq(self) -> int:
+        """버퍼에 남아 있는 가장 오래된 로그의 seq"""
+        return max(self._start_seq, self.next_seq - self.max_size)
+
+    @property
+    def last_seq(self) -> int:
+        """가장 최근 로그의 seq (로그가 없으면 -1)"""
+        return self.next_seq - 1
+
+    def read_since(
+        self,
+        cursor: int = -1,
+        level: Optional[str] = None,
+        source: Optional[str] = None,
+        limit: Optional[int] = None
+    ) -> tuple[list[LogEntry], int]:
+        """
+        커서 이후의 새 로그 조회
+
+        Args:
+            cursor: 마지막으로 읽은 seq (처음이면 -1)
+            level: 필터링할 로그 레벨 (None이면 전체)
+            source: 필터링할 로그 소스 (None이면 전체)
+            limit: 최대 조회 수 (None이면 전체, 넘치면 최신 로그 우선)
+
+        Returns:
+            (LogEntry 리스트 (최신 로그가 마지막), 다음 호출에 넘길 커서)
+        """
+        with self._buffer_lock:
+            new_cursor = self.last_seq
+            start = max(cursor + 1, self.first_seq)
+            if start > new_cursor:
+                return [], new_cursor
+
+            if level is None and source is None:
+                first = start if limit is None else max(start, new_cursor + 1 - limit)
+                slots = (self._slots[seq % self.max_size] for seq in range(first, new_cursor + 1))
+                return [entry for entry in slots if entry is not None], new_cursor
+
+            # 색인이 작은 쪽을 최신부터 역순으로 훑고 나머지 조건은 엔트리에서 확인
+            candidates = [
+                index.get(key, ())
+                for index, key in ((self._by_level, level), (self._by_source, source))
+                if key is not None
+            ]
+            seqs = min(candidates, key=len)
+
+            entries: list[LogEntry] = []
+            for seq in reversed(seqs):
+                if seq < start or (limit is not None and len(entries) >= limit):
+                    break
+                entry = self._slots[seq % self.max_size]
+                if entry is None or (level is not None and entry.level != level):
+                    continue
+                if source is None or entry.source == source:
+                    entries.append(entry)
+            entries.reverse()
+            return entries, new_cursor
+
     def get_logs(self, count: Optional[int] = None, level: Optional[str] = None) -> list[LogEntry]:
         """
         저장된 로그를 조회
@@ -107,25 +207,20 @@ class LogStreamHandler(logging.Handler):
         Returns:
             LogEntry 리스트 (최신 로그가 마지막)
         """
-        logs = list(self.log_queue)
-
-        # 레벨 필터링
-        if level:
-            logs = [log for log in logs if log.level == level]
-
-        # 개수 제한
-        if count:
-            logs = logs[-count:]
-
-        return logs
+        entries, _ = self.read_since(-1, level=level, limit=count or None)
+        return entries
 
     def clear(self):
-        """저장된 모든 로그 삭제"""
-        self.log_queue.clear()
+        """저장된 모든 로그 삭제 (seq는 계속 증가하므로 기존 커서는 그대로 유효)"""
+        with self._buffer_lock:
+            self._by_level.clear()
+            self._by_source.clear()
+            self._start_seq = self.next_seq
 
     def get_count(self) -> int:
         """저장된 로그 수 반환"""
-        return len(self.log_queue)
+        with self._buffer_lock:
+            return self.next_seq - self.first_seq
 
     def get_latest(self, count: int = 10) -> list[LogEntry]:
         """
@@ -137,7 +232,7 @@ class LogStreamHandler(logging.Handler):
         Returns:
             최근 LogEntry 리스트
         """
-        return list(self.log_queue)[-count:]
+        return self.get_logs(count=count)
 
 
 # ============================================================================
@@ -145,9 +240,10 @@ class LogStreamHandler(logging.Handler):
 # ============================================================================
 
 _global_stream_handler: Optional[LogStreamHandler] = None
+_stream_handler_lock = threading.Lock()
 
 
-def get_log_stream_handler(max_size: int = 100) -> LogStreamHandler:
+def get_log_stream_handler(max_size: int = DEFAULT_MAX_SIZE) -> LogStreamHandler:
     """
     전역 로그 스트림 핸들러를 가져오거나 생성
 
@@ -162,13 +258,14 @@ def get_log_stream_handler(max_size: int = 100) -> LogStreamHandler:
     """
     global _global_stream_handler
 
-    if _global_stream_handler is None:
-        _global_stream_handler = LogStreamHandler(max_size=max_size)
+    with _stream_handler_lock:
+        if _global_stream_handler is None:
+            _global_stream_handler = LogStreamHandler(max_size=max_size)
 
     return _global_stream_handler
 
 
-def attach_stream_handler_to_logger(logger_name: str = None, max_size: int = 100):
+def attach_stream_handler_to_logger(logger_name: str = None, max_size: int = DEFAULT_MAX_SIZE):
     """
     특정 로거에 스트림 핸들러 연결
 
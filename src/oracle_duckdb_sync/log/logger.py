@@ -1,10 +1,155 @@
+import atexit
+import copy
 import logging
+import logging.handlers
+import os
+import queue
 import sys
+import threading
+import time
+from typing import Optional
 
 
-def setup_logger(name: str, log_file: str = "sync.log", level=logging.INFO):
+class _LogDispatcher:
+    """Process-wide queue drained by a single background thread.
+
+    Every AsyncQueueHandler enqueues ``(handler, record)`` here, so the
+    process runs one logging thread no matter how many loggers exist. The
+    thread hands each record to the handlers of the AsyncQueueHandler that
+    enqueued it.
+    """
+
+    def __init__(self):
+        self._queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._lock = threading.Lock()
+        self._thread = None
+
+    @property
+    def alive(self) -> bool:
+        thread = self._thread
+        return thread is not None and thread.is_alive()
+
+    def enqueue(self, handler: 'AsyncQueueHandler', record: logging.LogRecord) -> None:
+        self._ensure_started()
+        self._queue.put_nowait((handler, record))
+
+    def flush(self) -> None:
+        """Block until every record enqueued so far has been delivered."""
+        if not self.alive or threading.current_thread() is self._thread:
+            return
+        done = threading.Event()
+        self._queue.put_nowait((None, done))
+        done.wait()
+
+    def stop(self) -> None:
+        """Deliver the queued records and stop the thread."""
+        with self._lock:
+            thread, self._thread = self._thread, None
+        if thread is not None and thread.is_alive():
+            self._queue.put_nowait((None, None))
+            thread.join()
+
+    def _ensure_started(self) -> None:
+        if self.alive:
+            return
+        with self._lock:
+            if not self.alive:
+                self._thread = threading.Thread(target=self._run, name='LogDispatcher', daemon=True)
+                self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            handler, item = self._queue.get()
+            if handler is None:
+                if item is None:
+                    return
+                item.set()
+            else:
+                try:
+                    handler.deliver(item)
+                except Exception:
+                    # A failing filter or handler must not stop the thread all loggers share
+                    handler.handleError(item)
+
+
+_dispatcher = _LogDispatcher()
+atexit.register(_dispatcher.stop)
+
+
+class AsyncQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler writing through the process-wide log dispatcher thread.
+
+    The calling thread only enqueues the record; formatting and the
+    console/file writes happen on the dispatcher thread. Closing the handler
+    first waits for every queued record, so ``handler.close()`` still
+    guarantees the log file is complete.
+    """
+
+    def __init__(self, handlers: list):
+        super().__init__(_dispatcher._queue)
+        self.target_handlers = handlers
+        self._stopped = False
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        if not self._stopped:
+            _dispatcher.enqueue(self, record)
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Keep msg/args unformatted: the dispatcher thread formats the record.
+        # Exceptions are rendered now because the traceback refers to live frames.
+        record = copy.copy(record)
+        if record.exc_info and not record.exc_text:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+    def deliver(self, record: logging.LogRecord) -> None:
+        """Write a record to the target handlers (called on the dispatcher thread)."""
+        if self._stopped:
+            return
+        for handler in self.target_handlers:
+            if record.levelno >= handler.level:
+                handler.handle(record)
+
+    def flush(self):
+        """Block until every record enqueued so far has been written."""
+        _dispatcher.flush()
+
+    def close(self):
+        if not self._stopped:
+            _dispatcher.flush()
+            self._stopped = True
+        for handler in self.target_handlers:
+            handler.close()
+        super().close()
+
+    @property
+    def running(self) -> bool:
+        """True while records logged through this handler are delivered."""
+        return not self._stopped
+
+
+def setup_logger(name: str, log_file: str = "sync.log", level=logging.INFO,
+                 non_blocking: bool = True):
+    """Create a logger writing to stdout and ``log_file``.
+
+    Calling it again for a logger already set up with the same file, level
+    and mode returns it unchanged: objects set up their logger on every
+    construction, and replacing a live handler would stop its listener
+    while other threads are still logging through it.
+
+    Args:
+        name: Logger name
+        log_file: Log file path
+        level: Logger level
+        non_blocking: Write through the process-wide log dispatcher thread
+            so callers never wait on console or file I/O (default: True)
+    """
     logger = logging.getLogger(name)
     logger.setLevel(level)
+    signature = (os.path.abspath(log_file), level, non_blocking)
+    if _is_configured(logger, signature):
+        return logger
 
     # Remove old handlers first to prevent accumulation
     for handler in logger.handlers[:]:
@@ -16,7 +161,6 @@ def setup_logger(name: str, log_file: str = "sync.log", level=logging.INFO):
     # 콘솔 출력
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setFormatter(formatter)
-    logger.addHandler(console_handler)
 
     # 파일 출력 (즉시 flush)
     file_handler = logging.FileHandler(log_file)
@@ -24,11 +168,32 @@ def setup_logger(name: str, log_file: str = "sync.log", level=logging.INFO):
     file_handler.setLevel(level)
     # Force flush after every log
     file_handler.flush = lambda: file_handler.stream.flush() if file_handler.stream else None  # type: ignore[method-assign]
-    logger.addHandler(file_handler)
+
+    handlers: list[logging.Handler]
+    if non_blocking:
+        handlers = [AsyncQueueHandler([console_handler, file_handler])]
+    else:
+        handlers = [console_handler, file_handler]
+    for handler in handlers:
+        handler._setup_signature = signature  # type: ignore[attr-defined]
+        logger.addHandler(handler)
 
     return logger
 
 
+def _is_configured(logger: logging.Logger, signature: tuple) -> bool:
+    """True if setup_logger configured logger with signature and its handlers still run."""
+    owned = [handler for handler in logger.handlers if hasattr(handler, '_setup_signature')]
+    if not owned:
+        return False
+    for handler in owned:
+        if handler._setup_signature != signature:
+            return False
+        if isinstance(handler, AsyncQueueHandler) and not handler.running:
+            return False
+    return True
+
+
 def cleanup_logger(logger):
     """Close all handlers and remove them"""
     for handler in logger.handlers[:]:
@@ -36,6 +201,30 @@ def cleanup_logger(logger):
         logger.removeHandler(handler)
 
 
+class LogRateLimiter:
+    """Allow a log line at most once per interval.
+
+    Used for per-batch progress logging so the hot loop logs every N seconds
+    instead of every batch. An interval of 0 allows every call.
+    """
+
+    def __init__(self, interval_seconds: float):
+        self.interval_seconds = interval_seconds
+        self._last: Optional[float] = None
+
+    def ready(self) -> bool:
+        """Return True (and restart the interval) if a line may be logged now."""
+        now = time.monotonic()
+        if self._last is not None and now - self._last < self.interval_seconds:
+            return False
+        self._last = now
+        return True
+
+    def reset(self) -> None:
+        """Let the next call through (e.g. at the start of a new run)."""
+        self._last = None
+
+
 def get_logger(name: str):
     """Get or create a logger with the given name."""
     logger = logging.getLogger(name)
@@ -1,5 +1,6 @@
 """Menu management module for Oracle-DuckDB Sync."""
 
+from oracle_duckdb_sync.menu.cache import MenuTreeCache, get_menu_cache
 from oracle_duckdb_sync.menu.models import DEFAULT_MENUS, Menu
 from oracle_duckdb_sync.menu.repository import MenuRepository
 from oracle_duckdb_sync.menu.service import MenuService
@@ -9,4 +10,6 @@ __all__ = [
     'DEFAULT_MENUS',
     'MenuRepository',
     'MenuService',
+    'MenuTreeCache',
+    'get_menu_cache',
 ]
@@ -0,0 +1,92 @@
+"""
+메뉴 캐시
+
+활성 메뉴 전체를 한 번의 쿼리로 읽어 메모리에 보관하고, 역할별 메뉴 트리를
+미리 계산해 둡니다. 메뉴가 생성/수정/삭제되면 invalidate()로 전체를 비우며,
+version이 증가하므로 메뉴에서 파생된 다른 캐시(메뉴 검색 등)도 함께 갱신됩니다.
+"""
+
+import copy
+import threading
+from typing import Callable, List, Optional
+
+from oracle_duckdb_sync.menu.models import Menu
+
+
+class MenuTreeCache:
+    """
+    역할별 메뉴 트리 캐시
+
+    Example:
+        >>> cache = get_menu_cache()
+        >>> tree = cache.get_tree('user', build_tree)
+        >>> cache.invalidate()  # 메뉴 변경 시
+    """
+
+    def __init__(self):
+        self._menus: Optional[List[Menu]] = None
+        self._trees: dict[str, List[dict]] = {}
+        self._lock = threading.Lock()
+        self.version = 0
+        self.loads = 0
+
+    def get_menus(self, loader: Callable[[], List[Menu]]) -> List[Menu]:
+        """
+        활성 메뉴 전체 (캐시에 없으면 loader로 한 번 조회)
+
+        Args:
+            loader: 활성 메뉴 전체를 조회하는 함수 (예: MenuRepository.get_all)
+
+        Returns:
+            Menu 리스트 (order, name 순)
+        """
+        with self._lock:
+            if self._menus is None:
+                self._menus = loader()
+                self.loads += 1
+            return list(self._menus)
+
+    def get_tree(self, role: str, builder: Callable[[], List[dict]]) -> List[dict]:
+        """
+        역할별 메뉴 트리 (캐시에 없으면 builder로 생성)
+
+        Args:
+            role: 역할 값 (예: 'admin')
+            builder: 메뉴 트리를 생성하는 함수
+
+        Returns:
+            메뉴 트리 복사본 (호출자가 수정해도 캐시에 영향 없음)
+        """
+        with self._lock:
+            tree = self._trees.get(role)
+            version = self.version
+
+        if tree is None:
+            tree = builder()
+            with self._lock:
+                # 생성 중에 무효화되었으면 오래된 트리를 저장하지 않음
+                if version == self.version:
+                    self._trees[role] = tree
+
+        return copy.deepcopy(tree)
+
+    def invalidate(self) -> None:
+        """메뉴 목록과 모든 역할의 트리 무효화"""
+        with self._lock:
+            self._menus = None
+            self._trees.clear()
+            self.version += 1
+
+
+_global_menu_cache: Optional[MenuTreeCache] = None
+_menu_cache_lock = threading.Lock()
+
+
+def get_menu_cache() -> MenuTreeCache:
+    """전역 메뉴 캐시 반환 (없으면 생성)"""
+    global _global_menu_cache
+
+    with _menu_cache_lock:
+        if _global_menu_cache is None:
+            _global_menu_cache = MenuTreeCache()
+        return _global_menu_cache
@@ -6,10 +6,11 @@
 
 from typing import List, Optional
 
-from oracle_duckdb_sync.auth.models import User
+from oracle_duckdb_sync.auth.models import User, UserRole
 from oracle_duckdb_sync.config import Config
 from oracle_duckdb_sync.database.duckdb_source import DuckDBSource
 from oracle_duckdb_sync.log.logger import setup_logger
+from oracle_duckdb_sync.menu.cache import get_menu_cache
 from oracle_duckdb_sync.menu.models import DEFAULT_MENUS, Menu
 from oracle_duckdb_sync.menu.repository import MenuRepository
 
@@ -27,8 +28,25 @@ class MenuService:
             config: 애플리케이션 설정
             duckdb_source: DuckDB 소스 객체
         """
+        if not config and not duckdb_source:
+            raise ValueError("Either config or duckdb_source must be provided")
+
         self.logger = setup_logger('MenuService')
-        self.menu_repo = MenuRepository(config=config, duckdb_source=duckdb_source)
+        self.config = config
+        self.duckdb_source = duckdb_source
+        self.cache = get_menu_cache()
+        self._menu_repo: Optional[MenuRepository] = None
+
+    @property
+    def menu_repo(self) -> MenuRepository:
+        """메뉴 저장소 (캐시 미스 시에만 DB에 연결하도록 처음 사용할 때 생성)"""
+        if self._menu_repo is None:
+            self._menu_repo = MenuRepository(config=self.config, duckdb_source=self.duckdb_source)
+        return self._menu_repo
+
+    def _get_active_menus(self) -> List[Menu]:
+        """활성 메뉴 전체 (한 번의 쿼리로 조회 후 캐시)"""
+        return self.cache.get_menus(lambda: self.menu_repo.get_all(include_inactive=False))
 
     def get_menus_for_user(self, user: User) -> List[Menu]:
         """
@@ -41,7 +59,7 @@ class MenuService:
             접근 가능한 Menu 리스트
         """
         # 모든 활성 메뉴 조회
-        all_menus = self.menu_repo.get_all(include_inactive=False)
+        all_menus = self._get_active_menus()
 
         # 권한 필터링
         accessible_menus = []
@@ -62,59 +80,51 @@ class MenuService:
         Returns:
             접근 가능한 최상위 Menu 리스트
         """
-        top_menus = self.menu_repo.get_top_level_menus(include_inactive=False)
-
-        accessible_menus = []
-        for menu in top_menus:
-            if self._can_access_menu(user, menu):
-                accessible_menus.append(menu)
-
-        return accessible_menus
+        return [
+            menu for menu in self._get_active_menus()
+            if menu.parent_id is None and self._can_access_menu(user, menu)
+        ]
 
     def get_menu_tree_for_user(self, user: User) -> List[dict]:
         """
         사용자 권한에 맞는 메뉴 트리 구조 생성
 
+        트리는 역할별로 캐시되며, 메뉴가 변경될 때까지 DB를 조회하지 않습니다.
+
         Args:
             user: 사용자 객체
 
         Returns:
             계층 구조의 메뉴 트리 (딕셔너리 리스트)
         """
-        # 최상위 메뉴 조회
-        top_menus = self.get_top_level_menus_for_user(user)
-
-        # 각 최상위 메뉴에 대해 하위 메뉴 추가
-        menu_tree = []
-        for menu in top_menus:
-            menu_dict = menu.to_dict()
-            menu_dict['children'] = self._get_accessible_children(user, menu.id)
-            menu_tree.append(menu_dict)
-
-        return menu_tree
+        role = user.role.value if isinstance(user.role, UserRole) else str(user.role)
+        return self.cache.get_tree(role, lambda: self._build_menu_tree(user))
 
-    def _get_accessible_children(self, user: User, parent_id: int) -> List[dict]:
+    def _build_menu_tree(self, user: User) -> List[dict]:
         """
-        사용자가 접근 가능한 하위 메뉴 조회 (재귀)
+        활성 메뉴 전체로부터 메모리에서 메뉴 트리 생성
 
         Args:
             user: 사용자 객체
-            parent_id: 상위 메뉴 ID
 
         Returns:
-            접근 가능한 하위 메뉴 리스트
+            접근 가능한 메뉴 트리
         """
-        children = self.menu_repo.get_children(parent_id, include_inactive=False)
-
-        accessible_children = []
-        for child in children:
-            if self._can_access_menu(user, child):
-                child_dict = child.to_dict()
-                # 재귀적으로 하위 메뉴 조회
-                child_dict['children'] = self._get_accessible_children(user, child.id)
-                accessible_children.append(child_dict)
-
-        return accessible_children
+        # parent_id 별로 그룹화 (get_all의 order, name 정렬 유지)
+        children_by_parent: dict = {}
+        for menu in self._get_active_menus():
+            children_by_parent.setdefault(menu.parent_id, []).append(menu)
+
+        def build(parent_id) -> List[dict]:
+            nodes = []
+            for menu in children_by_parent.get(parent_id, []):
+                if self._can_access_menu(user, menu):
+                    menu_dict = menu.to_dict()
+                    menu_dict['children'] = build(menu.id)
+                    nodes.append(menu_dict)
+            return nodes
+
+        return build(None)
 
     def _can_access_menu(self, user: User, menu: Menu) -> bool:
         """
@@ -150,15 +160,21 @@ class MenuService:
 
     def create_menu(self, menu: Menu) -> Menu:
         """메뉴 생성"""
-        return self.menu_repo.create(menu)
+        created = self.menu_repo.create(menu)
+        self.cache.invalidate()
+        return created
 
     def update_menu(self, menu: Menu) -> Menu:
         """메뉴 업데이트"""
-        return self.menu_repo.update(menu)
+        updated = self.menu_repo.update(menu)
+        self.cache.invalidate()
+        return updated
 
     def delete_menu(self, menu_id: int) -> bool:
         """메뉴 삭제"""
-        return self.menu_repo.delete(menu_id)
+        deleted = self.menu_repo.delete(menu_id)
+        self.cache.invalidate()
+        return deleted
 
     def get_menu_by_id(self, menu_id: int) -> Optional[Menu]:
         """ID로 메뉴 조회"""
@@ -210,5 +226,8 @@ class MenuService:
             except Exception as e:
                 self.logger.error(f"Failed to create default menu {menu.name}: {e}")
 
+        if created_count:
+            self.cache.invalidate()
+
         self.logger.info(f"Initialized {created_count} default menus")
         return created_count
@@ -0,0 +1,20 @@
+"""Metrics module for Oracle-DuckDB Sync."""
+
+from oracle_duckdb_sync.metrics.registry import (
+    Counter,
+    Histogram,
+    MetricsRegistry,
+    get_metrics_registry,
+)
+from oracle_duckdb_sync.metrics.server import start_metrics_server, stop_metrics_server
+from oracle_duckdb_sync.metrics.sync_metrics import SyncRunMetrics
+
+__all__ = [
+    'Counter',
+    'Histogram',
+    'MetricsRegistry',
+    'get_metrics_registry',
+    'start_metrics_server',
+    'stop_metrics_server',
+    'SyncRunMetrics',
+]
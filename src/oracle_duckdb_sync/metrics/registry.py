@@ -0,0 +1,214 @@
+"""
+In-process metrics registry
+
+Counter/Histogram 메트릭을 레이블별로 집계하고
+Prometheus 텍스트 포맷으로 노출합니다.
+"""
+
+import bisect
+import threading
+from typing import Optional, TypeVar
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+
+def _escape_label_value(value) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(labelnames: tuple, values: tuple, extra: Optional[dict] = None) -> str:
+    pairs = list(zip(labelnames, values))
+    if extra:
+        pairs.extend(extra.items())
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape_label_value(value)}"' for name, value in pairs) + "}"
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+class _Metric:
+    """Common label handling for metrics."""
+
+    kind = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: tuple = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def _key(self, labels: dict) -> tuple:
+        if set(labels) != set(self.labelnames):
+            raise ValueError(
+                f"Metric {self.name} expects labels {self.labelnames}, got {tuple(labels)}"
+            )
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def samples(self) -> list:
+        """Return (sample_name, label_values, extra_labels, value) tuples."""
+        raise NotImplementedError
+
+
+MetricT = TypeVar("MetricT", bound=_Metric)
+
+
+class Counter(_Metric):
+    """Monotonically increasing counter."""
+
+    kind = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: tuple = ()):
+        super().__init__(name, documentation, labelnames)
+        self._values: dict[tuple, float] = {}
+
+    def inc(self, amount: float = 1.0, **labels) -> None:
+        if amount < 0:
+            raise ValueError("Counters can only be incremented")
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def get(self, **labels) -> float:
+        return self._values.get(self._key(labels), 0.0)
+
+    def samples(self) -> list:
+        with self._lock:
+            return [(self.name, key, {}, value) for key, value in sorted(self._values.items())]
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return dict(self._values)
+
+
+class Histogram(_Metric):
+    """Histogram with cumulative buckets, count and sum per label set."""
+
+    kind = "histogram"
+
+    def __init__(self, name: str, documentation: str, labelnames: tuple = (),
+                 buckets: tuple = DEFAULT_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        self._values: dict[tuple, dict] = {}
+
+    def observe(self, value: float, **labels) -> None:
+        key = self._key(labels)
+        with self._lock:
+            state = self._values.get(key)
+            if state is None:
+                state = {"buckets": [0] * len(self.buckets), "count": 0, "sum": 0.0}
+                self._values[key] = state
+            index = bisect.bisect_left(self.buckets, value)
+            if index < len(self.buckets):
+                state["buckets"][index] += 1
+            state["count"] += 1
+            state["sum"] += value
+
+    def get(self, **labels) -> dict:
+        """Return count and sum for a label set."""
+        state = self._values.get(self._key(labels))
+        if not state:
+            return {"count": 0, "sum": 0.0}
+        return {"count": state["count"], "sum": state["sum"]}
+
+    def samples(self) -> list:
+        samples = []
+        with self._lock:
+            for key, state in sorted(self._values.items()):
+                cumulative = 0
+                for bound, count in zip(self.buckets, state["buckets"]):
+                    cumulative += count
+                    le = _format_value(bound)
+                    samples.append((f"{self.name}_bucket", key, {"le": le}, cumulative))
+                samples.append((f"{self.name}_bucket", key, {"le": "+Inf"}, state["count"]))
+                samples.append((f"{self.name}_count", key, {}, state["count"]))
+                samples.append((f"{self.name}_sum", key, {}, state["sum"]))
+        return samples
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {key: {"count": s["count"], "sum": s["sum"]} for key, s in self._values.items()}
+
+
+class MetricsRegistry:
+    """
+    메트릭 레지스트리
+
+    같은 이름으로 다시 등록하면 기존 메트릭을 반환하므로
+    여러 모듈에서 안전하게 공유할 수 있습니다.
+    """
+
+    def __init__(self):
+        self._metrics: dict[str, _Metric] = {}
+        self._lock = threading.Lock()
+
+    def _register(self, metric_cls: type[MetricT], name: str, documentation: str,
+                  labelnames: tuple, **kwargs) -> MetricT:
+        with self._lock:
+            existing = self._metrics.get(name)
+            if existing is not None:
+                if not isinstance(existing, metric_cls) or existing.labelnames != tuple(labelnames):
+                    raise ValueError(
+                        f"Metric {name} already registered with a different type or labels"
+                    )
+                return existing
+            metric = metric_cls(name, documentation, labelnames, **kwargs)
+            self._metrics[name] = metric
+            return metric
+
+    def counter(self, name: str, documentation: str, labelnames: tuple = ()) -> Counter:
+        return self._register(Counter, name, documentation, labelnames)
+
+    def histogram(self, name: str, documentation: str, labelnames: tuple = (),
+                  buckets: tuple = DEFAULT_BUCKETS) -> Histogram:
+        return self._register(Histogram, name, documentation, labelnames, buckets=buckets)
+
+    def get(self, name: str) -> Optional[_Metric]:
+        return self._metrics.get(name)
+
+    def render_prometheus(self) -> str:
+        """Render all metrics in the Prometheus text exposition format (v0.0.4)."""
+        lines = []
+        with self._lock:
+            metrics = list(self._metrics.values())
+        for metric in sorted(metrics, key=lambda m: m.name):
+            lines.append(f"# HELP {metric.name} {metric.documentation}")
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+            for sample_name, key, extra, value in metric.samples():
+                labels = _format_labels(metric.labelnames, key, extra)
+                lines.append(f"{sample_name}{labels} {_format_value(value)}")
+        return "\n".join(lines) + "\n"
+
+    def clear(self) -> None:
+        """Remove all registered metrics (mainly for tests)."""
+        with self._lock:
+            self._metrics.clear()
+
+
+# ============================================================================
+# 전역 메트릭 레지스트리 인스턴스
+# ============================================================================
+
+_global_registry: Optional[MetricsRegistry] = None
+
+
+def get_metrics_registry() -> MetricsRegistry:
+    """
+    전역 메트릭 레지스트리를 가져오거나 생성
+
+    Returns:
+        MetricsRegistry 인스턴스
+    """
+    global _global_registry
+
+    if _global_registry is None:
+        _global_registry = MetricsRegistry()
+
+    return _global_registry
@@ -0,0 +1,116 @@
+"""
+Prometheus 메트릭 HTTP 엔드포인트
+
+GET /metrics 요청에 전역 레지스트리를 Prometheus 텍스트 포맷으로 응답합니다.
+GET /sync/progress[/<sync_id>] 요청에는 동기화 진행 이벤트를
+Server-Sent Events 스트림으로 보냅니다 (sync_id 지정 시 종료 이벤트 후 닫힘).
+"""
+
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional
+
+from oracle_duckdb_sync.log.logger import setup_logger
+from oracle_duckdb_sync.metrics.registry import MetricsRegistry, get_metrics_registry
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+SSE_CONTENT_TYPE = "text/event-stream; charset=utf-8"
+PROGRESS_PATH = "/sync/progress"
+
+# 이벤트가 없을 때 연결 유지를 위한 주석 전송 주기 (초)
+SSE_KEEPALIVE_SECONDS = 15.0
+
+_servers: dict[int, ThreadingHTTPServer] = {}
+_servers_lock = threading.Lock()
+
+
+def _make_handler(registry: MetricsRegistry):
+    class MetricsHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            path = self.path.split("?", 1)[0].rstrip("/")
+            if path == PROGRESS_PATH or path.startswith(PROGRESS_PATH + "/"):
+                self._stream_progress(path[len(PROGRESS_PATH) + 1:] or None)
+                return
+            if path != "/metrics":
+                self.send_error(404)
+                return
+            body = registry.render_prometheus().encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", CONTENT_TYPE)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def _stream_progress(self, sync_id):
+            # Imported lazily: the scheduler package imports the sync engine, which imports metrics
+            from oracle_duckdb_sync.scheduler.progress_bus import get_progress_bus
+
+            self.send_response(200)
+            self.send_header("Content-Type", SSE_CONTENT_TYPE)
+            self.send_header("Cache-Control", "no-cache")
+            self.end_headers()
+
+            with get_progress_bus().subscribe(sync_id) as subscription:
+                try:
+                    while True:
+                        event = subscription.get(timeout=SSE_KEEPALIVE_SECONDS)
+                        if event is None:
+                            self.wfile.write(b": keepalive\n\n")
+                        else:
+                            data = json.dumps(event.to_message(), ensure_ascii=False, default=str)
+                            frame = f"id: {event.seq}\nevent: {event.type}\ndata: {data}\n\n"
+                            self.wfile.write(frame.encode())
+                        self.wfile.flush()
+                        if event is not None and event.is_terminal and sync_id is not None:
+                            return
+                except (BrokenPipeError, ConnectionResetError):
+                    # Viewer went away
+                    return
+
+        def log_message(self, format, *args):
+            # Scrapes every few seconds would flood the sync log
+            pass
+
+    return MetricsHandler
+
+
+def start_metrics_server(port: int, host: str = "127.0.0.1",
+                         registry: Optional[MetricsRegistry] = None) -> ThreadingHTTPServer:
+    """
+    메트릭 HTTP 서버를 백그라운드 스레드로 시작
+
+    같은 포트로 여러 번 호출해도 서버는 하나만 실행됩니다.
+
+    Args:
+        port: 리슨 포트 (0이면 임의 포트)
+        host: 바인드 주소 (인증이 없으므로 기본값은 루프백)
+        registry: 노출할 레지스트리 (기본값: 전역 레지스트리)
+
+    Returns:
+        실행 중인 ThreadingHTTPServer
+    """
+    with _servers_lock:
+        if port and port in _servers:
+            return _servers[port]
+
+        handler = _make_handler(registry or get_metrics_registry())
+        server = ThreadingHTTPServer((host, port), handler)
+        thread = threading.Thread(target=server.serve_forever, daemon=True, name="metrics-server")
+        thread.start()
+
+        bound_port = server.server_address[1]
+        _servers[bound_port] = server
+        setup_logger("MetricsServer").info(
+            f"Metrics endpoint listening on {host}:{bound_port}/metrics"
+        )
+        return server
+
+
+def stop_metrics_server(port: int) -> None:
+    """메트릭 HTTP 서버 종료"""
+    with _servers_lock:
+        server = _servers.pop(port, None)
+    if server:
+        server.shutdown()
+        server.server_close()
@@ -0,0 +1,115 @@
+"""
+동기화 메트릭
+
+SyncEngine의 단계별(fetch/convert/insert) 소요 시간, 처리 행/바이트 수,
+재시도 횟수를 테이블·동기화 유형 레이블로 집계합니다.
+"""
+
+import time
+from typing import Optional
+
+from oracle_duckdb_sync.metrics.registry import MetricsRegistry, get_metrics_registry
+
+STAGES = ("fetch", "convert", "insert")
+
+RUN_DURATION_BUCKETS = (1.0, 5.0, 15.0, 30.0, 60.0, 300.0, 900.0, 1800.0, 3600.0, 7200.0)
+
+
+class SyncRunMetrics:
+    """
+    단일 동기화 실행의 메트릭 수집기
+
+    배치마다 관측값을 전역 레지스트리(Prometheus 노출용)에 기록하고,
+    실행 단위 합계를 유지하여 sync_logs에 요약으로 저장할 수 있게 합니다.
+    """
+
+    def __init__(self, table: str, sync_type: str, registry: Optional[MetricsRegistry] = None):
+        """
+        Args:
+            table: DuckDB 대상 테이블명 (레이블)
+            sync_type: 동기화 유형 (test, full, incremental, upsert)
+            registry: 메트릭 레지스트리 (기본값: 전역 레지스트리)
+        """
+        self.table = table
+        self.sync_type = sync_type
+        self.registry = registry or get_metrics_registry()
+
+        labels = ("table", "sync_type")
+        self._stage_seconds = self.registry.histogram(
+            "sync_stage_seconds", "Per-batch time spent in a sync stage", labels + ("stage",)
+        )
+        self._rows = self.registry.counter("sync_rows_total", "Rows written to DuckDB", labels)
+        self._bytes = self.registry.counter(
+            "sync_bytes_total", "Estimated bytes fetched from Oracle", labels
+        )
+        self._batches = self.registry.counter("sync_batches_total", "Batches processed", labels)
+        self._retries = self.registry.counter("sync_retries_total", "Sync retry attempts", labels)
+        self._runs = self.registry.counter(
+            "sync_runs_total", "Finished sync runs", labels + ("status",)
+        )
+        self._run_seconds = self.registry.histogram(
+            "sync_run_duration_seconds", "Duration of sync runs", labels,
+            buckets=RUN_DURATION_BUCKETS
+        )
+
+        self.rows = 0
+        self.bytes = 0
+        self.batches = 0
+        self.retries = 0
+        self.stage_seconds = dict.fromkeys(STAGES, 0.0)
+        self.start_time = time.time()
+        self.end_time: Optional[float] = None
+        self.status: Optional[str] = None
+
+    @property
+    def _labels(self) -> dict:
+        return {"table": self.table, "sync_type": self.sync_type}
+
+    def observe_stage(self, stage: str, seconds: float) -> None:
+        """단계별 소요 시간 기록 (fetch, convert, insert)"""
+        self.stage_seconds[stage] = self.stage_seconds.get(stage, 0.0) + seconds
+        self._stage_seconds.observe(seconds, stage=stage, **self._labels)
+
+    def observe_batch(self, rows: int, num_bytes: int) -> None:
+        """배치 처리 결과 기록"""
+        self.rows += rows
+        self.bytes += num_bytes
+        self.batches += 1
+        self._rows.inc(rows, **self._labels)
+        self._bytes.inc(num_bytes, **self._labels)
+        self._batches.inc(**self._labels)
+
+    def record_retry(self) -> None:
+        """재시도 1회 기록"""
+        self.retries += 1
+        self._retries.inc(**self._labels)
+
+    def finish(self, status: str) -> None:
+        """실행 종료 기록"""
+        self.end_time = time.time()
+        self.status = status
+        self._runs.inc(status=status, **self._labels)
+        self._run_seconds.observe(self.elapsed, **self._labels)
+
+    @property
+    def elapsed(self) -> float:
+        end = self.end_time if self.end_time is not None else time.time()
+        return end - self.start_time
+
+    def summary(self) -> dict:
+        """sync_logs에 저장할 실행 요약"""
+        elapsed = self.elapsed
+        return {
+            "table": self.table,
+            "sync_type": self.sync_type,
+            "status": self.status,
+            "rows": self.rows,
+            "bytes": self.bytes,
+            "batches": self.batches,
+            "retries": self.retries,
+            "elapsed_seconds": round(elapsed, 3),
+            "rows_per_second": round(self.rows / elapsed, 1) if elapsed > 0 else 0.0,
+            "stage_seconds": {
+                stage: round(value, 3) for stage, value in self.stage_seconds.items()
+            },
+        }
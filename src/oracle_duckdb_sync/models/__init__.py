@@ -1,5 +1,6 @@
 """Models module for Oracle-DuckDB Sync."""
 
+from oracle_duckdb_sync.models.query_history import QueryHistoryEntry
 from oracle_duckdb_sync.models.sync_log import SyncLog, SyncStatus, SyncType
 
-__all__ = ['SyncLog', 'SyncStatus', 'SyncType']
+__all__ = ['QueryHistoryEntry', 'SyncLog', 'SyncStatus', 'SyncType']
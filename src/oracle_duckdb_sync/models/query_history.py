@@ -0,0 +1,57 @@
+"""
+쿼리 이력 데이터 모델
+
+대시보드 쿼리의 실행 시간, 결과 크기, 프로파일을 기록하기 위한 모델입니다.
+"""
+
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional
+
+
+@dataclass
+class QueryHistoryEntry:
+    """
+    쿼리 실행 이력 데이터 클래스
+
+    Attributes:
+        query_text: 실행한 SQL
+        executed_at: 실행 시각
+        latency_ms: 실행 시간 (밀리초, 결과 변환 포함)
+        row_count: 결과 행 수
+        result_bytes: 결과 크기 (바이트, 추정치)
+        table_name: 조회 대상 테이블명 (알 수 있는 경우)
+        source: 쿼리를 실행한 구성 요소 (예: QueryService.query_table)
+        profile: DuckDB 프로파일 요약 (연산자 트리, 진단 힌트)
+        id: 이력 고유 ID (자동 생성)
+    """
+    query_text: str
+    executed_at: datetime
+    latency_ms: float
+    row_count: int = 0
+    result_bytes: int = 0
+    table_name: Optional[str] = None
+    source: Optional[str] = None
+    profile: Optional[dict] = None
+    id: Optional[int] = None
+
+    @property
+    def hints(self) -> list[str]:
+        """프로파일에서 감지한 진단 힌트 (전체 스캔, 캐스팅 등)"""
+        if not self.profile:
+            return []
+        return list(self.profile.get('hints', []))
+
+    def to_dict(self) -> dict:
+        """딕셔너리로 변환"""
+        return {
+            'id': self.id,
+            'query_text': self.query_text,
+            'executed_at': self.executed_at.isoformat() if self.executed_at else None,
+            'latency_ms': self.latency_ms,
+            'row_count': self.row_count,
+            'result_bytes': self.result_bytes,
+            'table_name': self.table_name,
+            'source': self.source,
+            'profile': self.profile
+        }
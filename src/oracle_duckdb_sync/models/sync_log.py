@@ -15,6 +15,7 @@ class SyncType(Enum):
     TEST = "test"
     FULL = "full"
     INCREMENTAL = "incremental"
+    UPSERT = "upsert"
 
 
 class SyncStatus(Enum):
@@ -41,6 +42,8 @@ class SyncLog:
         end_time: 종료 시각 (진행 중이면 None)
         total_rows: 처리된 총 행 수
         error_message: 에러 메시지 (실패 시)
+        metrics: 실행 요약 메트릭 (단계별 소요 시간, 바이트, 재시도 등)
+        duckdb_table: 대상 DuckDB 테이블명 (대시보드의 데이터 버전 조회용)
     """
     sync_id: str
     table_name: str
@@ -51,6 +54,8 @@ class SyncLog:
     end_time: Optional[datetime] = None
     total_rows: int = 0
     error_message: Optional[str] = None
+    metrics: Optional[dict] = None
+    duckdb_table: Optional[str] = None
 
     def to_dict(self) -> dict:
         """딕셔너리로 변환"""
@@ -63,7 +68,9 @@ class SyncLog:
             'start_time': self.start_time.isoformat() if self.start_time else None,
             'end_time': self.end_time.isoformat() if self.end_time else None,
             'total_rows': self.total_rows,
-            'error_message': self.error_message
+            'error_message': self.error_message,
+            'metrics': self.metrics,
+            'duckdb_table': self.duckdb_table
         }
 
     @classmethod
@@ -78,7 +85,9 @@ class SyncLog:
             start_time=datetime.fromisoformat(data['start_time']) if isinstance(data['start_time'], str) else data['start_time'],
             end_time=datetime.fromisoformat(data['end_time']) if data.get('end_time') and isinstance(data['end_time'], str) else data.get('end_time'),
             total_rows=data.get('total_rows', 0),
-            error_message=data.get('error_message')
+            error_message=data.get('error_message'),
+            metrics=data.get('metrics'),
+            duckdb_table=data.get('duckdb_table')
         )
 
     def get_duration_seconds(self) -> Optional[float]:
@@ -1,5 +1,7 @@
 """Repository module for Oracle-DuckDB Sync."""
 
+from oracle_duckdb_sync.repository.query_history_repo import QueryHistoryRepository
 from oracle_duckdb_sync.repository.sync_log_repo import SyncLogRepository
+from oracle_duckdb_sync.repository.sync_log_writer import SyncLogWriter
 
-__all__ = ['SyncLogRepository']
+__all__ = ['QueryHistoryRepository', 'SyncLogRepository', 'SyncLogWriter']
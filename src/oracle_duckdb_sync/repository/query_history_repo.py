@@ -0,0 +1,295 @@
+"""
+쿼리 이력 저장소
+
+DuckDB에 쿼리 실행 이력(지연 시간, 결과 크기, 프로파일)을 저장하고 조회하는 레포지토리입니다.
+"""
+
+import json
+from typing import List, Optional
+
+import duckdb
+
+from oracle_duckdb_sync.config import Config
+from oracle_duckdb_sync.database.duckdb_source import DuckDBSource
+from oracle_duckdb_sync.log.logger import setup_logger
+from oracle_duckdb_sync.models.query_history import QueryHistoryEntry
+
+
+class QueryHistoryRepository:
+    """
+    쿼리 이력 레포지토리
+
+    DuckDB의 query_history 테이블을 관리합니다.
+    쿼리는 백그라운드 작업 스레드에서도 기록되므로 각 작업은 별도 커서에서 실행합니다.
+    """
+
+    TABLE_NAME = 'query_history'
+    SEQUENCE_NAME = 'query_history_id_seq'
+    COLUMNS = (
+        "id, query_text, executed_at, latency_ms, row_count, result_bytes, table_name, source, "
+        "profile"
+    )
+
+    def __init__(self, config: Optional[Config] = None,
+                 duckdb_source: Optional[DuckDBSource] = None):
+        """
+        Args:
+            config: 애플리케이션 설정 (duckdb_source가 없을 때 필수)
+            duckdb_source: DuckDB 소스 객체 (테스트 시 사용)
+        """
+        self.logger = setup_logger('QueryHistoryRepository')
+
+        if duckdb_source:
+            self.duckdb = duckdb_source
+        elif config:
+            self.duckdb = DuckDBSource(config)
+        else:
+            raise ValueError("Either config or duckdb_source must be provided")
+
+        self._ensure_table_exists()
+
+    @property
+    def _conn(self) -> duckdb.DuckDBPyConnection:
+        """열린 DuckDB 연결 (연결이 닫혔으면 RuntimeError)"""
+        conn = self.duckdb.conn
+        if conn is None:
+            raise RuntimeError("DuckDB connection is closed")
+        return conn
+
+    def _ensure_table_exists(self):
+        """query_history 테이블이 없으면 생성"""
+        create_sequence_sql = f"CREATE SEQUENCE IF NOT EXISTS {self.SEQUENCE_NAME} START 1"
+        create_table_sql = f"""
+        CREATE TABLE IF NOT EXISTS {self.TABLE_NAME} (
+            id INTEGER PRIMARY KEY DEFAULT nextval('{self.SEQUENCE_NAME}'),
+            query_text TEXT NOT NULL,
+            executed_at TIMESTAMP NOT NULL,
+            latency_ms DOUBLE NOT NULL,
+            row_count BIGINT DEFAULT 0,
+            result_bytes BIGINT DEFAULT 0,
+            table_name VARCHAR(255),
+            source VARCHAR(100),
+            profile TEXT
+        )
+        """
+
+        try:
+            self._conn.execute(create_sequence_sql)
+            self._conn.execute(create_table_sql)
+            self.logger.debug(f"Table {self.TABLE_NAME} is ready")
+        except Exception as e:
+            self.logger.error(f"Failed to create {self.TABLE_NAME} table: {e}")
+            raise
+
+    def create(self, entry: QueryHistoryEntry) -> QueryHistoryEntry:
+        """
+        쿼리 이력 기록
+
+        Args:
+            entry: 기록할 QueryHistoryEntry 객체
+
+        Returns:
+            기록된 QueryHistoryEntry 객체 (id 포함)
+        """
+        insert_sql = f"""
+        INSERT INTO {self.TABLE_NAME}
+        (id, query_text, executed_at, latency_ms, row_count, result_bytes, table_name, source,
+         profile)
+        VALUES (nextval('{self.SEQUENCE_NAME}'), ?, ?, ?, ?, ?, ?, ?, ?)
+        RETURNING id
+        """
+
+        params = (
+            entry.query_text,
+            entry.executed_at,
+            entry.latency_ms,
+            entry.row_count,
+            entry.result_bytes,
+            entry.table_name,
+            entry.source,
+            json.dumps(entry.profile, default=str) if entry.profile else None
+        )
+
+        try:
+            cursor = self._conn.cursor()
+            try:
+                row = cursor.execute(insert_sql, params).fetchone()
+                entry.id = row[0] if row else None
+            finally:
+                cursor.close()
+
+            self.logger.debug(
+                f"Recorded query ({entry.latency_ms:.1f} ms): {entry.query_text[:100]}"
+            )
+            return entry
+
+        except Exception as e:
+            self.logger.error(f"Failed to record query history: {e}")
+            raise
+
+    def get_by_id(self, entry_id: int) -> Optional[QueryHistoryEntry]:
+        """
+        ID로 이력 조회
+
+        Args:
+            entry_id: 이력 ID
+
+        Returns:
+            QueryHistoryEntry 객체 또는 None
+        """
+        select_sql = f"SELECT {self.COLUMNS} FROM {self.TABLE_NAME} WHERE id = ?"
+
+        try:
+            row = self._fetch(select_sql, (entry_id,))
+            return self._row_to_entry(row[0]) if row else None
+
+        except Exception as e:
+            self.logger.error(f"Failed to get query history by id: {e}")
+            raise
+
+    def get_slowest(self, limit: int = 20,
+                    table_name: Optional[str] = None) -> List[QueryHistoryEntry]:
+        """
+        가장 느린 쿼리 조회
+
+        Args:
+            limit: 조회할 최대 개수
+            table_name: 필터링할 테이블명 (선택적)
+
+        Returns:
+            QueryHistoryEntry 리스트 (느린 순)
+        """
+        where_clause = "WHERE table_name = ?" if table_name else ""
+        select_sql = f"""
+        SELECT {self.COLUMNS}
+        FROM {self.TABLE_NAME}
+        {where_clause}
+        ORDER BY latency_ms DESC
+        LIMIT ?
+        """
+        params = (table_name, limit) if table_name else (limit,)
+
+        try:
+            return [self._row_to_entry(row) for row in self._fetch(select_sql, params)]
+
+        except Exception as e:
+            self.logger.error(f"Failed to get slowest queries: {e}")
+            raise
+
+    def get_slowest_per_table(self, limit_per_table: int = 5) -> List[QueryHistoryEntry]:
+        """
+        테이블별로 가장 느린 쿼리 조회
+
+        Args:
+            limit_per_table: 테이블당 최대 개수
+
+        Returns:
+            QueryHistoryEntry 리스트 (테이블명, 느린 순)
+        """
+        select_sql = f"""
+        SELECT {self.COLUMNS}
+        FROM {self.TABLE_NAME}
+        QUALIFY row_number() OVER (PARTITION BY table_name ORDER BY latency_ms DESC) <= ?
+        ORDER BY table_name NULLS LAST, latency_ms DESC
+        """
+
+        try:
+            return [self._row_to_entry(row) for row in self._fetch(select_sql, (limit_per_table,))]
+
+        except Exception as e:
+            self.logger.error(f"Failed to get slowest queries per table: {e}")
+            raise
+
+    def get_table_statistics(self) -> List[dict]:
+        """
+        테이블별 쿼리 통계 조회
+
+        Returns:
+            통계 딕셔너리 리스트 (table_name, query_count, avg_ms, p95_ms, max_ms, total_rows)
+        """
+        stats_sql = f"""
+        SELECT
+            table_name,
+            COUNT(*) AS query_count,
+            AVG(latency_ms) AS avg_ms,
+            quantile_cont(latency_ms, 0.95) AS p95_ms,
+            MAX(latency_ms) AS max_ms,
+            SUM(row_count) AS total_rows
+        FROM {self.TABLE_NAME}
+        GROUP BY table_name
+        ORDER BY max_ms DESC
+        """
+
+        try:
+            return [
+                {
+                    'table_name': row[0],
+                    'query_count': row[1],
+                    'avg_ms': row[2] or 0,
+                    'p95_ms': row[3] or 0,
+                    'max_ms': row[4] or 0,
+                    'total_rows': row[5] or 0
+                }
+                for row in self._fetch(stats_sql)
+            ]
+
+        except Exception as e:
+            self.logger.error(f"Failed to get query statistics: {e}")
+            raise
+
+    def delete_old_entries(self, days: int = 30) -> int:
+        """
+        오래된 이력 삭제
+
+        Args:
+            days: 보관 기간 (일)
+
+        Returns:
+            삭제된 이력 수
+        """
+        delete_sql = f"""
+        DELETE FROM {self.TABLE_NAME}
+        WHERE executed_at < CURRENT_TIMESTAMP - INTERVAL '{days} days'
+        """
+
+        try:
+            deleted_count = int(self._fetch(delete_sql)[0][0])
+            self.logger.info(
+                f"Deleted {deleted_count} query history entries (older than {days} days)"
+            )
+            return deleted_count
+
+        except Exception as e:
+            self.logger.error(f"Failed to delete old query history: {e}")
+            raise
+
+    def _fetch(self, sql: str, params: tuple = ()) -> list:
+        """별도 커서에서 SQL을 실행하고 모든 행을 반환"""
+        cursor = self._conn.cursor()
+        try:
+            return cursor.execute(sql, params).fetchall()
+        finally:
+            cursor.close()
+
+    def _row_to_entry(self, row: tuple) -> QueryHistoryEntry:
+        """
+        DB 행을 QueryHistoryEntry 객체로 변환
+
+        Args:
+            row: (id, query_text, executed_at, latency_ms, row_count, result_bytes, table_name,
+                  source, profile)
+
+        Returns:
+            QueryHistoryEntry 객체
+        """
+        return QueryHistoryEntry(
+            id=row[0],
+            query_text=row[1],
+            executed_at=row[2],
+            latency_ms=row[3],
+            row_count=row[4] or 0,
+            result_bytes=row[5] or 0,
+            table_name=row[6],
+            source=row[7],
+            profile=json.loads(row[8]) if row[8] else None
+        )
@@ -2,10 +2,17 @@
 동기화 로그 저장소
 
 DuckDB에 동기화 작업 로그를 저장하고 조회하는 CRUD 레포지토리입니다.
+
+로그가 하루 수천 건씩 쌓여도 이력 조회가 느려지지 않도록
+- (table_name, start_time) 인덱스로 테이블별 최근 로그를 조회하고
+- (duckdb_table, end_time) 인덱스로 대시보드가 조회마다 확인하는 마지막 동기화를 찾으며
+- 일별 집계 테이블(sync_log_daily)에 실행 수, 행 수, 실패 수, 소요 시간을 유지하며
+- 보관 기간이 지난 원본 로그는 apply_retention으로 정리합니다 (집계는 더 오래 보관).
 """
 
-from datetime import datetime
-from typing import List, Optional
+import json
+from datetime import datetime, timedelta
+from typing import Iterable, List, Optional
 from uuid import uuid4
 
 import duckdb
@@ -24,6 +31,15 @@ class SyncLogRepository:
     """
 
     TABLE_NAME = 'sync_logs'
+    SEQUENCE_NAME = 'sync_logs_id_seq'
+    ROLLUP_TABLE_NAME = 'sync_log_daily'
+    INDEX_NAME = 'idx_sync_logs_table_start'
+    SYNC_ID_INDEX_NAME = 'idx_sync_logs_sync_id'
+    DUCKDB_TABLE_INDEX_NAME = 'idx_sync_logs_duckdb_table_end'
+    COLUMNS = (
+        "id, sync_id, table_name, sync_type, status, start_time, end_time, total_rows, "
+        "error_message, metrics, duckdb_table"
+    )
 
     def __init__(self, config: Config = None, duckdb_source: DuckDBSource = None):
         """
@@ -42,11 +58,20 @@ class SyncLogRepository:
 
         self._ensure_table_exists()
 
+    @property
+    def _conn(self) -> duckdb.DuckDBPyConnection:
+        """열린 DuckDB 연결 (연결이 닫혔으면 RuntimeError)"""
+        conn = self.duckdb.conn
+        if conn is None:
+            raise RuntimeError("DuckDB connection is closed")
+        return conn
+
     def _ensure_table_exists(self):
         """sync_logs 테이블이 없으면 생성"""
+        create_sequence_sql = f"CREATE SEQUENCE IF NOT EXISTS {self.SEQUENCE_NAME} START 1"
         create_table_sql = f"""
         CREATE TABLE IF NOT EXISTS {self.TABLE_NAME} (
-            id INTEGER PRIMARY KEY,
+            id INTEGER PRIMARY KEY DEFAULT nextval('{self.SEQUENCE_NAME}'),
             sync_id VARCHAR(36) NOT NULL,
             table_name VARCHAR(255) NOT NULL,
             sync_type VARCHAR(20) NOT NULL,
@@ -54,12 +79,67 @@ class SyncLogRepository:
             start_time TIMESTAMP NOT NULL,
             end_time TIMESTAMP,
             total_rows INTEGER DEFAULT 0,
-            error_message TEXT
+            error_message TEXT,
+            metrics TEXT,
+            duckdb_table VARCHAR(255)
+        )
+        """
+        # 이전 버전에서 생성된 테이블에는 metrics, duckdb_table 컬럼이 없음
+        add_metrics_sql = f"ALTER TABLE {self.TABLE_NAME} ADD COLUMN IF NOT EXISTS metrics TEXT"
+        add_duckdb_table_sql = (
+            f"ALTER TABLE {self.TABLE_NAME} ADD COLUMN IF NOT EXISTS duckdb_table VARCHAR(255)"
+        )
+        # 기존 로그의 DuckDB 테이블명은 실행 요약(metrics)의 table에 있음
+        backfill_duckdb_table_sql = f"""
+        UPDATE {self.TABLE_NAME}
+        SET duckdb_table = json_extract_string(metrics, '$.table')
+        WHERE duckdb_table IS NULL AND metrics IS NOT NULL
+        """
+        create_index_sql = f"""
+        CREATE INDEX IF NOT EXISTS {self.INDEX_NAME}
+        ON {self.TABLE_NAME} (table_name, start_time)
+        """
+        create_sync_id_index_sql = f"""
+        CREATE INDEX IF NOT EXISTS {self.SYNC_ID_INDEX_NAME}
+        ON {self.TABLE_NAME} (sync_id)
+        """
+        create_duckdb_table_index_sql = f"""
+        CREATE INDEX IF NOT EXISTS {self.DUCKDB_TABLE_INDEX_NAME}
+        ON {self.TABLE_NAME} (duckdb_table, end_time)
+        """
+        create_rollup_sql = f"""
+        CREATE TABLE IF NOT EXISTS {self.ROLLUP_TABLE_NAME} (
+            day DATE NOT NULL,
+            table_name VARCHAR(255) NOT NULL,
+            runs INTEGER DEFAULT 0,
+            completed INTEGER DEFAULT 0,
+            failed INTEGER DEFAULT 0,
+            running INTEGER DEFAULT 0,
+            total_rows BIGINT DEFAULT 0,
+            completed_rows BIGINT DEFAULT 0,
+            total_duration_seconds DOUBLE DEFAULT 0,
+            max_duration_seconds DOUBLE DEFAULT 0,
+            PRIMARY KEY (day, table_name)
         )
         """
 
         try:
-            self.duckdb.conn.execute(create_table_sql)
+            self._conn.execute(create_sequence_sql)
+            self._conn.execute(create_table_sql)
+            self._conn.execute(add_metrics_sql)
+            if not self._has_column('duckdb_table'):
+                self._conn.execute(add_duckdb_table_sql)
+                self._conn.execute(backfill_duckdb_table_sql)
+            self._conn.execute(create_index_sql)
+            self._conn.execute(create_sync_id_index_sql)
+            self._conn.execute(create_duckdb_table_index_sql)
+
+            # 집계 테이블이 새로 만들어지면 기존 로그로 채움 (이전 버전에서 업그레이드)
+            rollup_exists = self.duckdb.table_exists(self.ROLLUP_TABLE_NAME)
+            self._conn.execute(create_rollup_sql)
+            if not rollup_exists:
+                self._conn.execute(self._rollup_sql())
+
             self.logger.debug(f"Table {self.TABLE_NAME} is ready")
         except Exception as e:
             self.logger.error(f"Failed to create {self.TABLE_NAME} table: {e}")
@@ -81,8 +161,10 @@ class SyncLogRepository:
 
         insert_sql = f"""
         INSERT INTO {self.TABLE_NAME}
-        (sync_id, table_name, sync_type, status, start_time, end_time, total_rows, error_message)
-        VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+        (id, sync_id, table_name, sync_type, status, start_time, end_time, total_rows,
+         error_message, metrics, duckdb_table)
+        VALUES (nextval('{self.SEQUENCE_NAME}'), ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        RETURNING id
         """
 
         params = (
@@ -93,15 +175,16 @@ class SyncLogRepository:
             sync_log.start_time,
             sync_log.end_time,
             sync_log.total_rows,
-            sync_log.error_message
+            sync_log.error_message,
+            self._dump_metrics(sync_log.metrics),
+            sync_log.duckdb_table
         )
 
         try:
-            self.duckdb.conn.execute(insert_sql, params)
-
-            # Get the auto-generated ID
-            result = self.duckdb.conn.execute("SELECT last_insert_rowid()").fetchone()
+            # DuckDB에는 last_insert_rowid()가 없으므로 시퀀스 값을 RETURNING으로 받음
+            result = self._conn.execute(insert_sql, params).fetchone()
             sync_log.id = result[0]
+            self._refresh_rollup(sync_log.table_name, sync_log.start_time)
 
             self.logger.info(f"Created sync log: {sync_log.sync_id} for table {sync_log.table_name}")
             return sync_log
@@ -128,7 +211,8 @@ class SyncLogRepository:
         SET status = ?,
             end_time = ?,
             total_rows = ?,
-            error_message = ?
+            error_message = ?,
+            metrics = ?
         WHERE id = ?
         """
 
@@ -137,11 +221,13 @@ class SyncLogRepository:
             sync_log.end_time,
             sync_log.total_rows,
             sync_log.error_message,
+            self._dump_metrics(sync_log.metrics),
             sync_log.id
         )
 
         try:
-            self.duckdb.conn.execute(update_sql, params)
+            self._conn.execute(update_sql, params)
+            self._refresh_rollup(sync_log.table_name, sync_log.start_time)
             self.logger.info(f"Updated sync log: {sync_log.sync_id}")
             return sync_log
 
@@ -149,6 +235,86 @@ class SyncLogRepository:
             self.logger.error(f"Failed to update sync log: {e}")
             raise
 
+    def write_batch(self, new_logs: List[SyncLog], updated_logs: List[SyncLog]) -> None:
+        """
+        여러 로그를 한 트랜잭션으로 생성/업데이트 (SyncLogWriter에서 사용)
+
+        백그라운드 스레드에서 호출되므로 별도 커서에서 실행합니다.
+        생성된 로그의 id는 채워지지 않으며, 업데이트는 sync_id 기준입니다.
+
+        Args:
+            new_logs: 새로 생성할 로그
+            updated_logs: sync_id로 업데이트할 로그
+        """
+        insert_sql = f"""
+        INSERT INTO {self.TABLE_NAME}
+        (id, sync_id, table_name, sync_type, status, start_time, end_time, total_rows,
+         error_message, metrics, duckdb_table)
+        VALUES (nextval('{self.SEQUENCE_NAME}'), ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """
+        update_sql = f"""
+        UPDATE {self.TABLE_NAME}
+        SET status = ?,
+            end_time = ?,
+            total_rows = ?,
+            error_message = ?,
+            metrics = ?
+        WHERE sync_id = ?
+        """
+
+        cursor = self._conn.cursor()
+        try:
+            cursor.execute("BEGIN TRANSACTION")
+            if new_logs:
+                cursor.executemany(insert_sql, [
+                    (
+                        log.sync_id,
+                        log.table_name,
+                        (
+                            log.sync_type.value if isinstance(log.sync_type, SyncType)
+                            else log.sync_type
+                        ),
+                        self._status_value(log.status),
+                        log.start_time,
+                        log.end_time,
+                        log.total_rows,
+                        log.error_message,
+                        self._dump_metrics(log.metrics),
+                        log.duckdb_table
+                    )
+                    for log in new_logs
+                ])
+            if updated_logs:
+                cursor.executemany(update_sql, [
+                    (
+                        self._status_value(log.status),
+                        log.end_time,
+                        log.total_rows,
+                        log.error_message,
+                        self._dump_metrics(log.metrics),
+                        log.sync_id
+                    )
+                    for log in updated_logs
+                ])
+
+            cursor.execute("COMMIT")
+        except Exception as e:
+            cursor.execute("ROLLBACK")
+            self.logger.error(f"Failed to write sync log batch: {e}")
+            cursor.close()
+            raise
+
+        # 집계는 커밋 후에 갱신: 트랜잭션 안에서 실패하면 DuckDB가 트랜잭션을 중단시켜
+        # COMMIT까지 실패하고, 기록기가 같은 배치를 계속 재시도하게 됨
+        try:
+            # (날짜, 테이블)마다 한 번만 집계
+            days = {(log.table_name, log.start_time.date()) for log in new_logs + updated_logs}
+            for table_name, day in days:
+                day_start = datetime.combine(day, datetime.min.time())
+                self._refresh_rollup(table_name, day_start, conn=cursor)
+        finally:
+            cursor.close()
+
     def get_by_id(self, log_id: int) -> Optional[SyncLog]:
         """
         ID로 로그 조회
@@ -160,13 +326,13 @@ class SyncLogRepository:
             SyncLog 객체 또는 None
         """
         select_sql = f"""
-        SELECT id, sync_id, table_name, sync_type, status, start_time, end_time, total_rows, error_message
+        SELECT {self.COLUMNS}
         FROM {self.TABLE_NAME}
         WHERE id = ?
         """
 
         try:
-            result = self.duckdb.conn.execute(select_sql, (log_id,)).fetchone()
+            result = self._conn.execute(select_sql, (log_id,)).fetchone()
             if result:
                 return self._row_to_sync_log(result)
             return None
@@ -186,13 +352,13 @@ class SyncLogRepository:
             SyncLog 객체 또는 None
         """
         select_sql = f"""
-        SELECT id, sync_id, table_name, sync_type, status, start_time, end_time, total_rows, error_message
+        SELECT {self.COLUMNS}
         FROM {self.TABLE_NAME}
         WHERE sync_id = ?
         """
 
         try:
-            result = self.duckdb.conn.execute(select_sql, (sync_id,)).fetchone()
+            result = self._conn.execute(select_sql, (sync_id,)).fetchone()
             if result:
                 return self._row_to_sync_log(result)
             return None
@@ -201,6 +367,53 @@ class SyncLogRepository:
             self.logger.error(f"Failed to get sync log by sync_id: {e}")
             raise
 
+    def get_last_finished(
+        self,
+        table_name: str,
+        sync_types: Optional[Iterable[SyncType]] = None
+    ) -> Optional[SyncLog]:
+        """
+        테이블의 가장 최근에 끝난 동기화 조회
+
+        중지되거나 실패한 실행도 행을 기록했을 수 있으므로 상태와 관계없이
+        종료 시각이 있는 실행 중 가장 최근 것을 반환합니다.
+
+        대시보드가 조회마다 호출하므로 (duckdb_table, end_time) 인덱스로 찾습니다.
+
+        Args:
+            table_name: DuckDB 테이블명
+            sync_types: 조회할 동기화 유형 (None이면 전체)
+
+        Returns:
+            SyncLog 객체 또는 None
+        """
+        params: list = [table_name]
+        type_clause = ""
+        if sync_types is not None:
+            type_values = [sync_type.value for sync_type in sync_types]
+            type_clause = f"AND sync_type IN ({', '.join('?' for _ in type_values)})"
+            params.extend(type_values)
+
+        select_sql = f"""
+        SELECT {self.COLUMNS}
+        FROM {self.TABLE_NAME}
+        WHERE duckdb_table = ?
+          AND end_time IS NOT NULL
+          {type_clause}
+        ORDER BY end_time DESC, id DESC
+        LIMIT 1
+        """
+
+        try:
+            result = self._conn.execute(select_sql, params).fetchone()
+            if result:
+                return self._row_to_sync_log(result)
+            return None
+
+        except Exception as e:
+            self.logger.error(f"Failed to get last finished sync log: {e}")
+            raise
+
     def get_recent_logs(self, limit: int = 50, table_name: Optional[str] = None) -> List[SyncLog]:
         """
         최근 로그 조회
@@ -214,7 +427,7 @@ class SyncLogRepository:
         """
         where_clause = f"WHERE table_name = ?" if table_name else ""
         select_sql = f"""
-        SELECT id, sync_id, table_name, sync_type, status, start_time, end_time, total_rows, error_message
+        SELECT {self.COLUMNS}
         FROM {self.TABLE_NAME}
         {where_clause}
         ORDER BY start_time DESC
@@ -223,9 +436,9 @@ class SyncLogRepository:
 
         try:
             if table_name:
-                results = self.duckdb.conn.execute(select_sql, (table_name, limit)).fetchall()
+                results = self._conn.execute(select_sql, (table_name, limit)).fetchall()
             else:
-                results = self.duckdb.conn.execute(select_sql, (limit,)).fetchall()
+                results = self._conn.execute(select_sql, (limit,)).fetchall()
 
             return [self._row_to_sync_log(row) for row in results]
 
@@ -237,30 +450,33 @@ class SyncLogRepository:
         """
         동기화 통계 조회
 
+        원본 로그 대신 일별 집계 테이블에서 계산하므로 로그 수와 무관하게 빠르며,
+        원본 로그 보관 기간이 지난 실행도 포함됩니다.
+
         Args:
             table_name: 필터링할 테이블명 (선택적)
 
         Returns:
             통계 딕셔너리 (total, completed, failed, avg_rows 등)
         """
-        where_clause = f"WHERE table_name = ?" if table_name else ""
+        where_clause = "WHERE table_name = ?" if table_name else ""
         stats_sql = f"""
         SELECT
-            COUNT(*) as total,
-            SUM(CASE WHEN status = 'completed' THEN 1 ELSE 0 END) as completed,
-            SUM(CASE WHEN status = 'failed' THEN 1 ELSE 0 END) as failed,
-            SUM(CASE WHEN status = 'running' THEN 1 ELSE 0 END) as running,
-            AVG(CASE WHEN status = 'completed' THEN total_rows ELSE NULL END) as avg_rows,
-            SUM(CASE WHEN status = 'completed' THEN total_rows ELSE 0 END) as total_rows_synced
-        FROM {self.TABLE_NAME}
+            SUM(runs) as total,
+            SUM(completed) as completed,
+            SUM(failed) as failed,
+            SUM(running) as running,
+            SUM(completed_rows) / NULLIF(SUM(completed), 0) as avg_rows,
+            SUM(completed_rows) as total_rows_synced
+        FROM {self.ROLLUP_TABLE_NAME}
         {where_clause}
         """
 
         try:
             if table_name:
-                result = self.duckdb.conn.execute(stats_sql, (table_name,)).fetchone()
+                result = self._conn.execute(stats_sql, (table_name,)).fetchone()
             else:
-                result = self.duckdb.conn.execute(stats_sql).fetchone()
+                result = self._conn.execute(stats_sql).fetchone()
 
             if result:
                 return {
@@ -277,9 +493,56 @@ class SyncLogRepository:
             self.logger.error(f"Failed to get statistics: {e}")
             raise
 
+    def get_daily_rollup(self, days: int = 30, table_name: Optional[str] = None) -> List[dict]:
+        """
+        일별 테이블별 실행 집계 조회
+
+        Args:
+            days: 조회 기간 (오늘 포함 최근 N일)
+            table_name: 필터링할 테이블명 (선택적)
+
+        Returns:
+            집계 딕셔너리 리스트 (최신 날짜순)
+        """
+        where_clauses = ["day >= CURRENT_DATE - ?::INTEGER"]
+        params: list = [days - 1]
+        if table_name:
+            where_clauses.append("table_name = ?")
+            params.append(table_name)
+
+        select_sql = f"""
+        SELECT day, table_name, runs, completed, failed, running, total_rows,
+               total_duration_seconds / NULLIF(runs - running, 0) as avg_duration_seconds,
+               max_duration_seconds
+        FROM {self.ROLLUP_TABLE_NAME}
+        WHERE {" AND ".join(where_clauses)}
+        ORDER BY day DESC, table_name
+        """
+
+        try:
+            rows = self._conn.execute(select_sql, params).fetchall()
+            return [
+                {
+                    'day': row[0],
+                    'table_name': row[1],
+                    'runs': row[2],
+                    'completed': row[3],
+                    'failed': row[4],
+                    'running': row[5],
+                    'total_rows': row[6],
+                    'avg_duration_seconds': row[7] or 0.0,
+                    'max_duration_seconds': row[8] or 0.0
+                }
+                for row in rows
+            ]
+
+        except Exception as e:
+            self.logger.error(f"Failed to get daily rollup: {e}")
+            raise
+
     def delete_old_logs(self, days: int = 30) -> int:
         """
-        오래된 로그 삭제
+        오래된 로그 삭제 (일별 집계는 유지)
 
         Args:
             days: 보관 기간 (일)
@@ -289,11 +552,11 @@ class SyncLogRepository:
         """
         delete_sql = f"""
         DELETE FROM {self.TABLE_NAME}
-        WHERE start_time < CURRENT_TIMESTAMP - INTERVAL '{days} days'
+        WHERE start_time < CURRENT_TIMESTAMP - INTERVAL '{int(days)} days'
         """
 
         try:
-            result = self.duckdb.conn.execute(delete_sql)
+            result = self._conn.execute(delete_sql)
             deleted_count = result.fetchone()[0] if result else 0
             self.logger.info(f"Deleted {deleted_count} old logs (older than {days} days)")
             return deleted_count
@@ -302,12 +565,90 @@ class SyncLogRepository:
             self.logger.error(f"Failed to delete old logs: {e}")
             raise
 
+    def apply_retention(self, log_days: int, rollup_days: int = 0) -> dict:
+        """
+        보관 기간 정책 적용
+
+        Args:
+            log_days: 원본 로그 보관 기간 (일, 0이면 삭제하지 않음)
+            rollup_days: 일별 집계 보관 기간 (일, 0이면 삭제하지 않음)
+
+        Returns:
+            {'logs': 삭제된 로그 수, 'rollups': 삭제된 집계 행 수}
+        """
+        deleted = {'logs': 0, 'rollups': 0}
+        if log_days > 0:
+            deleted['logs'] = self.delete_old_logs(log_days)
+
+        if rollup_days > 0:
+            delete_sql = f"""
+            DELETE FROM {self.ROLLUP_TABLE_NAME}
+            WHERE day < CURRENT_DATE - {int(rollup_days)}::INTEGER
+            """
+            try:
+                result = self._conn.execute(delete_sql).fetchone()
+                deleted['rollups'] = result[0] if result else 0
+            except Exception as e:
+                self.logger.error(f"Failed to delete old rollups: {e}")
+                raise
+
+        return deleted
+
+    def _has_column(self, column: str) -> bool:
+        """sync_logs 테이블에 컬럼이 있는지 확인"""
+        result = self._conn.execute(
+            "SELECT COUNT(*) FROM information_schema.columns "
+            "WHERE table_name = ? AND column_name = ?",
+            (self.TABLE_NAME, column)
+        ).fetchone()
+        return bool(result and result[0])
+
+    def _rollup_sql(self, where_clause: str = "") -> str:
+        """sync_logs를 (날짜, 테이블)별로 집계해 sync_log_daily에 덮어쓰는 SQL"""
+        return f"""
+        INSERT OR REPLACE INTO {self.ROLLUP_TABLE_NAME}
+        SELECT
+            CAST(start_time AS DATE) as day,
+            table_name,
+            COUNT(*) as runs,
+            COUNT(*) FILTER (WHERE status = 'completed') as completed,
+            COUNT(*) FILTER (WHERE status = 'failed') as failed,
+            COUNT(*) FILTER (WHERE status = 'running') as running,
+            COALESCE(SUM(total_rows), 0) as total_rows,
+            COALESCE(SUM(total_rows) FILTER (WHERE status = 'completed'), 0) as completed_rows,
+            COALESCE(SUM(date_diff('millisecond', start_time, end_time) / 1000.0), 0)
+                as total_duration_seconds,
+            COALESCE(MAX(date_diff('millisecond', start_time, end_time) / 1000.0), 0)
+                as max_duration_seconds
+        FROM {self.TABLE_NAME}
+        {where_clause}
+        GROUP BY CAST(start_time AS DATE), table_name
+        """
+
+    def _refresh_rollup(self, table_name: str, start_time: datetime,
+                        conn: Optional[duckdb.DuckDBPyConnection] = None) -> None:
+        """
+        로그 한 건이 속한 (날짜, 테이블) 집계를 다시 계산
+
+        (table_name, start_time) 인덱스 범위만 읽으므로 로그 수와 무관하게 빠릅니다.
+        집계 실패는 로그 기록을 막지 않습니다.
+        """
+        day_start = datetime.combine(start_time.date(), datetime.min.time())
+        try:
+            (conn or self._conn).execute(
+                self._rollup_sql("WHERE table_name = ? AND start_time >= ? AND start_time < ?"),
+                (table_name, day_start, day_start + timedelta(days=1))
+            )
+        except Exception as e:
+            self.logger.warning(f"Failed to refresh sync log rollup for {table_name}: {e}")
+
     def _row_to_sync_log(self, row: tuple) -> SyncLog:
         """
         DB 행을 SyncLog 객체로 변환
 
         Args:
-            row: (id, sync_id, table_name, sync_type, status, start_time, end_time, total_rows, error_message)
+            row: (id, sync_id, table_name, sync_type, status, start_time, end_time,
+                  total_rows, error_message, metrics, duckdb_table)
 
         Returns:
             SyncLog 객체
@@ -321,5 +662,16 @@ class SyncLogRepository:
             start_time=row[5],
             end_time=row[6],
             total_rows=row[7] or 0,
-            error_message=row[8]
+            error_message=row[8],
+            metrics=json.loads(row[9]) if row[9] else None,
+            duckdb_table=row[10]
         )
+
+    @staticmethod
+    def _status_value(status) -> str:
+        return status.value if isinstance(status, SyncStatus) else status
+
+    @staticmethod
+    def _dump_metrics(metrics: Optional[dict]) -> Optional[str]:
+        """메트릭 딕셔너리를 TEXT 컬럼용 JSON으로 직렬화"""
+        return json.dumps(metrics) if metrics else None
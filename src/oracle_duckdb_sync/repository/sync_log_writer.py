@@ -0,0 +1,218 @@
+"""
+동기화 로그 비동기 기록기
+
+동기화 중의 로그 기록(시작/진행/종료)을 메모리 버퍼에 쌓고 백그라운드 스레드에서
+묶어서 기록합니다. 같은 sync_id의 이벤트는 마지막 상태 하나로 합쳐지므로,
+배치마다 진행 상황을 보고해도 DuckDB에는 flush 주기마다 최대 한 번만 기록됩니다.
+
+데이터 경로는 버퍼에 이벤트를 넣기만 하며 DB 기록을 기다리지 않습니다.
+close() 또는 프로세스 종료(atexit) 시 남은 이벤트를 반드시 기록합니다.
+"""
+
+import atexit
+import threading
+import weakref
+from dataclasses import dataclass, replace
+from datetime import datetime
+from typing import Dict, Optional, Set
+from uuid import uuid4
+
+from oracle_duckdb_sync.log.logger import setup_logger
+from oracle_duckdb_sync.models.sync_log import SyncLog, SyncStatus
+from oracle_duckdb_sync.repository.sync_log_repo import SyncLogRepository
+
+# 대기 중인 sync_id가 이 수를 넘으면 주기를 기다리지 않고 기록
+DEFAULT_MAX_PENDING = 500
+
+# 종료 시 flush할 기록기 목록
+_open_writers: "weakref.WeakSet[SyncLogWriter]" = weakref.WeakSet()
+
+
+@dataclass
+class _RunState:
+    log: SyncLog
+    inserted: bool = False
+    finished: bool = False
+
+
+class SyncLogWriter:
+    """
+    동기화 로그 버퍼링 기록기
+
+    Example:
+        >>> writer = SyncLogWriter(SyncLogRepository(duckdb_source=duckdb))
+        >>> sync_id = writer.start(SyncLog(sync_id="", table_name="T", sync_type=SyncType.FULL,
+        ...                                status=SyncStatus.RUNNING, start_time=datetime.now()))
+        >>> writer.progress(sync_id, total_rows=50000)
+        >>> writer.finish(sync_id, SyncStatus.COMPLETED, total_rows=120000)
+        >>> writer.close()  # 남은 이벤트 기록
+    """
+
+    def __init__(
+        self,
+        repository: SyncLogRepository,
+        flush_interval: float = 2.0,
+        max_pending: int = DEFAULT_MAX_PENDING
+    ):
+        """
+        Args:
+            repository: 기록 대상 레포지토리
+            flush_interval: 백그라운드 기록 주기 (초)
+            max_pending: 이 수 이상의 sync_id가 대기하면 즉시 기록
+        """
+        self.logger = setup_logger('SyncLogWriter')
+        self.repository = repository
+        self.flush_interval = flush_interval
+        self.max_pending = max_pending
+
+        self._runs: Dict[str, _RunState] = {}
+        self._dirty: Set[str] = set()
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._closed = False
+
+        self.events = 0
+        self.flushes = 0
+        self.rows_written = 0
+
+        self._thread = threading.Thread(target=self._run, name='sync-log-writer', daemon=True)
+        self._thread.start()
+        _open_writers.add(self)
+
+    def start(self, sync_log: SyncLog) -> str:
+        """
+        동기화 시작 기록 (sync_id가 없으면 생성)
+
+        Returns:
+            sync_id
+        """
+        if not sync_log.sync_id:
+            sync_log.sync_id = str(uuid4())
+        self._enqueue(sync_log.sync_id, lambda state: None, _RunState(sync_log))
+        return sync_log.sync_id
+
+    def progress(self, sync_id: str, total_rows: int, metrics: Optional[dict] = None) -> None:
+        """진행 상황 기록 (flush 전까지 마지막 값만 유지)"""
+        def apply(state: _RunState):
+            state.log.total_rows = total_rows
+            if metrics is not None:
+                state.log.metrics = metrics
+
+        self._enqueue(sync_id, apply)
+
+    def finish(
+        self,
+        sync_id: str,
+        status: SyncStatus,
+        total_rows: Optional[int] = None,
+        error_message: Optional[str] = None,
+        metrics: Optional[dict] = None,
+        end_time: Optional[datetime] = None
+    ) -> None:
+        """동기화 종료 기록"""
+        def apply(state: _RunState):
+            state.log.status = status
+            state.log.end_time = end_time or datetime.now()
+            state.log.error_message = error_message
+            if total_rows is not None:
+                state.log.total_rows = total_rows
+            if metrics is not None:
+                state.log.metrics = metrics
+            state.finished = True
+
+        self._enqueue(sync_id, apply)
+
+    def _enqueue(self, sync_id: str, apply, new_state: Optional[_RunState] = None) -> None:
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("SyncLogWriter is closed")
+            if new_state is not None:
+                self._runs[sync_id] = new_state
+            state = self._runs.get(sync_id)
+            if state is None:
+                self.logger.warning(f"Ignoring sync log event for unknown sync_id {sync_id}")
+                return
+            apply(state)
+            self._dirty.add(sync_id)
+            self.events += 1
+            if len(self._dirty) >= self.max_pending:
+                self._wake.set()
+
+    def flush(self) -> int:
+        """
+        대기 중인 이벤트를 한 트랜잭션으로 기록
+
+        Returns:
+            기록된 로그 행 수 (실패 시 0, 이벤트는 다음 flush에서 재시도)
+        """
+        with self._flush_lock:
+            with self._lock:
+                sync_ids = self._dirty
+                self._dirty = set()
+                batch = [
+                    (sync_id, replace(self._runs[sync_id].log), self._runs[sync_id].inserted)
+                    for sync_id in sync_ids
+                ]
+
+            if not batch:
+                return 0
+
+            inserts = [log for _, log, inserted in batch if not inserted]
+            updates = [log for _, log, inserted in batch if inserted]
+            try:
+                self.repository.write_batch(inserts, updates)
+            except Exception as e:
+                self.logger.warning(f"Failed to write {len(batch)} sync logs, will retry: {e}")
+                with self._lock:
+                    self._dirty |= sync_ids
+                return 0
+
+            with self._lock:
+                for sync_id, _, _ in batch:
+                    state = self._runs[sync_id]
+                    state.inserted = True
+                    if state.finished and sync_id not in self._dirty:
+                        del self._runs[sync_id]
+
+            self.flushes += 1
+            self.rows_written += len(batch)
+            return len(batch)
+
+    def close(self) -> None:
+        """백그라운드 스레드를 멈추고 남은 이벤트를 기록"""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+        self._wake.set()
+        if self._thread is not threading.current_thread():
+            self._thread.join()
+        self.flush()
+        _open_writers.discard(self)
+
+    @property
+    def pending(self) -> int:
+        """기록 대기 중인 sync_id 수"""
+        with self._lock:
+            return len(self._dirty)
+
+    def _run(self) -> None:
+        while True:
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            with self._lock:
+                closed = self._closed
+            if closed:
+                return
+            self.flush()
+
+
+@atexit.register
+def _flush_open_writers() -> None:
+    """프로세스 종료 시 열린 기록기의 남은 이벤트 기록"""
+    for writer in list(_open_writers):
+        try:
+            writer.close()
+        except Exception:
+            pass
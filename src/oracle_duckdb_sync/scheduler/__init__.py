@@ -1,6 +1,15 @@
 """Scheduling and background worker functionality."""
 
+from oracle_duckdb_sync.scheduler.progress_bus import (
+    ProgressBus,
+    ProgressEvent,
+    Subscription,
+    get_progress_bus,
+)
 from oracle_duckdb_sync.scheduler.scheduler import SyncScheduler
 from oracle_duckdb_sync.scheduler.sync_worker import SyncWorker
 
-__all__ = ['SyncScheduler', 'SyncWorker']
+__all__ = [
+    'SyncScheduler', 'SyncWorker',
+    'ProgressBus', 'ProgressEvent', 'Subscription', 'get_progress_bus',
+]
@@ -0,0 +1,47 @@
+"""Smoothed sync throughput and remaining-time estimate."""
+
+import time
+from typing import Callable, Optional
+
+
+class ThroughputEta:
+    """Exponentially smoothed rows/second and ETA.
+
+    Per-batch throughput swings with network latency and DuckDB
+    checkpoints, so the rate between updates is smoothed with an
+    exponential moving average before the remaining time is derived.
+    """
+
+    def __init__(self, alpha: float = 0.3, clock: Callable[[], float] = time.monotonic):
+        """
+        Args:
+            alpha: Weight of the newest rate sample (0 < alpha <= 1)
+            clock: Monotonic time function
+        """
+        self.alpha = alpha
+        self.clock = clock
+        self.rows_per_second: Optional[float] = None
+        self._last_time = clock()
+        self._last_rows = 0
+
+    def update(self, total_rows: int) -> Optional[float]:
+        """Record the cumulative row count; returns the smoothed rows/second."""
+        now = self.clock()
+        elapsed = now - self._last_time
+        if elapsed <= 0:
+            return self.rows_per_second
+
+        rate = (total_rows - self._last_rows) / elapsed
+        if self.rows_per_second is None:
+            self.rows_per_second = rate
+        else:
+            self.rows_per_second = self.alpha * rate + (1 - self.alpha) * self.rows_per_second
+        self._last_time = now
+        self._last_rows = total_rows
+        return self.rows_per_second
+
+    def remaining_seconds(self, total_rows: int, expected_rows: Optional[int]) -> Optional[float]:
+        """Seconds until expected_rows at the smoothed rate (None if unknown)."""
+        if not expected_rows or not self.rows_per_second or self.rows_per_second <= 0:
+            return None
+        return max(expected_rows - total_rows, 0) / self.rows_per_second
@@ -0,0 +1,117 @@
+"""Background retention of sync logs and query history.
+
+Raw sync_logs rows are purged after SYNC_LOG_RETENTION_DAYS, daily
+rollups after SYNC_LOG_ROLLUP_RETENTION_DAYS and query_history rows after
+QUERY_HISTORY_RETENTION_DAYS. The purge runs on a background scheduler
+every SYNC_LOG_RETENTION_INTERVAL_HOURS (and once at startup), so neither
+the sync nor the admin pages pay for it.
+"""
+
+import threading
+from typing import Optional
+
+from oracle_duckdb_sync.config import Config
+from oracle_duckdb_sync.log.logger import setup_logger
+from oracle_duckdb_sync.scheduler.scheduler import SyncScheduler
+
+logger = setup_logger('SyncLogRetention')
+
+_retention_scheduler: Optional[SyncScheduler] = None
+_retention_lock = threading.Lock()
+
+
+def run_log_retention(config: Config) -> dict:
+    """Apply the sync log retention policy once.
+
+    Returns:
+        {'logs': deleted raw logs, 'rollups': deleted rollup rows}
+    """
+    # Imported lazily: the repository layer depends on the database layer
+    from oracle_duckdb_sync.database.duckdb_source import DuckDBSource
+    from oracle_duckdb_sync.repository.sync_log_repo import SyncLogRepository
+
+    duckdb = DuckDBSource(config)
+    try:
+        deleted = SyncLogRepository(duckdb_source=duckdb).apply_retention(
+            config.sync_log_retention_days,
+            config.sync_log_rollup_retention_days
+        )
+        logger.info(
+            f"Sync log retention: removed {deleted['logs']} logs, "
+            f"{deleted['rollups']} rollup rows"
+        )
+        return deleted
+    finally:
+        duckdb.disconnect()
+
+
+def run_query_history_retention(config: Config) -> int:
+    """Delete query history entries older than QUERY_HISTORY_RETENTION_DAYS once.
+
+    Returns:
+        Number of deleted entries
+    """
+    from oracle_duckdb_sync.database.duckdb_source import DuckDBSource
+    from oracle_duckdb_sync.repository.query_history_repo import QueryHistoryRepository
+
+    duckdb = DuckDBSource(config)
+    try:
+        return QueryHistoryRepository(duckdb_source=duckdb).delete_old_entries(
+            config.query_history_retention_days
+        )
+    finally:
+        duckdb.disconnect()
+
+
+def _run_log_retention_safely(config: Config) -> None:
+    if config.sync_log_retention_days > 0 or config.sync_log_rollup_retention_days > 0:
+        try:
+            run_log_retention(config)
+        except Exception as e:
+            logger.warning(f"Sync log retention failed: {e}")
+
+    if config.query_history_retention_days > 0:
+        try:
+            run_query_history_retention(config)
+        except Exception as e:
+            logger.warning(f"Query history retention failed: {e}")
+
+
+def start_log_retention(config: Config) -> Optional[SyncScheduler]:
+    """Start the process-wide retention scheduler (idempotent).
+
+    Returns:
+        The running scheduler, or None when retention is disabled
+    """
+    global _retention_scheduler
+
+    if (config.sync_log_retention_days <= 0 and config.sync_log_rollup_retention_days <= 0
+            and config.query_history_retention_days <= 0):
+        return None
+
+    with _retention_lock:
+        if _retention_scheduler is None:
+            scheduler = SyncScheduler()
+            job = scheduler.create_protected_job(lambda: _run_log_retention_safely(config))
+            hours = max(1, config.sync_log_retention_interval_hours)
+            scheduler.add_interval_job(job, hours=hours, run_now=True)
+            scheduler.start()
+            _retention_scheduler = scheduler
+            logger.info(
+                f"Log retention scheduled every {config.sync_log_retention_interval_hours}h "
+                f"(logs {config.sync_log_retention_days}d, "
+                f"rollups {config.sync_log_rollup_retention_days}d, "
+                f"query history {config.query_history_retention_days}d)"
+            )
+
+    return _retention_scheduler
+
+
+def stop_log_retention() -> None:
+    """Stop the retention scheduler, if running."""
+    global _retention_scheduler
+
+    with _retention_lock:
+        if _retention_scheduler is not None:
+            _retention_scheduler.stop()
+            _retention_scheduler = None
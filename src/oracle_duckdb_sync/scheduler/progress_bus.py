@@ -0,0 +1,361 @@
+"""Process-wide sync progress bus.
+
+SyncWorker publishes progress, completion and error events per sync_id
+(a topic). Each topic keeps a bounded history, so any number of viewers
+can follow one sync:
+
+- Streamlit sessions keep a cursor and call read_since() on rerun. This
+  costs O(new events) and needs no per-viewer queue.
+- Background consumers (SyncService, SSE clients) subscribe() and get
+  events pushed into their own bounded queue.
+
+'progress' events are coalesced: a topic delivers at most one per
+interval_seconds. The most recent pending update is delivered when the
+interval ends, or just before the next non-progress event.
+"""
+
+import threading
+import time
+from collections import OrderedDict, deque
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Callable, Optional
+
+from oracle_duckdb_sync.log.logger import setup_logger
+
+# Event types that end a sync
+TERMINAL_TYPES = frozenset({'complete', 'error', 'stopped'})
+
+# Events a subscriber may fall behind by before the oldest are dropped
+DEFAULT_SUBSCRIPTION_SIZE = 256
+
+
+@dataclass(frozen=True)
+class ProgressEvent:
+    """One delivered event on a sync topic.
+
+    Attributes:
+        seq: Bus-wide sequence number (increases in delivery order)
+        sync_id: Topic the event belongs to
+        type: 'progress', 'complete', 'error', 'stopped', ...
+        data: Event payload
+        timestamp: When the event was published
+    """
+    seq: int
+    sync_id: str
+    type: str
+    data: dict
+    timestamp: datetime
+
+    @property
+    def is_terminal(self) -> bool:
+        return self.type in TERMINAL_TYPES
+
+    def to_message(self) -> dict:
+        """Message dict in the format SyncWorker puts on progress queues."""
+        return {
+            'type': self.type,
+            'data': self.data,
+            'timestamp': self.timestamp.strftime('%H:%M:%S'),
+            'seq': self.seq,
+            'sync_id': self.sync_id,
+        }
+
+
+class Subscription:
+    """Bounded push queue for one subscriber.
+
+    When the subscriber falls behind, the oldest events are dropped. The
+    newest event (e.g. the terminal one) is always kept.
+    """
+
+    def __init__(self, bus: 'ProgressBus', sync_id: Optional[str], max_pending: int):
+        self.sync_id = sync_id
+        self.dropped = 0
+        self.closed = False
+        self._bus = bus
+        self._events: deque[ProgressEvent] = deque(maxlen=max_pending)
+        self._cond = threading.Condition()
+
+    def _deliver(self, event: ProgressEvent) -> None:
+        with self._cond:
+            if len(self._events) == self._events.maxlen:
+                self.dropped += 1
+            self._events.append(event)
+            self._cond.notify_all()
+
+    def get(self, timeout: Optional[float] = None) -> Optional[ProgressEvent]:
+        """Next event, waiting up to timeout seconds (None if none arrived)."""
+        with self._cond:
+            if not self._events and not self.closed:
+                self._cond.wait(timeout)
+            return self._events.popleft() if self._events else None
+
+    def drain(self) -> list[ProgressEvent]:
+        """All queued events, without waiting."""
+        with self._cond:
+            events = list(self._events)
+            self._events.clear()
+            return events
+
+    def close(self) -> None:
+        """Stop receiving events and wake any waiting reader."""
+        self._bus._unsubscribe(self)
+        with self._cond:
+            self.closed = True
+            self._cond.notify_all()
+
+    def __enter__(self) -> 'Subscription':
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+class _Topic:
+    def __init__(self, sync_id: str, history_size: int):
+        self.sync_id = sync_id
+        self.history: deque[ProgressEvent] = deque(maxlen=history_size)
+        # Latest coalesced progress not delivered yet: (type, data, timestamp)
+        self.pending: Optional[tuple] = None
+        self.last_delivered: Optional[float] = None
+        self.timer: Optional[threading.Timer] = None
+        self.finished = False
+        self.subscribers: list[Subscription] = []
+
+
+class ProgressBus:
+    """Per-sync progress topics with bounded history and subscriptions.
+
+    Example:
+        >>> bus = get_progress_bus()
+        >>> bus.publish(worker.sync_id, 'progress', {'total_rows': 10000})
+        >>> events, cursor = bus.read_since(worker.sync_id, cursor)
+        >>> with bus.subscribe(worker.sync_id) as sub:
+        ...     event = sub.get(timeout=1.0)
+    """
+
+    def __init__(
+        self,
+        interval_seconds: float = 0.5,
+        history_size: int = 200,
+        max_topics: int = 20,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Args:
+            interval_seconds: Minimum time between delivered progress events per topic
+            history_size: Events kept per topic for late readers
+            max_topics: Topics kept; the oldest finished topics are dropped first
+            clock: Monotonic time function
+        """
+        self.logger = setup_logger('ProgressBus')
+        self.interval_seconds = interval_seconds
+        self.history_size = history_size
+        self.max_topics = max_topics
+        self.clock = clock
+
+        self._topics: OrderedDict[str, _Topic] = OrderedDict()
+        self._wildcard: list[Subscription] = []
+        self._lock = threading.Lock()
+        self._seq = 0
+        self.published = 0
+        self.delivered = 0
+
+    def publish(self, sync_id: str, msg_type: str, data: Optional[dict] = None) -> None:
+        """Publish an event on a sync topic.
+
+        'progress' events may be held back and coalesced; all other types
+        are delivered immediately (after any pending progress).
+        """
+        payload = (msg_type, data or {}, datetime.now())
+        with self._lock:
+            self.published += 1
+            topic = self._get_topic(sync_id)
+            topic.finished = False
+
+            if msg_type == 'progress' and topic.last_delivered is not None:
+                wait = topic.last_delivered + self.interval_seconds - self.clock()
+                if wait > 0:
+                    topic.pending = payload
+                    self._schedule_flush(topic, wait)
+                    return
+
+            if msg_type != 'progress':
+                self._deliver_pending(topic)
+            topic.pending = None
+            self._deliver(topic, *payload)
+
+    def read_since(self, sync_id: str, cursor: int = -1) -> tuple[list[ProgressEvent], int]:
+        """Events of a topic delivered after cursor.
+
+        Args:
+            sync_id: Topic to read
+            cursor: Last seq seen by the caller (-1 for the whole history)
+
+        Returns:
+            (events oldest first, cursor to pass next time)
+        """
+        with self._lock:
+            topic = self._topics.get(sync_id)
+            if topic is None:
+                return [], cursor
+            events = []
+            for event in reversed(topic.history):
+                if event.seq <= cursor:
+                    break
+                events.append(event)
+            events.reverse()
+            return events, events[-1].seq if events else cursor
+
+    def latest(self, sync_id: str) -> Optional[ProgressEvent]:
+        """Most recently delivered event of a topic."""
+        with self._lock:
+            topic = self._topics.get(sync_id)
+            return topic.history[-1] if topic is not None and topic.history else None
+
+    def active_sync_ids(self) -> list[str]:
+        """Topics that have delivered events but no terminal one, oldest first.
+
+        Topics created by a subscription alone (e.g. to an unknown sync_id)
+        are not active.
+        """
+        with self._lock:
+            return [
+                sync_id for sync_id, topic in self._topics.items()
+                if topic.history and not topic.finished
+            ]
+
+    def subscribe(
+        self,
+        sync_id: Optional[str] = None,
+        replay: bool = True,
+        max_pending: int = DEFAULT_SUBSCRIPTION_SIZE
+    ) -> Subscription:
+        """Receive events as they are delivered.
+
+        A subscription may be opened before the sync publishes its first
+        event; the topic it creates is dropped again when it is closed
+        without any event having been published.
+
+        Args:
+            sync_id: Topic to follow (None: every topic)
+            replay: Queue the topic's history first (ignored for every-topic subscriptions)
+            max_pending: Events kept for a slow subscriber
+
+        Returns:
+            Subscription; close it when done
+        """
+        subscription = Subscription(self, sync_id, max_pending)
+        with self._lock:
+            if sync_id is None:
+                self._wildcard.append(subscription)
+            else:
+                topic = self._get_topic(sync_id)
+                if replay:
+                    for event in topic.history:
+                        subscription._deliver(event)
+                topic.subscribers.append(subscription)
+        return subscription
+
+    def forget(self, sync_id: str) -> None:
+        """Drop a topic and its history."""
+        with self._lock:
+            topic = self._topics.pop(sync_id, None)
+            if topic is not None and topic.timer is not None:
+                topic.timer.cancel()
+
+    def _unsubscribe(self, subscription: Subscription) -> None:
+        with self._lock:
+            if subscription.sync_id is None:
+                subscribers = self._wildcard
+            else:
+                topic = self._topics.get(subscription.sync_id)
+                subscribers = topic.subscribers if topic is not None else []
+            if subscription in subscribers:
+                subscribers.remove(subscription)
+            if subscription.sync_id is not None and topic is not None and self._is_unused(topic):
+                del self._topics[subscription.sync_id]
+
+    def _get_topic(self, sync_id: str) -> _Topic:
+        topic = self._topics.get(sync_id)
+        if topic is None:
+            topic = self._topics[sync_id] = _Topic(sync_id, self.history_size)
+            self._evict_topics()
+        return topic
+
+    def _evict_topics(self) -> None:
+        excess = len(self._topics) - self.max_topics
+        if excess <= 0:
+            return
+        finished = [
+            sync_id for sync_id, topic in self._topics.items()
+            if (topic.finished or self._is_unused(topic)) and not topic.subscribers
+        ]
+        for sync_id in finished[:excess]:
+            del self._topics[sync_id]
+
+    @staticmethod
+    def _is_unused(topic: _Topic) -> bool:
+        """A topic nothing was published on and nobody follows."""
+        return not topic.history and topic.pending is None and not topic.subscribers
+
+    def _deliver(self, topic: _Topic, msg_type: str, data: dict, timestamp: datetime) -> None:
+        event = ProgressEvent(self._seq, topic.sync_id, msg_type, data, timestamp)
+        self._seq += 1
+        self.delivered += 1
+        topic.history.append(event)
+        topic.last_delivered = self.clock()
+        if event.is_terminal:
+            topic.finished = True
+            if topic.timer is not None:
+                topic.timer.cancel()
+                topic.timer = None
+        for subscription in topic.subscribers + self._wildcard:
+            subscription._deliver(event)
+
+    def _deliver_pending(self, topic: _Topic) -> None:
+        if topic.pending is not None:
+            pending, topic.pending = topic.pending, None
+            self._deliver(topic, *pending)
+
+    def _schedule_flush(self, topic: _Topic, delay: float) -> None:
+        if topic.timer is not None:
+            return
+        timer = threading.Timer(delay, self._flush_topic, args=(topic.sync_id,))
+        timer.daemon = True
+        topic.timer = timer
+        timer.start()
+
+    def _flush_topic(self, sync_id: str) -> None:
+        with self._lock:
+            topic = self._topics.get(sync_id)
+            if topic is None:
+                return
+            topic.timer = None
+            self._deliver_pending(topic)
+
+
+_global_progress_bus: Optional[ProgressBus] = None
+_progress_bus_lock = threading.Lock()
+
+
+def get_progress_bus(config=None) -> ProgressBus:
+    """Return the process-wide progress bus, creating it on first use.
+
+    Args:
+        config: Applied only when the bus is created
+            (sync_progress_interval_seconds, sync_progress_history_size)
+    """
+    global _global_progress_bus
+
+    with _progress_bus_lock:
+        if _global_progress_bus is None:
+            if config is not None:
+                _global_progress_bus = ProgressBus(
+                    interval_seconds=config.sync_progress_interval_seconds,
+                    history_size=config.sync_progress_history_size
+                )
+            else:
+                _global_progress_bus = ProgressBus()
+        return _global_progress_bus
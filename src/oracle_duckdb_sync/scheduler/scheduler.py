@@ -1,7 +1,9 @@
 import threading
+from datetime import datetime
 
 from apscheduler.schedulers.background import BackgroundScheduler
 from apscheduler.triggers.cron import CronTrigger
+from apscheduler.triggers.interval import IntervalTrigger
 
 
 class SyncScheduler:
@@ -14,6 +16,14 @@ class SyncScheduler:
         trigger = CronTrigger(hour=hour, minute=minute)
         self.scheduler.add_job(func, trigger=trigger)
 
+    def add_interval_job(self, func, hours=24, run_now=False):
+        """Run func every `hours` hours (and once right after start if run_now)"""
+        trigger = IntervalTrigger(hours=hours)
+        if run_now:
+            self.scheduler.add_job(func, trigger=trigger, next_run_time=datetime.now())
+        else:
+            self.scheduler.add_job(func, trigger=trigger)
+
     def start(self):
         """Start the scheduler"""
         if not self.scheduler.running:
@@ -3,10 +3,16 @@ import datetime
 import threading
 import time
 import traceback
+from typing import Optional
+from uuid import uuid4
 
 from oracle_duckdb_sync.config import Config
+from oracle_duckdb_sync.database.cancellation import CancellationToken, SyncCancelled
 from oracle_duckdb_sync.database.sync_engine import SyncEngine
+from oracle_duckdb_sync.database.sync_events import BatchWritten, SyncEvent
 from oracle_duckdb_sync.log.logger import setup_logger
+from oracle_duckdb_sync.scheduler.eta import ThroughputEta
+from oracle_duckdb_sync.scheduler.progress_bus import ProgressBus, get_progress_bus
 
 
 class SyncWorker:
@@ -14,29 +20,37 @@ class SyncWorker:
 
     This allows the UI to remain responsive while sync operations run.
     Supports status monitoring, error handling, and progress reporting.
+    Progress is published on the process-wide progress bus under
+    ``sync_id`` so any session or service can follow it.
     """
 
-    def __init__(self, config: Config, sync_params: dict, progress_queue=None):
+    def __init__(self, config: Config, sync_params: dict, progress_queue=None,
+                 progress_bus: Optional[ProgressBus] = None):
         """Initialize SyncWorker
 
         Args:
             config: Configuration object
-            progress_queue: Optional queue.Queue for progress messages
+            progress_queue: Optional queue.Queue that also receives every message
+            progress_bus: Bus to publish on (default: the process-wide bus)
         """
         self.config = config
         self.sync_params = sync_params or {}
         self.progress_queue = progress_queue
-        self.status = 'idle'  # idle, running, paused, completed, error
+        self.progress_bus = progress_bus or get_progress_bus(config)
+        self.sync_id = str(uuid4())
+        self.status = 'idle'  # idle, running, paused, completed, error, stopped
         self.thread = None
         self.error_info = None
         self.total_rows = 0
         self.start_time = None
+        # Rows the sync is expected to read (estimated before the sync starts)
+        self.expected_rows: Optional[int] = None
+        self.estimate_method: Optional[str] = None
+        self._eta: Optional[ThroughputEta] = None
         self.logger = setup_logger('SyncWorker')
 
-        # Pause/resume control
-        self._pause_event = threading.Event()
-        self._pause_event.set()  # Not paused initially
-        self._stop_flag = threading.Event()  # Initialize logger
+        # Pause/resume/stop control, honoured by the engine at batch boundaries
+        self.cancel_token = CancellationToken()
 
     def start(self):
         """Start the sync operation in a background thread"""
@@ -53,33 +67,37 @@ class SyncWorker:
     def pause(self):
         """Pause the sync operation"""
         if self.status == 'running':
-            self._pause_event.clear()
+            self.cancel_token.pause()
             self.status = 'paused'
             self.logger.info("Sync paused")
 
     def resume(self):
         """Resume the sync operation"""
         if self.status == 'paused':
-            self._pause_event.set()
+            self.cancel_token.resume()
             self.status = 'running'
             self.logger.info("Sync resumed")
 
     def stop(self):
-        """Stop the sync operation"""
-        self._stop_flag.set()
-        self._pause_event.set()  # Unpause if paused so thread can exit
+        """Stop the sync operation at the next batch boundary
+
+        Interrupts an in-flight Oracle call; a paused sync stops without resuming.
+        """
+        self.cancel_token.cancel("Sync stopped by user")
         self.logger.info("Sync stop requested")
 
     def _run_sync(self):
         """Internal method that runs in the background thread"""
         self.start_time = time.time()
+        sync_engine = None
 
         try:
-            # Create sync engine with progress callback if queue is provided
-            sync_engine = SyncEngine(self.config)
-
-            # Create progress callback
-            progress_callback = self._create_progress_callback() if self.progress_queue else None
+            # Progress is published from the engine's events, off the batch loop
+            sync_engine = SyncEngine(
+                self.config,
+                cancel_token=self.cancel_token,
+                event_handler=self._handle_sync_event
+            )
 
             def get_param(key, default=None):
                 if isinstance(self.sync_params, dict):
@@ -109,13 +127,9 @@ class SyncWorker:
             if not duckdb_table:
                 raise ValueError("DuckDB table name is required for sync")
 
-            # Note: We need to modify sync methods to accept progress_callback
-            # For now, we'll use a wrapper approach with monkey patching
-            if progress_callback:
-                self._wrap_sync_engine_with_callback(sync_engine, progress_callback)
-
             if sync_type == 'test':
                 row_limit = get_param('row_limit', 10000)
+                self._estimate_expected_rows(sync_engine, oracle_table_name, row_limit=row_limit)
                 self.total_rows = sync_engine.test_sync(
                     oracle_table_name=oracle_table_name,
                     duckdb_table=duckdb_table,
@@ -123,6 +137,7 @@ class SyncWorker:
                     row_limit=row_limit
                 )
             elif sync_type == 'full':
+                self._estimate_expected_rows(sync_engine, oracle_table_name)
                 self.total_rows = sync_engine.full_sync(
                     oracle_table_name=oracle_table_name,
                     duckdb_table=duckdb_table,
@@ -135,6 +150,8 @@ class SyncWorker:
                     raise ValueError("time_column is required for incremental sync")
                 if last_value is None:
                     raise ValueError("last_value is required for incremental sync")
+                self._estimate_expected_rows(sync_engine, oracle_table_name,
+                                             column=time_column, last_value=last_value)
                 self.total_rows = sync_engine.incremental_sync(
                     oracle_table_name=oracle_table_name,
                     duckdb_table=duckdb_table,
@@ -145,18 +162,33 @@ class SyncWorker:
             else:
                 raise ValueError(f"Unknown sync_type: {sync_type}")
 
+            # Progress of the last batches goes out before the completion
+            self._close_engine(sync_engine)
+
             # Send completion message
-            if self.progress_queue:
-                self._send_message('complete', {
-                    'total_rows': self.total_rows
-                })
+            self._send_message('complete', {
+                'total_rows': self.total_rows
+            })
 
             # Mark as completed
             self.status = 'completed'
 
+        except SyncCancelled as e:
+            self._close_engine(sync_engine)
+            metrics = getattr(sync_engine, 'last_run_metrics', None)
+            if metrics is not None:
+                self.total_rows = metrics.rows
+            self.status = 'stopped'
+            self.logger.info(f"Sync stopped after {self.total_rows} rows")
+            self._send_message('stopped', {
+                'total_rows': self.total_rows,
+                'reason': str(e)
+            })
+
         except Exception as e:
             # Capture error information
             error_traceback = traceback.format_exc()
+            self._close_engine(sync_engine)
             self.error_info = {
                 'exception': str(e),
                 'traceback': error_traceback
@@ -168,39 +200,90 @@ class SyncWorker:
             self.logger.error(f"Traceback:\n{error_traceback}")
 
             # Send error message
-            if self.progress_queue:
-                self._send_message('error', self.error_info)
-
-    def _create_progress_callback(self):
-        """Create a progress callback function with ETA calculation"""
-        def callback(total_rows, batch_rows):
-            """Progress callback that sends messages to queue"""
-            elapsed = time.time() - self.start_time
-            rows_per_second = total_rows / elapsed if elapsed > 0 else 0
-
-            # Calculate ETA if we know total expected rows
-            eta = None
-            percentage = 0
-            if hasattr(self, 'expected_rows') and self.expected_rows > 0:
-                percentage = total_rows / self.expected_rows
-                remaining_rows = self.expected_rows - total_rows
-                if rows_per_second > 0:
-                    eta_seconds = remaining_rows / rows_per_second
-                    eta = time.strftime('%H:%M:%S', time.gmtime(eta_seconds))
-
-            self._send_message('progress', {
-                'total_rows': total_rows,
-                'batch_rows': batch_rows,
-                'elapsed_time': elapsed,
-                'rows_per_second': rows_per_second,
-                'percentage': percentage,
-                'eta': eta
-            })
+            self._send_message('error', self.error_info)
+
+    def _estimate_expected_rows(self, sync_engine, oracle_table_name, column=None,
+                                last_value=None, row_limit=None):
+        """Estimate the rows to sync (bounded by the configured time budget)
 
-        return callback
+        Keeps a preset expected_rows when no estimate is available.
+        """
+        try:
+            estimate = sync_engine.estimate_rows(
+                oracle_table_name, column=column, last_value=last_value, row_limit=row_limit
+            )
+        except Exception as e:
+            self.logger.warning(f"Row estimate failed, progress will show no ETA: {e}")
+            estimate = None
+
+        if estimate is not None:
+            self.expected_rows = estimate.rows
+            self.estimate_method = estimate.method
+        # Throughput is measured from here, not from the estimate queries
+        self._eta = ThroughputEta()
+
+    def _handle_sync_event(self, event: SyncEvent):
+        """Turn engine events into progress messages (runs on the engine's event thread)"""
+        if isinstance(event, BatchWritten):
+            self._publish_progress(event)
+
+    def _publish_progress(self, event: BatchWritten):
+        """Publish a progress message with ETA calculation"""
+        total_rows = event.total_rows
+        elapsed = time.time() - self.start_time
+        if self._eta is None:
+            self._eta = ThroughputEta()
+        rows_per_second = self._eta.update(total_rows) or 0
+
+        # Statistics can be stale: once exceeded, the estimate is only a lower bound
+        if self.expected_rows and total_rows > self.expected_rows:
+            self.expected_rows = total_rows
+
+        eta = None
+        eta_seconds = None
+        finish_at = None
+        percentage = 0.0
+        if self.expected_rows and self.expected_rows > 0:
+            percentage = min(total_rows / self.expected_rows, 1.0)
+            eta_seconds = self._eta.remaining_seconds(total_rows, self.expected_rows)
+            if eta_seconds is not None:
+                eta = time.strftime('%H:%M:%S', time.gmtime(eta_seconds))
+                finish_time = datetime.datetime.now() + datetime.timedelta(seconds=eta_seconds)
+                finish_at = finish_time.strftime('%Y-%m-%d %H:%M:%S')
+
+        self._send_message('progress', {
+            'total_rows': total_rows,
+            'batch_rows': event.rows,
+            'batch_bytes': event.bytes,
+            'batch_write_seconds': event.write_seconds,
+            'elapsed_time': elapsed,
+            'rows_per_second': rows_per_second,
+            'expected_rows': self.expected_rows,
+            'estimate_method': self.estimate_method,
+            'percentage': percentage,
+            'eta': eta,
+            'eta_seconds': eta_seconds,
+            'finish_at': finish_at
+        })
+
+    def _close_engine(self, sync_engine):
+        """Deliver the engine's pending events and release its connections"""
+        if sync_engine is None:
+            return
+        try:
+            sync_engine.close()
+        except Exception as e:
+            self.logger.warning(f"Failed to close sync engine: {e}")
 
     def _send_message(self, msg_type, data):
-        """Send a message to the progress queue"""
+        """Publish a message on the progress bus (and the progress queue, if any)
+
+        The bus is readable by any session and over /sync/progress, so
+        tracebacks stay in error_info and on the in-process queue.
+        """
+        self.progress_bus.publish(self.sync_id, msg_type, {
+            key: value for key, value in data.items() if key != 'traceback'
+        })
         if self.progress_queue:
             message = {
                 'type': msg_type,
@@ -208,15 +291,3 @@ class SyncWorker:
                 'timestamp': datetime.datetime.now().strftime('%H:%M:%S')
             }
             self.progress_queue.put_nowait(message)
-
-    def _wrap_sync_engine_with_callback(self, sync_engine, callback):
-        """Wrap sync engine's _log_progress to call our callback"""
-        original_log_progress = sync_engine._log_progress
-
-        def wrapped_log_progress(table, total_count, batch_count):
-            # Call original
-            original_log_progress(table, total_count, batch_count)
-            # Call our callback
-            callback(total_count, batch_count)
-
-        sync_engine._log_progress = wrapped_log_progress
@@ -4,10 +4,11 @@
 멀티 테이블 동기화 설정 관리 비즈니스 로직을 담당합니다.
 """
 
-from typing import List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 
 from oracle_duckdb_sync.config import Config
 from oracle_duckdb_sync.database.duckdb_source import DuckDBSource
+from oracle_duckdb_sync.database.schema_catalog import OracleSchemaCatalog, TableSchema
 from oracle_duckdb_sync.log.logger import setup_logger
 from oracle_duckdb_sync.table_config.models import TableConfig
 from oracle_duckdb_sync.table_config.repository import TableConfigRepository
@@ -20,14 +21,21 @@ class TableConfigService:
     테이블 설정 생성, 유효성 검증, 동기화 대상 관리를 담당합니다.
     """
 
-    def __init__(self, config: Config = None, duckdb_source: DuckDBSource = None):
+    def __init__(
+        self,
+        config: Config = None,
+        duckdb_source: DuckDBSource = None,
+        schema_catalog: Optional[OracleSchemaCatalog] = None
+    ):
         """
         Args:
             config: 애플리케이션 설정
             duckdb_source: DuckDB 소스 객체
+            schema_catalog: Oracle 스키마 카탈로그 (있으면 Oracle 테이블/컬럼 존재 여부도 검증)
         """
         self.logger = setup_logger('TableConfigService')
         self.config_repo = TableConfigRepository(config=config, duckdb_source=duckdb_source)
+        self.schema_catalog = schema_catalog
 
     def create_table_config(
         self,
@@ -259,4 +267,57 @@ class TableConfigService:
         if table_config.time_column and not table_config.time_column.replace('_', '').isalnum():
             errors.append("시간 컬럼명에 특수문자는 사용할 수 없습니다.")
 
+        # 3. Oracle 스키마 검증 (카탈로그가 있을 때)
+        # 카탈로그 조회 실패(Oracle 연결 불가 등)는 설정 오류가 아니므로 경고만 남기고 건너뜀
+        if self.schema_catalog and not errors:
+            try:
+                schema = self.schema_catalog.get_schema(
+                    table_config.oracle_schema, table_config.oracle_table
+                )
+                errors.extend(self._validate_against_schema(table_config, schema))
+            except Exception as e:
+                self.logger.warning(
+                    f"Oracle schema check skipped for {table_config.get_oracle_full_name()}: {e}"
+                )
+
         return len(errors) == 0, errors
+
+    def validate_configs(
+        self, table_configs: List[TableConfig]
+    ) -> Dict[str, Tuple[bool, List[str]]]:
+        """
+        여러 테이블 설정을 한 번에 검증
+
+        스키마 카탈로그가 있으면 모든 Oracle 테이블의 스키마를 한 번의 쿼리로 미리 조회합니다.
+
+        Args:
+            table_configs: 검증할 TableConfig 리스트
+
+        Returns:
+            Oracle 전체 테이블명 → (유효 여부, 에러 메시지 리스트)
+        """
+        if self.schema_catalog and table_configs:
+            try:
+                self.schema_catalog.get_schemas(
+                    (tc.oracle_schema, tc.oracle_table) for tc in table_configs
+                )
+            except Exception as e:
+                self.logger.warning(f"Bulk schema prefetch failed: {e}")
+
+        return {tc.get_oracle_full_name(): self.validate_config(tc) for tc in table_configs}
+
+    @staticmethod
+    def _validate_against_schema(table_config: TableConfig,
+                                 schema: Optional[TableSchema]) -> List[str]:
+        """Oracle 스키마와 설정의 컬럼을 비교"""
+        if schema is None:
+            return [f"Oracle 테이블 {table_config.get_oracle_full_name()}을(를) 찾을 수 없습니다."]
+
+        errors = []
+        if not schema.has_column(table_config.primary_key):
+            errors.append(
+                f"기본 키 컬럼 {table_config.primary_key}이(가) Oracle 테이블에 없습니다."
+            )
+        if table_config.time_column and not schema.has_column(table_config.time_column):
+            errors.append(f"시간 컬럼 {table_config.time_column}이(가) Oracle 테이블에 없습니다.")
+        return errors
@@ -17,8 +17,10 @@ from oracle_duckdb_sync.config import load_config
 from oracle_duckdb_sync.data.query import (
     query_duckdb_table_cached,
 )
+from oracle_duckdb_sync.data.sorted_merge import as_frame
 from oracle_duckdb_sync.database.duckdb_source import DuckDBSource
 from oracle_duckdb_sync.log.logger import setup_logger
+from oracle_duckdb_sync.scheduler.progress_bus import get_progress_bus
 from oracle_duckdb_sync.ui.handlers import handle_full_sync, handle_test_sync, render_sync_status_ui
 from oracle_duckdb_sync.ui.session_state import (
     SYNC_PROGRESS_REFRESH_INTERVAL,
@@ -39,26 +41,49 @@ app_logger.info("Streamlit cache provider initialized for data layer")
 
 
 def check_progress():
-    """Check for progress updates from worker"""
-    import queue
-    try:
-        while not st.session_state.progress_queue.empty():
-            msg = st.session_state.progress_queue.get_nowait()
-
-            if msg['type'] == 'progress':
-                st.session_state.sync_progress = msg['data']
-            elif msg['type'] == 'complete':
-                st.session_state.sync_status = 'completed'
-                st.session_state.sync_result = msg['data']
-                # Release lock on completion
-                release_sync_lock()
-            elif msg['type'] == 'error':
-                st.session_state.sync_status = 'error'
-                st.session_state.sync_error = msg['data']
-                # Release lock on error
-                release_sync_lock()
-    except queue.Empty:
-        pass
+    """Apply progress updates published since this session's last check
+
+    Sessions that did not start a sync follow the one currently running,
+    so every open session sees the same progress.
+    """
+    bus = get_progress_bus()
+
+    if not st.session_state.get('sync_id'):
+        active = bus.active_sync_ids()
+        if not active:
+            return
+        st.session_state.sync_id = active[-1]
+        st.session_state.sync_progress_cursor = -1
+        st.session_state.sync_status = 'running'
+        st.session_state.sync_progress = {}
+
+    events, cursor = bus.read_since(
+        st.session_state.sync_id, st.session_state.get('sync_progress_cursor', -1)
+    )
+    st.session_state.sync_progress_cursor = cursor
+
+    for event in events:
+        if event.type == 'progress':
+            st.session_state.sync_progress = event.data
+        elif event.type == 'complete':
+            st.session_state.sync_status = 'completed'
+            st.session_state.sync_result = event.data
+            # Release lock on completion
+            release_sync_lock()
+        elif event.type == 'error':
+            st.session_state.sync_status = 'error'
+            # The traceback is not published; only the session running the worker has it
+            worker = st.session_state.get('sync_worker')
+            if worker is not None and worker.sync_id == event.sync_id and worker.error_info:
+                st.session_state.sync_error = worker.error_info
+            else:
+                st.session_state.sync_error = event.data
+            # Release lock on error
+            release_sync_lock()
+        elif event.type == 'stopped':
+            st.session_state.sync_status = 'stopped'
+            st.session_state.sync_result = event.data
+            release_sync_lock()
 
 
 def main():
@@ -232,8 +257,10 @@ def main():
 
     st.subheader("시각화")
     # Display cached query result if available and successful
-    if st.session_state.query_result and st.session_state.query_result.get('success') and st.session_state.query_result.get('df_converted') is not None:
-        df_converted = st.session_state.query_result['df_converted']
+    df_converted = None
+    if st.session_state.query_result and st.session_state.query_result.get('success'):
+        df_converted = as_frame(st.session_state.query_result.get('df_converted'))
+    if df_converted is not None:
         visualization_table_name = st.session_state.query_result['table_name']
         query_mode = st.session_state.query_result.get('query_mode', 'detailed')
 
@@ -323,7 +350,7 @@ def main():
                         ))
                         st.dataframe(grid_df.head(max_display_rows))
                     else:
-                        st.dataframe(grid_df)
+                        st.dataframe(as_frame(grid_df))
 
 if __name__ == "__main__":
     main()
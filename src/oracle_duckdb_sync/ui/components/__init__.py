@@ -26,6 +26,12 @@ from oracle_duckdb_sync.ui.components.search import (
     search_pages,
     render_search_box
 )
+from oracle_duckdb_sync.ui.components.search_index import (
+    SearchEntry,
+    SearchIndex,
+    get_search_index,
+    register_search_tables
+)
 from oracle_duckdb_sync.ui.components.shortcuts import (
     get_shortcut_config,
     render_keyboard_shortcuts,
@@ -56,6 +62,10 @@ __all__ = [
     'get_searchable_pages',
     'search_pages',
     'render_search_box',
+    'SearchEntry',
+    'SearchIndex',
+    'get_search_index',
+    'register_search_tables',
     # Shortcuts
     'get_shortcut_config',
     'render_keyboard_shortcuts',
@@ -77,7 +77,8 @@ def get_page_title(path: str) -> str:
         '/admin/sync': '동기화 관리',
         '/admin/users': '사용자 관리',
         '/admin/menus': '메뉴 관리',
-        '/admin/tables': '테이블 설정'
+        '/admin/tables': '테이블 설정',
+        '/admin/queries': '쿼리 이력'
     }
 
     return titles.get(path, '페이지')
@@ -4,20 +4,56 @@
 사용자가 메뉴를 검색하여 빠르게 페이지로 이동할 수 있습니다.
 """
 
+import threading
+from typing import Dict, List, Optional
+
 import streamlit as st
-from typing import List, Dict
+
+from oracle_duckdb_sync.ui.components.search_index import SearchEntry, SearchIndex, get_search_index
+
+# 사이드바에 표시할 최대 검색 결과 수
+MAX_SEARCH_RESULTS = 20
+
+# 역할별 검색 대상 페이지 (메뉴 캐시 version이 바뀌면 다시 생성)
+_searchable_pages_cache: Dict[Optional[str], List[Dict[str, str]]] = {}
+_searchable_pages_version: Optional[int] = None
+_searchable_pages_lock = threading.Lock()
 
 
 def get_searchable_pages(user) -> List[Dict[str, str]]:
     """
     검색 가능한 페이지 목록 조회
 
+    역할별로 한 번만 생성하여 캐시하며, 메뉴가 변경되면 다시 생성합니다.
+
     Args:
         user: 현재 사용자
 
     Returns:
         페이지 목록 (path, name, category, keywords)
     """
+    global _searchable_pages_version
+
+    # Imported lazily: the menu package pulls in auth (bcrypt)
+    from oracle_duckdb_sync.menu.cache import get_menu_cache
+
+    role = user.role.value if user else None
+    version = get_menu_cache().version
+
+    with _searchable_pages_lock:
+        if _searchable_pages_version != version:
+            _searchable_pages_cache.clear()
+            _searchable_pages_version = version
+
+        pages = _searchable_pages_cache.get(role)
+        if pages is None:
+            pages = _searchable_pages_cache[role] = _build_searchable_pages(user)
+
+    return list(pages)
+
+
+def _build_searchable_pages(user) -> List[Dict[str, str]]:
+    """역할에 따른 검색 대상 페이지 목록 생성"""
     pages = [
         {
             'path': '/dashboard',
@@ -79,6 +115,15 @@ def get_searchable_pages(user) -> List[Dict[str, str]]:
                 'icon': '🗄️',
                 'category': '관리자',
                 'keywords': ['테이블', 'table', '설정', 'config', '구성', 'configuration']
+            },
+            {
+                'path': '/admin/queries',
+                'name': '쿼리 이력',
+                'icon': '⏱️',
+                'category': '관리자',
+                'keywords': [
+                    '쿼리', 'query', '이력', 'history', '성능', 'performance', '프로파일', 'profile'
+                ]
             }
         ]
         pages.extend(admin_pages)
@@ -90,6 +135,9 @@ def search_pages(query: str, pages: List[Dict[str, str]]) -> List[Dict[str, str]
     """
     페이지 검색
 
+    이름과 키워드를 n-gram 색인으로 검색하며, 결과는 일치 정도 순으로 정렬됩니다.
+    (반복 검색 시에는 get_search_index의 캐시된 인덱스를 사용하세요.)
+
     Args:
         query: 검색어
         pages: 검색 대상 페이지 목록
@@ -100,22 +148,8 @@ def search_pages(query: str, pages: List[Dict[str, str]]) -> List[Dict[str, str]
     if not query:
         return pages
 
-    query_lower = query.lower()
-    results = []
-
-    for page in pages:
-        # 이름 매칭
-        if query_lower in page['name'].lower():
-            results.append(page)
-            continue
-
-        # 키워드 매칭
-        for keyword in page['keywords']:
-            if query_lower in keyword.lower():
-                results.append(page)
-                break
-
-    return results
+    index = SearchIndex([SearchEntry.from_page(page) for page in pages])
+    return [pages[position] for position in index.rank(query)]
 
 
 def render_search_box(user):
@@ -136,29 +170,32 @@ def render_search_box(user):
     )
 
     if query:
-        # 검색 실행
-        all_pages = get_searchable_pages(user)
-        results = search_pages(query, all_pages)
+        # 검색 실행 (역할별로 캐시된 인덱스 사용)
+        results = get_search_index(user).search(query, limit=MAX_SEARCH_RESULTS)
 
         if results:
             st.sidebar.markdown(f"**검색 결과** ({len(results)}개)")
 
-            for page in results:
+            for entry in results:
                 # 카테고리 표시
-                category_badge = f"<span style='font-size: 10px; color: #888;'>[{page['category']}]</span>"
+                category_badge = (
+                    f"<span style='font-size: 10px; color: #888;'>[{entry.category}]</span>"
+                )
 
                 col1, col2 = st.sidebar.columns([1, 5])
 
                 with col1:
-                    st.markdown(page['icon'], unsafe_allow_html=True)
+                    st.markdown(entry.icon, unsafe_allow_html=True)
 
                 with col2:
                     if st.button(
-                        f"{page['name']}",
-                        key=f"search_result_{page['path']}",
+                        f"{entry.name}",
+                        key=f"search_result_{entry.kind}_{entry.target or entry.path}",
                         use_container_width=True
                     ):
-                        st.session_state.current_page = page['path']
+                        st.session_state.current_page = entry.path
+                        if entry.kind == 'table':
+                            st.session_state.selected_table = entry.target
                         st.session_state.menu_search_query = ""  # 검색어 초기화
                         st.rerun()
 
@@ -0,0 +1,257 @@
+"""
+메뉴 검색 인덱스
+
+페이지 이름/키워드와 테이블 이름을 n-gram(1~3글자) 역색인으로 미리 만들어 두고,
+키 입력마다 전체를 훑지 않고 색인에서 후보만 찾아 순위를 매깁니다.
+
+- 한글/영문 모두 소문자, 공백/구분자 제거 후 색인
+- 한글 제목은 초성 문자열도 함께 색인 (예: 'ㄷㅅㅂㄷ' → 대시보드)
+- 완전 일치 > 접두어 > 부분 문자열 > 오타 허용(trigram 유사도) 순으로 정렬
+
+인덱스는 역할별로 캐시되며, 메뉴(메뉴 캐시 version) 또는 테이블 목록이
+바뀔 때만 다시 만듭니다.
+"""
+
+import re
+import threading
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Tuple
+
+# 한글 초성 (가 = U+AC00, 초성마다 21 * 28 글자)
+_CHOSEONG = "ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ"
+_HANGUL_BASE = 0xAC00
+_HANGUL_LAST = 0xD7A3
+_SYLLABLES_PER_CHOSEONG = 21 * 28
+
+_SEPARATORS = re.compile(r"[\s_\-./]+")
+
+# 일치 종류별 점수
+SCORE_EXACT = 100.0
+SCORE_PREFIX = 80.0
+SCORE_SUBSTRING = 60.0
+SCORE_FUZZY = 40.0
+
+# 오타 허용 검색에서 검색어 trigram 중 일치해야 하는 비율
+FUZZY_MIN_SIMILARITY = 0.5
+
+# 용어 종류별 가중치
+WEIGHT_TITLE = 1.0
+WEIGHT_KEYWORD = 0.9
+WEIGHT_CHOSEONG = 0.8
+
+
+def normalize(text: str) -> str:
+    """소문자 변환 후 공백과 구분자(_ - . /) 제거"""
+    return _SEPARATORS.sub("", text.lower())
+
+
+def to_choseong(text: str) -> str:
+    """한글 음절을 초성으로 변환 (한글이 아닌 글자는 그대로)"""
+    chars = []
+    for ch in text:
+        code = ord(ch)
+        if _HANGUL_BASE <= code <= _HANGUL_LAST:
+            chars.append(_CHOSEONG[(code - _HANGUL_BASE) // _SYLLABLES_PER_CHOSEONG])
+        else:
+            chars.append(ch)
+    return "".join(chars)
+
+
+def _ngrams(text: str, n: int) -> List[str]:
+    return [text[i:i + n] for i in range(len(text) - n + 1)]
+
+
+@dataclass
+class SearchEntry:
+    """
+    검색 대상 항목
+
+    Attributes:
+        name: 표시 이름
+        path: 이동할 페이지 경로
+        icon: 아이콘
+        category: 분류 (예: '일반', '관리자', '테이블')
+        keywords: 추가 검색어
+        kind: 항목 종류 ('page', 'table')
+        target: 페이지 외 대상 (예: 테이블 이름)
+    """
+    name: str
+    path: str
+    icon: str = "📄"
+    category: str = ""
+    keywords: Tuple[str, ...] = field(default_factory=tuple)
+    kind: str = "page"
+    target: Optional[str] = None
+
+    @classmethod
+    def from_page(cls, page: Dict) -> 'SearchEntry':
+        """get_searchable_pages 형식의 딕셔너리로부터 생성"""
+        return cls(
+            name=page['name'],
+            path=page['path'],
+            icon=page.get('icon', '📄'),
+            category=page.get('category', ''),
+            keywords=tuple(page.get('keywords', ())),
+        )
+
+    @classmethod
+    def for_table(cls, table_name: str) -> 'SearchEntry':
+        """데이터 조회 페이지에서 여는 테이블 항목"""
+        return cls(
+            name=table_name,
+            path='/data',
+            icon='🗄️',
+            category='테이블',
+            kind='table',
+            target=table_name,
+        )
+
+
+class SearchIndex:
+    """
+    n-gram 역색인 기반 검색 인덱스
+
+    Example:
+        >>> index = SearchIndex([SearchEntry.from_page(p) for p in pages])
+        >>> [entry.name for entry in index.search("dashbord")]
+        ['대시보드']
+    """
+
+    def __init__(self, entries: Iterable[SearchEntry]):
+        self.entries: List[SearchEntry] = list(entries)
+        # (항목 위치, 정규화된 용어, 가중치)
+        self._terms: List[Tuple[int, str, float]] = []
+        # n-gram -> 용어 위치 목록 (용어에 여러 번 나와도 한 번만)
+        self._postings: Dict[str, List[int]] = {}
+
+        for position, entry in enumerate(self.entries):
+            self._add_term(position, entry.name, WEIGHT_TITLE)
+            for keyword in entry.keywords:
+                self._add_term(position, keyword, WEIGHT_KEYWORD)
+            choseong = to_choseong(entry.name)
+            if choseong != entry.name:
+                self._add_term(position, choseong, WEIGHT_CHOSEONG)
+
+    def _add_term(self, position: int, text: str, weight: float) -> None:
+        term = normalize(text)
+        if not term:
+            return
+        term_id = len(self._terms)
+        self._terms.append((position, term, weight))
+        for n in (1, 2, 3):
+            for gram in set(_ngrams(term, n)):
+                self._postings.setdefault(gram, []).append(term_id)
+
+    def rank(self, query: str, limit: Optional[int] = None) -> List[int]:
+        """
+        검색어에 맞는 항목 위치를 점수 순으로 반환
+
+        Args:
+            query: 검색어
+            limit: 최대 결과 수 (None이면 전체)
+
+        Returns:
+            self.entries 내 위치 리스트
+        """
+        q = normalize(query)
+        if not q:
+            positions = list(range(len(self.entries)))
+            return positions[:limit] if limit else positions
+
+        n = min(3, len(q))
+        query_grams = set(_ngrams(q, n))
+        shared: Counter = Counter()
+        for gram in query_grams:
+            shared.update(self._postings.get(gram, ()))
+
+        scores: Dict[int, float] = {}
+        for term_id, count in shared.items():
+            position, term, weight = self._terms[term_id]
+            if q == term:
+                score = SCORE_EXACT
+            elif term.startswith(q):
+                score = SCORE_PREFIX
+            elif q in term:
+                score = SCORE_SUBSTRING
+            elif n == 3 and count / len(query_grams) >= FUZZY_MIN_SIMILARITY:
+                score = SCORE_FUZZY * count / len(query_grams)
+            else:
+                continue
+            score *= weight
+            if score > scores.get(position, 0.0):
+                scores[position] = score
+
+        ranked = sorted(
+            scores,
+            key=lambda pos: (-scores[pos], len(self.entries[pos].name), self.entries[pos].name)
+        )
+        return ranked[:limit] if limit else ranked
+
+    def search(self, query: str, limit: Optional[int] = None) -> List[SearchEntry]:
+        """검색어에 맞는 항목을 점수 순으로 반환"""
+        return [self.entries[pos] for pos in self.rank(query, limit)]
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+
+# 검색 대상 테이블 (데이터 조회 페이지가 테이블 목록을 읽을 때 등록)
+_search_tables: Tuple[str, ...] = ()
+_search_tables_version = 0
+
+# 역할별 인덱스와 생성 시점의 (메뉴 version, 테이블 version)
+_index_cache: Dict[Optional[str], Tuple[Tuple[int, int], SearchIndex]] = {}
+_index_lock = threading.Lock()
+
+
+def register_search_tables(table_names: Iterable[str]) -> None:
+    """
+    검색 인덱스에 포함할 테이블 목록 등록
+
+    목록이 바뀐 경우에만 인덱스를 다시 만들도록 표시합니다.
+
+    Args:
+        table_names: DuckDB 테이블 이름들
+    """
+    global _search_tables, _search_tables_version
+
+    tables = tuple(sorted(set(table_names)))
+    with _index_lock:
+        if tables != _search_tables:
+            _search_tables = tables
+            _search_tables_version += 1
+
+
+def get_search_index(user) -> SearchIndex:
+    """
+    사용자 역할의 검색 인덱스 (페이지 + 테이블)
+
+    메뉴나 테이블 목록이 바뀌지 않았으면 캐시된 인덱스를 반환합니다.
+
+    Args:
+        user: 현재 사용자
+
+    Returns:
+        SearchIndex
+    """
+    # Imported lazily: the menu package pulls in auth (bcrypt)
+    from oracle_duckdb_sync.menu.cache import get_menu_cache
+    from oracle_duckdb_sync.ui.components.search import get_searchable_pages
+
+    role = user.role.value if user else None
+
+    with _index_lock:
+        version = (get_menu_cache().version, _search_tables_version)
+        tables = _search_tables
+        cached = _index_cache.get(role)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+
+    entries = [SearchEntry.from_page(page) for page in get_searchable_pages(user)]
+    entries += [SearchEntry.for_table(table) for table in tables]
+    index = SearchIndex(entries)
+
+    with _index_lock:
+        _index_cache[role] = (version, index)
+    return index
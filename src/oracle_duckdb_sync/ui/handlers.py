@@ -89,8 +89,8 @@ def _start_sync_worker(config, sync_params: dict, sync_lock: SyncLock):
         sync_params: 동기화 파라미터 딕셔너리
         sync_lock: 획득된 동기화 락 객체
     """
-    # Create and start worker
-    worker = SyncWorker(config, sync_params, st.session_state.progress_queue)
+    # Create and start worker (progress is published on the process-wide progress bus)
+    worker = SyncWorker(config, sync_params)
 
     # Set expected_rows for test sync (for ETA calculation)
     if sync_params.get('sync_type') == 'test' and 'row_limit' in sync_params:
@@ -100,6 +100,8 @@ def _start_sync_worker(config, sync_params: dict, sync_lock: SyncLock):
 
     # Update session state
     st.session_state.sync_worker = worker
+    st.session_state.sync_id = worker.sync_id
+    st.session_state.sync_progress_cursor = -1
     st.session_state.sync_status = 'running'
     st.session_state.sync_progress = {}
     st.session_state.sync_lock = sync_lock
@@ -239,6 +241,7 @@ def handle_reset_sync():
     handler_logger.info("Resetting sync state")
     st.session_state.sync_status = 'idle'
     st.session_state.sync_worker = None
+    st.session_state.sync_id = None
     st.session_state.sync_progress = {}
     st.session_state.sync_result = {}
     st.rerun()
@@ -251,6 +254,7 @@ def handle_retry_sync():
     handler_logger.info("Retrying sync after error")
     st.session_state.sync_status = 'idle'
     st.session_state.sync_worker = None
+    st.session_state.sync_id = None
     st.session_state.sync_error = {}
     st.rerun()
 
@@ -289,17 +293,12 @@ def handle_stop_sync():
     """
     동기화 중지 버튼 클릭 이벤트 처리
 
-    진행 중인 동기화를 완전히 중지하고 리소스를 정리합니다.
+    진행 중인 동기화를 다음 배치 경계에서 중지합니다. 동기화 잠금은
+    워커가 'stopped' 이벤트를 보낸 뒤(check_progress) 해제됩니다.
     """
     if st.session_state.sync_worker:
         st.session_state.sync_worker.stop()
         st.session_state.sync_status = 'stopped'
-
-        # Release sync lock if exists
-        if hasattr(st.session_state, 'sync_lock') and st.session_state.sync_lock:
-            st.session_state.sync_lock.release()
-            handler_logger.info("Sync lock released after stop")
-
         handler_logger.info("Sync stopped by user")
         st.rerun()
     else:
@@ -325,13 +324,20 @@ def render_running_status():
         col1.metric("처리된 행", f"{progress.get('total_rows', 0):,}")
         col2.metric("처리 속도", f"{progress.get('rows_per_second', 0):.0f} rows/s")
 
+        # Expected rows (statistics/sample estimates are approximate)
+        if progress.get('expected_rows'):
+            approx = "" if progress.get('estimate_method') in ('count', 'limit') else "약 "
+            st.sidebar.text(f"📊 예상 총 행 수: {approx}{progress['expected_rows']:,}")
+
         # Elapsed time
         elapsed = progress.get('elapsed_time', 0)
         st.sidebar.text(f"⏱️ 경과 시간: {elapsed:.0f}초")
 
         # ETA
         if progress.get('eta'):
-            st.sidebar.text(f"⏰ 예상 완료: {progress['eta']}")
+            st.sidebar.text(f"⏳ 남은 시간: {progress['eta']}")
+        if progress.get('finish_at'):
+            st.sidebar.text(f"⏰ 예상 완료: {progress['finish_at']}")
     else:
         st.sidebar.info("동기화 시작 중...")
 
@@ -374,6 +380,22 @@ def render_completed_status():
         handle_reset_sync()
 
 
+def render_stopped_status():
+    """
+    동기화 중지 상태 UI 렌더링
+
+    중지 전까지 적재된 배치는 유지됩니다. 증분 동기화는 다음 실행 시
+    중지된 지점부터 이어서 진행됩니다.
+    """
+    st.sidebar.warning("⏹️ 동기화 중지됨")
+    if st.session_state.sync_result:
+        result = st.session_state.sync_result
+        st.sidebar.info(f"중지 전까지 {result.get('total_rows', 0):,} 행 적재됨")
+
+    if st.sidebar.button("새 동기화 시작"):
+        handle_reset_sync()
+
+
 def render_paused_status():
     """
     동기화 일시정지 상태 UI 렌더링
@@ -434,3 +456,5 @@ def render_sync_status_ui():
         render_completed_status()
     elif st.session_state.sync_status == 'error':
         render_error_status()
+    elif st.session_state.sync_status == 'stopped':
+        render_stopped_status()
@@ -6,9 +6,12 @@ Oracle-DuckDB Sync Dashboard - Main Entry Point
 
 import streamlit as st
 
+from oracle_duckdb_sync.config import load_config
 from oracle_duckdb_sync.log.logger import setup_logger
+from oracle_duckdb_sync.scheduler.log_retention import start_log_retention
+from oracle_duckdb_sync.scheduler.progress_bus import get_progress_bus
 from oracle_duckdb_sync.ui.navigation import render_sidebar_navigation
-from oracle_duckdb_sync.ui.pages.login import render_login_page
+from oracle_duckdb_sync.ui.pages.login import render_login_page, resolve_session_user
 from oracle_duckdb_sync.ui.router import get_router
 from oracle_duckdb_sync.ui.session_state import initialize_session_state
 from oracle_duckdb_sync.ui.components import (
@@ -36,13 +39,21 @@ def main():
     # 세션 상태 초기화
     initialize_session_state()
 
+    config = load_config()
+
+    # 동기화 로그·쿼리 이력 보관 기간 정리 (프로세스당 한 번 백그라운드 스케줄 등록)
+    start_log_retention(config)
+
+    # 프로세스 전역 진행 상황 버스 (설정은 최초 생성 시에만 적용)
+    get_progress_bus(config)
+
     # 로그인 체크
     if not st.session_state.get('authenticated', False):
         render_login_page()
         return
 
-    # 사용자 정보
-    user = st.session_state.get('user')
+    # 사용자 정보 (세션 토큰 검증, 캐시 미스 시에만 DB 조회)
+    user = resolve_session_user()
     if not user:
         st.error("❌ 사용자 정보를 찾을 수 없습니다. 다시 로그인하세요.")
         st.session_state.authenticated = False
@@ -103,6 +103,7 @@ class NavigationMenu:
                 {'icon': '👥', 'name': '사용자 관리', 'path': '/admin/users'},
                 {'icon': '📑', 'name': '메뉴 관리', 'path': '/admin/menus'},
                 {'icon': '🗄️', 'name': '테이블 설정', 'path': '/admin/tables'},
+                {'icon': '⏱️', 'name': '쿼리 이력', 'path': '/admin/queries'},
             ])
 
     def _render_menu_items(self, menus: List[dict]):
@@ -136,6 +137,7 @@ class NavigationMenu:
         # 세션 상태 초기화
         st.session_state.authenticated = False
         st.session_state.user = None
+        st.session_state.session_token = None
         st.session_state.current_page = '/dashboard'
 
         st.success("로그아웃되었습니다.")
@@ -0,0 +1,125 @@
+"""
+쿼리 이력 페이지
+
+관리자가 대시보드 쿼리의 실행 시간, 결과 크기, DuckDB 프로파일을 확인하는 페이지입니다.
+쿼리 이력은 QUERY_PROFILING_ENABLED=true 일 때만 기록됩니다.
+"""
+
+import pandas as pd
+import streamlit as st
+
+from oracle_duckdb_sync.config import load_config
+from oracle_duckdb_sync.data.query_profiler import QueryProfiler
+from oracle_duckdb_sync.database.duckdb_source import DuckDBSource
+from oracle_duckdb_sync.log.logger import setup_logger
+from oracle_duckdb_sync.models.query_history import QueryHistoryEntry
+from oracle_duckdb_sync.repository.query_history_repo import QueryHistoryRepository
+from oracle_duckdb_sync.ui.pages.login import require_auth
+
+# Logger 설정
+logger = setup_logger('AdminQueryHistoryPage')
+
+
+@require_auth(required_permission="admin:*")
+def render_admin_query_history_page():
+    """쿼리 이력 페이지 렌더링"""
+    st.title("⏱️ 쿼리 이력")
+
+    try:
+        config = load_config()
+        duckdb = DuckDBSource(config)
+        history_repo = QueryHistoryRepository(duckdb_source=duckdb)
+
+        if not config.query_profiling_enabled:
+            st.info(
+                "쿼리 프로파일링이 비활성화되어 있습니다. "
+                "QUERY_PROFILING_ENABLED=true 로 설정하면 이력이 기록됩니다."
+            )
+
+        render_table_statistics(history_repo)
+
+        st.markdown("---")
+
+        render_slowest_queries(history_repo, duckdb)
+
+    except Exception as e:
+        logger.error(f"쿼리 이력 페이지 렌더링 실패: {e}", exc_info=True)
+        st.error(f"❌ 페이지를 로드할 수 없습니다: {e}")
+
+
+def render_table_statistics(history_repo: QueryHistoryRepository):
+    """테이블별 쿼리 통계 렌더링"""
+    st.subheader("📊 테이블별 통계")
+
+    stats = history_repo.get_table_statistics()
+    if not stats:
+        st.info("기록된 쿼리가 없습니다.")
+        return
+
+    df_stats = pd.DataFrame(stats).rename(columns={
+        'table_name': '테이블',
+        'query_count': '쿼리 수',
+        'avg_ms': '평균 (ms)',
+        'p95_ms': 'p95 (ms)',
+        'max_ms': '최대 (ms)',
+        'total_rows': '총 결과 행'
+    })
+    st.dataframe(df_stats, use_container_width=True, hide_index=True)
+
+
+def render_slowest_queries(history_repo: QueryHistoryRepository, duckdb: DuckDBSource):
+    """테이블별 가장 느린 쿼리 렌더링"""
+    st.subheader("🐢 느린 쿼리")
+
+    limit_per_table = st.number_input("테이블당 표시 개수", min_value=1, max_value=50, value=5)
+    entries = history_repo.get_slowest_per_table(limit_per_table=int(limit_per_table))
+
+    if not entries:
+        st.info("기록된 쿼리가 없습니다.")
+        return
+
+    for entry in entries:
+        hint_icon = '⚠️ ' if entry.hints else ''
+        title = (
+            f"{hint_icon}{entry.table_name or '(알 수 없음)'} · {entry.latency_ms:,.1f} ms · "
+            f"{entry.row_count:,}행 · {entry.executed_at:%Y-%m-%d %H:%M:%S}"
+        )
+        with st.expander(title):
+            render_query_entry(entry, duckdb)
+
+
+def render_query_entry(entry: QueryHistoryEntry, duckdb: DuckDBSource):
+    """쿼리 이력 상세 렌더링 (SQL, 진단 힌트, 연산자별 프로파일)"""
+    st.code(entry.query_text.strip(), language='sql')
+
+    col1, col2, col3 = st.columns(3)
+    col1.metric("실행 시간", f"{entry.latency_ms:,.1f} ms")
+    col2.metric("결과 행", f"{entry.row_count:,}")
+    col3.metric("결과 크기", f"{entry.result_bytes / 1024 / 1024:,.2f} MB")
+
+    if entry.source:
+        st.caption(f"호출 위치: {entry.source}")
+
+    for hint in entry.hints:
+        st.warning(hint)
+
+    if entry.profile and entry.profile.get('operators'):
+        st.markdown("##### 연산자별 프로파일")
+        df_operators = pd.DataFrame([
+            {
+                '연산자': '  ' * op['depth'] + str(op['operator']),
+                '시간 (ms)': (op['seconds'] or 0) * 1000,
+                '출력 행': op['rows'],
+                '스캔 행': op['rows_scanned']
+            }
+            for op in entry.profile['operators']
+        ])
+        st.dataframe(df_operators, use_container_width=True, hide_index=True)
+
+    # 파라미터가 있는 쿼리(페이지 조회)는 다시 실행할 수 없으므로 제외
+    if '?' not in entry.query_text and st.button("EXPLAIN ANALYZE 실행", key=f"explain_{entry.id}"):
+        try:
+            profiler = QueryProfiler(QueryHistoryRepository(duckdb_source=duckdb), profiling=False)
+            st.code(profiler.explain_analyze(duckdb.conn, entry.query_text))
+        except Exception as e:
+            st.error(f"❌ EXPLAIN ANALYZE 실패: {e}")
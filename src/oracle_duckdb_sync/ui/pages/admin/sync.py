@@ -5,12 +5,19 @@ Oracle에서 DuckDB로 데이터 동기화를 관리합니다.
 """
 
 import time
+from collections import deque
 
+import pandas as pd
 import streamlit as st
 
 from oracle_duckdb_sync.config import load_config
 from oracle_duckdb_sync.database import DuckDBSource
+from oracle_duckdb_sync.log.log_stream import (
+    attach_stream_handler_to_logger,
+    get_log_stream_handler,
+)
 from oracle_duckdb_sync.log.logger import setup_logger
+from oracle_duckdb_sync.repository.sync_log_repo import SyncLogRepository
 from oracle_duckdb_sync.ui.handlers import (
     handle_full_sync,
     handle_test_sync,
@@ -21,6 +28,9 @@ from oracle_duckdb_sync.ui.session_state import SYNC_PROGRESS_REFRESH_INTERVAL
 
 logger = setup_logger('SyncPage')
 
+# 세션별로 화면에 유지할 실시간 로그 줄 수
+LIVE_LOG_LINES = 200
+
 
 def check_progress():
     """동기화 진행 상황 체크 (app.py에서 복사)"""
@@ -55,6 +65,14 @@ def render_sync_page():
         # 동기화 상태 표시
         render_sync_status()
 
+        # 실시간 로그
+        render_live_logs()
+
+        st.markdown("---")
+
+        # 동기화 이력 (일별 집계 + 최근 로그)
+        render_sync_history(duckdb, config)
+
     except Exception as e:
         logger.error(f"동기화 관리 페이지 렌더링 실패: {e}", exc_info=True)
         st.error(f"❌ 페이지를 로드할 수 없습니다: {e}")
@@ -173,6 +191,109 @@ def render_sync_status():
     render_sync_status_ui()
 
 
+def render_live_logs():
+    """
+    실시간 동기화 로그 표시
+
+    세션마다 마지막으로 읽은 로그 seq(커서)를 기억해 두고, rerun 마다
+    그 이후의 새 로그만 가져와 화면용 버퍼에 덧붙입니다.
+    """
+    # 모든 로거의 레코드가 전파되는 root 로거에 연결 (중복 연결 없음)
+    attach_stream_handler_to_logger()
+    handler = get_log_stream_handler()
+
+    with st.expander("📜 실시간 로그", expanded=st.session_state.get('sync_status') == 'running'):
+        level = st.selectbox(
+            "로그 레벨",
+            options=[None, 'INFO', 'WARNING', 'ERROR'],
+            format_func=lambda value: value or '전체',
+            key='live_log_level'
+        )
+
+        # 필터가 바뀌면 처음부터 다시 읽음
+        filter_changed = st.session_state.get('live_log_filter') != level
+        if filter_changed or 'live_log_lines' not in st.session_state:
+            st.session_state.live_log_filter = level
+            st.session_state.live_log_lines = deque(maxlen=LIVE_LOG_LINES)
+            st.session_state.live_log_cursor = -1
+
+        entries, cursor = handler.read_since(
+            st.session_state.live_log_cursor,
+            level=level,
+            limit=LIVE_LOG_LINES
+        )
+        st.session_state.live_log_cursor = cursor
+        st.session_state.live_log_lines.extend(str(entry) for entry in entries)
+
+        if st.session_state.live_log_lines:
+            st.code("\n".join(st.session_state.live_log_lines), language=None)
+        else:
+            st.caption("표시할 로그가 없습니다.")
+
+
+def get_sync_log_repo(duckdb: DuckDBSource) -> SyncLogRepository:
+    """세션에 한 번만 생성한 동기화 로그 저장소 (매 rerun마다 테이블/인덱스 DDL 확인 방지)"""
+    if 'sync_log_repo' not in st.session_state:
+        st.session_state.sync_log_repo = SyncLogRepository(duckdb_source=duckdb)
+    log_repo: SyncLogRepository = st.session_state.sync_log_repo
+    return log_repo
+
+
+def render_sync_history(duckdb: DuckDBSource, config):
+    """동기화 이력 표시 (일별 집계 테이블과 인덱스로 조회)"""
+    st.subheader("📜 동기화 이력")
+
+    log_repo = get_sync_log_repo(duckdb)
+    table_name = config.oracle_full_table_name
+
+    stats = log_repo.get_statistics(table_name=table_name)
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        st.metric("🔁 총 실행", f"{stats.get('total', 0):,}")
+    with col2:
+        st.metric("❌ 실패", f"{stats.get('failed', 0):,}")
+    with col3:
+        st.metric("📝 누적 동기화 행", f"{int(stats.get('total_rows_synced', 0)):,}")
+
+    # selectbox returns None only when it has no options
+    days = st.selectbox(
+        "조회 기간", options=[7, 30, 90], index=1, format_func=lambda d: f"최근 {d}일"
+    ) or 30
+    rollup = log_repo.get_daily_rollup(days=days, table_name=table_name)
+    if rollup:
+        df_rollup = pd.DataFrame(rollup).rename(columns={
+            'day': '날짜',
+            'table_name': '테이블',
+            'runs': '실행',
+            'completed': '완료',
+            'failed': '실패',
+            'running': '진행 중',
+            'total_rows': '행 수',
+            'avg_duration_seconds': '평균 소요 (초)',
+            'max_duration_seconds': '최대 소요 (초)'
+        })
+        st.dataframe(df_rollup, use_container_width=True, hide_index=True)
+    else:
+        st.info("기록된 동기화 이력이 없습니다.")
+
+    with st.expander("🕐 최근 실행 로그"):
+        logs = log_repo.get_recent_logs(limit=20, table_name=table_name)
+        if logs:
+            st.dataframe(pd.DataFrame([
+                {
+                    '시작': log.start_time,
+                    '종료': log.end_time,
+                    '유형': log.sync_type.value,
+                    '상태': log.status.value,
+                    '행 수': log.total_rows,
+                    '오류': log.error_message or ''
+                }
+                for log in logs
+            ]), use_container_width=True, hide_index=True)
+        else:
+            st.info("기록된 로그가 없습니다.")
+
+
 def get_duckdb_row_count(duckdb: DuckDBSource, config) -> int:
     """DuckDB 테이블 행 수 조회"""
     try:
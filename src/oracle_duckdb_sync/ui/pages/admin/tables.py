@@ -7,6 +7,7 @@
 import streamlit as st
 
 from oracle_duckdb_sync.config import load_config
+from oracle_duckdb_sync.database.schema_catalog import get_schema_catalog
 from oracle_duckdb_sync.log.logger import setup_logger
 from oracle_duckdb_sync.table_config import TableConfig, TableConfigService
 from oracle_duckdb_sync.ui.pages.login import require_auth
@@ -22,7 +23,7 @@ def render_admin_tables_page():
 
     # 설정 및 서비스 초기화
     config = load_config()
-    table_service = TableConfigService(config=config)
+    table_service = TableConfigService(config=config, schema_catalog=get_schema_catalog(config))
 
     # 탭 구성
     tab1, tab2, tab3 = st.tabs(["📋 테이블 목록", "➕ 테이블 추가", "⚙️ 환경변수 가져오기"])
@@ -51,6 +52,10 @@ def render_table_list(table_service: TableConfigService):
         st.info("등록된 테이블 설정이 없습니다.")
         return
 
+    # Oracle 스키마 일괄 검증 (모든 테이블을 한 번의 쿼리로 조회)
+    if st.button("🔍 Oracle 스키마 검증"):
+        render_validation_results(table_service, tables)
+
     # 테이블 목록 표시
     for table in tables:
         status_icon = '🟢' if table.sync_enabled else '🔴'
@@ -157,6 +162,23 @@ def render_table_list(table_service: TableConfigService):
                     handle_delete_table(table_service, table.id, table.get_oracle_full_name())
 
 
+def render_validation_results(table_service: TableConfigService, tables: list[TableConfig]):
+    """테이블 설정 일괄 검증 결과 렌더링"""
+    with st.spinner("Oracle 스키마 조회 중..."):
+        results = table_service.validate_configs(tables)
+
+    invalid = {name: errors for name, (is_valid, errors) in results.items() if not is_valid}
+    if not invalid:
+        st.success(f"✅ {len(results)}개 테이블 설정이 모두 유효합니다.")
+        return
+
+    st.error(f"❌ {len(invalid)}/{len(results)}개 테이블 설정에 문제가 있습니다.")
+    for name, errors in invalid.items():
+        st.markdown(f"**{name}**")
+        for error in errors:
+            st.markdown(f"- {error}")
+
+
 def render_create_table_form(table_service: TableConfigService):
     """테이블 추가 폼 렌더링"""
     st.subheader("새 테이블 설정 추가")
@@ -4,9 +4,11 @@
 사용자 인증을 처리하는 Streamlit 페이지입니다.
 """
 
+from typing import Optional
+
 import streamlit as st
 
-from oracle_duckdb_sync.auth import AuthService
+from oracle_duckdb_sync.auth import AuthService, User, get_session_manager, get_user_session_cache
 from oracle_duckdb_sync.config import load_config
 from oracle_duckdb_sync.log.logger import setup_logger
 
@@ -62,10 +64,11 @@ def handle_login(username: str, password: str):
     # 인증 시도
     success, message, user = auth_service.authenticate(username, password)
 
-    if success:
+    if success and user is not None:
         # 세션에 사용자 정보 저장
         st.session_state.authenticated = True
         st.session_state.user = user
+        st.session_state.session_token = auth_service.issue_session_token(user)
         logger.info(f"User logged in: {username}")
 
         st.success(f"✅ {message}")
@@ -87,9 +90,35 @@ def handle_logout():
     # 세션 정보 삭제
     st.session_state.authenticated = False
     st.session_state.user = None
+    st.session_state.session_token = None
     st.success("로그아웃되었습니다.")
 
 
+def resolve_session_user() -> Optional[User]:
+    """
+    세션 토큰으로 현재 사용자 복원
+
+    rerun 마다 호출되며, 토큰 서명만 검증하고 사용자는 메모리 캐시에서 가져옵니다.
+    캐시 미스(만료, 사용자 정보 변경) 시에만 DB를 조회합니다.
+
+    Returns:
+        활성 사용자 또는 None (토큰 만료, 계정 비활성화/삭제 시 세션 정보 삭제)
+    """
+    config = load_config()
+    user = get_session_manager(config).resolve(
+        st.session_state.get('session_token'),
+        lambda user_id: AuthService(config=config).get_user_by_id(user_id)
+    )
+
+    if user is None:
+        st.session_state.authenticated = False
+        st.session_state.user = None
+        st.session_state.session_token = None
+    else:
+        st.session_state.user = user
+    return user
+
+
 def require_auth(required_permission: str = None):
     """
     인증 필수 데코레이터
@@ -113,12 +142,14 @@ def require_auth(required_permission: str = None):
             # 권한 체크
             if required_permission:
                 user = st.session_state.get('user')
-                config = load_config()
-                auth_service = AuthService(config=config)
 
-                if not auth_service.has_permission(user, required_permission):
+                cache = get_user_session_cache()
+                if user is None or not cache.has_permission(user, required_permission):
                     st.error("❌ 이 페이지에 접근할 권한이 없습니다.")
-                    logger.warning(f"Permission denied: {user.username} tried to access with {required_permission}")
+                    username = user.username if user is not None else None
+                    logger.warning(
+                        f"Permission denied: {username} tried to access with {required_permission}"
+                    )
                     st.stop()
 
             return func(*args, **kwargs)
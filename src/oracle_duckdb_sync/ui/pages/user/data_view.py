@@ -4,14 +4,19 @@
 DuckDB 테이블 데이터를 조회하고 표시합니다.
 """
 
+import pandas as pd
 import streamlit as st
 
-from oracle_duckdb_sync.application import QueryService
+from oracle_duckdb_sync.adapters import MessageContext, StreamlitAdapter
+from oracle_duckdb_sync.application import AsyncQueryService, QueryHandle, QueryService, QueryStatus
 from oracle_duckdb_sync.config import load_config
+from oracle_duckdb_sync.config.query_constants import QUERY_CONSTANTS
+from oracle_duckdb_sync.data.converter import convert_selected_columns, detect_and_convert_types
+from oracle_duckdb_sync.data.query_profiler import QueryProfiler
+from oracle_duckdb_sync.data.sorted_merge import as_frame
 from oracle_duckdb_sync.database import DuckDBSource
 from oracle_duckdb_sync.log.logger import setup_logger
-from oracle_duckdb_sync.adapters import MessageContext, StreamlitAdapter
-# query_duckdb_table_cached is not needed - using QueryService directly
+from oracle_duckdb_sync.ui.components.search_index import register_search_tables
 from oracle_duckdb_sync.ui.pages.login import require_auth
 
 logger = setup_logger('DataViewPage')
@@ -30,7 +35,7 @@ def render_data_view():
             return
 
         duckdb = DuckDBSource(config)
-        query_service = QueryService(duckdb)
+        query_service = QueryService(duckdb, profiler=QueryProfiler.from_config(config, duckdb))
         ui_adapter = StreamlitAdapter()
 
         # 테이블 선택
@@ -46,6 +51,11 @@ def render_data_view():
         # 조회 결과 표시
         render_query_results(query_service, ui_adapter)
 
+        st.markdown("---")
+
+        # 페이지 단위 탐색
+        render_table_browser(query_service, ui_adapter)
+
     except Exception as e:
         logger.error(f"데이터 조회 페이지 렌더링 실패: {e}", exc_info=True)
         st.error(f"❌ 페이지를 로드할 수 없습니다: {e}")
@@ -62,8 +72,13 @@ def render_table_selection(query_service: QueryService, config):
         st.warning("⚠️ 사용 가능한 테이블이 없습니다.")
         return None
 
-    # 기본 테이블 결정
-    default_table = query_service.determine_default_table_name(config, table_list)
+    # 메뉴 검색에서 테이블을 찾을 수 있도록 등록 (목록이 바뀐 경우에만 색인 재생성)
+    register_search_tables(table_list)
+
+    # 기본 테이블 결정 (메뉴 검색에서 고른 테이블 우선)
+    default_table = st.session_state.get('selected_table')
+    if default_table not in table_list:
+        default_table = query_service.determine_default_table_name(config, table_list)
 
     # 테이블 선택
     selected_table = st.selectbox(
@@ -141,17 +156,80 @@ def handle_query(
     resolution: str,
     row_count: int
 ):
-    """조회 처리"""
+    """조회 처리 (백그라운드 실행)"""
+    # 이전 조회가 실행 중이면 취소
+    previous = st.session_state.get('query_handle')
+    if previous is not None and not previous.done():
+        previous.cancel()
+
+    async_service = AsyncQueryService(query_service)
+
     if query_mode == "집계 뷰 (빠름)":
         # 집계 조회
-        with st.spinner(f"집계 데이터 조회 중... (해상도: {resolution})"):
-            agg_result = query_service.query_table_aggregated_legacy(
-                table_name=table_name,
-                time_column=time_column,
-                interval=resolution
-            )
+        handle = async_service.query_table_aggregated_legacy(
+            table_name=table_name,
+            time_column=time_column,
+            interval=resolution
+        )
+        label = f"집계 데이터 조회 중... (해상도: {resolution})"
+    else:
+        # 상세 조회
+        handle = async_service.query_table(
+            table_name,
+            convert_types=True
+        )
+        label = f"전체 데이터 조회 중... ({row_count:,}행)"
+
+    st.session_state.query_handle = handle
+    st.session_state.query_request = {
+        'query_mode': query_mode,
+        'table_name': table_name,
+        'row_count': row_count,
+        'label': label
+    }
+    st.session_state.query_result = None
+    close_raw_data_stream()
+
+
+@st.fragment(run_every=QUERY_CONSTANTS.ASYNC_QUERY_POLL_INTERVAL_SECONDS)
+def render_running_query():
+    """실행 중인 조회의 진행률 표시 및 취소"""
+    handle = st.session_state.get('query_handle')
+    if handle is None:
+        return
+
+    if not handle.done():
+        request = st.session_state.query_request
+        progress = handle.progress
+        text = f"⏳ {request['label']} ({handle.elapsed_seconds:.1f}초)"
+        st.progress(progress if progress is not None else 0.0, text=text)
+
+        if st.button("⏹️ 조회 취소", key=f"cancel_query_{handle.query_id}"):
+            handle.cancel()
+        return
+
+    # 조회 완료: 결과를 세션에 반영하고 페이지 전체를 다시 그림
+    st.session_state.query_handle = None
+    apply_query_result(handle, st.session_state.query_request, StreamlitAdapter())
+    st.rerun()
 
-        if agg_result['success']:
+
+def apply_query_result(handle: QueryHandle, request: dict, ui_adapter: StreamlitAdapter):
+    """완료된 백그라운드 조회 결과를 query_result 세션 상태로 변환"""
+    table_name = request['table_name']
+    row_count = request['row_count']
+
+    if handle.status == QueryStatus.CANCELLED:
+        st.session_state.query_message = MessageContext(
+            level='warning',
+            message="⏹️ 조회가 취소되었습니다."
+        )
+        st.session_state.query_result = None
+        return
+
+    if request['query_mode'] == "집계 뷰 (빠름)":
+        agg_result = handle.result
+        if handle.status == QueryStatus.COMPLETED:
             st.session_state.query_result = {
                 'df_converted': agg_result['df_aggregated'],
                 'table_name': agg_result['table_name'],
@@ -161,26 +239,20 @@ def handle_query(
                 'numeric_cols': agg_result.get('numeric_cols', []),
                 'row_count': row_count
             }
-            ui_adapter.presenter.show_message(MessageContext(
+            st.session_state.query_message = MessageContext(
                 level='success',
                 message=f"✅ 집계 완료: {len(agg_result['df_aggregated'])} 시간 구간"
-            ))
+            )
         else:
-            ui_adapter.presenter.show_message(MessageContext(
+            st.session_state.query_message = MessageContext(
                 level='error',
-                message=f"집계 쿼리 오류: {agg_result['error']}"
-            ))
+                message=f"집계 쿼리 오류: {handle.error}"
+            )
             st.session_state.query_result = None
 
     else:
-        # 상세 조회
-        with st.spinner(f"전체 데이터 조회 중... ({row_count:,}행)"):
-            result = query_service.query_table(
-                table_name,
-                convert_types=True
-            )
-
-        if result.success:
+        result = handle.result
+        if handle.status == QueryStatus.COMPLETED:
             st.session_state.query_result = {
                 'df_converted': result.data,
                 'table_name': table_name,
@@ -189,10 +261,10 @@ def handle_query(
                 'row_count': row_count
             }
         else:
-            ui_adapter.presenter.show_message(MessageContext(
+            st.session_state.query_message = MessageContext(
                 level='error',
-                message=f"상세 조회 오류: {result.error or 'Unknown error'}"
-            ))
+                message=f"상세 조회 오류: {handle.error or 'Unknown error'}"
+            )
             st.session_state.query_result = None
 
 
@@ -200,6 +272,13 @@ def render_query_results(query_service: QueryService, ui_adapter: StreamlitAdapt
     """조회 결과 표시"""
     st.subheader("📋 조회 결과")
 
+    # 백그라운드 조회 진행 상황
+    render_running_query()
+
+    message = st.session_state.pop('query_message', None)
+    if message is not None:
+        ui_adapter.presenter.show_message(message)
+
     if not st.session_state.get('query_result') or not st.session_state.query_result.get('success'):
         st.info("💡 조회 버튼을 클릭하여 데이터를 조회하세요.")
         return
@@ -238,37 +317,168 @@ def render_query_results(query_service: QueryService, ui_adapter: StreamlitAdapt
     )
 
     # 데이터 표시
-    grid_df = None
     if query_mode == 'aggregated' and table_name_for_grid:
-        # 원본 데이터 가져오기
-        raw_result = query_service.query_table(
-            table_name_for_grid,
-            limit=max_display_rows,
-            convert_types=True
+        # 원본 데이터는 첫 페이지를 바로 표시하고 나머지는 요청 시 불러옴
+        render_raw_data_pages(
+            query_service, table_name_for_grid, max_display_rows, total_rows, ui_adapter
         )
+        return
+
+    grid_df = df_converted
+    shown_rows = total_rows if total_rows is not None else len(grid_df)
+    display_rows = min(shown_rows, max_display_rows)
 
-        if raw_result.success:
-            grid_df = raw_result.data
+    with st.spinner(f"데이터 테이블 렌더링 중... ({display_rows:,}행)"):
+        if total_rows is not None and total_rows > max_display_rows:
+            ui_adapter.presenter.show_message(MessageContext(
+                level='warning',
+                message=(
+                    f"⚠️ 성능을 위해 {max_display_rows:,}행만 표시합니다. "
+                    f"(전체: {total_rows:,}행)"
+                )
+            ))
+            st.dataframe(grid_df.head(max_display_rows), use_container_width=True)
         else:
+            st.dataframe(as_frame(grid_df), use_container_width=True)
+
+
+def render_raw_data_pages(
+    query_service: QueryService,
+    table_name: str,
+    page_rows: int,
+    total_rows,
+    ui_adapter: StreamlitAdapter
+):
+    """원본 데이터를 스트리밍으로 페이지 단위 표시"""
+    state = st.session_state.get('raw_data_stream')
+
+    if state is None or state['table_name'] != table_name or state['page_rows'] != page_rows:
+        close_raw_data_stream()
+        try:
+            stream = query_service.stream_table(table_name, chunk_size=page_rows)
+        except Exception as e:
+            logger.error(f"원본 데이터 조회 실패: {e}")
             ui_adapter.presenter.show_message(MessageContext(
                 level='error',
-                message=f"원본 데이터 조회 오류: {raw_result.error or 'Unknown error'}"
+                message=f"원본 데이터 조회 오류: {e}"
             ))
-    else:
-        grid_df = df_converted
-
-    if grid_df is not None:
-        display_rows = min(total_rows, max_display_rows) if total_rows is not None else min(len(grid_df), max_display_rows)
-
-        with st.spinner(f"데이터 테이블 렌더링 중... ({display_rows:,}행)"):
-            if total_rows is not None and total_rows > max_display_rows:
-                ui_adapter.presenter.show_message(MessageContext(
-                    level='warning',
-                    message=f"⚠️ 성능을 위해 {max_display_rows:,}행만 표시합니다. (전체: {total_rows:,}행)"
-                ))
-                st.dataframe(grid_df.head(max_display_rows), use_container_width=True)
-            else:
-                st.dataframe(grid_df, use_container_width=True)
+            return
+
+        first_page = stream.next_chunk()
+        if first_page is None:
+            first_page = stream.empty_frame()
+        first_page, summary = detect_and_convert_types(first_page)
+
+        # 다음 페이지에도 첫 페이지에서 감지한 변환을 그대로 적용
+        conversions = dict.fromkeys(summary.get('numeric', []), 'numeric')
+        conversions.update(dict.fromkeys(summary.get('datetime', []), 'datetime'))
+
+        state = {
+            'table_name': table_name,
+            'page_rows': page_rows,
+            'stream': stream,
+            'pages': [first_page],
+            'conversions': conversions
+        }
+        st.session_state.raw_data_stream = state
+
+    pages = state['pages']
+    grid_df = pages[0] if len(pages) == 1 else pd.concat(pages, ignore_index=True)
+
+    if total_rows is not None:
+        st.caption(f"{len(grid_df):,}행 표시 중 (전체: {total_rows:,}행)")
+    st.dataframe(grid_df, use_container_width=True)
+
+    if not state['stream'].exhausted:
+        st.button(
+            f"⬇️ 다음 {page_rows:,}행 불러오기",
+            on_click=load_next_raw_data_page,
+            args=(state,)
+        )
+
+
+def load_next_raw_data_page(state: dict):
+    """스트림에서 다음 페이지를 읽어 표시 목록에 추가"""
+    page = state['stream'].next_chunk()
+    if page is not None:
+        state['pages'].append(convert_selected_columns(page, state['conversions']))
+
+
+def close_raw_data_stream():
+    """열려 있는 원본 데이터 스트림 닫기"""
+    state = st.session_state.pop('raw_data_stream', None)
+    if state is not None:
+        state['stream'].close()
+
+
+def render_table_browser(query_service: QueryService, ui_adapter: StreamlitAdapter):
+    """테이블 전체를 정렬 기준에 따라 페이지 단위로 탐색 (keyset 페이지네이션)"""
+    st.subheader("📖 테이블 탐색")
+
+    table_name = st.session_state.get('selected_table')
+    if not table_name:
+        return
+
+    columns = query_service.get_table_columns(table_name)
+    col1, col2, col3 = st.columns([2, 1, 1])
+    with col1:
+        sort_column = st.selectbox(
+            "정렬 기준", options=["(기본 키)"] + columns, key="browse_sort_column"
+        )
+    with col2:
+        order = st.radio("정렬 순서", options=["오름차순", "내림차순"], horizontal=True)
+        descending = order == "내림차순"
+    with col3:
+        # selectbox returns None only when it has no options
+        page_size = st.selectbox("페이지 크기", options=[50, 100, 500, 1000], index=1) or 100
+
+    # 정렬 조건이 바뀌면 첫 페이지부터 다시 탐색
+    browse_key = (table_name, sort_column, descending, page_size)
+    if st.session_state.get('browse_key') != browse_key:
+        st.session_state.browse_key = browse_key
+        st.session_state.browse_cursor = None
+        st.session_state.browse_page_number = 1
+
+    result = query_service.browse_table(
+        table_name,
+        sort_column=None if sort_column == "(기본 키)" else sort_column,
+        descending=descending,
+        page_size=page_size,
+        cursor=st.session_state.browse_cursor
+    )
+
+    if not result.success:
+        ui_adapter.presenter.show_message(MessageContext(
+            level='error',
+            message=f"페이지 조회 오류: {result.error}"
+        ))
+        return
+
+    st.dataframe(result.data, use_container_width=True)
+
+    prev_col, page_col, next_col = st.columns([1, 2, 1])
+    with prev_col:
+        st.button(
+            "◀ 이전",
+            disabled=result.metadata['previous_cursor'] is None,
+            on_click=_move_browse_cursor,
+            args=(result.metadata['previous_cursor'], -1)
+        )
+    with page_col:
+        page_rows = 0 if result.data is None else len(result.data)
+        st.caption(f"{st.session_state.browse_page_number}페이지 ({page_rows:,}행)")
+    with next_col:
+        st.button(
+            "다음 ▶",
+            disabled=result.metadata['next_cursor'] is None,
+            on_click=_move_browse_cursor,
+            args=(result.metadata['next_cursor'], 1)
+        )
+
+
+def _move_browse_cursor(cursor, step: int):
+    st.session_state.browse_cursor = cursor
+    st.session_state.browse_page_number += step
 
 
 if __name__ == "__main__":
@@ -6,6 +6,7 @@
 
 import streamlit as st
 
+from oracle_duckdb_sync.data.sorted_merge import as_frame
 from oracle_duckdb_sync.log.logger import setup_logger
 from oracle_duckdb_sync.ui.pages.login import require_auth
 from oracle_duckdb_sync.ui.visualization import render_data_visualization
@@ -30,7 +31,7 @@ def render_visualization():
 
     # 조회 결과 가져오기
     query_result = st.session_state.query_result
-    df_converted = query_result.get('df_converted')
+    df_converted = as_frame(query_result.get('df_converted'))
     table_name = query_result.get('table_name')
     query_mode = query_result.get('query_mode', 'detailed')
 
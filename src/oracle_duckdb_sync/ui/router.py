@@ -10,7 +10,6 @@ from typing import Callable, Optional
 import streamlit as st
 
 from oracle_duckdb_sync.auth import User
-from oracle_duckdb_sync.config import load_config
 from oracle_duckdb_sync.log.logger import setup_logger
 
 logger = setup_logger('Router')
@@ -43,6 +42,10 @@ class PageRouter:
             '/admin/tables', 'oracle_duckdb_sync.ui.pages.admin.tables',
             'render_admin_tables_page', 'admin:*'
         )
+        self.register(
+            '/admin/queries', 'oracle_duckdb_sync.ui.pages.admin.query_history',
+            'render_admin_query_history_page', 'admin:*'
+        )
 
     def register(
         self, path: str, module_path: str, function_name: str,
@@ -80,12 +83,9 @@ class PageRouter:
 
         # 권한 체크
         if required_permission and user:
-            from oracle_duckdb_sync.auth import AuthService
-
-            config = load_config()
-            auth_service = AuthService(config=config)
+            from oracle_duckdb_sync.auth import get_user_session_cache
 
-            if not auth_service.has_permission(user, required_permission):
+            if not get_user_session_cache().has_permission(user, required_permission):
                 st.error("❌ 이 페이지에 접근할 권한이 없습니다.")
                 logger.warning(f"Permission denied: {user.username} tried to access {path}")
                 return False
@@ -5,8 +5,6 @@ This module provides functions for initializing and managing Streamlit
 session state variables.
 """
 
-import queue
-
 import streamlit as st
 
 # Auto-refresh interval for sync progress (seconds)
@@ -23,7 +21,8 @@ def initialize_session_state():
     defaults = {
         'sync_status': 'idle',
         'sync_worker': None,
-        'progress_queue': queue.Queue(),
+        'sync_id': None,  # Sync followed on the progress bus
+        'sync_progress_cursor': -1,  # Last progress bus seq read by this session
         'sync_progress': {},
         'sync_result': {},
         'sync_error': {},
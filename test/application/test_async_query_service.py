@@ -0,0 +1,104 @@
+"""
+Test AsyncQueryService.
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from oracle_duckdb_sync.application.async_query_service import AsyncQueryService, QueryStatus
+from oracle_duckdb_sync.application.query_service import QueryService
+from oracle_duckdb_sync.config import Config
+from oracle_duckdb_sync.database.duckdb_source import DuckDBSource
+
+SLOW_QUERY = "SELECT i % 1000 AS g, COUNT(DISTINCT i * r) FROM big GROUP BY g"
+
+
+@pytest.fixture
+def duckdb_source(tmp_path):
+    config = Config(
+        oracle_host="lh", oracle_port=1521, oracle_service_name="xe",
+        oracle_user="u", oracle_password="p", duckdb_path=str(tmp_path / "test.duckdb")
+    )
+    source = DuckDBSource(config)
+    source.conn.execute(
+        "CREATE TABLE small AS SELECT range AS id, range * 2 AS value FROM range(100)"
+    )
+    yield source
+    source.disconnect()
+
+
+@pytest.fixture
+def worker_pool():
+    pool = ThreadPoolExecutor(max_workers=1)
+    yield pool
+    pool.shutdown(wait=True, cancel_futures=True)
+
+
+def test_query_table_completes(duckdb_source, worker_pool):
+    """The handle carries the QueryService result once the query finished."""
+    service = AsyncQueryService(QueryService(duckdb_source), worker_pool)
+
+    handle = service.query_table("small", limit=10, convert_types=False)
+
+    assert handle.wait(timeout=10)
+    assert handle.status == QueryStatus.COMPLETED
+    assert handle.progress == 1.0
+    assert len(handle.result.data) == 10
+
+
+def test_failed_query(duckdb_source, worker_pool):
+    """An unsuccessful QueryService result marks the handle FAILED."""
+    service = AsyncQueryService(QueryService(duckdb_source), worker_pool)
+
+    handle = service.query_table("missing_table")
+
+    assert handle.wait(timeout=10)
+    assert handle.status == QueryStatus.FAILED
+    assert "missing_table" in handle.error
+
+
+def test_cancel_running_query(duckdb_source, worker_pool):
+    """cancel() interrupts the running DuckDB statement."""
+    duckdb_source.conn.execute(
+        "CREATE TABLE big AS SELECT range AS i, random() AS r FROM range(20000000)"
+    )
+    service = AsyncQueryService(QueryService(duckdb_source), worker_pool)
+    started = threading.Event()
+
+    def slow(query_service):
+        started.set()
+        return query_service._get_connection().execute(SLOW_QUERY).fetchall()
+
+    handle = service.submit("slow aggregation", slow)
+    assert started.wait(timeout=10)
+    time.sleep(0.2)
+
+    assert handle.cancel()
+    assert handle.wait(timeout=10)
+    assert handle.status == QueryStatus.CANCELLED
+    assert handle.elapsed_seconds < 10
+    # The page's own connection is still usable
+    assert duckdb_source.execute("SELECT COUNT(*) FROM small")[0][0] == 100
+
+
+def test_cancel_pending_query(duckdb_source, worker_pool):
+    """A query still waiting for a worker never runs once cancelled."""
+    service = AsyncQueryService(QueryService(duckdb_source), worker_pool)
+    release = threading.Event()
+    blocker = service.submit("blocker", lambda _: release.wait(10))
+
+    ran = []
+    pending = service.submit("pending", lambda _: ran.append(True))
+
+    assert pending.status == QueryStatus.PENDING
+    assert pending.progress is None
+    assert pending.cancel()
+    release.set()
+
+    assert blocker.wait(timeout=10)
+    assert pending.status == QueryStatus.CANCELLED
+    assert not ran
+    assert not pending.cancel()
@@ -0,0 +1,389 @@
+"""
+Test the disk-backed cache tier.
+"""
+
+import os
+import time
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+import pandas as pd
+import pytest
+
+from oracle_duckdb_sync.application import disk_cache_provider
+from oracle_duckdb_sync.application.cache_provider import InMemoryCacheProvider
+from oracle_duckdb_sync.application.disk_cache_provider import (
+    DiskCacheProvider,
+    TieredCacheProvider,
+    create_query_cache_provider,
+)
+from oracle_duckdb_sync.application.enhanced_query_service import EnhancedQueryService
+from oracle_duckdb_sync.application.query_cache_manager import (
+    CachedQueryMetadata,
+    CacheMemoryBudget,
+    QueryCacheManager,
+)
+from oracle_duckdb_sync.config import Config
+from oracle_duckdb_sync.data.incremental_loader import IncrementalLoader
+from oracle_duckdb_sync.data.query_executor import QueryExecutor
+from oracle_duckdb_sync.data.type_converter_service import TypeConverterService
+from oracle_duckdb_sync.database.duckdb_source import DuckDBSource
+from oracle_duckdb_sync.models.sync_log import SyncLog, SyncStatus, SyncType
+from oracle_duckdb_sync.repository.sync_log_repo import SyncLogRepository
+
+MB = 1024 * 1024
+
+def make_config(tmp_path, **kwargs) -> Config:
+    return Config(
+        oracle_host="lh", oracle_port=1521, oracle_service_name="xe",
+        oracle_user="u", oracle_password="p", duckdb_path=":memory:",
+        state_directory=str(tmp_path), **kwargs
+    )
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Controllable time for the disk cache module (expiry checks)."""
+    clock = SimpleNamespace(now=time.time())
+    monkeypatch.setattr(disk_cache_provider, "time", SimpleNamespace(time=lambda: clock.now))
+    return clock
+
+
+def make_frame(rows: int = 100) -> pd.DataFrame:
+    return pd.DataFrame({
+        'id': range(rows),
+        'value': [float(i) * 1.5 for i in range(rows)],
+        'name': [f"row_{i}" for i in range(rows)],
+        'ts': pd.date_range('2024-01-01', periods=rows, freq='min'),
+    })
+
+
+class TestDiskCacheProvider:
+    """Test DiskCacheProvider."""
+
+    def test_dataframe_roundtrip(self, tmp_path):
+        """DataFrames are written as Arrow files and read back unchanged."""
+        cache = DiskCacheProvider(str(tmp_path), max_bytes=100 * MB)
+        df = make_frame()
+
+        cache.set("query_data_users", df)
+        cache.flush()
+
+        assert any(name.endswith(".arrow") for name in os.listdir(tmp_path))
+        pd.testing.assert_frame_equal(cache.get("query_data_users"), df, check_dtype=False)
+
+    def test_metadata_roundtrip(self, tmp_path):
+        """Non-DataFrame values are pickled."""
+        cache = DiskCacheProvider(str(tmp_path), max_bytes=100 * MB, async_writes=False)
+        metadata = CachedQueryMetadata(
+            last_timestamp=pd.Timestamp('2024-01-01'),
+            row_count=10,
+            last_update=datetime(2024, 1, 2),
+            selected_conversions={'value': 'float64'},
+            data_version="run-1"
+        )
+
+        cache.set("query_metadata_users", metadata)
+
+        assert cache.get("query_metadata_users") == metadata
+
+    def test_get_waits_for_pending_write(self, tmp_path):
+        """A read right after an async write sees the new value."""
+        cache = DiskCacheProvider(str(tmp_path), max_bytes=100 * MB)
+
+        cache.set("key", make_frame(10))
+        cache.set("key", make_frame(20))
+
+        assert cache.has("key")
+        assert len(cache.get("key")) == 20
+
+    def test_delete_and_clear(self, tmp_path):
+        """delete() removes one entry and clear() removes all of them."""
+        cache = DiskCacheProvider(str(tmp_path), max_bytes=100 * MB, async_writes=False)
+        cache.set("a", make_frame())
+        cache.set("b", {"x": 1})
+
+        cache.delete("a")
+        assert not cache.has("a")
+        assert cache.has("b")
+
+        cache.clear()
+        assert cache.get_statistics()['entry_count'] == 0
+
+    def test_evicts_least_recently_used_over_size_limit(self, tmp_path):
+        """Oldest entries are deleted once the directory exceeds max_bytes."""
+        probe = DiskCacheProvider(str(tmp_path / "probe"), max_bytes=100 * MB, async_writes=False)
+        probe.set("probe", make_frame(1000))
+        entry_size = probe.get_statistics()['total_bytes']
+
+        cache = DiskCacheProvider(
+            str(tmp_path / "cache"), max_bytes=int(entry_size * 2.5), async_writes=False
+        )
+        cache.set("a", make_frame(1000))
+        cache.set("b", make_frame(1000))
+        # Make "a" the most recently used entry
+        past = time.time() - 60
+        os.utime(cache._find_file("b"), (past, past))
+        cache.get("a")
+
+        cache.set("c", make_frame(1000))
+
+        assert cache.has("a")
+        assert not cache.has("b")
+        assert cache.has("c")
+        assert cache.get_statistics()['total_bytes'] <= cache.max_bytes
+
+    def test_unreadable_file_is_discarded(self, tmp_path):
+        """A corrupt cache file is treated as a miss and removed."""
+        cache = DiskCacheProvider(str(tmp_path), max_bytes=100 * MB, async_writes=False)
+        cache.set("key", make_frame())
+        with open(cache._find_file("key"), 'wb') as f:
+            f.write(b"not arrow")
+
+        assert cache.get("key") is None
+        assert not cache.has("key")
+
+    def test_entries_expire_after_ttl(self, tmp_path, clock):
+        """Frames and pickled values written with a ttl are gone once it passes."""
+        cache = DiskCacheProvider(str(tmp_path), max_bytes=100 * MB, async_writes=False)
+        cache.set("frame", make_frame(), ttl=60)
+        cache.set("meta", {"x": 1}, ttl=60)
+        cache.set("forever", {"x": 2})
+
+        clock.now += 30
+        assert cache.has("frame") and cache.get("meta") == {"x": 1}
+
+        clock.now += 31
+        assert cache.get("frame") is None
+        assert not cache.has("meta")
+        assert cache.get("forever") == {"x": 2}
+        assert cache.get_statistics()['entry_count'] == 1
+
+
+class TestTieredCacheProvider:
+    """Test TieredCacheProvider."""
+
+    def test_disk_hit_is_promoted_to_memory(self, tmp_path):
+        """A value found only on disk is copied into the memory tier."""
+        memory = InMemoryCacheProvider()
+        disk = DiskCacheProvider(str(tmp_path), max_bytes=100 * MB, async_writes=False)
+        disk.set("key", make_frame())
+        cache = TieredCacheProvider(memory, disk)
+
+        assert cache.get("key") is not None
+        assert memory.has("key")
+
+    def test_evict_keeps_disk_copy(self, tmp_path):
+        """Memory-pressure eviction only drops the memory tier."""
+        memory = InMemoryCacheProvider()
+        disk = DiskCacheProvider(str(tmp_path), max_bytes=100 * MB, async_writes=False)
+        cache = TieredCacheProvider(memory, disk)
+        cache.set("key", make_frame())
+
+        cache.evict("key")
+
+        assert not memory.has("key")
+        assert cache.has("key")
+
+    def test_clear_keeps_other_sessions_disk_entries(self, tmp_path):
+        """A session clearing its cache leaves other sessions' entries on the shared disk tier."""
+        disk = DiskCacheProvider(str(tmp_path), max_bytes=100 * MB, async_writes=False)
+        first = TieredCacheProvider(InMemoryCacheProvider(), disk)
+        second = TieredCacheProvider(InMemoryCacheProvider(), disk)
+        first.set("first", make_frame())
+        second.set("second", make_frame())
+
+        first.clear()
+        second.delete("first")
+
+        assert not disk.has("first")
+        assert disk.has("second")
+        assert TieredCacheProvider(InMemoryCacheProvider(), disk).has("second")
+
+    def test_ttl_applies_to_memory_tier(self, tmp_path, clock):
+        """The memory tier does not serve an entry past its ttl, even after promotion."""
+        disk = DiskCacheProvider(str(tmp_path), max_bytes=100 * MB, async_writes=False)
+        TieredCacheProvider(InMemoryCacheProvider(), disk).set("key", make_frame(), ttl=60)
+        memory = InMemoryCacheProvider()
+        cache = TieredCacheProvider(memory, disk)
+        assert cache.get("key") is not None
+        assert memory.has("key")
+
+        clock.now += 61
+
+        assert cache.get("key") is None
+        assert not memory.has("key")
+        assert not disk.has("key")
+
+    def test_cold_start_served_from_disk(self, tmp_path):
+        """A new process (fresh memory tier) reads cached query results from disk."""
+        df = make_frame()
+        first = QueryCacheManager(
+            TieredCacheProvider(
+                InMemoryCacheProvider(), DiskCacheProvider(str(tmp_path), 100 * MB)
+            ),
+            memory_budget=CacheMemoryBudget(100 * MB)
+        )
+        first.set_cached_data("users", df, CachedQueryMetadata(
+            last_timestamp=df['ts'].max(), row_count=len(df), last_update=datetime.now(),
+            data_version="run-1"
+        ))
+        first.cache.disk.flush()
+
+        budget = CacheMemoryBudget(100 * MB)
+        second = QueryCacheManager(
+            TieredCacheProvider(
+                InMemoryCacheProvider(), DiskCacheProvider(str(tmp_path), 100 * MB)
+            ),
+            memory_budget=budget
+        )
+
+        assert second.has_cache("users")
+        assert second.get_metadata("users").data_version == "run-1"
+        pd.testing.assert_frame_equal(second.get_cached_data("users"), df, check_dtype=False)
+        # The promoted frame is accounted against the memory budget
+        assert budget.get_statistics()['entry_count'] == 1
+
+
+def test_from_config(tmp_path):
+    """The disk tier defaults to <state_directory>/query_cache."""
+    config = make_config(tmp_path, query_disk_cache_max_mb=64)
+
+    cache = DiskCacheProvider.from_config(config)
+
+    assert cache.cache_dir == os.path.join(str(tmp_path), "query_cache")
+    assert cache.max_bytes == 64 * 1024 * 1024
+
+
+def test_manager_from_config_reads_previous_managers_results(tmp_path):
+    """Results cached by one manager are served to a new one from the configured disk tier."""
+    config = make_config(tmp_path)
+    df = make_frame()
+    first = QueryCacheManager.from_config(config, memory_budget=CacheMemoryBudget(100 * MB))
+    first.set_cached_data("users", df, CachedQueryMetadata(
+        last_timestamp=df['ts'].max(), row_count=len(df), last_update=datetime.now()
+    ))
+    first.cache.disk.flush()
+
+    second = QueryCacheManager.from_config(config, memory_budget=CacheMemoryBudget(100 * MB))
+
+    assert isinstance(second.cache, TieredCacheProvider)
+    assert not second.cache.memory.has("query_data_users")
+    pd.testing.assert_frame_equal(second.get_cached_data("users"), df, check_dtype=False)
+    assert os.listdir(os.path.join(str(tmp_path), "query_cache"))
+
+
+def test_disk_tier_can_be_disabled(tmp_path):
+    """QUERY_DISK_CACHE_MAX_MB=0 keeps query results in memory only."""
+    memory = InMemoryCacheProvider()
+    config = make_config(tmp_path, query_disk_cache_max_mb=0)
+
+    assert create_query_cache_provider(config, memory) is memory
+
+
+def test_cache_key_by_conversion_plan_and_data_version():
+    """Cached data is keyed by conversion plan and data version."""
+    key = EnhancedQueryService._cache_key
+
+    assert key({'value': 'float64'}, "run-1") == key({'value': 'float64'}, "run-1")
+    assert key({'a': 'float64', 'b': 'int64'}, "run-1") == \
+        key({'b': 'int64', 'a': 'float64'}, "run-1")
+    assert key({'value': 'float64'}, "run-1") != key({'value': 'int64'}, "run-1")
+    assert key({'value': 'float64'}, "run-1") != key({'value': 'float64'}, "run-2")
+    # Automatic conversion and no conversion are different plans
+    assert key(None, None) != key({}, None)
+
+
+def test_sessions_with_different_plans_keep_separate_disk_entries(tmp_path):
+    """One session's conversion plan does not overwrite another session's cached result."""
+    disk = DiskCacheProvider(str(tmp_path), max_bytes=100 * MB, async_writes=False)
+    budget = CacheMemoryBudget(100 * MB)
+    df = make_frame()
+    source = Mock(table_exists=Mock(return_value=False))
+    loader = Mock()
+    loader.fetch_incremental.side_effect = lambda table, column, last_timestamp=None, limit=None: (
+        SimpleNamespace(data=df, max_timestamp=df['ts'].max(), row_count=len(df))
+        if last_timestamp is None
+        else SimpleNamespace(data=df.iloc[:0], max_timestamp=None, row_count=0)
+    )
+    converter = Mock()
+    converter.convert_selected.side_effect = lambda frame, plan, preserve_original: SimpleNamespace(
+        df_converted=frame.assign(value=frame['value'].astype(plan['value'])),
+        df_original=frame, conversions={}, suggestions={}
+    )
+
+    services = [
+        EnhancedQueryService(
+            source, QueryCacheManager(TieredCacheProvider(InMemoryCacheProvider(), disk), budget),
+            loader, converter
+        )
+        for _ in range(2)
+    ]
+    for service, dtype in zip(services, ('float32', 'int64')):
+        service.query_with_caching("users", time_column='ts', selected_conversions={'value': dtype})
+
+    fresh = EnhancedQueryService(
+        source, QueryCacheManager(TieredCacheProvider(InMemoryCacheProvider(), disk), budget),
+        loader, converter
+    )
+    result = fresh.query_with_caching(
+        "users", time_column='ts', selected_conversions={'value': 'float32'}
+    )
+    assert result.df_converted['value'].dtype == 'float32'
+    assert len(result.df_converted) == len(df)
+    # Extended from the first session's disk entry, not reloaded
+    calls = loader.fetch_incremental.call_args_list
+    assert [c.kwargs['last_timestamp'] is None for c in calls].count(True) == 2
+
+
+def test_query_without_time_column_sees_inserted_rows(tmp_path):
+    """A table without a time column is reloaded, so rows inserted since the last query show up."""
+    source = DuckDBSource(make_config(tmp_path))
+    source.conn.execute("CREATE TABLE events AS SELECT range AS id FROM range(10)")
+    service = EnhancedQueryService(
+        source, QueryCacheManager(InMemoryCacheProvider(), CacheMemoryBudget(100 * MB)),
+        IncrementalLoader(QueryExecutor(source)), TypeConverterService()
+    )
+
+    assert service.query_with_caching("events").row_count == 10
+
+    source.conn.execute("INSERT INTO events SELECT range AS id FROM range(10, 15)")
+
+    assert service.query_with_caching("events").row_count == 15
+    source.disconnect()
+
+
+def test_data_version_changes_with_every_finished_sync(tmp_path):
+    """Resyncs keeping the row count still get a new data version; incremental syncs do not."""
+    source = DuckDBSource(make_config(tmp_path))
+    service = EnhancedQueryService(source, Mock(), Mock(), Mock())
+    assert service._get_data_version("users") is None
+
+    repo = SyncLogRepository(duckdb_source=source)
+    start = datetime.now() - timedelta(minutes=10)
+    for index, sync_type in enumerate((SyncType.FULL, SyncType.UPSERT)):
+        repo.create(SyncLog(
+            sync_id=f"run-{index + 1}", table_name="APP.USERS", sync_type=sync_type,
+            status=SyncStatus.COMPLETED, start_time=start + timedelta(minutes=index),
+            end_time=start + timedelta(minutes=index, seconds=30), total_rows=100,
+            metrics={"table": "users"}, duckdb_table="users",
+        ))
+        assert service._get_data_version("users") == f"run-{index + 1}"
+
+    # Incremental syncs only append rows: the cached frame is extended, not reloaded
+    repo.create(SyncLog(
+        sync_id="run-inc", table_name="APP.USERS", sync_type=SyncType.INCREMENTAL,
+        status=SyncStatus.COMPLETED, start_time=start + timedelta(minutes=5),
+        end_time=start + timedelta(minutes=5, seconds=30), total_rows=10,
+        metrics={"table": "users"}, duckdb_table="users",
+    ))
+    assert service._get_data_version("users") == "run-2"
+
+    # A run still in progress does not change the version yet
+    repo.create(SyncLog(
+        sync_id="run-3", table_name="APP.USERS", sync_type=SyncType.FULL,
+        status=SyncStatus.RUNNING, start_time=datetime.now(), duckdb_table="users",
+    ))
+    assert service._get_data_version("users") == "run-2"
+    source.disconnect()
@@ -0,0 +1,167 @@
+"""
+Tests for QueryCacheManager memory accounting and eviction.
+"""
+
+import gc
+import weakref
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+from oracle_duckdb_sync.application.cache_provider import InMemoryCacheProvider
+from oracle_duckdb_sync.application.query_cache_manager import (
+    CachedQueryMetadata,
+    CacheMemoryBudget,
+    QueryCacheManager,
+    estimate_dataframe_bytes,
+)
+
+
+def _frame(rows: int) -> pd.DataFrame:
+    return pd.DataFrame({'id': np.arange(rows, dtype='int64'), 'value': np.zeros(rows)})
+
+
+def _metadata(df: pd.DataFrame) -> CachedQueryMetadata:
+    return CachedQueryMetadata(last_timestamp=None, row_count=len(df), last_update=datetime.now())
+
+
+class TestEstimateDataFrameBytes:
+    """Test DataFrame size estimation."""
+
+    def test_small_frame_is_exact(self):
+        df = pd.DataFrame({'id': [1, 2, 3], 'name': ['a', 'bb', 'ccc']})
+        assert estimate_dataframe_bytes(df) == df.memory_usage(deep=True).sum()
+
+    def test_large_frame_sampling_is_close(self):
+        df = pd.DataFrame({
+            'id': np.arange(50000),
+            'name': pd.Series([f"name-{i % 1000}" for i in range(50000)], dtype=object),
+        })
+        exact = df.memory_usage(deep=True).sum()
+        estimate = estimate_dataframe_bytes(df, sample_rows=1000)
+        assert abs(estimate - exact) / exact < 0.05
+
+
+class TestQueryCacheManagerBudget:
+    """Test byte accounting, LRU eviction and statistics."""
+
+    def test_statistics_report_size(self):
+        budget = CacheMemoryBudget(max_bytes=10 * 1024 * 1024)
+        manager = QueryCacheManager(InMemoryCacheProvider(), memory_budget=budget)
+        df = _frame(1000)
+
+        manager.set_cached_data("t1", df, _metadata(df))
+        stats = manager.get_cache_statistics()
+
+        assert stats['entry_count'] == 1
+        assert stats['cached_bytes'] == estimate_dataframe_bytes(df)
+        assert stats['eviction_count'] == 0
+        assert stats['memory_budget']['total_bytes'] == stats['cached_bytes']
+
+    def test_lru_entry_is_evicted_over_budget(self):
+        df = _frame(1000)
+        size = estimate_dataframe_bytes(df)
+        budget = CacheMemoryBudget(max_bytes=int(size * 2.5))
+        manager = QueryCacheManager(InMemoryCacheProvider(), memory_budget=budget)
+
+        manager.set_cached_data("t1", df, _metadata(df))
+        manager.set_cached_data("t2", df, _metadata(df))
+        # t1 becomes most recently used
+        assert manager.get_cached_data("t1") is not None
+        manager.set_cached_data("t3", df, _metadata(df))
+
+        assert manager.has_cache("t1")
+        assert not manager.has_cache("t2")
+        assert manager.has_cache("t3")
+        stats = manager.get_cache_statistics()
+        assert stats['eviction_count'] == 1
+        assert stats['entry_count'] == 2
+        assert stats['memory_budget']['evicted_bytes'] == size
+
+    def test_budget_is_shared_between_managers(self):
+        df = _frame(1000)
+        size = estimate_dataframe_bytes(df)
+        budget = CacheMemoryBudget(max_bytes=int(size * 1.5))
+        first = QueryCacheManager(InMemoryCacheProvider(), memory_budget=budget)
+        second = QueryCacheManager(InMemoryCacheProvider(), memory_budget=budget)
+
+        first.set_cached_data("t1", df, _metadata(df))
+        second.set_cached_data("t1", df, _metadata(df))
+
+        assert first.get_cached_data("t1") is None
+        assert first.get_cache_statistics()['eviction_count'] == 1
+        assert second.has_cache("t1")
+        assert budget.get_statistics()['total_bytes'] == size
+
+    def test_eviction_by_another_session_frees_memory_immediately(self):
+        size = estimate_dataframe_bytes(_frame(1000))
+        budget = CacheMemoryBudget(max_bytes=int(size * 1.5))
+        idle = QueryCacheManager(InMemoryCacheProvider(), memory_budget=budget)
+        active = QueryCacheManager(InMemoryCacheProvider(), memory_budget=budget)
+
+        df = _frame(1000)
+        idle.set_cached_data("t1", df, _metadata(df))
+        frame_ref = weakref.ref(df)
+        del df
+
+        # The idle session makes no further call; its frame is released all the same
+        df = _frame(1000)
+        active.set_cached_data("t1", df, _metadata(df))
+        gc.collect()
+
+        assert frame_ref() is None
+        assert budget.get_statistics()['total_bytes'] == size
+        assert idle.get_cache_statistics()['eviction_count'] == 1
+        assert not idle.has_cache("t1")
+
+    def test_closed_session_releases_its_frames(self):
+        df = _frame(1000)
+        budget = CacheMemoryBudget(max_bytes=10 * 1024 * 1024)
+        manager = QueryCacheManager(InMemoryCacheProvider(), memory_budget=budget)
+        manager.set_cached_data("t1", df, _metadata(df))
+
+        del manager
+        gc.collect()
+
+        assert budget.get_statistics()['total_bytes'] == 0
+
+    def test_manager_rebuilt_on_rerun_keeps_session_frames(self):
+        df = _frame(1000)
+        budget = CacheMemoryBudget(max_bytes=10 * 1024 * 1024)
+        provider = InMemoryCacheProvider()  # stands in for st.session_state
+        manager = QueryCacheManager(provider, memory_budget=budget, session_id="session-1")
+        manager.set_cached_data("t1", df, _metadata(df))
+
+        del manager
+        gc.collect()
+        rebuilt = QueryCacheManager(provider, memory_budget=budget, session_id="session-1")
+
+        assert rebuilt.get_cached_data("t1") is df
+        assert rebuilt.get_cache_statistics()['entry_count'] == 1
+        assert not QueryCacheManager(
+            InMemoryCacheProvider(), memory_budget=budget, session_id="session-2"
+        ).has_cache("t1")
+
+    def test_frame_larger_than_budget_is_not_cached(self):
+        df = _frame(1000)
+        budget = CacheMemoryBudget(max_bytes=100)
+        manager = QueryCacheManager(InMemoryCacheProvider(), memory_budget=budget)
+
+        manager.set_cached_data("t1", df, _metadata(df))
+
+        assert not manager.has_cache("t1")
+        assert manager.get_cache_statistics()['rejected_count'] == 1
+
+    def test_clear_cache_releases_budget(self):
+        df = _frame(1000)
+        budget = CacheMemoryBudget(max_bytes=10 * 1024 * 1024)
+        manager = QueryCacheManager(InMemoryCacheProvider(), memory_budget=budget)
+
+        manager.set_cached_data("t1", df, _metadata(df))
+        manager.set_cached_data("t2", df, _metadata(df))
+        manager.clear_cache("t1")
+        assert budget.get_statistics()['entry_count'] == 1
+
+        manager.clear_cache()
+        assert budget.get_statistics()['total_bytes'] == 0
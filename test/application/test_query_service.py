@@ -266,5 +266,112 @@ class TestQueryServiceAggregation:
         assert 'No numeric columns' in result['error']
 
 
+class TestBrowseTable:
+    """Test keyset pagination in QueryService.browse_table."""
+
+    @pytest.fixture
+    def service(self):
+        import duckdb
+
+        conn = duckdb.connect()
+        conn.execute(
+            "CREATE TABLE events (id INTEGER PRIMARY KEY, grp INTEGER, ts TIMESTAMP)"
+        )
+        conn.execute(
+            "INSERT INTO events SELECT range, range % 7, "
+            "TIMESTAMP '2024-01-01' + INTERVAL (range) MINUTE FROM range(25)"
+        )
+        mock_source = Mock()
+        mock_source.get_connection.return_value = conn
+        yield QueryService(mock_source)
+        conn.close()
+
+    def _walk_forward(self, service, **kwargs):
+        pages = []
+        cursor = None
+        while True:
+            result = service.browse_table('events', cursor=cursor, **kwargs)
+            assert result.success, result.error
+            pages.append(result)
+            cursor = result.metadata['next_cursor']
+            if cursor is None:
+                return pages
+
+    def test_pages_cover_table_in_sort_order(self, service):
+        """Forward pages visit every row once, ordered by sort column then primary key."""
+        pages = self._walk_forward(service, sort_column='grp', page_size=10)
+
+        ids = [i for page in pages for i in page.data['id'].tolist()]
+        expected = sorted(range(25), key=lambda i: (i % 7, i))
+        assert ids == expected
+        assert [len(page.data) for page in pages] == [10, 10, 5]
+        assert pages[0].metadata['previous_cursor'] is None
+        assert pages[0].metadata['sort_columns'] == ['grp', 'id']
+
+    def test_backward_cursor_returns_previous_page(self, service):
+        pages = self._walk_forward(service, sort_column='ts', descending=True, page_size=10)
+
+        back = service.browse_table(
+            'events', sort_column='ts', descending=True, page_size=10,
+            cursor=pages[2].metadata['previous_cursor']
+        )
+
+        assert back.data['id'].tolist() == pages[1].data['id'].tolist()
+        assert back.metadata['next_cursor'] is not None
+        first = service.browse_table(
+            'events', sort_column='ts', descending=True, page_size=10,
+            cursor=back.metadata['previous_cursor']
+        )
+        assert first.data['id'].tolist() == list(range(24, 14, -1))
+        assert first.metadata['previous_cursor'] is None
+
+    def test_rowid_tie_breaker_without_primary_key(self, service):
+        """Tables without a primary key are paged by rowid, which is not returned."""
+        conn = service._get_connection()
+        conn.execute("CREATE TABLE plain AS SELECT range % 3 AS v FROM range(7)")
+
+        first = service.browse_table('plain', sort_column='v', page_size=4)
+        second = service.browse_table('plain', sort_column='v', page_size=4,
+                                      cursor=first.metadata['next_cursor'])
+
+        assert list(first.data.columns) == ['v']
+        assert first.data['v'].tolist() + second.data['v'].tolist() == [0, 0, 0, 1, 1, 2, 2]
+        assert second.metadata['next_cursor'] is None
+
+    def test_view_is_paged_by_offset(self, service):
+        """Views have no rowid; they are paged by OFFSET in a stable order."""
+        conn = service._get_connection()
+        conn.execute("CREATE VIEW events_typed AS SELECT grp, ts FROM events")
+
+        pages = []
+        cursor = None
+        while True:
+            result = service.browse_table(
+                'events_typed', sort_column='grp', page_size=10, cursor=cursor
+            )
+            assert result.success, result.error
+            pages.append(result)
+            cursor = result.metadata['next_cursor']
+            if cursor is None:
+                break
+
+        rows = [row for page in pages for row in page.data.itertuples(index=False)]
+        expected = conn.execute("SELECT grp, ts FROM events ORDER BY grp, ts").fetchall()
+        assert [(row.grp, row.ts) for row in rows] == expected
+        assert [len(page.data) for page in pages] == [10, 10, 5]
+
+        back = service.browse_table(
+            'events_typed', sort_column='grp', page_size=10,
+            cursor=pages[2].metadata['previous_cursor']
+        )
+        assert back.data.equals(pages[1].data)
+
+    def test_unknown_sort_column(self, service):
+        result = service.browse_table('events', sort_column='missing')
+
+        assert result.success is False
+        assert 'missing' in result.error
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
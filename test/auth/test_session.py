@@ -0,0 +1,132 @@
+import pytest
+
+pytest.importorskip("bcrypt")
+
+from oracle_duckdb_sync.auth import (  # noqa: E402
+    AuthService,
+    Permission,
+    SessionManager,
+    User,
+    UserRepository,
+    UserRole,
+    UserSessionCache,
+    hash_password,
+)
+from oracle_duckdb_sync.config import Config  # noqa: E402
+from oracle_duckdb_sync.database.duckdb_source import DuckDBSource  # noqa: E402
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1_000_000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def duckdb_source():
+    config = Config(
+        oracle_host="lh", oracle_port=1521, oracle_service_name="xe",
+        oracle_user="u", oracle_password="p", duckdb_path=":memory:"
+    )
+    source = DuckDBSource(config)
+    yield source
+    source.disconnect()
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def manager(clock):
+    return SessionManager(
+        secret="test-secret", ttl_seconds=60, cache=UserSessionCache(), clock=clock
+    )
+
+
+def make_user(user_id=1, role=UserRole.USER):
+    return User(username="kim", password_hash="x", role=role, id=user_id)
+
+
+class CountingLoader:
+    def __init__(self, user):
+        self.user = user
+        self.calls = 0
+
+    def __call__(self, user_id):
+        self.calls += 1
+        return self.user
+
+
+def test_token_round_trip_uses_cache(manager):
+    user = make_user()
+    loader = CountingLoader(user)
+
+    token = manager.issue(user)
+
+    assert manager.verify(token).user_id == 1
+    assert manager.resolve(token, loader) is user
+    assert manager.resolve(token, loader) is user
+    assert loader.calls == 0
+
+
+def test_tampered_and_expired_tokens_rejected(manager, clock):
+    token = manager.issue(make_user())
+    body, signature = token.split('.')
+    other = SessionManager(secret="other-secret", cache=UserSessionCache(), clock=clock)
+
+    assert manager.verify(f"{body}x.{signature}") is None
+    assert other.verify(token) is None
+    assert manager.verify("garbage") is None
+
+    clock.now += 61
+    assert manager.verify(token) is None
+
+
+def test_cache_miss_reloads_and_drops_inactive_users(manager):
+    user = make_user()
+    loader = CountingLoader(user)
+    token = manager.issue(user)
+
+    manager.cache.invalidate(user.id)
+    assert manager.resolve(token, loader) is user
+    assert loader.calls == 1
+
+    manager.cache.invalidate(user.id)
+    user.is_active = False
+    assert manager.resolve(token, loader) is None
+
+
+def insert_user(duckdb_source, user_id, username, password, role=UserRole.USER):
+    UserRepository(duckdb_source=duckdb_source)
+    duckdb_source.conn.execute(
+        "INSERT INTO users (id, username, password_hash, role) VALUES (?, ?, ?, ?)",
+        (user_id, username, hash_password(password), role.value)
+    )
+    return UserRepository(duckdb_source=duckdb_source).get_by_id(user_id)
+
+
+def test_repository_changes_invalidate_cache(duckdb_source):
+    service = AuthService(duckdb_source=duckdb_source)
+    user = insert_user(duckdb_source, 11, "lee", "Secret123", UserRole.VIEWER)
+
+    token = service.issue_session_token(user)
+    assert not service.has_permission(service.resolve_session(token), Permission.SYNC_WRITE)
+
+    service.update_user_role(user.id, UserRole.USER)
+    assert service.resolve_session(token).role == UserRole.USER
+    assert service.has_permission(service.resolve_session(token), Permission.SYNC_WRITE)
+
+    service.deactivate_user(user.id)
+    assert service.resolve_session(token) is None
+
+
+def test_authenticate_verifies_on_worker_pool(duckdb_source):
+    service = AuthService(duckdb_source=duckdb_source)
+    insert_user(duckdb_source, 12, "park", "Secret123")
+
+    assert service.authenticate("park", "Secret123")[0] is True
+    assert service.authenticate("park", "wrong")[0] is False
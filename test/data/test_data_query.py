@@ -5,11 +5,18 @@ This test module covers data query functionality including table counting
 and full table querying.
 """
 
+from datetime import datetime
 from unittest.mock import Mock
 
+import duckdb
 import pandas as pd
 
-from oracle_duckdb_sync.data.query import get_table_row_count, query_duckdb_table_aggregated
+from oracle_duckdb_sync.data.query import (
+    _fetch_incremental_data,
+    _get_executor,
+    get_table_row_count,
+    query_duckdb_table_aggregated,
+)
 
 
 class TestGetTableRowCount:
@@ -201,3 +208,27 @@ class TestQueryDuckDBTableAggregated:
         assert result['success'] is False
         assert 'error' in result
         assert result['df_aggregated'] is None
+
+
+class TestFetchIncrementalData:
+    """Tests for _fetch_incremental_data function."""
+
+    def test_polls_bind_timestamp_and_reuse_prepared_statement(self):
+        """Incremental polls compare the timestamp natively through one prepared statement."""
+        conn = duckdb.connect()
+        conn.execute("CREATE TABLE logs (ts TIMESTAMP, v INTEGER)")
+        conn.execute(
+            "INSERT INTO logs VALUES ('2024-01-01 09:00:00', 1), ('2024-01-01 10:00:00', 2)"
+        )
+        source = Mock(conn=conn)
+
+        first = _fetch_incremental_data(source, "logs", "ts", datetime(2024, 1, 1, 8, 0))
+        second = _fetch_incremental_data(source, "logs", "ts", first['max_timestamp'])
+        third = _fetch_incremental_data(source, "logs", "ts", datetime(2024, 1, 1, 9, 30))
+
+        assert first['row_count'] == 2
+        assert first['max_timestamp'] == datetime(2024, 1, 1, 10, 0)
+        assert second['row_count'] == 0
+        assert [row[1] for row in third['data']] == [2]
+        assert _get_executor(source).get_statement_cache_statistics()['misses'] == 1
+        conn.close()
@@ -0,0 +1,153 @@
+"""
+Tests for prepared_statements module.
+
+This test module covers parameter literal rendering, the per-connection
+LRU cache of prepared statements and parameterized incremental loading
+through QueryExecutor.
+"""
+
+import datetime
+from decimal import Decimal
+
+import duckdb
+import numpy as np
+import pandas as pd
+import pytest
+
+from oracle_duckdb_sync.config import Config
+from oracle_duckdb_sync.data.incremental_loader import IncrementalLoader
+from oracle_duckdb_sync.data.prepared_statements import (
+    PreparedStatementCache,
+    UnsupportedParameterError,
+    to_sql_literal,
+)
+from oracle_duckdb_sync.data.query_builder import QueryBuilder
+from oracle_duckdb_sync.data.query_executor import QueryExecutor
+from oracle_duckdb_sync.database.duckdb_source import DuckDBSource
+
+
+@pytest.fixture
+def conn():
+    connection = duckdb.connect()
+    connection.execute(
+        "CREATE TABLE logs AS "
+        "SELECT range AS id, TIMESTAMP '2024-01-01' + INTERVAL (range) MINUTE AS ts FROM range(100)"
+    )
+    yield connection
+    connection.close()
+
+
+def prepared_names(conn) -> set:
+    rows = conn.execute("SELECT name FROM duckdb_prepared_statements()").fetchall()
+    return {row[0] for row in rows}
+
+
+class TestToSqlLiteral:
+    """Tests for to_sql_literal."""
+
+    @pytest.mark.parametrize("value, expected", [
+        (None, "NULL"),
+        (True, "TRUE"),
+        (np.int64(42), "42"),
+        ("it's", "'it''s'"),
+        (datetime.date(2024, 1, 2), "DATE '2024-01-02'"),
+        (pd.Timestamp("2024-01-02 03:04:05.123456789"), "TIMESTAMP '2024-01-02 03:04:05.123456'"),
+        (pd.NaT, "NULL"),
+    ])
+    def test_literals(self, value, expected):
+        assert to_sql_literal(value) == expected
+
+    def test_unsupported_values(self):
+        with pytest.raises(UnsupportedParameterError):
+            to_sql_literal(float('nan'))
+        with pytest.raises(UnsupportedParameterError):
+            to_sql_literal(Decimal('Infinity'))
+        with pytest.raises(UnsupportedParameterError):
+            to_sql_literal([1, 2])
+
+
+class TestPreparedStatementCache:
+    """Tests for PreparedStatementCache."""
+
+    def test_reuses_prepared_statement(self, conn):
+        cache = PreparedStatementCache(conn)
+        query = "SELECT COUNT(*) FROM logs WHERE ts > ?"
+
+        first = cache.execute(query, [datetime.datetime(2024, 1, 1, 1, 0)]).fetchone()[0]
+        second = cache.execute(query, [pd.Timestamp("2024-01-01 01:30")]).fetchone()[0]
+
+        assert (first, second) == (39, 9)
+        assert cache.get_statistics()['hits'] == 1
+        assert cache.get_statistics()['misses'] == 1
+        assert len(prepared_names(conn)) == 1
+
+    def test_lru_eviction_deallocates(self, conn):
+        cache = PreparedStatementCache(conn, capacity=2)
+
+        for offset in range(3):
+            cache.execute(f"SELECT id + {offset} FROM logs WHERE id = ?", [1])
+
+        assert len(cache) == 2
+        assert len(prepared_names(conn)) == 2
+        assert cache.execute("SELECT id + 0 FROM logs WHERE id = ?", [1]).fetchone()[0] == 1
+        assert cache.get_statistics()['misses'] == 4
+
+    def test_unsupported_parameter_falls_back(self, conn):
+        cache = PreparedStatementCache(conn)
+
+        result = cache.execute("SELECT ? IS NULL", [float('nan')]).fetchone()[0]
+
+        assert result is False
+        assert len(cache) == 0
+
+    def test_clear(self, conn):
+        cache = PreparedStatementCache(conn)
+        cache.execute("SELECT * FROM logs WHERE id = ?", [1])
+
+        cache.clear()
+
+        assert len(cache) == 0
+        assert prepared_names(conn) == set()
+
+
+class TestParameterizedIncrementalLoad:
+    """Incremental polling binds the timestamp and reuses the prepared statement."""
+
+    def test_build_incremental_query_uses_placeholder(self):
+        ts = datetime.datetime(2024, 1, 1)
+
+        assert QueryBuilder.build_incremental_query("logs", "ts", ts, limit=10) == (
+            "SELECT * FROM logs WHERE ts > ? ORDER BY ts LIMIT 10", [ts]
+        )
+        assert QueryBuilder.build_incremental_query("logs", "ts") == (
+            "SELECT * FROM logs ORDER BY ts", []
+        )
+
+    def test_repeated_polls_hit_cache(self):
+        config = Config(
+            oracle_host="lh", oracle_port=1521, oracle_service_name="xe",
+            oracle_user="u", oracle_password="p", duckdb_path=":memory:"
+        )
+        source = DuckDBSource(config)
+        source.conn.execute(
+            "CREATE TABLE logs AS "
+            "SELECT range AS id, TIMESTAMP '2024-01-01' + INTERVAL (range) MINUTE AS ts "
+            "FROM range(100)"
+        )
+        executor = QueryExecutor(source)
+        loader = IncrementalLoader(executor)
+
+        try:
+            initial = loader.fetch_incremental("logs", "ts", limit=50)
+            second = loader.fetch_incremental(
+                "logs", "ts", last_timestamp=initial.max_timestamp, limit=30
+            )
+            third = loader.fetch_incremental(
+                "logs", "ts", last_timestamp=second.max_timestamp, limit=30
+            )
+        finally:
+            source.disconnect()
+
+        assert (initial.row_count, second.row_count, third.row_count) == (50, 30, 20)
+        assert third.max_timestamp == pd.Timestamp("2024-01-01 01:39")
+        assert executor.get_statement_cache_statistics()['hits'] == 1
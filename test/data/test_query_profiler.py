@@ -0,0 +1,170 @@
+"""
+Tests for query_profiler module.
+
+This test module covers recording query history with DuckDB profiles,
+the diagnostic hints derived from them and QueryService integration.
+"""
+
+import duckdb
+import pytest
+
+from oracle_duckdb_sync.application.query_service import QueryService
+from oracle_duckdb_sync.config import Config
+from oracle_duckdb_sync.data import query_profiler
+from oracle_duckdb_sync.data.query_profiler import QueryProfiler, detect_hints
+from oracle_duckdb_sync.database.duckdb_source import DuckDBSource
+from oracle_duckdb_sync.repository.query_history_repo import QueryHistoryRepository
+
+
+@pytest.fixture
+def config():
+    return Config(
+        oracle_host="lh", oracle_port=1521, oracle_service_name="xe",
+        oracle_user="u", oracle_password="p", duckdb_path=":memory:"
+    )
+
+
+@pytest.fixture
+def duckdb_source(config):
+    source = DuckDBSource(config)
+    source.conn.execute(
+        "CREATE TABLE metrics AS "
+        "SELECT range AS id, "
+        "strftime(TIMESTAMP '2024-01-01' + INTERVAL (range) SECOND, '%Y%m%d%H%M%S') AS ts, "
+        "CAST(range % 100 AS VARCHAR) AS value FROM range(5000)"
+    )
+    yield source
+    source.disconnect()
+
+
+@pytest.fixture
+def history_repo(duckdb_source):
+    return QueryHistoryRepository(duckdb_source=duckdb_source)
+
+
+class TestQueryProfiler:
+    """Tests for QueryProfiler.track."""
+
+    def test_records_latency_size_and_profile(self, duckdb_source, history_repo):
+        profiler = QueryProfiler(history_repo)
+        query = "SELECT * FROM metrics WHERE id < 100"
+
+        with profiler.track(
+            duckdb_source.conn, query, table_name="metrics", source="test"
+        ) as record:
+            df = duckdb_source.conn.execute(query).df()
+            record.set_result(df)
+
+        [entry] = history_repo.get_slowest()
+        assert entry.query_text == query
+        assert entry.table_name == "metrics"
+        assert entry.row_count == 100
+        assert entry.result_bytes > 0
+        assert entry.latency_ms > 0
+
+        operator_types = [op['type'] for op in entry.profile['operators']]
+        assert 'TABLE_SCAN' in operator_types
+
+    def test_untracked_queries_are_not_recorded(self, duckdb_source, history_repo):
+        profiler = QueryProfiler(history_repo)
+
+        with profiler.track(duckdb_source.conn, "SELECT 1"):
+            duckdb_source.conn.execute("SELECT 1").fetchall()
+        duckdb_source.conn.execute("SELECT 2").fetchall()
+
+        assert [entry.query_text for entry in history_repo.get_slowest()] == ["SELECT 1"]
+
+    def test_failed_query_is_not_recorded(self, duckdb_source, history_repo):
+        profiler = QueryProfiler(history_repo)
+
+        with pytest.raises(duckdb.CatalogException):
+            with profiler.track(duckdb_source.conn, "SELECT * FROM missing"):
+                duckdb_source.conn.execute("SELECT * FROM missing")
+
+        assert history_repo.get_slowest() == []
+
+    def test_history_write_failure_does_not_fail_query(self, duckdb_source):
+        class BrokenRepo:
+            def create(self, entry):
+                raise RuntimeError("disk full")
+
+        profiler = QueryProfiler(BrokenRepo(), profiling=False)
+
+        with profiler.track(duckdb_source.conn, "SELECT 1") as record:
+            record.set_result(duckdb_source.conn.execute("SELECT 1").df())
+
+    def test_explain_analyze(self, duckdb_source, history_repo):
+        profiler = QueryProfiler(history_repo, profiling=False)
+
+        plan = profiler.explain_analyze(duckdb_source.conn, "SELECT COUNT(*) FROM metrics")
+
+        assert 'TABLE_SCAN' in plan.replace(' ', '_') or 'SEQ_SCAN' in plan.replace(' ', '_')
+
+    def test_from_config_is_opt_in(self, config, duckdb_source):
+        assert QueryProfiler.from_config(config, duckdb_source) is None
+
+        config.query_profiling_enabled = True
+        assert isinstance(QueryProfiler.from_config(config, duckdb_source), QueryProfiler)
+
+
+class TestHints:
+    """Tests for detect_hints."""
+
+    def test_full_scan_and_cast_hints(self, duckdb_source, history_repo, monkeypatch):
+        monkeypatch.setattr(query_profiler, 'FULL_SCAN_HINT_ROWS', 1000)
+        profiler = QueryProfiler(history_repo)
+        query = "SELECT id, TRY_CAST(value AS DOUBLE) AS v FROM metrics"
+
+        with profiler.track(duckdb_source.conn, query, table_name="metrics") as record:
+            record.set_result(duckdb_source.conn.execute(query).df())
+
+        hints = history_repo.get_slowest()[0].hints
+        assert any(hint.startswith("Full scan of metrics") for hint in hints)
+        assert any(hint.startswith("Per-row cast") for hint in hints)
+
+    def test_rollup_hint(self):
+        summary = {
+            'rows_scanned': 5_000_000,
+            'operators': [
+                {'type': 'HASH_GROUP_BY', 'operator': 'HASH_GROUP_BY', 'rows': 24,
+                 'rows_scanned': 0, 'extra_info': {}}
+            ]
+        }
+
+        assert detect_hints(summary) == [
+            "HASH_GROUP_BY reduces 5,000,000 rows to 24: consider a rollup table"
+        ]
+
+
+class TestQueryHistoryRepository:
+    """Tests for per-table aggregation of the query history."""
+
+    def test_slowest_per_table_and_statistics(self, duckdb_source, history_repo):
+        profiler = QueryProfiler(history_repo, profiling=False)
+        service = QueryService(duckdb_source, profiler=profiler)
+
+        service.query_table("metrics", limit=10)
+        service.query_table("metrics", limit=20)
+        service.browse_table("metrics", page_size=5)
+
+        entries = history_repo.get_slowest_per_table(limit_per_table=2)
+        stats = history_repo.get_table_statistics()
+
+        assert len(entries) == 2
+        assert {entry.source for entry in history_repo.get_slowest()} == {
+            'QueryService.query_table', 'QueryService.browse_table'
+        }
+        assert stats[0]['table_name'] == 'metrics'
+        assert stats[0]['query_count'] == 3
+        assert stats[0]['total_rows'] == 10 + 20 + 6
+
+    def test_delete_old_entries(self, history_repo):
+        from datetime import datetime, timedelta
+
+        from oracle_duckdb_sync.models.query_history import QueryHistoryEntry
+
+        history_repo.create(QueryHistoryEntry("SELECT 1", datetime.now() - timedelta(days=40), 1.0))
+        history_repo.create(QueryHistoryEntry("SELECT 2", datetime.now(), 1.0))
+
+        assert history_repo.delete_old_entries(days=30) == 1
+        assert [entry.query_text for entry in history_repo.get_slowest()] == ["SELECT 2"]
@@ -0,0 +1,111 @@
+"""
+Tests for result_stream module.
+
+This test module covers streaming query results in typed chunks and the
+single-execution column metadata of QueryExecutor and query_duckdb_table.
+"""
+
+from unittest.mock import Mock
+
+import pandas as pd
+import pytest
+
+from oracle_duckdb_sync.config import Config
+from oracle_duckdb_sync.data.query import query_duckdb_table
+from oracle_duckdb_sync.data.query_executor import QueryExecutionError, QueryExecutor
+from oracle_duckdb_sync.database.duckdb_source import DuckDBSource
+
+
+@pytest.fixture
+def duckdb_source():
+    config = Config(
+        oracle_host="lh", oracle_port=1521, oracle_service_name="xe",
+        oracle_user="u", oracle_password="p", duckdb_path=":memory:"
+    )
+    source = DuckDBSource(config)
+    source.conn.execute(
+        "CREATE TABLE events AS "
+        "SELECT range AS id, 'name_' || range AS name, "
+        "TIMESTAMP '2024-01-01' + INTERVAL (range) MINUTE AS ts FROM range(2500)"
+    )
+    yield source
+    source.disconnect()
+
+
+class TestResultStream:
+    """Tests for QueryExecutor.stream and ResultStream."""
+
+    def test_chunks_are_typed_and_bounded(self, duckdb_source):
+        executor = QueryExecutor(duckdb_source)
+
+        with executor.stream("SELECT * FROM events ORDER BY id", chunk_size=1000) as stream:
+            assert stream.columns == ['id', 'name', 'ts']
+            assert stream.column_types['ts'] == 'TIMESTAMP'
+
+            chunks = list(stream)
+
+        assert [len(chunk) for chunk in chunks] == [1000, 1000, 500]
+        assert pd.api.types.is_integer_dtype(chunks[0]['id'])
+        assert pd.api.types.is_datetime64_any_dtype(chunks[0]['ts'])
+        assert chunks[2]['id'].iloc[-1] == 2499
+        assert stream.rows_fetched == 2500
+
+    def test_pages_on_demand(self, duckdb_source):
+        """Pages are read one at a time while the main connection keeps working."""
+        executor = QueryExecutor(duckdb_source)
+        stream = executor.stream("SELECT * FROM events ORDER BY id", chunk_size=100)
+
+        first = stream.next_chunk()
+        # Another query on the main connection does not invalidate the stream
+        assert executor.get_row_count("events") == 2500
+        second = stream.next_chunk()
+        stream.close()
+
+        assert first['id'].tolist() == list(range(100))
+        assert second['id'].tolist() == list(range(100, 200))
+        assert stream.next_chunk() is None
+
+    def test_read_all_and_empty_result(self, duckdb_source):
+        executor = QueryExecutor(duckdb_source)
+
+        with executor.stream("SELECT * FROM events", chunk_size=1000) as stream:
+            assert len(stream.read_all()) == 2500
+
+        with executor.stream("SELECT id, name FROM events WHERE id < 0") as stream:
+            empty = stream.read_all()
+
+        assert empty.empty
+        assert list(empty.columns) == ['id', 'name']
+
+    def test_invalid_query_raises(self, duckdb_source):
+        executor = QueryExecutor(duckdb_source)
+
+        with pytest.raises(QueryExecutionError):
+            executor.stream("SELECT * FROM missing_table")
+
+
+class TestSingleExecution:
+    """Column names come from the description of the data query itself."""
+
+    def test_fetch_to_dataframe_columns(self, duckdb_source):
+        executor = QueryExecutor(duckdb_source)
+
+        df = executor.fetch_to_dataframe("SELECT id, name FROM events ORDER BY id LIMIT 5")
+        empty = executor.fetch_to_dataframe("SELECT id, name FROM events WHERE id < 0")
+
+        assert list(df.columns) == ['id', 'name']
+        assert len(df) == 5
+        assert list(empty.columns) == ['id', 'name']
+
+    def test_query_duckdb_table_executes_once(self):
+        mock_duckdb = Mock()
+        mock_result = Mock()
+        mock_result.fetchall.return_value = [(1, 'a'), (2, 'b')]
+        mock_result.description = [('id',), ('name',)]
+        mock_duckdb.conn.execute.return_value = mock_result
+
+        result = query_duckdb_table(mock_duckdb, 'events', limit=2)
+
+        assert result['success'] is True
+        assert list(result['df_converted'].columns) == ['id', 'name']
+        mock_duckdb.conn.execute.assert_called_once_with("SELECT * FROM events LIMIT 2")
@@ -0,0 +1,165 @@
+"""
+Tests for sorted_merge module.
+
+This test module covers the append-optimised merge used by incremental
+cache refreshes.
+"""
+
+from unittest.mock import patch
+
+import pandas as pd
+import pytest
+
+from oracle_duckdb_sync.data.sorted_merge import SortedSegments, merge_sorted
+
+
+def _frame(ids, times):
+    return pd.DataFrame({'id': ids, 'ts': pd.to_datetime(times)})
+
+
+class TestMergeSorted:
+    """Tests for merge_sorted function."""
+
+    def test_empty_inputs_return_other_frame(self):
+        df = _frame([1], ['2024-01-01'])
+
+        assert merge_sorted(None, df, 'ts') is df
+        assert merge_sorted(df, pd.DataFrame(), 'ts') is df
+
+    def test_sorted_append_does_not_sort(self):
+        """New rows after the last cached timestamp are appended without sorting."""
+        existing = _frame([1, 2], ['2024-01-01', '2024-01-02'])
+        new = _frame([3, 4], ['2024-01-03', '2024-01-04'])
+
+        with patch.object(pd.DataFrame, 'sort_values', side_effect=AssertionError("sorted")):
+            merged = merge_sorted(existing, new, 'ts')
+
+        assert merged['id'].tolist() == [1, 2, 3, 4]
+        assert merged.index.tolist() == [0, 1, 2, 3]
+
+    def test_equal_boundary_timestamp_is_appended(self):
+        existing = _frame([1, 2], ['2024-01-01', '2024-01-02'])
+        new = _frame([3], ['2024-01-02'])
+
+        merged = merge_sorted(existing, new, 'ts')
+
+        assert merged['id'].tolist() == [1, 2, 3]
+
+    def test_overlap_only_sorts_window(self):
+        """Out-of-order rows are merged into the overlapping tail only."""
+        existing = _frame([1, 2, 3, 4], ['2024-01-01', '2024-01-02', '2024-01-04', '2024-01-05'])
+        new = _frame([5, 6], ['2024-01-06', '2024-01-03'])
+
+        sorted_lengths = []
+        original_sort = pd.DataFrame.sort_values
+
+        def spy(self, *args, **kwargs):
+            sorted_lengths.append(len(self))
+            return original_sort(self, *args, **kwargs)
+
+        with patch.object(pd.DataFrame, 'sort_values', spy):
+            merged = merge_sorted(existing, new, 'ts')
+
+        assert merged['id'].tolist() == [1, 2, 6, 3, 4, 5]
+        assert merged['ts'].is_monotonic_increasing
+        # new rows (2) and the window (ids 3, 4) plus new rows (4) - never all 6
+        assert sorted_lengths == [2, 4]
+
+    def test_unique_columns_deduplicates_overlap_window(self):
+        existing = _frame([1, 2, 3], ['2024-01-01', '2024-01-02', '2024-01-03'])
+        new = pd.DataFrame({
+            'id': [3, 4],
+            'ts': pd.to_datetime(['2024-01-03', '2024-01-04']),
+        })
+        new['value'] = ['new', 'new']
+        existing['value'] = ['old', 'old', 'old']
+
+        merged = merge_sorted(existing, new, 'ts', unique_columns=['id'])
+
+        assert merged['id'].tolist() == [1, 2, 3, 4]
+        assert merged.loc[merged['id'] == 3, 'value'].item() == 'new'
+
+    def test_missing_time_column_concatenates(self):
+        existing = pd.DataFrame({'id': [2]})
+        new = pd.DataFrame({'id': [1]})
+
+        merged = merge_sorted(existing, new, 'ts')
+
+        assert merged['id'].tolist() == [2, 1]
+
+    def test_missing_timestamps_fall_back_to_full_sort(self):
+        existing = pd.DataFrame({'id': [1, 2], 'ts': pd.to_datetime(['2024-01-02', None])})
+        new = _frame([3], ['2024-01-01'])
+
+        merged = merge_sorted(existing, new, 'ts')
+
+        assert merged['id'].tolist() == [3, 1, 2]
+
+    @pytest.mark.parametrize("new_times", [
+        ['2024-01-10', '2024-01-11'],
+        ['2024-01-01', '2024-01-11'],
+    ])
+    def test_matches_full_concat_and_sort(self, new_times):
+        existing = _frame(list(range(10)), pd.date_range('2024-01-01', periods=10, freq='D'))
+        new = _frame([100, 101], new_times)
+
+        expected = pd.concat([existing, new], ignore_index=True).sort_values('ts', kind='stable')
+        merged = merge_sorted(existing, new, 'ts')
+
+        assert merged['ts'].tolist() == expected['ts'].tolist()
+        assert sorted(merged['id'].tolist()) == sorted(expected['id'].tolist())
+
+
+class TestSortedSegments:
+    """Tests for the segmented cache of sorted rows."""
+
+    def test_sorted_append_adds_segment_without_copying(self):
+        existing = _frame([1, 2], ['2024-01-01', '2024-01-02'])
+        segments = SortedSegments('ts', existing)
+
+        with patch.object(pd, 'concat', side_effect=AssertionError("copied")):
+            segments.append(_frame([3], ['2024-01-03']))
+            segments.append(_frame([4], ['2024-01-04']))
+
+        assert segments.segment_count == 3
+        assert len(segments) == 4
+        merged = segments.to_frame()
+        assert merged['id'].tolist() == [1, 2, 3, 4]
+        assert merged.index.tolist() == [0, 1, 2, 3]
+        # The frame replaces the segments instead of being kept next to them
+        assert segments.segment_count == 1
+        assert segments.to_frame() is merged
+
+    def test_head_only_reads_leading_segments(self):
+        segments = SortedSegments('ts', _frame([1, 2], ['2024-01-01', '2024-01-02']))
+        segments.append(_frame([3, 4], ['2024-01-03', '2024-01-04']))
+        segments.append(_frame([5], ['2024-01-05']))
+
+        assert segments.head(3)['id'].tolist() == [1, 2, 3]
+        assert segments.head(10)['id'].tolist() == [1, 2, 3, 4, 5]
+        assert segments.segment_count == 3
+
+    def test_overlap_spanning_segments_only_merges_window(self):
+        segments = SortedSegments('ts', _frame([1, 2], ['2024-01-01', '2024-01-03']))
+        segments.append(_frame([3], ['2024-01-05']))
+
+        segments.append(_frame([4], ['2024-01-02']))
+
+        assert segments.segment_count == 2
+        assert segments.to_frame()['id'].tolist() == [1, 4, 2, 3]
+
+    def test_compacts_above_max_segments(self):
+        segments = SortedSegments('ts', max_segments=3)
+        for day in range(1, 6):
+            segments.append(_frame([day], [f'2024-01-0{day}']))
+
+        assert segments.segment_count <= 3
+        assert segments.to_frame()['id'].tolist() == [1, 2, 3, 4, 5]
+
+    def test_unique_columns_replace_boundary_rows(self):
+        segments = SortedSegments('ts', _frame([1, 2], ['2024-01-01', '2024-01-02']))
+        segments.append(_frame([3], ['2024-01-03']))
+
+        segments.append(_frame([3, 4], ['2024-01-03', '2024-01-04']), unique_columns=['id'])
+
+        assert segments.to_frame()['id'].tolist() == [1, 2, 3, 4]
@@ -0,0 +1,150 @@
+"""
+Test adaptive batch sizing.
+
+Covers the AdaptiveBatchSizer controller and its integration with SyncEngine
+(per-table learned size persisted between runs).
+"""
+
+from unittest.mock import patch
+
+import pytest
+
+from oracle_duckdb_sync.config import Config
+from oracle_duckdb_sync.database.batch_sizer import AdaptiveBatchSizer, estimate_row_bytes
+from oracle_duckdb_sync.database.sync_engine import SyncEngine
+
+
+@pytest.fixture
+def adaptive_config(tmp_path):
+    return Config(
+        oracle_host="lh", oracle_port=1521, oracle_service_name="xe",
+        oracle_user="u", oracle_password="p",
+        duckdb_path=":memory:",
+        state_directory=str(tmp_path),
+        adaptive_batch_enabled=True,
+        adaptive_batch_min_size=10,
+        adaptive_batch_max_size=1000,
+    )
+
+
+class TestAdaptiveBatchSizer:
+    """Test the throughput/memory driven controller."""
+
+    def test_grows_while_throughput_improves(self):
+        sizer = AdaptiveBatchSizer(initial_size=100, min_size=10, max_size=10000)
+
+        sizer.record(100, 1.0)      # 100 rows/s
+        assert sizer.size == 150
+        sizer.record(150, 1.0)      # 150 rows/s - better, keep growing
+        assert sizer.size == 225
+
+    def test_reverses_when_throughput_drops(self):
+        sizer = AdaptiveBatchSizer(initial_size=100, min_size=10, max_size=10000)
+
+        sizer.record(100, 1.0)      # 100 rows/s -> 150
+        sizer.record(150, 3.0)      # 50 rows/s - worse, shrink
+        assert sizer.size == 100
+
+    def test_partial_batch_does_not_change_size(self):
+        sizer = AdaptiveBatchSizer(initial_size=100, min_size=10, max_size=10000)
+
+        sizer.record(40, 0.1)
+        assert sizer.size == 100
+
+    def test_batch_capped_below_size_is_full(self):
+        """A batch holding every row requested is measured even if the caller capped the fetch"""
+        sizer = AdaptiveBatchSizer(initial_size=100, min_size=10, max_size=10000)
+
+        sizer.record(40, 1.0, requested=40)
+        assert sizer.best_throughput == 40
+        assert sizer.size == 150
+
+    def test_memory_budget_caps_size(self):
+        sizer = AdaptiveBatchSizer(
+            initial_size=1000, min_size=10, max_size=10000,
+            memory_budget_bytes=50_000,
+        )
+
+        # 1000 bytes/row -> at most 50 rows fit into the budget
+        sizer.record(1000, 1.0, row_bytes=1000)
+        assert sizer.size == 50
+
+    def test_respects_bounds(self):
+        sizer = AdaptiveBatchSizer(initial_size=5, min_size=10, max_size=20)
+        assert sizer.size == 10
+
+        for _ in range(5):
+            sizer.record(sizer.size, 0.01)
+        assert sizer.size <= 20
+
+    def test_estimate_row_bytes(self):
+        narrow = [(1,) for _ in range(100)]
+        wide = [tuple("x" * 100 for _ in range(20)) for _ in range(100)]
+
+        assert estimate_row_bytes([]) == 0.0
+        assert estimate_row_bytes(wide) > estimate_row_bytes(narrow) * 10
+
+
+class TestSyncEngineAdaptiveBatching:
+    """Test SyncEngine integration with learned batch sizes."""
+
+    def test_disabled_by_default(self, tmp_path):
+        config = Config(
+            oracle_host="lh", oracle_port=1521, oracle_service_name="xe",
+            oracle_user="u", oracle_password="p",
+            duckdb_path=":memory:", state_directory=str(tmp_path),
+        )
+        with patch("oracle_duckdb_sync.database.sync_engine.OracleSource") as mock_oracle_cls, \
+             patch("oracle_duckdb_sync.database.sync_engine.DuckDBSource"):
+            mock_oracle_cls.return_value.fetch_generator.return_value = iter([[(1,)]])
+            engine = SyncEngine(config)
+            engine.sync_in_batches("O", "D", batch_size=100)
+
+            mock_oracle_cls.return_value.fetch_generator.assert_called_with(
+                "SELECT * FROM O", convert=False, batch_size=100, batch_size_fn=None
+            )
+            assert not (tmp_path / "batch_sizes.json").exists()
+
+    def test_learned_size_is_persisted_and_reused(self, adaptive_config):
+        with patch("oracle_duckdb_sync.database.sync_engine.OracleSource") as mock_oracle_cls, \
+             patch("oracle_duckdb_sync.database.sync_engine.DuckDBSource"):
+            mock_oracle = mock_oracle_cls.return_value
+            mock_oracle.fetch_generator.return_value = iter([[(i,) for i in range(100)]])
+
+            engine = SyncEngine(adaptive_config)
+            engine.sync_in_batches("O", "D", batch_size=100)
+
+            learned = engine.load_batch_size("D")
+            assert learned is not None
+            # One full batch at 100 rows -> controller grows the size
+            assert learned["batch_size"] == 150
+            assert learned["bytes_per_row"] > 0
+
+            kwargs = mock_oracle.fetch_generator.call_args.kwargs
+            assert callable(kwargs["batch_size_fn"])
+
+            # A new run starts from the learned size
+            learned = AdaptiveBatchSizer(initial_size=400, min_size=10, max_size=1000)
+            engine.save_batch_size("D", learned)
+            sizer = engine._create_batch_sizer("D", 100)
+            assert sizer.size == 400
+
+    def test_governor_capped_batches_still_adapt(self, adaptive_config):
+        """Batches capped by the memory governor below the sizer's size still feed throughput"""
+        adaptive_config.sync_memory_budget_mb = 512
+
+        def fetch_generator(query, convert, batch_size, batch_size_fn):
+            for _ in range(3):
+                yield [(i,) for i in range(batch_size_fn())]
+
+        with patch("oracle_duckdb_sync.database.sync_engine.OracleSource") as mock_oracle_cls, \
+             patch("oracle_duckdb_sync.database.sync_engine.DuckDBSource"):
+            mock_oracle_cls.return_value.fetch_generator.side_effect = fetch_generator
+            engine = SyncEngine(adaptive_config)
+            engine.memory_governor.limit_batch_size = lambda size: min(size, 50)
+
+            assert engine.sync_in_batches("O", "D", batch_size=100) == 150
+
+            learned = engine.load_batch_size("D")
+            assert learned["rows_per_second"] > 0
+            assert learned["batch_size"] != 100
@@ -0,0 +1,183 @@
+import threading
+from unittest.mock import patch
+
+import pytest
+
+from oracle_duckdb_sync.config import Config
+from oracle_duckdb_sync.database.cancellation import CancellationToken, SyncCancelled
+from oracle_duckdb_sync.database.sync_engine import SyncEngine
+
+
+def test_paused_checkpoint_blocks_until_resumed():
+    token = CancellationToken()
+    token.pause()
+    assert token.is_paused
+
+    passed = threading.Event()
+    thread = threading.Thread(target=lambda: (token.checkpoint(), passed.set()), daemon=True)
+    thread.start()
+    assert not passed.wait(0.1)
+
+    token.resume()
+    assert passed.wait(1.0)
+
+
+def test_cancel_wakes_paused_checkpoint_and_runs_callbacks():
+    token = CancellationToken()
+    calls = []
+    token.on_cancel(lambda: calls.append("first"))
+    unregister = token.on_cancel(lambda: calls.append("removed"))
+    token.on_cancel(lambda: 1 / 0)  # failing callbacks do not prevent the stop
+    unregister()
+    token.pause()
+
+    errors = []
+
+    def wait():
+        try:
+            token.checkpoint()
+        except SyncCancelled as e:
+            errors.append(e)
+
+    thread = threading.Thread(target=wait, daemon=True)
+    thread.start()
+    token.cancel("stopped by test")
+    thread.join(1.0)
+
+    assert [str(e) for e in errors] == ["stopped by test"]
+    assert calls == ["first"]
+    assert token.is_cancelled and not token.is_paused
+
+    # Registering after the stop runs the callback immediately
+    token.on_cancel(lambda: calls.append("late"))
+    assert calls == ["first", "late"]
+
+
+def _stop_checkpoint(engine, sync_type, duckdb_table):
+    return engine.load_partial_progress(SyncEngine._stop_checkpoint_key(sync_type, duckdb_table))
+
+
+def test_engine_stops_at_batch_boundary(tmp_path):
+    config = Config(
+        oracle_host="lh", oracle_port=1521, oracle_service_name="xe",
+        oracle_user="u", oracle_password="p",
+        duckdb_path=":memory:", state_directory=str(tmp_path),
+    )
+    token = CancellationToken()
+    with patch("oracle_duckdb_sync.database.sync_engine.OracleSource") as mock_oracle_cls, \
+         patch("oracle_duckdb_sync.database.sync_engine.DuckDBSource") as mock_duckdb_cls:
+        mock_oracle = mock_oracle_cls.return_value
+        mock_oracle.fetch_generator.return_value = iter([[(i,)] * 10 for i in range(5)])
+        # Stop while the second batch is being inserted
+        insert_batch = mock_duckdb_cls.return_value.insert_batch
+        insert_batch.side_effect = (
+            lambda *args, **kwargs: token.cancel() if insert_batch.call_count == 2 else None
+        )
+
+        engine = SyncEngine(config, cancel_token=token)
+        with pytest.raises(SyncCancelled):
+            engine.sync_in_batches("O", "D", batch_size=10)
+
+        # The interrupted batch finished, no further batch was fetched or inserted
+        assert mock_duckdb_cls.return_value.insert_batch.call_count == 2
+        mock_oracle.conn.cancel.assert_called_once()
+        assert engine.last_run_metrics.status == "stopped"
+        assert engine.last_run_metrics.rows == 20
+        assert _stop_checkpoint(engine, "full", "D")["rows_processed"] == 20
+
+
+def _typed_engine(tmp_path, mock_oracle, token):
+    config = Config(
+        oracle_host="lh", oracle_port=1521, oracle_service_name="xe",
+        oracle_user="u", oracle_password="p",
+        duckdb_path=":memory:", state_directory=str(tmp_path),
+        typed_table_mode="table",
+    )
+    mock_oracle.get_table_schema.return_value = [("ID", "NUMBER"), ("TS", "VARCHAR2(14)")]
+    return SyncEngine(config, cancel_token=token)
+
+
+def _stop_after_first(token, first, second):
+    yield first
+    token.cancel()
+    yield second
+
+
+def test_stopped_incremental_sync_drops_split_group_and_refreshes_typed_table(tmp_path):
+    token = CancellationToken()
+    with patch("oracle_duckdb_sync.database.sync_engine.OracleSource") as mock_oracle_cls:
+        mock_oracle = mock_oracle_cls.return_value
+        engine = _typed_engine(tmp_path, mock_oracle, token)
+        mock_oracle.fetch_generator.return_value = iter([[(1, "20240101000000")]])
+        engine.full_sync("O", "sync_table", "ID")
+
+        # Rows of 20240101020000 are split across the batches when the stop arrives
+        mock_oracle.fetch_generator.return_value = _stop_after_first(
+            token,
+            [(2, "20240101010000"), (3, "20240101020000")],
+            [(4, "20240101020000")],
+        )
+        with pytest.raises(SyncCancelled):
+            engine.incremental_sync("O", "sync_table", "TS", "20240101000000")
+
+        raw = engine.duckdb.conn.execute("SELECT ID FROM sync_table ORDER BY ID").fetchall()
+        typed = engine.duckdb.conn.execute("SELECT ID FROM sync_table_typed ORDER BY ID").fetchall()
+        state = engine.load_state("O")
+        engine.close()
+
+    assert [row[0] for row in raw] == [1, 2]
+    assert [row[0] for row in typed] == [1, 2]
+    assert state == "20240101010000"
+    assert _stop_checkpoint(engine, "incremental", "sync_table") is None
+
+
+def test_full_sync_after_stop_refills_target(tmp_path):
+    token = CancellationToken()
+    with patch("oracle_duckdb_sync.database.sync_engine.OracleSource") as mock_oracle_cls:
+        mock_oracle = mock_oracle_cls.return_value
+        engine = _typed_engine(tmp_path, mock_oracle, token)
+        mock_oracle.fetch_generator.return_value = _stop_after_first(
+            token, [(1, "20240101000000")], [(2, "20240101010000")]
+        )
+        with pytest.raises(SyncCancelled):
+            engine.full_sync("O", "sync_table", "ID")
+        assert _stop_checkpoint(engine, "full", "sync_table")["rows_processed"] == 1
+
+        # The rerun inserts row 1 again; the primary key must not reject it
+        engine.cancel_token = CancellationToken()
+        mock_oracle.fetch_generator.return_value = iter(
+            [[(1, "20240101000000"), (2, "20240101010000")]]
+        )
+        assert engine.full_sync("O", "sync_table", "ID") == 2
+        rows = engine.duckdb.conn.execute("SELECT ID FROM sync_table ORDER BY ID").fetchall()
+        engine.close()
+
+    assert [row[0] for row in rows] == [1, 2]
+    assert _stop_checkpoint(engine, "full", "sync_table") is None
+
+
+def test_stopped_test_sync_does_not_empty_full_sync_target(tmp_path):
+    token = CancellationToken()
+    with patch("oracle_duckdb_sync.database.sync_engine.OracleSource") as mock_oracle_cls:
+        mock_oracle = mock_oracle_cls.return_value
+        engine = _typed_engine(tmp_path, mock_oracle, token)
+        mock_oracle.fetch_generator.return_value = iter([[(1, "20240101000000")]])
+        engine.full_sync("O", "sync_table", "ID")
+
+        # A test sync of the same Oracle table into another target is stopped
+        engine.config.sync_batch_size = 1
+        batches = _stop_after_first(token, [(1, "20240101000000")], [(2, "20240101010000")])
+        mock_oracle.conn.cursor.return_value.fetchmany.side_effect = lambda *args: next(batches, [])
+        with pytest.raises(SyncCancelled):
+            engine.test_sync("O", "sync_table_test", "ID", row_limit=10)
+
+        engine.cancel_token = CancellationToken()
+        engine.duckdb.conn.execute("INSERT INTO sync_table VALUES (9, '20240101090000')")
+        mock_oracle.fetch_generator.return_value = iter([[(2, "20240101010000")]])
+        engine.full_sync("O", "sync_table", "ID")
+        rows = engine.duckdb.conn.execute("SELECT ID FROM sync_table ORDER BY ID").fetchall()
+        engine.close()
+
+    # The full sync target was not emptied because of the test sync's checkpoint
+    assert [row[0] for row in rows] == [1, 2, 9]
+    assert _stop_checkpoint(engine, "test", "sync_table_test") is not None
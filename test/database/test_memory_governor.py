@@ -0,0 +1,127 @@
+"""
+Test memory governance for the sync path.
+
+Covers MemoryGovernor batch capping/back-off, DuckDB memory settings and the
+SyncEngine wiring.
+"""
+
+from unittest.mock import patch
+
+import pytest
+
+from oracle_duckdb_sync.config import Config
+from oracle_duckdb_sync.database.duckdb_source import DuckDBSource
+from oracle_duckdb_sync.database.memory_governor import MemoryGovernor
+from oracle_duckdb_sync.database.sync_engine import SyncEngine
+
+MB = 1024 * 1024
+RSS_PATCH = "oracle_duckdb_sync.database.memory_governor.get_rss_bytes"
+
+
+@pytest.fixture
+def budget_config(tmp_path):
+    return Config(
+        oracle_host="lh", oracle_port=1521, oracle_service_name="xe",
+        oracle_user="u", oracle_password="p",
+        duckdb_path=":memory:",
+        state_directory=str(tmp_path),
+        sync_memory_budget_mb=512,
+    )
+
+
+class TestMemoryGovernor:
+    """Test batch capping and RSS back-off."""
+
+    def test_limit_batch_size_from_bytes_per_row(self):
+        governor = MemoryGovernor(budget_bytes=100 * MB, batch_fraction=0.1)
+
+        # Unknown row size -> unchanged
+        assert governor.limit_batch_size(50000) == 50000
+
+        governor.observe(1024)  # 1KB per row -> 10MB share fits 10240 rows
+        assert governor.limit_batch_size(50000) == 10240
+        assert governor.limit_batch_size(100) == 100
+
+    def test_no_backoff_below_threshold(self):
+        governor = MemoryGovernor(budget_bytes=100 * MB)
+
+        with patch(RSS_PATCH, return_value=10 * MB):
+            assert governor.wait_for_headroom() == 0.0
+        assert governor.backoff_count == 0
+        assert governor.peak_rss == 10 * MB
+
+    def test_backoff_waits_until_memory_is_released(self):
+        governor = MemoryGovernor(budget_bytes=100 * MB, poll_interval=0.01)
+        readings = iter([95 * MB, 95 * MB, 50 * MB])
+
+        with patch(RSS_PATCH, side_effect=lambda: next(readings)):
+            governor.wait_for_headroom()
+
+        assert governor.backoff_count == 1
+        assert governor.peak_rss == 95 * MB
+
+    def test_backoff_gives_up_after_max_wait(self):
+        governor = MemoryGovernor(budget_bytes=100 * MB, poll_interval=0.01, max_wait_seconds=0.05)
+
+        with patch(RSS_PATCH, return_value=99 * MB):
+            waited = governor.wait_for_headroom()
+
+        assert waited >= 0.05
+        assert governor.last_wait == waited
+
+
+class TestDuckDBMemorySettings:
+    """Test DuckDB memory_limit/temp_directory configuration."""
+
+    def test_explicit_settings(self, tmp_path):
+        config = Config(
+            oracle_host="lh", oracle_port=1521, oracle_service_name="xe",
+            oracle_user="u", oracle_password="p",
+            duckdb_path=":memory:",
+            duckdb_memory_limit="300MB",
+            duckdb_temp_directory=str(tmp_path / "spill"),
+        )
+        with DuckDBSource(config) as source:
+            temp_dir = source.conn.execute("SELECT current_setting('temp_directory')").fetchone()[0]
+            limit = source.conn.execute("SELECT current_setting('memory_limit')").fetchone()[0]
+
+        assert temp_dir.endswith("spill")
+        assert (tmp_path / "spill").is_dir()
+        assert "MiB" in limit or "MB" in limit
+
+    def test_derived_from_budget(self, budget_config, tmp_path):
+        with patch("oracle_duckdb_sync.database.duckdb_source.duckdb") as mock_duckdb:
+            DuckDBSource(budget_config)
+            execute = mock_duckdb.connect.return_value.execute
+            executed = [call.args[0] for call in execute.call_args_list]
+
+        assert "SET memory_limit = '256MB'" in executed
+        assert any("temp_directory" in sql and "duckdb_tmp" in sql for sql in executed)
+
+    def test_no_settings_by_default(self):
+        config = Config(
+            oracle_host="lh", oracle_port=1521, oracle_service_name="xe",
+            oracle_user="u", oracle_password="p",
+            duckdb_path=":memory:",
+        )
+        with patch("oracle_duckdb_sync.database.duckdb_source.duckdb") as mock_duckdb:
+            DuckDBSource(config)
+            mock_duckdb.connect.return_value.execute.assert_not_called()
+
+
+def test_sync_engine_uses_governor(budget_config):
+    """SyncEngine resizes fetches through the governor when a budget is set"""
+    with patch("oracle_duckdb_sync.database.sync_engine.OracleSource") as mock_oracle_cls, \
+         patch("oracle_duckdb_sync.database.sync_engine.DuckDBSource"):
+        mock_oracle = mock_oracle_cls.return_value
+        mock_oracle.fetch_generator.return_value = iter([[(i, "x" * 100) for i in range(100)]])
+
+        engine = SyncEngine(budget_config)
+        assert engine.memory_governor is not None
+
+        total = engine.sync_in_batches("O", "D", batch_size=100)
+        assert total == 100
+
+        batch_size_fn = mock_oracle.fetch_generator.call_args.kwargs["batch_size_fn"]
+        assert batch_size_fn() == 100
+        assert engine.memory_governor.bytes_per_row > 0
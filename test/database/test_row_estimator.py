@@ -0,0 +1,84 @@
+from oracle_duckdb_sync.database.row_estimator import RowCountEstimator, RowEstimate
+
+
+class FakeCursor:
+    def __init__(self, oracle):
+        self.oracle = oracle
+        self.row = None
+
+    def execute(self, query, params):
+        self.oracle.executed.append((query, self.oracle.conn.call_timeout))
+        for marker, result in self.oracle.results.items():
+            if marker in query:
+                if isinstance(result, Exception):
+                    raise result
+                self.row = (result,)
+                return
+        raise AssertionError(f"unexpected query: {query}")
+
+    def fetchone(self):
+        return self.row
+
+    def close(self):
+        pass
+
+
+class FakeConnection:
+    def __init__(self, oracle):
+        self.oracle = oracle
+        self.call_timeout = 0
+
+    def cursor(self):
+        return FakeCursor(self.oracle)
+
+
+class FakeOracleSource:
+    def __init__(self, results):
+        self.results = results
+        self.executed = []
+        self.conn = FakeConnection(self)
+
+    def connect(self):
+        pass
+
+
+def test_full_table_uses_statistics():
+    oracle = FakeOracleSource({"all_tables": 120000})
+    estimate = RowCountEstimator(oracle).estimate("APP.ORDERS")
+
+    assert estimate == RowEstimate(120000, 'statistics')
+    assert not estimate.exact
+    assert len(oracle.executed) == 1
+
+
+def test_unanalyzed_table_falls_back_to_count_then_sample():
+    oracle = FakeOracleSource(
+        {"user_tables": None, "SAMPLE BLOCK": 12, "COUNT(*)": TimeoutError("DPY-4024")}
+    )
+    estimate = RowCountEstimator(oracle, budget_seconds=2, sample_percent=0.5).estimate("ORDERS")
+
+    assert estimate == RowEstimate(2400, 'sample')
+    # COUNT and SAMPLE run under the time budget, which is restored afterwards
+    assert [timeout for _, timeout in oracle.executed] == [0, 2000, 2000]
+    assert oracle.conn.call_timeout == 0
+
+
+def test_incremental_counts_predicate_and_respects_row_limit():
+    oracle = FakeOracleSource({"COUNT(*)": 5000})
+    estimator = RowCountEstimator(oracle)
+
+    estimate = estimator.estimate("ORDERS", where="UPDATED_AT > '2024-01-01'")
+    assert estimate == RowEstimate(5000, 'count')
+    assert oracle.executed[0][0] == "SELECT COUNT(*) FROM ORDERS WHERE UPDATED_AT > '2024-01-01'"
+
+    assert estimator.estimate("ORDERS", where="X > 1", row_limit=1000) == RowEstimate(1000, 'limit')
+    estimate = estimator.estimate("ORDERS", where="X > 1", row_limit=10000)
+    assert estimate == RowEstimate(5000, 'count')
+
+
+def test_no_estimate_when_every_strategy_fails():
+    oracle = FakeOracleSource({"COUNT(*)": RuntimeError("ORA-00942")})
+    estimator = RowCountEstimator(oracle)
+
+    assert estimator.estimate("ORDERS", where="X > 1") is None
+    assert estimator.estimate("ORDERS", where="X > 1", row_limit=100) == RowEstimate(100, 'limit')
@@ -0,0 +1,163 @@
+from datetime import datetime
+
+import pytest
+
+from oracle_duckdb_sync.config import Config
+from oracle_duckdb_sync.database.schema_catalog import OracleSchemaCatalog
+from oracle_duckdb_sync.table_config import TableConfig, TableConfigService
+
+DDL_TIME = datetime(2024, 1, 1)
+
+
+class FakeCursor:
+    def __init__(self, oracle):
+        self.oracle = oracle
+        self.rows = []
+
+    def execute(self, query, params):
+        self.oracle.executed.append((query, params))
+        requested = {(params[f"o{i}"], params[f"t{i}"]) for i in range(len(params) // 2)}
+        if "all_tab_columns" in query:
+            self.rows = [
+                (owner, table, column, data_type, 10, 0, 22, 'N' if pk else 'Y',
+                 self.oracle.num_rows, self.oracle.ddl_times.get((owner, table), DDL_TIME), pk)
+                for owner, table in sorted(requested) if (owner, table) in self.oracle.tables
+                for column, data_type, pk in self.oracle.tables[(owner, table)]
+            ]
+        else:
+            self.rows = [
+                (owner, table, self.oracle.ddl_times.get((owner, table), DDL_TIME),
+                 self.oracle.num_rows)
+                for owner, table in sorted(requested) if (owner, table) in self.oracle.tables
+            ]
+
+    def fetchall(self):
+        return self.rows
+
+    def close(self):
+        pass
+
+
+class FakeOracleSource:
+    """Data dictionary with tables SALES.T0 .. SALES.T199 (ID primary key, UPDATED_AT)."""
+
+    def __init__(self):
+        self.conn = self
+        self.executed = []
+        self.num_rows = 1000
+        self.ddl_times = {}
+        self.tables = {
+            ("SALES", f"T{i}"): [("ID", "NUMBER", 1), ("UPDATED_AT", "DATE", None)]
+            for i in range(200)
+        }
+
+    def cursor(self):
+        return FakeCursor(self)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def oracle():
+    return FakeOracleSource()
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+def test_bulk_load_in_one_query(oracle, clock):
+    catalog = OracleSchemaCatalog(oracle, ttl_seconds=60, clock=clock)
+
+    schemas = catalog.get_schemas(("sales", f"t{i}") for i in range(200))
+
+    assert len(oracle.executed) == 1
+    schema = schemas[("SALES", "T42")]
+    assert schema.column_names == ["ID", "UPDATED_AT"]
+    assert schema.primary_key == ["ID"]
+    assert schema.num_rows == 1000
+    assert schema.columns[0].nullable is False
+
+
+def test_missing_table_is_cached_as_none(oracle, clock):
+    catalog = OracleSchemaCatalog(oracle, ttl_seconds=60, clock=clock)
+
+    assert catalog.get_schema("SALES", "NOPE") is None
+    assert catalog.get_schema("SALES", "NOPE") is None
+    assert len(oracle.executed) == 1
+
+
+def test_ttl_revalidates_ddl_time(oracle, clock):
+    catalog = OracleSchemaCatalog(oracle, ttl_seconds=60, clock=clock)
+    catalog.get_schemas([("SALES", "T1"), ("SALES", "T2")])
+
+    # Within the TTL nothing is queried
+    clock.now = 30
+    catalog.get_schemas([("SALES", "T1"), ("SALES", "T2")])
+    assert len(oracle.executed) == 1
+
+    # After the TTL only last_ddl_time is re-read; row estimates are refreshed
+    clock.now = 120
+    oracle.num_rows = 5000
+    schemas = catalog.get_schemas([("SALES", "T1"), ("SALES", "T2")])
+    assert len(oracle.executed) == 2
+    assert "all_tab_columns" not in oracle.executed[1][0]
+    assert schemas[("SALES", "T1")].num_rows == 5000
+
+    # A DDL change reloads only the changed table
+    clock.now = 240
+    oracle.ddl_times[("SALES", "T2")] = datetime(2024, 6, 1)
+    oracle.tables[("SALES", "T2")].append(("NEW_COL", "VARCHAR2", None))
+    schemas = catalog.get_schemas([("SALES", "T1"), ("SALES", "T2")])
+    assert len(oracle.executed) == 4
+    assert oracle.executed[3][1] == {"o0": "SALES", "t0": "T2"}
+    assert schemas[("SALES", "T2")].has_column("new_col")
+
+
+def test_validate_configs_uses_one_query(oracle, clock, tmp_path):
+    config = Config(
+        oracle_host="lh", oracle_port=1521, oracle_service_name="xe",
+        oracle_user="u", oracle_password="p", duckdb_path=":memory:",
+        state_directory=str(tmp_path)
+    )
+    catalog = OracleSchemaCatalog(oracle, ttl_seconds=60, clock=clock)
+    service = TableConfigService(config=config, schema_catalog=catalog)
+    configs = [
+        TableConfig("SALES", f"T{i}", f"t{i}", "ID", time_column="UPDATED_AT")
+        for i in range(200)
+    ]
+    configs[0].primary_key = "ORDER_ID"
+    configs.append(TableConfig("SALES", "MISSING", "missing", "ID"))
+
+    results = service.validate_configs(configs)
+
+    assert len(oracle.executed) == 1
+    assert results["SALES.T199"] == (True, [])
+    assert results["SALES.T0"][1] == ["기본 키 컬럼 ORDER_ID이(가) Oracle 테이블에 없습니다."]
+    invalid = [name for name, (is_valid, _) in results.items() if not is_valid]
+    assert invalid == ["SALES.T0", "SALES.MISSING"]
+
+
+def test_validate_config_skips_schema_check_when_catalog_fails(oracle, clock, tmp_path):
+    """An unreachable Oracle only skips the column checks; the config stays valid."""
+    config = Config(
+        oracle_host="lh", oracle_port=1521, oracle_service_name="xe",
+        oracle_user="u", oracle_password="p", duckdb_path=":memory:",
+        state_directory=str(tmp_path)
+    )
+    catalog = OracleSchemaCatalog(oracle, ttl_seconds=60, clock=clock)
+    service = TableConfigService(config=config, schema_catalog=catalog)
+
+    def unreachable():
+        raise ConnectionError("ORA-12541: TNS:no listener")
+
+    oracle.cursor = unreachable
+
+    assert service.validate_config(TableConfig("SALES", "T1", "t1", "ID")) == (True, [])
@@ -0,0 +1,105 @@
+import threading
+import time
+from unittest.mock import patch
+
+from oracle_duckdb_sync.config import Config
+from oracle_duckdb_sync.database.sync_engine import SyncEngine
+from oracle_duckdb_sync.database.sync_events import (
+    AsyncEventSink,
+    BatchFetched,
+    BatchWritten,
+    SyncFinished,
+    SyncStarted,
+)
+
+
+def test_slow_handler_does_not_block_publisher():
+    started = threading.Event()
+    release = threading.Event()
+    received = []
+
+    def handler(event):
+        started.set()
+        release.wait(1.0)
+        received.append(event.table)
+
+    sink = AsyncEventSink(handler, max_pending=3)
+    sink.publish(SyncStarted("t0", "full", "O"))
+    assert started.wait(1.0)
+    start = time.monotonic()
+    for i in range(1, 5):
+        sink.publish(BatchFetched(f"t{i}", i, 10, 0.1))
+    assert time.monotonic() - start < 0.5
+
+    release.set()
+    sink.close()
+    # t0 was being handled; of the rest only the newest 3 were kept
+    assert received == ["t0", "t2", "t3", "t4"]
+    assert sink.dropped == 1
+
+
+def test_full_buffer_keeps_lifecycle_events():
+    """Under backpressure only batch events are dropped; start and finish always arrive."""
+    release = threading.Event()
+    received = []
+
+    def handler(event):
+        release.wait(1.0)
+        received.append(event)
+
+    sink = AsyncEventSink(handler, max_pending=2)
+    sink.publish(SyncStarted("t", "full", "O"))
+    for i in range(1, 6):
+        sink.publish(BatchFetched("t", i, 10, 0.1))
+    sink.publish(SyncFinished("t", "completed", 50, 1.0, None, {}))
+    for i in range(6, 9):
+        sink.publish(BatchFetched("t", i, 10, 0.1))
+
+    release.set()
+    sink.close()
+
+    assert isinstance(received[0], SyncStarted)
+    assert any(isinstance(event, SyncFinished) for event in received)
+    assert sink.published == len(received) + sink.dropped
+
+
+def test_handler_errors_do_not_stop_delivery():
+    received = []
+
+    def handler(event):
+        if event.table == "bad":
+            raise RuntimeError("boom")
+        received.append(event.table)
+
+    sink = AsyncEventSink(handler)
+    for table in ("a", "bad", "b"):
+        sink.publish(SyncStarted(table, "full", "O"))
+    assert sink.flush(1.0)
+    assert received == ["a", "b"]
+    sink.close()
+
+
+def test_engine_emits_typed_events(tmp_path):
+    config = Config(
+        oracle_host="lh", oracle_port=1521, oracle_service_name="xe",
+        oracle_user="u", oracle_password="p",
+        duckdb_path=":memory:", state_directory=str(tmp_path),
+    )
+    events = []
+    with patch("oracle_duckdb_sync.database.sync_engine.OracleSource") as mock_oracle_cls, \
+         patch("oracle_duckdb_sync.database.sync_engine.DuckDBSource"):
+        mock_oracle_cls.return_value.fetch_generator.return_value = iter([[(1,)] * 50, [(2,)] * 30])
+
+        engine = SyncEngine(config, event_handler=events.append)
+        engine.sync_in_batches("O", "D", batch_size=50)
+        engine.close()
+
+    assert [type(event) for event in events] == [
+        SyncStarted, BatchFetched, BatchWritten, BatchFetched, BatchWritten, SyncFinished
+    ]
+    written = [event for event in events if isinstance(event, BatchWritten)]
+    assert [(event.rows, event.total_rows) for event in written] == [(50, 50), (30, 80)]
+    assert all(event.bytes > 0 for event in written)
+    finished = events[-1]
+    assert (finished.status, finished.total_rows, finished.error) == ("completed", 80, None)
+    assert finished.summary["batches"] == 2
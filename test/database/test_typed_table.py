@@ -0,0 +1,120 @@
+from unittest.mock import patch
+
+import pandas as pd
+import pytest
+
+from oracle_duckdb_sync.config import Config
+from oracle_duckdb_sync.database.duckdb_source import DuckDBSource
+from oracle_duckdb_sync.database.sync_engine import SyncEngine
+from oracle_duckdb_sync.database.typed_table import TypedTableMaterializer, TypedTablePlan
+
+
+@pytest.fixture
+def config(tmp_path):
+    return Config(
+        oracle_host="lh", oracle_port=1521, oracle_service_name="xe",
+        oracle_user="u", oracle_password="p",
+        duckdb_path=":memory:", state_directory=str(tmp_path),
+        typed_table_mode="table"
+    )
+
+
+@pytest.fixture
+def duckdb_source(config):
+    source = DuckDBSource(config)
+    source.conn.execute("CREATE TABLE raw (ID DOUBLE, TS VARCHAR, VAL VARCHAR, NAME VARCHAR)")
+    source.conn.execute("""
+        INSERT INTO raw
+        SELECT range, strftime(TIMESTAMP '2024-01-01' + INTERVAL (range) HOUR, '%Y%m%d%H%M%S'),
+               CASE WHEN range = 2 THEN 'x' ELSE CAST(range + 0.5 AS VARCHAR) END, 'name_' || range
+        FROM range(20)
+    """)
+    yield source
+    source.disconnect()
+
+
+def test_plan_detects_numeric_and_datetime_columns(duckdb_source):
+    materializer = TypedTableMaterializer(duckdb_source, mode="table")
+
+    plan = materializer.build_plan("raw")
+
+    assert plan.typed_table == "raw_typed"
+    assert plan.conversions == {"TS": "datetime", "VAL": "numeric"}
+    assert TypedTablePlan.from_dict(plan.to_dict()) == plan
+
+
+def test_rebuild_creates_typed_table(duckdb_source):
+    materializer = TypedTableMaterializer(duckdb_source, mode="table")
+    plan = materializer.build_plan("raw")
+
+    materializer.rebuild(plan)
+
+    df = duckdb_source.conn.execute("SELECT * FROM raw_typed ORDER BY ID").df()
+    assert pd.api.types.is_datetime64_any_dtype(df["TS"])
+    assert pd.api.types.is_float_dtype(df["VAL"])
+    assert df["TS"].iloc[1] == pd.Timestamp("2024-01-01 01:00:00")
+    # Values that do not convert become NULL instead of failing the refresh
+    assert pd.isna(df["VAL"].iloc[2])
+    assert materializer.is_current(plan)
+
+
+def test_incremental_refresh_appends_new_rows(duckdb_source):
+    materializer = TypedTableMaterializer(duckdb_source, mode="table")
+    plan = materializer.build_plan("raw")
+    materializer.rebuild(plan)
+
+    duckdb_source.conn.execute("INSERT INTO raw VALUES (20, '20240101200000', '20.5', 'new')")
+    appended = materializer.refresh_incremental(plan, "TS", "20240101190000")
+
+    assert appended == 1
+    summary = duckdb_source.conn.execute("SELECT COUNT(*), MAX(VAL) FROM raw_typed").fetchone()
+    assert summary == (21, 20.5)
+
+
+def test_view_mode_replaces_table(duckdb_source):
+    TypedTableMaterializer(duckdb_source, mode="table").rebuild(
+        TypedTableMaterializer(duckdb_source, mode="table").build_plan("raw")
+    )
+    materializer = TypedTableMaterializer(duckdb_source, mode="view")
+    plan = materializer.build_plan("raw")
+
+    materializer.rebuild(plan)
+    duckdb_source.conn.execute("INSERT INTO raw VALUES (20, '20240101200000', '20.5', 'new')")
+
+    assert materializer.refresh_incremental(plan, "TS", "20240101190000") == 0
+    assert duckdb_source.conn.execute("SELECT COUNT(*) FROM raw_typed").fetchone()[0] == 21
+    table_type = duckdb_source.conn.execute(
+        "SELECT table_type FROM information_schema.tables WHERE table_name = 'raw_typed'"
+    ).fetchone()[0]
+    assert table_type == "VIEW"
+
+
+def test_unknown_mode_rejected(duckdb_source):
+    with pytest.raises(ValueError):
+        TypedTableMaterializer(duckdb_source, mode="materialized")
+
+
+def test_sync_engine_refreshes_typed_table(config):
+    with patch("oracle_duckdb_sync.database.sync_engine.OracleSource") as mock_oracle_cls:
+        mock_oracle = mock_oracle_cls.return_value
+        mock_oracle.get_table_schema.return_value = [
+            ("ID", "NUMBER"), ("TS", "VARCHAR2(14)"), ("VAL", "VARCHAR2(10)")
+        ]
+        mock_oracle.fetch_generator.return_value = iter([
+            [(1, "20240101000000", "1.5"), (2, "20240101010000", "2.5")]
+        ])
+        engine = SyncEngine(config)
+
+        engine.full_sync("O", "sync_table", "ID")
+        plan = engine.load_typed_table_plan("sync_table")
+
+        mock_oracle.fetch_generator.return_value = iter([[(3, "20240101020000", "3.5")]])
+        engine.incremental_sync("O", "sync_table", "TS", "20240101010000")
+
+        rows = engine.duckdb.execute("SELECT ID, TS, VAL FROM sync_table_typed ORDER BY ID")
+        engine.close()
+
+    assert plan["columns"][1]["target_type"] == "datetime"
+    assert [row[0] for row in rows] == [1, 2, 3]
+    assert rows[2][1] == pd.Timestamp("2024-01-01 02:00:00")
+    assert rows[2][2] == 3.5
@@ -0,0 +1,94 @@
+"""LogStreamHandler 링 버퍼 및 커서 기반 조회 테스트"""
+
+import logging
+
+import pytest
+
+from oracle_duckdb_sync.log.log_stream import LogStreamHandler
+
+
+@pytest.fixture
+def stream_logger():
+    handler = LogStreamHandler(max_size=5)
+    logger = logging.getLogger("test_log_stream")
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+    logger.addHandler(handler)
+    yield logger, handler
+    logger.removeHandler(handler)
+
+
+def test_read_since_returns_only_new_entries(stream_logger):
+    logger, handler = stream_logger
+    logger.info("first")
+    logger.info("second")
+
+    entries, cursor = handler.read_since()
+    assert [e.message for e in entries] == ["first", "second"]
+    assert [e.seq for e in entries] == [0, 1]
+    assert cursor == 1
+
+    entries, cursor = handler.read_since(cursor)
+    assert entries == []
+    assert cursor == 1
+
+    logger.info("third")
+    entries, cursor = handler.read_since(cursor)
+    assert [e.message for e in entries] == ["third"]
+    assert cursor == 2
+
+
+def test_ring_buffer_drops_oldest_entries(stream_logger):
+    logger, handler = stream_logger
+    for i in range(8):
+        logger.info(f"message {i}")
+
+    assert handler.get_count() == 5
+    assert handler.first_seq == 3
+    # 버퍼에서 밀려난 구간의 커서는 남아 있는 가장 오래된 로그부터 읽음
+    entries, cursor = handler.read_since(0)
+    assert [e.message for e in entries] == [f"message {i}" for i in range(3, 8)]
+    assert cursor == 7
+
+
+def test_read_since_filters_by_level_and_source(stream_logger):
+    logger, handler = stream_logger
+    other = logging.getLogger("test_log_stream_other")
+    other.propagate = False
+    other.addHandler(handler)
+    try:
+        logger.info("info")
+        logger.error("error")
+        other.error("other error")
+        logger.warning("warning")
+    finally:
+        other.removeHandler(handler)
+
+    entries, cursor = handler.read_since(level="ERROR")
+    assert [e.message for e in entries] == ["error", "other error"]
+    assert cursor == 3
+
+    entries, _ = handler.read_since(level="ERROR", source="test_log_stream")
+    assert [e.message for e in entries] == ["error"]
+
+    entries, _ = handler.read_since(1, level="ERROR")
+    assert [e.message for e in entries] == ["other error"]
+
+
+def test_limit_keeps_newest_and_clear_keeps_cursors_valid(stream_logger):
+    logger, handler = stream_logger
+    for i in range(4):
+        logger.info(f"message {i}")
+
+    assert [e.message for e in handler.get_latest(2)] == ["message 2", "message 3"]
+    info_logs = handler.get_logs(count=2, level="INFO")
+    assert [e.message for e in info_logs] == ["message 2", "message 3"]
+
+    handler.clear()
+    assert handler.get_count() == 0
+    assert handler.read_since(1) == ([], 3)
+
+    logger.info("after clear")
+    entries, cursor = handler.read_since(3)
+    assert [(e.seq, e.message) for e in entries] == [(4, "after clear")]
+    assert cursor == 4
@@ -86,10 +86,11 @@ def test_103_batch_index_statistics(tmp_path):
 
     log_file = tmp_path / "batch_stats.log"
 
+    # Log progress after every batch (the default is rate limited)
     mock_config = Config(
         oracle_host="lh", oracle_port=1521, oracle_service_name="xe",
         oracle_user="u", oracle_password="p",
-        duckdb_path=":memory:"
+        duckdb_path=":memory:", progress_log_interval_seconds=0
     )
 
     with patch("oracle_duckdb_sync.database.sync_engine.OracleSource") as mock_oracle_cls, \
@@ -148,3 +149,132 @@ def test_103_batch_index_statistics(tmp_path):
         # Verify timing information is present
         assert re.search(r'(time|seconds?|duration|elapsed)', log_content, re.IGNORECASE), \
             "Log should contain timing-related keywords"
+
+
+def test_104_non_blocking_logger_writes_on_listener_thread(tmp_path):
+    """TEST-104: setup_logger는 QueueHandler로 기록하고 close 시 남은 로그를 모두 기록"""
+    import threading
+
+    from oracle_duckdb_sync.log.logger import AsyncQueueHandler
+
+    log_file = tmp_path / "async.log"
+    logger = setup_logger("async_test", str(log_file))
+    assert len(logger.handlers) == 1
+    assert isinstance(logger.handlers[0], AsyncQueueHandler)
+
+    writer_threads = set()
+
+    class Spy(logging.Filter):
+        def filter(self, record):
+            writer_threads.add(threading.current_thread().name)
+            return True
+
+    logger.handlers[0].target_handlers[1].addFilter(Spy())
+    for i in range(500):
+        logger.info("line %d", i)
+
+    try:
+        raise ValueError("boom")
+    except ValueError:
+        logger.exception("failed")
+
+    for handler in logger.handlers[:]:
+        handler.close()
+        logger.removeHandler(handler)
+
+    content = log_file.read_text()
+    assert "line 0" in content and "line 499" in content
+    assert "ValueError: boom" in content
+    assert threading.current_thread().name not in writer_threads
+
+
+def test_105_blocking_logger_option(tmp_path):
+    """TEST-105: non_blocking=False면 기존처럼 핸들러에 직접 기록"""
+    logger = setup_logger("sync_test", str(tmp_path / "sync.log"), non_blocking=False)
+    assert len(logger.handlers) == 2
+
+
+def test_106_progress_logging_is_rate_limited(tmp_path):
+    """TEST-106: 배치 진행 로그는 interval마다 한 번만 기록"""
+    from unittest.mock import MagicMock, patch
+
+    from oracle_duckdb_sync.config import Config
+    from oracle_duckdb_sync.database.sync_engine import SyncEngine
+    from oracle_duckdb_sync.log.logger import LogRateLimiter
+
+    limiter = LogRateLimiter(60)
+    assert limiter.ready()
+    assert not limiter.ready()
+    limiter.reset()
+    assert limiter.ready()
+
+    config = Config(
+        oracle_host="lh", oracle_port=1521, oracle_service_name="xe",
+        oracle_user="u", oracle_password="p",
+        duckdb_path=":memory:", progress_log_interval_seconds=60
+    )
+    with patch("oracle_duckdb_sync.database.sync_engine.OracleSource") as mock_oracle_cls, \
+         patch("oracle_duckdb_sync.database.sync_engine.DuckDBSource"):
+        batches = [[(i,)] for i in range(20)]
+        mock_oracle_cls.return_value.fetch_generator.return_value = iter(batches)
+        engine = SyncEngine(config)
+        engine.logger = MagicMock()
+
+        engine.sync_in_batches("O", "D", batch_size=1)
+
+        progress_calls = [
+            c for c in engine.logger.info.call_args_list
+            if c.args[0].startswith("Sync progress")
+        ]
+        assert len(progress_calls) == 1
+
+
+def test_107_repeated_setup_reuses_live_handler(tmp_path):
+    """TEST-107: 같은 설정으로 다시 호출하면 기존 핸들러를 유지해
+    다른 스레드의 로그가 유실되지 않음"""
+    import threading
+
+    log_file = tmp_path / "reuse.log"
+    logger = setup_logger("reuse_test", str(log_file))
+    handler = logger.handlers[0]
+
+    def write():
+        for i in range(2000):
+            logger.info("line %d", i)
+
+    writer = threading.Thread(target=write)
+    writer.start()
+    for _ in range(20):
+        assert setup_logger("reuse_test", str(log_file)).handlers == [handler]
+    writer.join()
+    assert handler.running
+
+    # A different file still reconfigures the logger
+    other = setup_logger("reuse_test", str(tmp_path / "other.log"))
+    assert other.handlers[0] is not handler
+    assert not handler.running
+
+    lines = log_file.read_text().splitlines()
+    assert len(lines) == 2000 and "line 1999" in lines[-1]
+    for h in other.handlers[:]:
+        h.close()
+        other.removeHandler(h)
+
+
+def test_108_async_loggers_share_one_dispatcher_thread(tmp_path):
+    """TEST-108: 비동기 로거가 여러 개여도 기록 스레드는 프로세스에 하나"""
+    import threading
+
+    loggers = [setup_logger(f"shared_{i}", str(tmp_path / f"shared_{i}.log")) for i in range(5)]
+    for i, logger in enumerate(loggers):
+        logger.info("from %d", i)
+    loggers[0].handlers[0].flush()
+
+    dispatchers = [t for t in threading.enumerate() if t.name == 'LogDispatcher']
+    assert len(dispatchers) == 1
+
+    for i, logger in enumerate(loggers):
+        for handler in logger.handlers[:]:
+            handler.close()
+            logger.removeHandler(handler)
+        assert f"from {i}" in (tmp_path / f"shared_{i}.log").read_text()
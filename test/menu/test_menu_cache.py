@@ -0,0 +1,120 @@
+import pytest
+
+pytest.importorskip("bcrypt")
+
+from oracle_duckdb_sync.auth import User, UserRole  # noqa: E402
+from oracle_duckdb_sync.menu import Menu, MenuService, get_menu_cache  # noqa: E402
+from oracle_duckdb_sync.ui.components.search import get_searchable_pages  # noqa: E402
+
+
+class FakeMenuRepository:
+    """In-memory menus table that counts queries."""
+
+    def __init__(self):
+        self.queries = 0
+        self.menus = [
+            Menu(id=1, name="대시보드", path="/", order=1),
+            Menu(id=2, name="동기화", path="/sync", order=2, required_permission="sync:read"),
+            Menu(id=3, name="관리자", path="/admin", order=10, required_permission="admin:*"),
+            Menu(
+                id=4, name="사용자 관리", path="/admin/users", parent_id=3, order=11,
+                required_permission="user:read"
+            ),
+            Menu(id=5, name="숨김", path="/hidden", order=5, is_active=False),
+        ]
+
+    def get_all(self, include_inactive=False):
+        self.queries += 1
+        return [m for m in self.menus if include_inactive or m.is_active]
+
+    def create(self, menu):
+        menu.id = max(m.id for m in self.menus) + 1
+        self.menus.append(menu)
+        return menu
+
+    def update(self, menu):
+        return menu
+
+    def delete(self, menu_id):
+        self.menus = [m for m in self.menus if m.id != menu_id]
+        return True
+
+
+@pytest.fixture
+def service():
+    get_menu_cache().invalidate()
+    menu_service = MenuService(duckdb_source=object())
+    menu_service._menu_repo = FakeMenuRepository()
+    return menu_service
+
+
+def make_user(role):
+    return User(username=role.value, password_hash="x", role=role, id=1)
+
+
+def test_tree_built_from_one_query_and_cached_per_role(service):
+    admin_tree = service.get_menu_tree_for_user(make_user(UserRole.ADMIN))
+    viewer_tree = service.get_menu_tree_for_user(make_user(UserRole.VIEWER))
+    service.get_menu_tree_for_user(make_user(UserRole.ADMIN))
+    service.get_menu_tree_for_user(make_user(UserRole.VIEWER))
+
+    assert service.menu_repo.queries == 1
+    assert [node['path'] for node in admin_tree] == ["/", "/sync", "/admin"]
+    assert [child['path'] for child in admin_tree[2]['children']] == ["/admin/users"]
+    assert [node['path'] for node in viewer_tree] == ["/", "/sync"]
+
+
+def test_returned_tree_is_a_copy(service):
+    user = make_user(UserRole.ADMIN)
+    service.get_menu_tree_for_user(user)[0]['name'] = "changed"
+
+    assert service.get_menu_tree_for_user(user)[0]['name'] == "대시보드"
+
+
+def test_menu_changes_invalidate_cache(service):
+    user = make_user(UserRole.USER)
+    service.get_menu_tree_for_user(user)
+
+    service.create_menu(
+        Menu(name="로그 조회", path="/logs", order=3, required_permission="log:read")
+    )
+    tree = service.get_menu_tree_for_user(user)
+    assert [node['path'] for node in tree] == ["/", "/sync", "/logs"]
+
+    service.delete_menu(2)
+    tree = service.get_menu_tree_for_user(user)
+    assert [node['path'] for node in tree] == ["/", "/logs"]
+    assert service.menu_repo.queries == 3
+
+
+def test_searchable_pages_cached_until_menu_change(service):
+    admin = make_user(UserRole.ADMIN)
+
+    first = get_searchable_pages(admin)
+    assert get_searchable_pages(admin)[0] is first[0]
+    assert len(get_searchable_pages(make_user(UserRole.VIEWER))) < len(first)
+
+    service.update_menu(service.menu_repo.menus[0])
+    assert get_searchable_pages(admin)[0] is not first[0]
+
+
+def test_search_index_rebuilt_only_on_menu_or_table_change(service):
+    from oracle_duckdb_sync.ui.components.search_index import (
+        get_search_index,
+        register_search_tables,
+    )
+
+    user = make_user(UserRole.USER)
+    register_search_tables(["orders", "items"])
+    index = get_search_index(user)
+
+    register_search_tables(["items", "orders"])
+    assert get_search_index(user) is index
+    assert index.search("orders")[0].target == "orders"
+
+    register_search_tables(["items", "orders", "customers"])
+    rebuilt = get_search_index(user)
+    assert rebuilt is not index
+
+    service.delete_menu(5)
+    assert get_search_index(user) is not rebuilt
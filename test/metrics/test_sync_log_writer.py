@@ -0,0 +1,127 @@
+"""Tests for the buffered sync log writer."""
+
+import threading
+from datetime import datetime, timedelta
+
+import pytest
+
+from oracle_duckdb_sync.config import Config
+from oracle_duckdb_sync.database.duckdb_source import DuckDBSource
+from oracle_duckdb_sync.models.sync_log import SyncLog, SyncStatus, SyncType
+from oracle_duckdb_sync.repository.sync_log_repo import SyncLogRepository
+from oracle_duckdb_sync.repository.sync_log_writer import SyncLogWriter
+
+
+@pytest.fixture
+def repo():
+    config = Config(
+        oracle_host="lh", oracle_port=1521, oracle_service_name="xe",
+        oracle_user="u", oracle_password="p", duckdb_path=":memory:"
+    )
+    source = DuckDBSource(config)
+    yield SyncLogRepository(duckdb_source=source)
+    source.disconnect()
+
+
+class CountingRepository:
+    """Wraps a repository and counts write_batch calls."""
+
+    def __init__(self, repo):
+        self.repo = repo
+        self.batches = []
+        self.fail = False
+
+    def write_batch(self, new_logs, updated_logs):
+        if self.fail:
+            raise RuntimeError("database is locked")
+        self.batches.append((len(new_logs), len(updated_logs)))
+        self.repo.write_batch(new_logs, updated_logs)
+
+
+def running_log(table="T"):
+    return SyncLog(sync_id="", table_name=table, sync_type=SyncType.FULL,
+                   status=SyncStatus.RUNNING, start_time=datetime.now() - timedelta(seconds=30))
+
+
+def test_events_coalesced_per_sync_id(repo):
+    counting = CountingRepository(repo)
+    writer = SyncLogWriter(counting, flush_interval=60)
+
+    sync_id = writer.start(running_log())
+    for rows in range(0, 10000, 100):
+        writer.progress(sync_id, rows)
+    writer.finish(sync_id, SyncStatus.COMPLETED, total_rows=10000, metrics={"batches": 100})
+    writer.close()
+
+    assert counting.batches == [(1, 0)]
+    log = repo.get_by_sync_id(sync_id)
+    assert log.status == SyncStatus.COMPLETED
+    assert log.total_rows == 10000
+    assert log.metrics == {"batches": 100}
+    assert repo.get_statistics()['completed'] == 1
+
+
+def test_running_row_updated_by_sync_id(repo):
+    counting = CountingRepository(repo)
+    writer = SyncLogWriter(counting, flush_interval=60)
+
+    sync_ids = [writer.start(running_log(f"T{i}")) for i in range(3)]
+    writer.flush()
+    assert repo.get_statistics()['running'] == 3
+
+    writer.progress(sync_ids[0], 500)
+    writer.finish(sync_ids[1], SyncStatus.FAILED, error_message="ORA-01555")
+    writer.close()
+
+    assert counting.batches == [(3, 0), (0, 2)]
+    assert repo.get_by_sync_id(sync_ids[0]).total_rows == 500
+    assert repo.get_by_sync_id(sync_ids[1]).error_message == "ORA-01555"
+    assert repo.get_statistics()['failed'] == 1
+
+
+def test_background_thread_flushes(repo):
+    writer = SyncLogWriter(repo, flush_interval=0.05)
+    flushed = threading.Event()
+    original_flush = writer.flush
+
+    def flush_and_signal():
+        written = original_flush()
+        if written:
+            flushed.set()
+        return written
+
+    writer.flush = flush_and_signal
+    sync_id = writer.start(running_log())
+
+    assert flushed.wait(5)
+    assert repo.get_by_sync_id(sync_id) is not None
+    writer.close()
+
+
+def test_failed_flush_is_retried(repo):
+    counting = CountingRepository(repo)
+    writer = SyncLogWriter(counting, flush_interval=60)
+    sync_id = writer.start(running_log())
+
+    counting.fail = True
+    assert writer.flush() == 0
+    assert writer.pending == 1
+
+    counting.fail = False
+    writer.close()
+    assert repo.get_by_sync_id(sync_id) is not None
+    with pytest.raises(RuntimeError):
+        writer.progress(sync_id, 1)
+
+
+def test_failed_rollup_does_not_abort_the_batch(repo, monkeypatch):
+    monkeypatch.setattr(
+        repo, "_rollup_sql", lambda where_clause="": "INSERT INTO missing_table VALUES (1)"
+    )
+    writer = SyncLogWriter(repo, flush_interval=60)
+    sync_id = writer.start(running_log())
+
+    assert writer.flush() == 1
+    assert writer.pending == 0
+    assert repo.get_by_sync_id(sync_id) is not None
+    writer.close()
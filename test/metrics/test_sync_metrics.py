@@ -0,0 +1,155 @@
+"""Tests for the in-process metrics registry and sync run metrics."""
+
+import urllib.request
+from unittest.mock import patch
+
+import pytest
+
+from oracle_duckdb_sync.config import Config
+from oracle_duckdb_sync.database.sync_engine import SyncEngine
+from oracle_duckdb_sync.metrics import (
+    MetricsRegistry,
+    SyncRunMetrics,
+    start_metrics_server,
+    stop_metrics_server,
+)
+from oracle_duckdb_sync.models.sync_log import SyncStatus, SyncType
+from oracle_duckdb_sync.repository.sync_log_repo import SyncLogRepository
+
+
+class TestMetricsRegistry:
+    """Test counters, histograms and the Prometheus rendering."""
+
+    def test_counter_per_label_set(self):
+        registry = MetricsRegistry()
+        counter = registry.counter("rows_total", "Rows", ("table",))
+
+        counter.inc(10, table="a")
+        counter.inc(5, table="a")
+        counter.inc(1, table="b")
+
+        assert counter.get(table="a") == 15
+        assert counter.get(table="b") == 1
+        assert registry.counter("rows_total", "Rows", ("table",)) is counter
+
+    def test_label_mismatch_raises(self):
+        registry = MetricsRegistry()
+        counter = registry.counter("rows_total", "Rows", ("table",))
+
+        with pytest.raises(ValueError):
+            counter.inc(1, other="x")
+        with pytest.raises(ValueError):
+            registry.histogram("rows_total", "Rows", ("table",))
+
+    def test_prometheus_text_format(self):
+        registry = MetricsRegistry()
+        registry.counter("rows_total", "Rows", ("table",)).inc(3, table='t"1')
+        fetch_seconds = registry.histogram("fetch_seconds", "Fetch", ("table",), buckets=(0.1, 1.0))
+        fetch_seconds.observe(0.5, table="t")
+
+        text = registry.render_prometheus()
+
+        assert "# TYPE rows_total counter" in text
+        assert 'rows_total{table="t\\"1"} 3' in text
+        assert 'fetch_seconds_bucket{table="t",le="0.1"} 0' in text
+        assert 'fetch_seconds_bucket{table="t",le="1"} 1' in text
+        assert 'fetch_seconds_bucket{table="t",le="+Inf"} 1' in text
+        assert 'fetch_seconds_count{table="t"} 1' in text
+        assert 'fetch_seconds_sum{table="t"} 0.5' in text
+
+
+class TestSyncRunMetrics:
+    """Test per-run aggregation."""
+
+    def test_summary_and_registry(self):
+        registry = MetricsRegistry()
+        metrics = SyncRunMetrics("sales", "full", registry=registry)
+
+        metrics.observe_stage("fetch", 0.25)
+        metrics.observe_stage("fetch", 0.25)
+        metrics.observe_stage("insert", 0.1)
+        metrics.observe_batch(100, 4000)
+        metrics.record_retry()
+        metrics.finish("completed")
+
+        summary = metrics.summary()
+        assert summary["rows"] == 100
+        assert summary["bytes"] == 4000
+        assert summary["retries"] == 1
+        assert summary["status"] == "completed"
+        assert summary["stage_seconds"] == {"fetch": 0.5, "convert": 0.0, "insert": 0.1}
+
+        labels = {"table": "sales", "sync_type": "full"}
+        assert registry.get("sync_rows_total").get(**labels) == 100
+        assert registry.get("sync_stage_seconds").get(stage="fetch", **labels)["count"] == 2
+        assert registry.get("sync_runs_total").get(status="completed", **labels) == 1
+
+
+def test_metrics_endpoint_serves_registry():
+    registry = MetricsRegistry()
+    registry.counter("up", "Up").inc()
+    server = start_metrics_server(0, host="127.0.0.1", registry=registry)
+    port = server.server_address[1]
+    try:
+        with urllib.request.urlopen(f"http://127.0.0.1:{port}/metrics") as response:
+            body = response.read().decode()
+            assert response.headers["Content-Type"].startswith("text/plain")
+        assert "up 1" in body
+    finally:
+        stop_metrics_server(port)
+
+
+def test_engine_records_stages_and_persists_summary(tmp_path):
+    """A sync run records per-stage metrics and stores its summary in sync_logs"""
+    config = Config(
+        oracle_host="lh", oracle_port=1521, oracle_service_name="xe",
+        oracle_user="u", oracle_password="p",
+        duckdb_path=":memory:", state_directory=str(tmp_path),
+    )
+    with patch("oracle_duckdb_sync.database.sync_engine.OracleSource") as mock_oracle_cls:
+        batches = [[(1, "a"), (2, "b")], [(3, "c")]]
+        mock_oracle_cls.return_value.fetch_generator.return_value = iter(batches)
+        engine = SyncEngine(config)
+        engine.duckdb.execute("CREATE TABLE target (ID INTEGER, NAME VARCHAR)")
+
+        assert engine.sync_in_batches("SRC", "target", batch_size=2) == 3
+
+        metrics = engine.last_run_metrics
+        assert metrics.status == "completed"
+        assert metrics.rows == 3
+        assert metrics.batches == 2
+        assert metrics.bytes > 0
+
+        engine.flush_sync_logs()
+        log = SyncLogRepository(duckdb_source=engine.duckdb).get_recent_logs(table_name="SRC")[0]
+        assert log.id is not None
+        assert log.end_time is not None
+        assert log.sync_type == SyncType.FULL
+        assert log.status == SyncStatus.COMPLETED
+        assert log.duckdb_table == "target"
+        assert log.total_rows == 3
+        assert log.metrics["batches"] == 2
+        assert set(log.metrics["stage_seconds"]) == {"fetch", "convert", "insert"}
+        engine.close()
+
+
+def test_engine_persists_failed_run(tmp_path):
+    config = Config(
+        oracle_host="lh", oracle_port=1521, oracle_service_name="xe",
+        oracle_user="u", oracle_password="p",
+        duckdb_path=":memory:", state_directory=str(tmp_path),
+    )
+    with patch("oracle_duckdb_sync.database.sync_engine.OracleSource") as mock_oracle_cls:
+        mock_oracle_cls.return_value.fetch_generator.side_effect = RuntimeError("ORA-03113")
+        engine = SyncEngine(config)
+        engine.duckdb.execute("CREATE TABLE target (ID INTEGER)")
+
+        with pytest.raises(RuntimeError):
+            engine._execute_sync("SELECT * FROM SRC", "target", primary_key="ID")
+
+        engine.flush_sync_logs()
+        log = SyncLogRepository(duckdb_source=engine.duckdb).get_recent_logs()[0]
+        assert log.sync_type == SyncType.UPSERT
+        assert log.status == SyncStatus.FAILED
+        assert log.error_message == "ORA-03113"
+        engine.close()
@@ -0,0 +1,152 @@
+"""Synthetic Oracle stand-in for sync benchmarks.
+
+FakeOracleConnection/FakeOracleCursor mimic the parts of the oracledb API used
+by OracleSource (cursor(), execute(), fetchmany(), fetchall(), close()) and
+generate rows on the fly, so SyncEngine can be driven end to end without an
+Oracle server. Row width, column types and per-round-trip latency are
+configurable through FakeTableSpec.
+"""
+
+import datetime
+import math
+import re
+import time
+from dataclasses import dataclass
+
+BASE_TIME = datetime.datetime(2024, 1, 1)
+
+_ROWNUM_PATTERN = re.compile(r"ROWNUM\s*<=\s*(\d+)", re.IGNORECASE)
+_INCREMENTAL_PATTERN = re.compile(r">\s*'([^']+)'")
+
+
+@dataclass
+class FakeTableSpec:
+    """Shape of the synthetic Oracle table.
+
+    Attributes:
+        row_count: Number of rows in the table
+        number_columns: Extra NUMBER columns (besides ID)
+        varchar_columns: VARCHAR2 columns
+        date_columns: Extra DATE columns (besides CREATED_AT)
+        varchar_width: Length of generated strings
+        round_trip_latency: Seconds of simulated network latency per round trip
+        arraysize: Rows per round trip (like oracledb's cursor.arraysize)
+    """
+    row_count: int
+    number_columns: int = 4
+    varchar_columns: int = 4
+    date_columns: int = 1
+    varchar_width: int = 20
+    round_trip_latency: float = 0.0
+    arraysize: int = 100
+
+    def schema(self) -> list:
+        """Column definitions as returned by all_tab_columns (name, type)."""
+        columns = [("ID", "NUMBER"), ("CREATED_AT", "DATE")]
+        columns += [(f"NUM_{i}", "NUMBER") for i in range(1, self.number_columns + 1)]
+        columns += [(f"STR_{i}", "VARCHAR2") for i in range(1, self.varchar_columns + 1)]
+        columns += [(f"DATE_{i}", "DATE") for i in range(1, self.date_columns + 1)]
+        return columns
+
+    def make_row(self, index: int) -> tuple:
+        """Generate the row at a zero-based position."""
+        row_id = index + 1
+        created_at = BASE_TIME + datetime.timedelta(seconds=index)
+        numbers = tuple(row_id * 1.5 + i for i in range(self.number_columns))
+        text = f"{row_id:0{self.varchar_width}d}"[-self.varchar_width:]
+        strings = tuple(text for _ in range(self.varchar_columns))
+        dates = tuple(created_at for _ in range(self.date_columns))
+        return (row_id, created_at) + numbers + strings + dates
+
+
+class FakeOracleCursor:
+    """Cursor producing rows of a FakeTableSpec."""
+
+    def __init__(self, spec: FakeTableSpec):
+        self.spec = spec
+        self.arraysize = spec.arraysize
+        self.round_trips = 0
+        self.fetch_seconds = 0.0
+        self._rows = None
+        self._position = 0
+        self._end = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+        return False
+
+    def execute(self, query: str, params=None):
+        if "tab_columns" in query.lower():
+            self._rows = self.spec.schema()
+            self._position = 0
+            self._end = len(self._rows)
+            return self
+
+        self._rows = None
+        self._position = 0
+        self._end = self.spec.row_count
+
+        match = _INCREMENTAL_PATTERN.search(query)
+        if match:
+            last_value = datetime.datetime.fromisoformat(match.group(1).replace("T", " "))
+            offset = int((last_value - BASE_TIME).total_seconds()) + 1
+            self._position = min(max(0, offset), self._end)
+
+        match = _ROWNUM_PATTERN.search(query)
+        if match:
+            self._end = min(self._end, self._position + int(match.group(1)))
+        return self
+
+    def fetchmany(self, size: int) -> list:
+        start = time.perf_counter()
+        stop = min(self._position + size, self._end)
+        if self._rows is not None:
+            rows = self._rows[self._position:stop]
+        else:
+            rows = [self.spec.make_row(i) for i in range(self._position, stop)]
+        self._position = stop
+
+        if rows:
+            trips = math.ceil(len(rows) / self.arraysize)
+            self.round_trips += trips
+            if self.spec.round_trip_latency > 0:
+                time.sleep(self.spec.round_trip_latency * trips)
+        self.fetch_seconds += time.perf_counter() - start
+        return rows
+
+    def fetchall(self) -> list:
+        return self.fetchmany(self._end - self._position)
+
+    def close(self):
+        self._rows = None
+
+
+class FakeOracleConnection:
+    """Connection handing out FakeOracleCursor instances.
+
+    Fetch statistics of every cursor are aggregated so a benchmark can report
+    the time spent waiting on the "database".
+    """
+
+    def __init__(self, spec: FakeTableSpec):
+        self.spec = spec
+        self.cursors = []
+
+    def cursor(self) -> FakeOracleCursor:
+        cursor = FakeOracleCursor(self.spec)
+        self.cursors.append(cursor)
+        return cursor
+
+    @property
+    def fetch_seconds(self) -> float:
+        return sum(cursor.fetch_seconds for cursor in self.cursors)
+
+    @property
+    def round_trips(self) -> int:
+        return sum(cursor.round_trips for cursor in self.cursors)
+
+    def close(self):
+        self.cursors = []
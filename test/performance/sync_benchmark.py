@@ -0,0 +1,216 @@
+"""Sync throughput benchmark harness.
+
+Drives SyncEngine end to end against the FakeOracleConnection stand-in and a
+real DuckDB file, and reports rows/sec, MB/sec, peak RSS and per-stage time
+(fetch, convert, insert) for the full, incremental, UPSERT and test sync paths.
+Results can be compared against a stored baseline to detect regressions.
+"""
+
+import json
+import os
+import threading
+import time
+from dataclasses import dataclass, field
+
+from oracle_duckdb_sync.config import Config
+from oracle_duckdb_sync.database.batch_sizer import estimate_row_bytes
+from oracle_duckdb_sync.database.memory_governor import get_rss_bytes
+from oracle_duckdb_sync.database.sync_engine import SyncEngine
+
+from .fake_oracle import FakeOracleConnection, FakeTableSpec
+
+SCENARIOS = ("full", "incremental", "upsert", "test")
+
+BASELINE_PATH = os.path.join(os.path.dirname(__file__), "sync_benchmark_baseline.json")
+
+ORACLE_TABLE = "BENCH.SYNC_SOURCE"
+DUCKDB_TABLE = "sync_bench"
+
+
+@dataclass
+class BenchmarkResult:
+    """Measurements of one scenario run."""
+    scenario: str
+    rows: int
+    seconds: float
+    rows_per_sec: float
+    mb_per_sec: float
+    peak_rss_mb: float
+    stages: dict = field(default_factory=dict)
+
+    @property
+    def key(self) -> str:
+        return f"{self.scenario}/{self.rows}"
+
+
+class RssSampler:
+    """Background thread recording the peak RSS while a benchmark runs."""
+
+    def __init__(self, interval: float = 0.05):
+        self.interval = interval
+        self.peak = get_rss_bytes() or 0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def _run(self):
+        while not self._stop.is_set():
+            self.peak = max(self.peak, get_rss_bytes() or 0)
+            self._stop.wait(self.interval)
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self._stop.set()
+        self._thread.join()
+        self.peak = max(self.peak, get_rss_bytes() or 0)
+        return False
+
+
+def _make_engine(work_dir: str, spec: FakeTableSpec, batch_size: int) -> SyncEngine:
+    config = Config(
+        oracle_host="bench", oracle_port=1521, oracle_service_name="bench",
+        oracle_user="bench", oracle_password="bench",
+        duckdb_path=os.path.join(work_dir, "bench.duckdb"),
+        state_directory=work_dir,
+        sync_batch_size=batch_size,
+        sync_max_iterations=max(10000, spec.row_count // batch_size + 10),
+    )
+    engine = SyncEngine(config)
+    engine.oracle.conn = FakeOracleConnection(spec)
+    return engine
+
+
+def _prepare_target(engine: SyncEngine, spec: FakeTableSpec, with_primary_key: bool):
+    columns = [(name, engine.map_oracle_type(oracle_type)) for name, oracle_type in spec.schema()]
+    engine.duckdb.execute(f"DROP TABLE IF EXISTS {DUCKDB_TABLE}")
+    if with_primary_key:
+        engine.duckdb.execute(engine.duckdb.build_create_table_query(DUCKDB_TABLE, columns, "ID"))
+    else:
+        col_defs = ", ".join(f"{name} {duckdb_type}" for name, duckdb_type in columns)
+        engine.duckdb.execute(f"CREATE TABLE {DUCKDB_TABLE} ({col_defs})")
+
+
+def _run_sync(engine: SyncEngine, scenario: str, rows: int) -> int:
+    if scenario == "full":
+        return engine.full_sync(ORACLE_TABLE, DUCKDB_TABLE, "ID")
+    if scenario == "incremental":
+        return engine.incremental_sync(
+            ORACLE_TABLE, DUCKDB_TABLE, "CREATED_AT", "2000-01-01 00:00:00"
+        )
+    if scenario == "upsert":
+        return engine._execute_sync(f"SELECT * FROM {ORACLE_TABLE}", DUCKDB_TABLE, primary_key="ID")
+    if scenario == "test":
+        return engine.test_sync(ORACLE_TABLE, DUCKDB_TABLE, "ID", row_limit=rows)
+    raise ValueError(f"Unknown scenario: {scenario}")
+
+
+def run_scenario(scenario: str, spec: FakeTableSpec, work_dir: str,
+                 batch_size: int = 10000) -> BenchmarkResult:
+    """Run one sync scenario against the fake Oracle source.
+
+    Args:
+        scenario: One of SCENARIOS
+        spec: Shape of the synthetic source table
+        work_dir: Directory for the DuckDB file and state files
+        batch_size: Sync batch size
+
+    Returns:
+        BenchmarkResult with throughput, peak RSS and per-stage timings
+    """
+    engine = _make_engine(work_dir, spec, batch_size)
+    try:
+        if scenario == "incremental":
+            _prepare_target(engine, spec, with_primary_key=False)
+        elif scenario == "upsert":
+            _prepare_target(engine, spec, with_primary_key=True)
+        else:
+            engine.duckdb.execute(f"DROP TABLE IF EXISTS {DUCKDB_TABLE}")
+
+        with RssSampler() as sampler:
+            start = time.perf_counter()
+            synced = _run_sync(engine, scenario, spec.row_count)
+            seconds = time.perf_counter() - start
+
+        stored = engine.duckdb.execute(f"SELECT COUNT(*) FROM {DUCKDB_TABLE}")[0][0]
+        if synced != spec.row_count or stored != spec.row_count:
+            raise AssertionError(
+                f"{scenario}: expected {spec.row_count} rows, synced {synced}, stored {stored}"
+            )
+
+        sample = [spec.make_row(i) for i in range(min(1000, spec.row_count))]
+        total_mb = estimate_row_bytes(sample) * synced / 1024 / 1024
+        stage_seconds = engine.last_run_metrics.stage_seconds
+        return BenchmarkResult(
+            scenario=scenario,
+            rows=synced,
+            seconds=seconds,
+            rows_per_sec=synced / seconds if seconds > 0 else 0.0,
+            mb_per_sec=total_mb / seconds if seconds > 0 else 0.0,
+            peak_rss_mb=sampler.peak / 1024 / 1024,
+            stages={stage: round(value, 3) for stage, value in stage_seconds.items()},
+        )
+    finally:
+        engine.close()
+
+
+def load_baseline(path: str = BASELINE_PATH) -> dict:
+    """Load stored baseline results keyed by 'scenario/rows'."""
+    if not os.path.exists(path):
+        return {}
+    with open(path) as f:
+        return json.load(f)
+
+
+def save_baseline(results: list, path: str = BASELINE_PATH) -> None:
+    """Merge results into the baseline file."""
+    baseline = load_baseline(path)
+    for result in results:
+        baseline[result.key] = {
+            "rows_per_sec": round(result.rows_per_sec, 1),
+            "mb_per_sec": round(result.mb_per_sec, 2),
+            "peak_rss_mb": round(result.peak_rss_mb, 1),
+        }
+    with open(path, "w") as f:
+        json.dump(dict(sorted(baseline.items())), f, indent=2)
+        f.write("\n")
+
+
+def find_regressions(results: list, baseline: dict, tolerance: float = 0.3) -> list:
+    """Compare results against the baseline.
+
+    A result regresses when its rows/sec falls more than ``tolerance`` below
+    the baseline. Scenarios without a baseline entry are ignored.
+
+    Returns:
+        list: Human readable regression messages (empty if none)
+    """
+    regressions = []
+    for result in results:
+        expected = baseline.get(result.key)
+        if not expected:
+            continue
+        floor = expected["rows_per_sec"] * (1 - tolerance)
+        if result.rows_per_sec < floor:
+            regressions.append(
+                f"{result.key}: {result.rows_per_sec:,.0f} rows/s < {floor:,.0f} rows/s "
+                f"(baseline {expected['rows_per_sec']:,.0f}, tolerance {tolerance:.0%})"
+            )
+    return regressions
+
+
+def format_report(results: list) -> str:
+    """Render results as a fixed-width table."""
+    header = (
+        f"{'scenario':<12}{'rows':>12}{'sec':>9}{'rows/s':>12}{'MB/s':>9}"
+        f"{'RSS MB':>9}{'fetch':>9}{'convert':>9}{'insert':>9}"
+    )
+    lines = [header, "-" * len(header)]
+    for r in results:
+        lines.append(
+            f"{r.scenario:<12}{r.rows:>12,}{r.seconds:>9.2f}{r.rows_per_sec:>12,.0f}"
+            f"{r.mb_per_sec:>9.1f}{r.peak_rss_mb:>9.0f}{r.stages['fetch']:>9.2f}"
+            f"{r.stages['convert']:>9.2f}{r.stages['insert']:>9.2f}"
+        )
+    return "\n".join(lines)
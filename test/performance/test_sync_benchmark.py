@@ -0,0 +1,144 @@
+"""Sync throughput benchmarks against the synthetic Oracle stand-in.
+
+The smoke tests always run with a few thousand rows to keep the harness
+working. The full benchmark is opt-in because it syncs up to 1M rows:
+
+    SYNC_BENCHMARK=1 pytest test/performance/test_sync_benchmark.py -s
+
+The default sizes are the ones with a stored baseline. Larger runs (e.g.
+10M rows) are only gated once their baseline has been recorded with
+SYNC_BENCHMARK_UPDATE_BASELINE=1.
+
+Environment variables:
+    SYNC_BENCHMARK_SIZES: Comma separated row counts (default: 100000,1000000)
+    SYNC_BENCHMARK_TOLERANCE: Allowed rows/sec drop vs. baseline (default: 0.3)
+    SYNC_BENCHMARK_UPDATE_BASELINE=1: Store the results as the new baseline
+"""
+
+import os
+import time
+
+import pytest
+
+from .fake_oracle import FakeOracleConnection, FakeTableSpec
+from .sync_benchmark import (
+    SCENARIOS,
+    BenchmarkResult,
+    find_regressions,
+    format_report,
+    load_baseline,
+    run_scenario,
+    save_baseline,
+)
+
+RUN_BENCHMARK = os.getenv("SYNC_BENCHMARK", "").lower() in ("1", "true", "yes")
+BENCHMARK_SIZES = [
+    int(size) for size in os.getenv("SYNC_BENCHMARK_SIZES", "100000,1000000").split(",") if size
+]
+
+
+class TestFakeOracle:
+    """Test the synthetic Oracle cursor."""
+
+    def test_schema_query(self):
+        spec = FakeTableSpec(row_count=10, number_columns=1, varchar_columns=1, date_columns=0)
+        cursor = FakeOracleConnection(spec).cursor()
+
+        cursor.execute(
+            "SELECT column_name, data_type FROM all_tab_columns WHERE owner = :o", {"o": "X"}
+        )
+        assert cursor.fetchall() == [("ID", "NUMBER"), ("CREATED_AT", "DATE"),
+                                     ("NUM_1", "NUMBER"), ("STR_1", "VARCHAR2")]
+
+    def test_rownum_limit_and_batches(self):
+        spec = FakeTableSpec(row_count=1000, arraysize=100)
+        conn = FakeOracleConnection(spec)
+        cursor = conn.cursor()
+
+        cursor.execute("SELECT * FROM (SELECT * FROM T) WHERE ROWNUM <= 250")
+        sizes = []
+        while True:
+            rows = cursor.fetchmany(100)
+            if not rows:
+                break
+            sizes.append(len(rows))
+
+        assert sizes == [100, 100, 50]
+        assert conn.round_trips == 3
+
+    def test_incremental_predicate_skips_older_rows(self):
+        spec = FakeTableSpec(row_count=100)
+        cursor = FakeOracleConnection(spec).cursor()
+
+        cursor.execute(
+            "SELECT * FROM T WHERE CREATED_AT > '2024-01-01 00:00:09' ORDER BY CREATED_AT ASC"
+        )
+        rows = cursor.fetchall()
+
+        assert len(rows) == 90
+        assert rows[0][0] == 11
+
+    def test_round_trip_latency(self):
+        spec = FakeTableSpec(row_count=300, arraysize=100, round_trip_latency=0.01)
+        cursor = FakeOracleConnection(spec).cursor()
+        cursor.execute("SELECT * FROM T")
+
+        start = time.perf_counter()
+        cursor.fetchmany(300)
+        assert time.perf_counter() - start >= 0.03
+
+
+@pytest.mark.parametrize("scenario", SCENARIOS)
+def test_benchmark_smoke(scenario, tmp_path):
+    """Every scenario syncs end to end and produces sane metrics"""
+    spec = FakeTableSpec(row_count=2500)
+
+    result = run_scenario(scenario, spec, str(tmp_path), batch_size=1000)
+
+    assert result.rows == 2500
+    assert result.rows_per_sec > 0
+    assert result.mb_per_sec > 0
+    assert set(result.stages) == {"fetch", "convert", "insert"}
+
+
+def test_baseline_regression_detection(tmp_path):
+    """Results slower than baseline minus tolerance are reported"""
+    path = str(tmp_path / "baseline.json")
+    fast = BenchmarkResult("full", 1000, 1.0, 1000.0, 1.0, 100.0, {})
+    slow = BenchmarkResult("full", 1000, 2.0, 500.0, 0.5, 100.0, {})
+    unknown = BenchmarkResult("upsert", 1000, 9.0, 1.0, 0.1, 100.0, {})
+
+    save_baseline([fast], path)
+    baseline = load_baseline(path)
+
+    assert find_regressions([fast, unknown], baseline) == []
+    assert len(find_regressions([slow], baseline, tolerance=0.3)) == 1
+    assert find_regressions([slow], baseline, tolerance=0.6) == []
+
+
+@pytest.mark.benchmark
+@pytest.mark.skipif(not RUN_BENCHMARK, reason="set SYNC_BENCHMARK=1 to run sync benchmarks")
+def test_sync_throughput_benchmark(tmp_path):
+    """Full benchmark matrix, compared against the stored baseline"""
+    results = []
+    for rows in BENCHMARK_SIZES:
+        for scenario in SCENARIOS:
+            work_dir = tmp_path / f"{scenario}_{rows}"
+            work_dir.mkdir()
+            results.append(run_scenario(scenario, FakeTableSpec(row_count=rows), str(work_dir)))
+
+    print()
+    print(format_report(results))
+
+    if os.getenv("SYNC_BENCHMARK_UPDATE_BASELINE", "").lower() in ("1", "true", "yes"):
+        save_baseline(results)
+        return
+
+    baseline = load_baseline()
+    ungated = [result.key for result in results if result.key not in baseline]
+    if ungated:
+        print(f"No baseline (not gated): {', '.join(ungated)}")
+
+    tolerance = float(os.getenv("SYNC_BENCHMARK_TOLERANCE", "0.3"))
+    regressions = find_regressions(results, baseline, tolerance)
+    assert not regressions, "Sync throughput regressed:\n" + "\n".join(regressions)
@@ -0,0 +1,28 @@
+"""Tests for the smoothed sync ETA"""
+import pytest
+
+from oracle_duckdb_sync.scheduler.eta import ThroughputEta
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_rate_is_smoothed_and_eta_uses_remaining_rows():
+    clock = FakeClock()
+    eta = ThroughputEta(alpha=0.5, clock=clock)
+
+    assert eta.remaining_seconds(0, 1000) is None
+
+    clock.now = 1.0
+    assert eta.update(100) == pytest.approx(100.0)
+    clock.now = 2.0
+    # A 300 rows/s batch only moves the smoothed rate half way
+    assert eta.update(400) == pytest.approx(200.0)
+    assert eta.remaining_seconds(400, 1000) == pytest.approx(3.0)
+    assert eta.remaining_seconds(1200, 1000) == 0
+    assert eta.remaining_seconds(400, None) is None
@@ -0,0 +1,135 @@
+from datetime import datetime, timedelta
+
+import pytest
+
+from oracle_duckdb_sync.config import Config
+from oracle_duckdb_sync.database.duckdb_source import DuckDBSource
+from oracle_duckdb_sync.models.query_history import QueryHistoryEntry
+from oracle_duckdb_sync.models.sync_log import SyncLog, SyncStatus, SyncType
+from oracle_duckdb_sync.repository.query_history_repo import QueryHistoryRepository
+from oracle_duckdb_sync.repository.sync_log_repo import SyncLogRepository
+from oracle_duckdb_sync.scheduler.log_retention import (
+    run_log_retention,
+    run_query_history_retention,
+)
+
+
+@pytest.fixture
+def config(tmp_path):
+    return Config(
+        oracle_host="lh", oracle_port=1521, oracle_service_name="xe",
+        oracle_user="u", oracle_password="p",
+        duckdb_path=str(tmp_path / "sync.duckdb"), state_directory=str(tmp_path),
+        sync_log_retention_days=30, sync_log_rollup_retention_days=365
+    )
+
+
+@pytest.fixture
+def repo(config):
+    source = DuckDBSource(config)
+    yield SyncLogRepository(duckdb_source=source)
+    source.disconnect()
+
+
+def add_log(repo, table, start, status=SyncStatus.COMPLETED, rows=100, seconds=10):
+    end = start + timedelta(seconds=seconds) if status != SyncStatus.RUNNING else None
+    return repo.create(SyncLog(
+        sync_id="", table_name=table, sync_type=SyncType.INCREMENTAL, status=status,
+        start_time=start, end_time=end, total_rows=rows
+    ))
+
+
+def test_index_created(repo):
+    indexes = repo.duckdb.conn.execute(
+        "SELECT index_name FROM duckdb_indexes() WHERE table_name = 'sync_logs'"
+    ).fetchall()
+
+    assert (SyncLogRepository.INDEX_NAME,) in indexes
+    assert (SyncLogRepository.DUCKDB_TABLE_INDEX_NAME,) in indexes
+
+
+def test_duckdb_table_backfilled_from_run_summaries(repo):
+    # Logs written before the duckdb_table column existed
+    conn = repo.duckdb.conn
+    conn.execute(f"DROP TABLE {SyncLogRepository.TABLE_NAME}")
+    conn.execute(f"""
+        CREATE TABLE {SyncLogRepository.TABLE_NAME} (
+            id INTEGER PRIMARY KEY, sync_id VARCHAR(36) NOT NULL,
+            table_name VARCHAR(255) NOT NULL, sync_type VARCHAR(20) NOT NULL,
+            status VARCHAR(20) NOT NULL, start_time TIMESTAMP NOT NULL, end_time TIMESTAMP,
+            total_rows INTEGER DEFAULT 0, error_message TEXT, metrics TEXT
+        )
+    """)
+    conn.execute(
+        f"CREATE INDEX {SyncLogRepository.INDEX_NAME} "
+        f"ON {SyncLogRepository.TABLE_NAME} (table_name, start_time)"
+    )
+    conn.execute(
+        f"INSERT INTO {SyncLogRepository.TABLE_NAME} VALUES "
+        "(1, 'old-run', 'APP.USERS', 'full', 'completed', ?, ?, 10, NULL, "
+        "'{\"table\": \"users\"}')",
+        (datetime.now() - timedelta(minutes=5), datetime.now())
+    )
+
+    reopened = SyncLogRepository(duckdb_source=repo.duckdb)
+
+    assert reopened.get_last_finished("users").sync_id == "old-run"
+    assert reopened.get_last_finished("APP.USERS") is None
+
+
+def test_rollup_tracks_creates_and_updates(repo):
+    today = datetime.now().replace(hour=1, minute=0, second=0, microsecond=0)
+    add_log(repo, "A", today, rows=100, seconds=10)
+    add_log(repo, "A", today + timedelta(minutes=5), status=SyncStatus.FAILED, rows=0, seconds=30)
+    running = add_log(repo, "A", today + timedelta(minutes=10), status=SyncStatus.RUNNING, rows=0)
+    add_log(repo, "B", today - timedelta(days=1), rows=50)
+
+    running.status = SyncStatus.COMPLETED
+    running.end_time = running.start_time + timedelta(seconds=20)
+    running.total_rows = 300
+    repo.update(running)
+
+    rollup = repo.get_daily_rollup(days=7, table_name="A")
+    assert len(rollup) == 1
+    day = rollup[0]
+    assert (day['runs'], day['completed'], day['failed'], day['running']) == (3, 2, 1, 0)
+    assert day['total_rows'] == 400
+    assert day['avg_duration_seconds'] == pytest.approx(20.0)
+    assert day['max_duration_seconds'] == pytest.approx(30.0)
+
+    stats = repo.get_statistics()
+    assert (stats['total'], stats['completed'], stats['failed']) == (4, 3, 1)
+    assert stats['total_rows_synced'] == 450
+    assert stats['avg_rows'] == pytest.approx(150.0)
+
+
+def test_rollup_backfilled_from_existing_logs(repo):
+    add_log(repo, "A", datetime.now() - timedelta(hours=1))
+    repo.duckdb.conn.execute(f"DROP TABLE {SyncLogRepository.ROLLUP_TABLE_NAME}")
+
+    reopened = SyncLogRepository(duckdb_source=repo.duckdb)
+
+    assert reopened.get_statistics(table_name="A")['total'] == 1
+
+
+def test_retention_keeps_rollups_of_purged_logs(config, repo):
+    now = datetime.now()
+    add_log(repo, "A", now - timedelta(days=100))
+    add_log(repo, "A", now - timedelta(days=400))
+    add_log(repo, "A", now - timedelta(hours=1))
+
+    deleted = run_log_retention(config)
+
+    assert deleted == {'logs': 2, 'rollups': 1}
+    assert len(repo.get_recent_logs(table_name="A")) == 1
+    # The 100-day-old run is gone from sync_logs but still counted
+    assert repo.get_statistics(table_name="A")['total'] == 2
+
+
+def test_query_history_retention(config, repo):
+    history_repo = QueryHistoryRepository(duckdb_source=repo.duckdb)
+    history_repo.create(QueryHistoryEntry("SELECT 1", datetime.now() - timedelta(days=40), 1.0))
+    history_repo.create(QueryHistoryEntry("SELECT 2", datetime.now(), 1.0))
+
+    assert run_query_history_retention(config) == 1
+    assert [entry.query_text for entry in history_repo.get_slowest()] == ["SELECT 2"]
@@ -0,0 +1,144 @@
+"""Tests for the process-wide sync progress bus"""
+import json
+import threading
+import time
+import urllib.request
+
+from oracle_duckdb_sync.scheduler.progress_bus import ProgressBus
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_progress_is_coalesced_to_interval():
+    clock = FakeClock()
+    bus = ProgressBus(interval_seconds=60, clock=clock)
+
+    bus.publish("s1", "progress", {"total_rows": 1})
+    clock.now = 1
+    bus.publish("s1", "progress", {"total_rows": 2})
+    clock.now = 2
+    bus.publish("s1", "progress", {"total_rows": 3})
+
+    events, cursor = bus.read_since("s1")
+    assert [e.data["total_rows"] for e in events] == [1]
+
+    # A terminal event first delivers the latest pending progress
+    bus.publish("s1", "complete", {"total_rows": 3})
+    events, cursor = bus.read_since("s1", cursor)
+    assert [(e.type, e.data["total_rows"]) for e in events] == [("progress", 3), ("complete", 3)]
+    assert bus.active_sync_ids() == []
+    assert bus.published == 4
+    assert bus.delivered == 3
+
+
+def test_pending_progress_is_flushed_after_interval():
+    bus = ProgressBus(interval_seconds=0.05)
+    bus.publish("s1", "progress", {"total_rows": 1})
+    bus.publish("s1", "progress", {"total_rows": 2})
+
+    deadline = time.time() + 2
+    while bus.latest("s1").data["total_rows"] != 2 and time.time() < deadline:
+        time.sleep(0.01)
+    assert bus.latest("s1").data["total_rows"] == 2
+
+
+def test_history_is_bounded_and_cursors_are_per_topic():
+    bus = ProgressBus(interval_seconds=0, history_size=3)
+    for i in range(5):
+        bus.publish("s1", "progress", {"total_rows": i})
+    bus.publish("s2", "progress", {"total_rows": 100})
+
+    events, cursor = bus.read_since("s1")
+    assert [e.data["total_rows"] for e in events] == [2, 3, 4]
+    assert bus.read_since("s1", cursor) == ([], cursor)
+    assert bus.read_since("missing", 7) == ([], 7)
+    assert bus.active_sync_ids() == ["s1", "s2"]
+
+
+def test_subscribers_share_one_topic():
+    bus = ProgressBus(interval_seconds=0)
+    bus.publish("s1", "progress", {"total_rows": 1})
+
+    first = bus.subscribe("s1")
+    second = bus.subscribe("s1", replay=False)
+    everything = bus.subscribe()
+    with first, second, everything:
+        bus.publish("s1", "complete", {"total_rows": 1})
+        bus.publish("s2", "progress", {"total_rows": 5})
+
+        assert [e.type for e in first.drain()] == ["progress", "complete"]
+        assert [e.type for e in second.drain()] == ["complete"]
+        assert [(e.sync_id, e.type) for e in everything.drain()] == [
+            ("s1", "complete"), ("s2", "progress")
+        ]
+
+    assert first.closed
+    assert first.get(timeout=0) is None
+
+
+def test_subscription_to_unknown_sync_is_not_active():
+    bus = ProgressBus(interval_seconds=0)
+
+    with bus.subscribe("typo-id") as subscription:
+        assert bus.active_sync_ids() == []
+        bus.publish("s1", "progress", {"total_rows": 1})
+        assert bus.active_sync_ids() == ["s1"]
+        bus.publish("s1", "complete", {"total_rows": 1})
+        assert subscription.get(timeout=0) is None
+
+    assert bus.active_sync_ids() == []
+    assert "typo-id" not in bus._topics
+
+
+def test_subscription_before_first_event_receives_it():
+    bus = ProgressBus(interval_seconds=0)
+
+    with bus.subscribe("s1") as subscription:
+        bus.publish("s1", "progress", {"total_rows": 1})
+
+        assert [e.type for e in subscription.drain()] == ["progress"]
+        assert bus.active_sync_ids() == ["s1"]
+
+
+def test_slow_subscriber_drops_oldest_events():
+    bus = ProgressBus(interval_seconds=0)
+    with bus.subscribe("s1", max_pending=2) as subscription:
+        for i in range(4):
+            bus.publish("s1", "progress", {"total_rows": i})
+        bus.publish("s1", "error", {"exception": "boom"})
+
+        assert [e.type for e in subscription.drain()] == ["progress", "error"]
+        assert subscription.dropped == 3
+
+
+def test_sse_endpoint_streams_until_terminal_event():
+    from unittest.mock import patch
+
+    from oracle_duckdb_sync.metrics.server import start_metrics_server, stop_metrics_server
+
+    bus = ProgressBus(interval_seconds=0)
+    bus.publish("s1", "progress", {"total_rows": 10})
+
+    with patch("oracle_duckdb_sync.scheduler.progress_bus._global_progress_bus", bus):
+        server = start_metrics_server(0)
+        host, port = server.server_address[:2]
+        # Unauthenticated endpoint: loopback unless METRICS_HOST says otherwise
+        assert host == "127.0.0.1"
+        try:
+            threading.Timer(0.1, bus.publish, args=("s1", "complete", {"total_rows": 10})).start()
+            url = f"http://127.0.0.1:{port}/sync/progress/s1"
+            with urllib.request.urlopen(url, timeout=5) as response:
+                assert response.headers["Content-Type"].startswith("text/event-stream")
+                body = response.read().decode("utf-8")
+        finally:
+            stop_metrics_server(port)
+
+    frames = [frame for frame in body.split("\n\n") if frame]
+    assert [frame.split("\n")[1] for frame in frames] == ["event: progress", "event: complete"]
+    assert json.loads(frames[-1].split("data: ", 1)[1])["data"] == {"total_rows": 10}
@@ -222,6 +222,11 @@ def test_150_sync_worker_error_handling(mock_config):
         assert 'Database connection failed' in worker.error_info['exception']
         assert 'traceback' in worker.error_info
 
+        # The published error is readable by other sessions: no traceback
+        event = worker.progress_bus.latest(worker.sync_id)
+        assert event.type == 'error'
+        assert event.data == {'exception': worker.error_info['exception']}
+
 
 def test_151_progress_callback_and_queue(mock_config):
     """TEST-151: 진행 상황 콜백 호출 및 큐 전달
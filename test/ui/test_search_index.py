@@ -0,0 +1,79 @@
+"""
+Tests for the menu search index.
+
+Covers normalization and Korean initial-consonant (choseong) matching,
+ranking of exact, prefix, substring and typo-tolerant matches, and
+table entries.
+"""
+
+from oracle_duckdb_sync.ui.components.search import search_pages
+from oracle_duckdb_sync.ui.components.search_index import (
+    SearchEntry,
+    SearchIndex,
+    normalize,
+    to_choseong,
+)
+
+PAGES = [
+    {'path': '/dashboard', 'name': '대시보드', 'icon': '🏠', 'category': '일반',
+     'keywords': ['dashboard', 'home']},
+    {'path': '/data', 'name': '데이터 조회', 'icon': '📊', 'category': '일반',
+     'keywords': ['data', 'query', 'table']},
+    {'path': '/admin/sync', 'name': '동기화 관리', 'icon': '🔄', 'category': '관리자',
+     'keywords': ['sync', 'manage']},
+    {'path': '/admin/queries', 'name': '쿼리 이력', 'icon': '⏱️', 'category': '관리자',
+     'keywords': ['query', 'history']},
+]
+
+
+def build_index(tables=()):
+    entries = [SearchEntry.from_page(page) for page in PAGES]
+    entries += [SearchEntry.for_table(table) for table in tables]
+    return SearchIndex(entries)
+
+
+def test_normalize_and_choseong():
+    assert normalize("Sales_Orders 2024") == "salesorders2024"
+    assert to_choseong("대시보드 v2") == "ㄷㅅㅂㄷ v2"
+
+
+def test_korean_and_english_matches():
+    index = build_index()
+
+    assert [e.path for e in index.search("대시")] == ["/dashboard"]
+    assert [e.path for e in index.search("ㄷㄱㅎ")] == ["/admin/sync"]
+    assert [e.path for e in index.search("Dash")] == ["/dashboard"]
+
+
+def test_ranking_prefers_exact_then_prefix():
+    index = build_index()
+
+    # 'query' is an exact keyword of both pages; the shorter title wins the tie
+    assert [e.path for e in index.search("query")] == ["/admin/queries", "/data"]
+    assert [e.path for e in index.search("hist")] == ["/admin/queries"]
+
+
+def test_typo_tolerant_match():
+    index = build_index()
+
+    assert [e.path for e in index.search("dashbord")] == ["/dashboard"]
+    assert index.search("zzzz") == []
+
+
+def test_tables_are_indexed():
+    tables = [f"sensor_{i:03d}" for i in range(300)] + ["sales_orders"]
+    index = build_index(tables)
+
+    results = index.search("sales ord", limit=5)
+
+    assert results[0].kind == "table"
+    assert results[0].target == "sales_orders"
+    assert results[0].path == "/data"
+    assert len(index.search("sensor", limit=20)) == 20
+
+
+def test_search_pages_returns_ranked_page_dicts():
+    results = search_pages("query", PAGES)
+
+    assert results == [PAGES[3], PAGES[1]]
+    assert search_pages("", PAGES) is PAGES